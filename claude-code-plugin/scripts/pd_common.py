@@ -254,16 +254,16 @@ def _walk_registry() -> list[dict[str, Any]]:
     for root in vendored_roots:
         if not root.exists():
             continue
-        for path in root.rglob("*.json"):
-            entry = _parse_registry_json(path, root)
+        for path, data in _load_registry_files(list(root.rglob("*.json"))):
+            entry = _registry_entry(path, root, data)
             if entry is not None:
                 seen[entry["name"]] = entry
 
     # Pass 2: user extensions override by name. Log each shadow so users
     # aren't surprised when their custom Concise overrides the core Concise.
     if user_dir is not None and user_dir.exists():
-        for path in user_dir.rglob("*.json"):
-            entry = _parse_registry_json(path, user_dir)
+        for path, data in _load_registry_files(list(user_dir.rglob("*.json"))):
+            entry = _registry_entry(path, user_dir, data)
             if entry is None:
                 continue
             name = entry["name"]
@@ -279,11 +279,38 @@ def _walk_registry() -> list[dict[str, Any]]:
     return sorted(seen.values(), key=lambda x: (x["category"], x["name"]))
 
 
+def _load_registry_files(paths: list[Path]) -> list[tuple[Path, Any]]:
+    """Parse registry files, skipping unreadable or invalid JSON.
+
+    Uses the engine's bulk loader (threaded, orjson when installed) when the
+    engine is already imported, as in the hook. `/decorate list` doesn't
+    otherwise need the engine, and importing it costs more than the walk.
+    """
+    json_backend = sys.modules.get("prompt_decorators.utils.json_backend")
+    if json_backend is not None:
+        return [
+            (Path(path), data)
+            for path, data, error in json_backend.load_json_files(paths)
+            if error is None
+        ]
+    loaded = []
+    for path in paths:
+        try:
+            loaded.append((path, json.loads(path.read_text(encoding="utf-8"))))
+        except (OSError, ValueError):
+            continue
+    return loaded
+
+
 def _parse_registry_json(path: Path, root: Path) -> dict[str, Any] | None:
     try:
         data = json.loads(path.read_text(encoding="utf-8"))
     except (OSError, json.JSONDecodeError):
         return None
+    return _registry_entry(path, root, data)
+
+
+def _registry_entry(path: Path, root: Path, data: Any) -> dict[str, Any] | None:
     # Defensive: a user could drop `[1, 2, 3]` or `"hi"` or `null` into the
     # registry. Skip silently instead of raising AttributeError on
     # `.get(...)` - that would propagate through `/decorate list` and
@@ -89,7 +89,7 @@ def _isolated_config(tmp_path, monkeypatch):
 
 @pytest.fixture(autouse=True)
 def _clean_engine_registry():
-    """Clear the vendored DynamicDecorator._registry between tests.
+    """Clear the vendored DynamicDecorator registry between tests.
 
     The engine's decorator registry is module-level class state. A test that
     registers a user decorator (e.g. via register_user_decorators or a direct
@@ -108,6 +108,7 @@ def _clean_engine_registry():
     if engine_mod is None:
         return
     try:
-        engine_mod.DynamicDecorator._registry.clear()
+        engine = engine_mod.DynamicDecorator
+        engine.update_registry({}, remove=engine.get_snapshot(load=False))
     except Exception:  # noqa: BLE001
         pass
@@ -54,6 +54,34 @@ def test_walk_registry_skips_non_dict_user_json(tmp_path, monkeypatch):
     assert any(d["name"] == "Concise" for d in decorators)
 
 
+def test_walk_registry_same_with_engine_loader(tmp_path, monkeypatch):
+    """Once the engine is imported, the walk uses its bulk JSON loader;
+    the catalogue must come out identical either way."""
+    user_reg = tmp_path / "reg"
+    user_reg.mkdir()
+    (user_reg / "broken.json").write_text("{nope")
+    (user_reg / "mine.json").write_text(
+        '{"decoratorName": "MyProbe", "description": "Mine"}'
+    )
+    monkeypatch.setenv("PROMPT_DECORATORS_USER_REGISTRY", str(user_reg))
+    monkeypatch.setenv("PROMPT_DECORATORS_CONFIG_DIR", str(tmp_path / "cfg"))
+
+    import sys
+
+    import pd_common as mod
+
+    importlib.reload(mod)
+    monkeypatch.delitem(
+        sys.modules, "prompt_decorators.utils.json_backend", raising=False
+    )
+    plain = mod._walk_registry()
+
+    mod.ensure_engine_on_path()
+    importlib.import_module("prompt_decorators.utils.json_backend")
+    assert mod._walk_registry() == plain
+    assert any(d["name"] == "MyProbe" for d in plain)
+
+
 # -----------------------------------------------------------------------------
 # Engine numeric-parameter parsing (cycle-6 vendor patch)
 # -----------------------------------------------------------------------------
@@ -13,20 +13,26 @@ logger = logging.getLogger(__name__)
 
 # Import the core elements
 from prompt_decorators.core.base import DecoratorBase, DecoratorParameter
+from prompt_decorators.core.budget import BudgetReport
 from prompt_decorators.core.dynamic_decorator import DynamicDecorator
+from prompt_decorators.core.render import DecoratedPrompt, PromptParts
 
 # Import the dynamic decorators module (replacing the generated decorators)
 from prompt_decorators.dynamic_decorators_module import (
     DecoratorDefinition,
     apply_decorator,
     apply_dynamic_decorators,
+    compile_chain,
+    complete_decorator_chain,
     create_decorator_class,
     create_decorator_instance,
+    estimate_prompt,
     extract_decorator_name,
     get_available_decorators,
     load_decorator_definitions,
     parse_decorator_text,
     register_decorator,
+    suggest_decorators,
 )
 
 # Import schemas
@@ -47,17 +53,24 @@ __all__ = [
     "DecoratorBase",
     "DecoratorParameter",
     "DynamicDecorator",
+    "PromptParts",
+    "DecoratedPrompt",
+    "BudgetReport",
     # Dynamic decorator module functions
     "load_decorator_definitions",
     "get_available_decorators",
     "create_decorator_instance",
     "create_decorator_class",
     "apply_dynamic_decorators",
+    "compile_chain",
+    "estimate_prompt",
     "apply_decorator",
     "register_decorator",
     "extract_decorator_name",
     "parse_decorator_text",
     "DecoratorDefinition",
+    "suggest_decorators",
+    "complete_decorator_chain",
     # Schemas
     "DecoratorSchema",
     "ParameterSchema",
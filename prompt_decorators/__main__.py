@@ -7,86 +7,144 @@ diagnosing registry issues, and performing maintenance operations.
 Usage:
     python -m prompt_decorators verify
     python -m prompt_decorators verify --detailed
+    python -m prompt_decorators verify --files --manifest .registry-manifest.json
+    python -m prompt_decorators verify --files path/to/registry --jobs 8 --json
     python -m prompt_decorators repair --auto
     python -m prompt_decorators info
+    python -m prompt_decorators transform prompts.jsonl --output results.jsonl
+    python -m prompt_decorators transform --jobs 8 --resume --output results.jsonl < prompts.jsonl
+    python -m prompt_decorators bench
+    python -m prompt_decorators bench --workload long_chain --profile profiles --json
 """
 
 import argparse
+import json
 import sys
 from typing import Any, Dict, cast  # Added cast
 
 
 def cmd_verify(args: argparse.Namespace) -> int:
     """Verify the prompt-decorators installation."""
+    report: Dict[str, Any] = {}
+
+    def say(message: str) -> None:
+        """Print a progress message unless a JSON report was requested.
+
+        Args:
+            message: The message to print
+
+        Returns:
+            None
+        """
+        if not args.json:
+            print(message)
+
     try:
         from prompt_decorators.core.dynamic_decorator import DynamicDecorator
         from prompt_decorators.utils.registry_validator import RegistryValidator
 
-        print("🔍 Verifying prompt-decorators installation...")
+        say("🔍 Verifying prompt-decorators installation...")
 
         # Get registry information
         registry_info = RegistryValidator.get_registry_info()
+        report["registry"] = registry_info
 
         # Basic verification
-        print(f"\n📊 Registry Status:")
-        print(f"  Package registry exists: {registry_info['package_registry_exists']}")
-        print(f"  Source registry exists: {registry_info['source_registry_exists']}")
-        print(f"  Package registry files: {registry_info['package_file_count']}")
-        print(f"  Source registry files: {registry_info['source_file_count']}")
+        say(f"\n📊 Registry Status:")
+        say(f"  Package registry exists: {registry_info['package_registry_exists']}")
+        say(f"  Source registry exists: {registry_info['source_registry_exists']}")
+        say(f"  Package registry files: {registry_info['package_file_count']}")
+        say(f"  Source registry files: {registry_info['source_file_count']}")
 
         # Try to load decorators
-        print(f"\n🔄 Loading decorators...")
+        say(f"\n🔄 Loading decorators...")
         DynamicDecorator._loaded = False  # Force reload
         DynamicDecorator.load_registry()
 
         decorator_count = len(DynamicDecorator._registry)
-        print(f"  Decorators loaded: {decorator_count}")
+        report["decorators_loaded"] = decorator_count
+        say(f"  Decorators loaded: {decorator_count}")
 
         if decorator_count == 0:
-            print("❌ No decorators loaded - installation may be incomplete")
+            say("❌ No decorators loaded - installation may be incomplete")
+            report["status"] = "failed"
             return 1
 
         # Show sample decorators
         if args.detailed:
-            print(f"\n📋 Available decorators:")
+            say(f"\n📋 Available decorators:")
             for i, (name, definition) in enumerate(DynamicDecorator._registry.items()):
                 if i >= 10:  # Limit to first 10
-                    print(f"  ... and {decorator_count - 10} more")
+                    say(f"  ... and {decorator_count - 10} more")
                     break
                 category = definition.get("category", "Unknown")
                 description = definition.get("description", "No description")[:60]
-                print(f"  {name} ({category}): {description}")
+                say(f"  {name} ({category}): {description}")
         else:
             sample_names = list(DynamicDecorator._registry.keys())[:5]
-            print(f"  Sample decorators: {sample_names}")
+            say(f"  Sample decorators: {sample_names}")
 
         # Validation check
-        print(f"\n✅ Validation:")
+        say(f"\n✅ Validation:")
         validation_result = RegistryValidator.validate_registry()
+        report["validation"] = validation_result
 
         if validation_result["status"] == "healthy":
-            print("  Registry status: Healthy ✅")
+            say("  Registry status: Healthy ✅")
         elif validation_result["status"] == "needs_repair":
-            print("  Registry status: Needs repair ⚠️")
+            say("  Registry status: Needs repair ⚠️")
             if args.detailed:
                 for issue in validation_result.get("issues", []):
-                    print(f"    - {issue}")
+                    say(f"    - {issue}")
         else:
-            print("  Registry status: Critical issues ❌")
+            say("  Registry status: Critical issues ❌")
             if args.detailed:
                 for issue in validation_result.get("issues", []):
-                    print(f"    - {issue}")
+                    say(f"    - {issue}")
+
+        # Decorator file check
+        if args.files is not None:
+            paths = args.files or DynamicDecorator.get_registry_dirs()
+            files_report = RegistryValidator.validate_files(
+                paths, args.manifest, args.jobs
+            )
+            report["files"] = files_report
+            say(f"\n📄 Decorator files:")
+            say(
+                f"  {files_report['total']} files: {files_report['checked']} checked, "
+                f"{files_report['skipped']} unchanged, "
+                f"{files_report['invalid']} invalid "
+                f"({files_report['duration']:.2f}s)"
+            )
+            invalid_files = [f for f in files_report["files"] if not f["valid"]]
+            shown = invalid_files if args.detailed else invalid_files[:10]
+            for entry in shown:
+                say(f"    ❌ {entry['path']}")
+                for error in entry["errors"]:
+                    say(f"       - {error}")
+            if len(shown) < len(invalid_files):
+                say(f"    ... and {len(invalid_files) - len(shown)} more")
+            if invalid_files:
+                say("❌ Some decorator files are invalid")
+                report["status"] = "invalid"
+                return 1
 
-        print(f"\n🎉 Installation verification completed successfully!")
+        say(f"\n🎉 Installation verification completed successfully!")
+        report["status"] = "ok"
         return 0
 
     except ImportError as e:
-        print(f"❌ Import error: {e}")
-        print("The prompt-decorators package may not be properly installed.")
+        say(f"❌ Import error: {e}")
+        say("The prompt-decorators package may not be properly installed.")
+        report.update(status="error", error=f"Import error: {e}")
         return 1
     except Exception as e:
-        print(f"❌ Verification failed: {e}")
+        say(f"❌ Verification failed: {e}")
+        report.update(status="error", error=str(e))
         return 1
+    finally:
+        if args.json:
+            print(json.dumps(report, indent=2, default=str))
 
 
 def cmd_repair(args: argparse.Namespace) -> int:
@@ -150,6 +208,124 @@ def cmd_info(args: argparse.Namespace) -> int:
         return 1
 
 
+def cmd_transform(args: argparse.Namespace) -> int:
+    """Transform a JSONL file of prompt records."""
+    try:
+        from prompt_decorators.utils.batch import (
+            BatchStats,
+            count_records,
+            transform_lines,
+            write_lines,
+        )
+
+        offset = args.offset
+        if args.resume:
+            if not args.output:
+                print("❌ --resume needs --output", file=sys.stderr)
+                return 1
+            offset = count_records(args.output)
+            if offset:
+                print(f"Resuming after {offset} records", file=sys.stderr)
+
+        defaults: Dict[str, Any] = {}
+        if args.model:
+            defaults["model"] = args.model
+        if args.compose:
+            defaults["compose"] = True
+        if args.budget is not None:
+            defaults["budget"] = args.budget
+
+        stats = BatchStats()
+
+        def progress() -> None:
+            """Report the throughput so far.
+
+            Returns:
+                None
+            """
+            if not args.quiet:
+                print(stats.summary(), file=sys.stderr)
+
+        source = (
+            sys.stdin
+            if args.input == "-"
+            else open(args.input, encoding="utf-8")  # noqa: SIM115
+        )
+        output = (
+            open(args.output, "a" if offset else "w", encoding="utf-8")
+            if args.output
+            else sys.stdout
+        )
+        try:
+            results = transform_lines(
+                source,
+                jobs=args.jobs,
+                batch_size=args.batch_size,
+                offset=offset,
+                defaults=defaults,
+                stats=stats,
+            )
+            write_lines(results, output, progress, args.progress)
+        finally:
+            if source is not sys.stdin:
+                source.close()
+            if output is not sys.stdout:
+                output.close()
+        return 1 if stats.errors and args.strict else 0
+
+    except Exception as e:
+        print(f"❌ Transform failed: {e}", file=sys.stderr)
+        return 1
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    """Run the standard performance workloads."""
+    try:
+        from prompt_decorators.utils.bench import (
+            TABLE_HEADER,
+            BenchResult,
+            environment,
+            format_result,
+            run_benchmarks,
+            select_workloads,
+        )
+
+        def show(result: BenchResult) -> None:
+            """Print a workload's row unless a JSON report was requested.
+
+            Args:
+                result: The workload's timings
+
+            Returns:
+                None
+            """
+            if not args.json:
+                print(format_result(result), flush=True)
+
+        workloads = select_workloads(args.workload)
+        if not args.json:
+            print(TABLE_HEADER)
+        results = run_benchmarks(
+            workloads, args.iterations, args.profile, progress=show
+        )
+        report = {
+            "environment": environment(),
+            "results": [result.to_dict() for result in results],
+        }
+        if args.json:
+            print(json.dumps(report, indent=2))
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+        if args.profile and not args.json:
+            print(f"\nProfiles written to {args.profile}")
+        return 0
+
+    except Exception as e:
+        print(f"❌ Benchmark failed: {e}", file=sys.stderr)
+        return 1
+
+
 def main() -> int:
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -163,6 +339,26 @@ def main() -> int:
     verify_parser.add_argument(
         "--detailed", action="store_true", help="Show detailed verification information"
     )
+    verify_parser.add_argument(
+        "--files",
+        nargs="*",
+        metavar="PATH",
+        help="Validate every decorator file (in the registry directories by default)",
+    )
+    verify_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for file validation (default: CPU count)",
+    )
+    verify_parser.add_argument(
+        "--manifest",
+        metavar="PATH",
+        help="Content-hash manifest used to skip unchanged files",
+    )
+    verify_parser.add_argument(
+        "--json", action="store_true", help="Print a JSON report instead of text"
+    )
     verify_parser.set_defaults(func=cmd_verify)
 
     # Repair command
@@ -176,6 +372,102 @@ def main() -> int:
     info_parser = subparsers.add_parser("info", help="Show installation information")
     info_parser.set_defaults(func=cmd_info)
 
+    # Transform command
+    transform_parser = subparsers.add_parser(
+        "transform", help="Transform a JSONL file of {prompt, decorators} records"
+    )
+    transform_parser.add_argument(
+        "input",
+        nargs="?",
+        default="-",
+        help="JSONL input file (default: standard input)",
+    )
+    transform_parser.add_argument(
+        "--output", metavar="PATH", help="JSONL output file (default: standard output)"
+    )
+    transform_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count; 1 runs in this process)",
+    )
+    transform_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=256,
+        help="Records sent to a worker at a time",
+    )
+    transform_parser.add_argument(
+        "--offset",
+        type=int,
+        default=0,
+        help="Number of input records to skip",
+    )
+    transform_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip the records already in --output and append to it",
+    )
+    transform_parser.add_argument(
+        "--model", help="Target model for records that do not set one"
+    )
+    transform_parser.add_argument(
+        "--compose",
+        action="store_true",
+        help="Compose decorator instructions and drop duplicate text",
+    )
+    transform_parser.add_argument(
+        "--budget",
+        type=int,
+        default=None,
+        help="Token budget for records that do not set one",
+    )
+    transform_parser.add_argument(
+        "--progress",
+        type=float,
+        default=0,
+        metavar="SECONDS",
+        help="Report throughput every SECONDS (default: only at the end)",
+    )
+    transform_parser.add_argument(
+        "--quiet", action="store_true", help="Do not report throughput"
+    )
+    transform_parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Exit with status 1 if any record failed",
+    )
+    transform_parser.set_defaults(func=cmd_transform)
+
+    # Bench command
+    bench_parser = subparsers.add_parser(
+        "bench", help="Run standard performance workloads"
+    )
+    bench_parser.add_argument(
+        "--workload",
+        action="append",
+        metavar="NAME",
+        help="Workload to run (repeatable; default: all)",
+    )
+    bench_parser.add_argument(
+        "--iterations",
+        type=int,
+        default=None,
+        help="Measured passes per workload (default: per workload)",
+    )
+    bench_parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        help="Write a cProfile .pstats file per workload to DIR",
+    )
+    bench_parser.add_argument(
+        "--output", metavar="PATH", help="Also write the JSON report to PATH"
+    )
+    bench_parser.add_argument(
+        "--json", action="store_true", help="Print a JSON report instead of a table"
+    )
+    bench_parser.set_defaults(func=cmd_bench)
+
     # Parse arguments
     args = parser.parse_args()
 
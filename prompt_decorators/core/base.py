@@ -434,6 +434,22 @@ class DecoratorBase:
         # Create the decorator instance
         return cls(**params)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the decorator to a dictionary representation.
+
+        Args:
+            self: The decorator instance
+
+        Returns:
+            Dictionary with the decorator name and its set parameter values
+        """
+        parameters = {}
+        for name in self.parameters:
+            value = getattr(self, f"_{name}", None)
+            if value is not None:
+                parameters[name] = value
+        return {"name": self.name, "parameters": parameters}
+
     def apply_to_prompt(self, prompt: str) -> str:
         """Apply the decorator to a prompt.
 
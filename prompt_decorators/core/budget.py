@@ -0,0 +1,254 @@
+"""Fitting decorated prompts to a token budget.
+
+Decoration adds instructions to a prompt, and a long prompt with several
+decorators can exceed the target model's context window. The size of a
+decorated prompt is known before it is rendered: every compiled instruction
+carries a precomputed token estimate (see
+:meth:`~prompt_decorators.core.render.RenderPlan.estimate_tokens`), so
+:meth:`~prompt_decorators.core.render.ChainPlan.estimate_tokens` only adds
+numbers.
+
+:func:`fit_chain` enforces a budget on a compiled chain. Decorators later in the
+chain have lower priority. Their instructions are removed first, working
+backwards from the last one. Where removing a whole instruction would free more
+than needed, it is cut to its leading sentences instead. If the prompt alone
+still exceeds the budget, it is cut at the end, on a section (blank line)
+boundary where possible. The :class:`BudgetReport` records the estimated size
+and what was removed.
+"""
+
+import logging
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+from prompt_decorators.core.composition import split_sentences
+from prompt_decorators.core.render import ChainPlan, ChainStep
+from prompt_decorators.utils.tokens import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Section separator preferred as the end of a truncated prompt
+SECTION_SEPARATOR = "\n\n"
+
+
+class BudgetReport:
+    """Estimated size of a decorated prompt and what fitting it removed."""
+
+    __slots__ = (
+        "budget",
+        "prompt_tokens",
+        "original_tokens",
+        "estimated_tokens",
+        "dropped",
+        "truncated",
+        "prompt_truncated",
+    )
+
+    def __init__(self, budget: Optional[int] = None) -> None:
+        """Initialize an empty report.
+
+        Args:
+            self: The report instance
+            budget: Maximum number of tokens, or None for no limit
+
+        Returns:
+            None
+        """
+        self.budget = budget
+        # Estimated tokens of the prompt as given
+        self.prompt_tokens = 0
+        # Estimated tokens of the decorated prompt before and after fitting
+        self.original_tokens = 0
+        self.estimated_tokens = 0
+        # Names of decorators whose instructions were removed or shortened
+        self.dropped: List[str] = []
+        self.truncated: List[str] = []
+        # Estimated tokens cut from the end of the prompt
+        self.prompt_truncated = 0
+
+    @property
+    def fits(self) -> bool:
+        """Check whether the decorated prompt fits the budget.
+
+        Args:
+            self: The report instance
+
+        Returns:
+            True if there is no budget or the estimate is within it
+        """
+        return self.budget is None or self.estimated_tokens <= self.budget
+
+    def __repr__(self) -> str:
+        """Return a string representation of the report.
+
+        Args:
+            self: The report instance
+
+        Returns:
+            The report as a string
+        """
+        return (
+            f"BudgetReport(budget={self.budget}, "
+            f"estimated_tokens={self.estimated_tokens}, "
+            f"original_tokens={self.original_tokens}, dropped={self.dropped!r}, "
+            f"truncated={self.truncated!r}, "
+            f"prompt_truncated={self.prompt_truncated})"
+        )
+
+
+def _rebuild(
+    chain: ChainPlan, steps: Sequence[Union[ChainStep, Callable[[str], str]]]
+) -> ChainPlan:
+    """Build a chain from a subset of another chain's steps.
+
+    Args:
+        chain: The original chain
+        steps: The steps to keep, in chain order
+
+    Returns:
+        The new chain, sharing the original's composition report
+    """
+    fitted = ChainPlan()
+    fitted.report = chain.report
+    for step in steps:
+        if callable(step):
+            fitted.add_transform(step)
+        else:
+            fitted.add(*step)
+    return fitted
+
+
+def _shorten(
+    chain: ChainPlan,
+    steps: List[Union[ChainStep, Callable[[str], str]]],
+    index: int,
+    text: str,
+    text_tokens: int,
+    budget: int,
+) -> Optional[Tuple[ChainPlan, int]]:
+    """Cut an instruction to the most leading sentences that fit the budget.
+
+    Args:
+        chain: The original chain
+        steps: The steps of the chain being fitted
+        index: Position of the instruction in the steps
+        text: The prompt text
+        text_tokens: Token estimate of the prompt text
+        budget: Maximum number of tokens
+
+    Returns:
+        Tuple of (fitted chain, its estimate), or None if no sentence fits
+    """
+    step = steps[index]
+    assert not callable(step)
+    sentences = split_sentences(step.instruction)
+    for count in range(len(sentences) - 1, 0, -1):
+        instruction = "".join(s + sep for s, sep in sentences[:count]).rstrip()
+        steps[index] = step._replace(
+            instruction=instruction, tokens=estimate_tokens(instruction)
+        )
+        fitted = _rebuild(chain, steps)
+        estimate = fitted.estimate_tokens(text, text_tokens)
+        if estimate <= budget:
+            return fitted, estimate
+    steps[index] = step
+    return None
+
+
+def truncate_text(text: str, tokens: int) -> str:
+    """Cut a text to the leading part that fits in a number of tokens.
+
+    The cut is moved back to the last section boundary when one is in the
+    final quarter of what fits.
+
+    Args:
+        text: The text to cut
+        tokens: Maximum number of tokens to keep
+
+    Returns:
+        The leading part of the text
+    """
+    total = estimate_tokens(text)
+    if total <= tokens:
+        return text
+    if tokens <= 0:
+        return ""
+    end = len(text) * tokens // total
+    while end > 0 and estimate_tokens(text[:end]) > tokens:
+        end -= max(1, end // 10)
+    section = text.rfind(SECTION_SEPARATOR, end - end // 4, end)
+    if section > 0:
+        end = section
+    return text[:end]
+
+
+def fit_chain(
+    chain: ChainPlan, text: str, budget: Optional[int] = None
+) -> Tuple[ChainPlan, str]:
+    """Fit a decorated prompt to a token budget.
+
+    Nothing is rendered; sizes come from the chain's precomputed estimates. The
+    returned chain's ``budget`` holds the report, including the estimate when
+    no budget is given.
+
+    Args:
+        chain: The compiled decorator chain
+        text: The prompt text
+        budget: Maximum number of tokens, or None to only estimate the size
+
+    Returns:
+        Tuple of (chain to apply, prompt text to apply it to)
+    """
+    report = BudgetReport(budget)
+    report.prompt_tokens = estimate_tokens(text)
+    report.original_tokens = chain.estimate_tokens(text, report.prompt_tokens)
+    report.estimated_tokens = report.original_tokens
+    if report.fits:
+        chain.budget = report
+        return chain, text
+    assert budget is not None
+
+    steps = list(chain.steps)
+    fitted = chain
+    for index in reversed(range(len(steps))):
+        step = steps[index]
+        if callable(step) or step.placement == "replace":
+            continue
+        trial = steps[:index] + steps[index + 1 :]
+        candidate = _rebuild(chain, trial)
+        estimate = candidate.estimate_tokens(text, report.prompt_tokens)
+        if estimate >= report.estimated_tokens:
+            # A later replace instruction discards this one anyway
+            continue
+        if estimate < budget:
+            shortened = _shorten(
+                chain, steps, index, text, report.prompt_tokens, budget
+            )
+            if shortened is not None:
+                fitted, report.estimated_tokens = shortened
+                report.truncated.append(step.key)
+                break
+        steps = trial
+        fitted = candidate
+        report.estimated_tokens = estimate
+        report.dropped.append(step.key)
+        if estimate <= budget:
+            break
+
+    if not report.fits:
+        overhead = report.estimated_tokens - report.prompt_tokens
+        shortened_text = truncate_text(text, budget - overhead)
+        estimate = fitted.estimate_tokens(shortened_text)
+        if estimate < report.estimated_tokens:
+            report.prompt_truncated = report.prompt_tokens - estimate_tokens(
+                shortened_text
+            )
+            report.estimated_tokens = estimate
+            text = shortened_text
+            logger.warning(
+                f"Prompt cut by about {report.prompt_truncated} tokens to fit "
+                f"a budget of {budget}"
+            )
+
+    fitted.budget = report
+    logger.debug(f"Fitted decorator chain to budget: {report}")
+    return fitted, text
@@ -0,0 +1,187 @@
+"""Composition of decorator instructions within a chain.
+
+Every registry template declares a ``compositionBehavior`` for when it is
+combined with other decorators:
+
+``accumulate``
+    The instruction is added to those of earlier decorators.
+``override``
+    The instruction replaces those of earlier decorators in the same category.
+``selective-override``
+    The instruction replaces earlier instructions of the same decorator only.
+
+Decorators in the default ``General`` category, which is every decorator that
+does not declare a category, are not grouped with each other; for them
+``override`` only replaces earlier instructions of the same decorator.
+
+Whatever the behaviour, an instruction also replaces those of earlier
+decorators it conflicts with, and sentences that an earlier instruction in the
+chain already gives are dropped, so overlapping decorators do not repeat
+themselves. :func:`compose_instructions` applies these rules to a run of
+rendered instructions and reports the tokens saved.
+"""
+
+import re
+from typing import Callable, Iterable, List, NamedTuple, Set, Tuple
+
+from prompt_decorators.utils.tokens import estimate_tokens
+
+COMPOSITION_BEHAVIORS = ("accumulate", "override", "selective-override")
+
+# Category of decorators that do not declare one
+DEFAULT_CATEGORY = "General"
+
+_SENTENCE_PATTERN = re.compile(r"(?<=[.!?])(\s+)")
+
+
+class InstructionBlock(NamedTuple):
+    """A rendered decorator instruction with what composition needs to know."""
+
+    name: str
+    category: str
+    behavior: str
+    placement: str
+    instruction: str
+
+
+class CompositionReport:
+    """What composing a chain removed, and the tokens that saved."""
+
+    __slots__ = ("original_tokens", "composed_tokens", "dropped")
+
+    def __init__(self) -> None:
+        """Initialize an empty report.
+
+        Args:
+            self: The report instance
+
+        Returns:
+            None
+        """
+        self.original_tokens = 0
+        self.composed_tokens = 0
+        # (decorator name, reason) for each instruction removed entirely
+        self.dropped: List[Tuple[str, str]] = []
+
+    @property
+    def saved_tokens(self) -> int:
+        """Get the estimated number of instruction tokens saved.
+
+        Args:
+            self: The report instance
+
+        Returns:
+            The difference between the original and composed estimates
+        """
+        return self.original_tokens - self.composed_tokens
+
+    def __repr__(self) -> str:
+        """Return a string representation of the report.
+
+        Args:
+            self: The report instance
+
+        Returns:
+            The report as a string
+        """
+        return (
+            f"CompositionReport(original_tokens={self.original_tokens}, "
+            f"composed_tokens={self.composed_tokens}, dropped={self.dropped!r})"
+        )
+
+
+def split_sentences(text: str) -> List[Tuple[str, str]]:
+    """Split a text into sentences, keeping the whitespace after each one.
+
+    Joining the pairs back gives the original text, so a selection of them keeps
+    its line breaks and list layout.
+
+    Args:
+        text: The text to split
+
+    Returns:
+        List of (sentence, following whitespace) pairs
+    """
+    # Alternating sentences and the whitespace that follows each of them
+    parts = _SENTENCE_PATTERN.split(text) + [""]
+    return [
+        (sentence, separator)
+        for sentence, separator in zip(parts[::2], parts[1::2])
+        if sentence
+    ]
+
+
+def _normalize(sentence: str) -> str:
+    """Normalize a sentence for duplicate detection.
+
+    Args:
+        sentence: The sentence
+
+    Returns:
+        The sentence in lower case with whitespace collapsed
+    """
+    return " ".join(sentence.lower().split())
+
+
+def compose_instructions(
+    blocks: Iterable[InstructionBlock],
+    conflicts_of: Callable[[str], Iterable[str]],
+    report: CompositionReport,
+) -> List[InstructionBlock]:
+    """Apply composition behaviours to a run of instructions.
+
+    Args:
+        blocks: The instructions in chain order, with no custom transform between
+        conflicts_of: Function returning the decorators a decorator conflicts with
+        report: Report updated with the original and composed sizes
+
+    Returns:
+        The instructions to render, in chain order
+    """
+    kept: List[InstructionBlock] = []
+    original: List[InstructionBlock] = []
+    for block in blocks:
+        if block.placement == "replace":
+            # Everything before a replace is discarded anyway
+            kept = []
+            original = []
+        original.append(block)
+
+        conflicts = set(conflicts_of(block.name))
+        remaining = []
+        for earlier in kept:
+            if earlier.name == block.name and block.behavior != "accumulate":
+                report.dropped.append((earlier.name, f"overridden by {block.name}"))
+            elif (
+                block.behavior == "override"
+                and block.category != DEFAULT_CATEGORY
+                and earlier.category == block.category
+            ):
+                report.dropped.append((earlier.name, f"overridden by {block.name}"))
+            elif earlier.name in conflicts:
+                report.dropped.append((earlier.name, f"conflicts with {block.name}"))
+            else:
+                remaining.append(earlier)
+        remaining.append(block)
+        kept = remaining
+
+    composed: List[InstructionBlock] = []
+    seen: Set[str] = set()
+    for block in kept:
+        sentences = split_sentences(block.instruction)
+        unique = []
+        for sentence, separator in sentences:
+            key = _normalize(sentence)
+            if key not in seen:
+                seen.add(key)
+                unique.append(sentence + separator)
+        if not unique:
+            report.dropped.append((block.name, "duplicate"))
+            continue
+        if len(unique) < len(sentences):
+            block = block._replace(instruction="".join(unique).rstrip())
+        composed.append(block)
+
+    report.original_tokens += sum(estimate_tokens(b.instruction) for b in original)
+    report.composed_tokens += sum(estimate_tokens(b.instruction) for b in composed)
+    return composed
@@ -17,6 +17,7 @@ import logging
 import math
 import os
 import re
+import threading
 from importlib import resources
 from pathlib import Path
 from typing import (
@@ -24,16 +25,22 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
+    Literal,
+    Mapping,
     Optional,
     Tuple,
     Union,
     cast,
+    overload,
 )
 
 if TYPE_CHECKING:
     from typing import Iterator, Protocol
 
+    from prompt_decorators.utils.compatibility import CompatibilityIndex
+
     class HasGlob(Protocol):
         """Protocol for objects that support the glob method."""
 
@@ -86,10 +93,35 @@ if TYPE_CHECKING:
             ...
 
 
+from prompt_decorators.core.budget import BudgetReport, fit_chain
+from prompt_decorators.core.composition import (
+    DEFAULT_CATEGORY,
+    CompositionReport,
+    InstructionBlock,
+    compose_instructions,
+)
+from prompt_decorators.core.records import DecoratorRecord, RegistrySnapshot
+from prompt_decorators.core.render import (
+    ChainPlan,
+    DecoratedPrompt,
+    ModelTarget,
+    PromptParts,
+    RenderPlan,
+    compile_model_variants,
+    compile_render_plan,
+    resolve_model_target,
+)
+from prompt_decorators.core.versions import (
+    VersionedDefinitions,
+    VersionIndex,
+    VersionKey,
+)
 from prompt_decorators.schemas.decorator_schema import DecoratorSchema, ParameterSchema
+from prompt_decorators.utils.json_backend import load_json_files
 
 # Constants
 DEFAULT_REGISTRY_DIR = "registry"
+REGISTRY_SUBDIRS = ("core", "extensions", "simplified_decorators")
 REGISTRY_ENV_VAR = "DECORATOR_REGISTRY_DIR"
 DECORATOR_PREFIX = "+++"
 PARAMETER_PATTERN = r'([a-zA-Z0-9_]+)=("(?:[^"\\]|\\.)*"|[^,)]+)'
@@ -254,6 +286,35 @@ class DecoratorParameter:
                     f"Parameter '{self.name}' must be at most {self.validation['maximum']}"
                 )
 
+    @classmethod
+    def from_validated(
+        cls,
+        name: str,
+        value: Any,
+        param_type: str,
+        validation: Optional[Dict[str, Any]] = None,
+        enum_values: Optional[List[str]] = None,
+    ) -> "DecoratorParameter":
+        """Create a parameter whose value has already been validated.
+
+        Args:
+            name: Name of the parameter
+            value: Value of the parameter, already checked by a validation plan
+            param_type: Type of the parameter (string, number, boolean, array, enum)
+            validation: Optional validation rules
+            enum_values: Optional list of allowed enum values
+
+        Returns:
+            The parameter, without re-running validation
+        """
+        parameter = cls.__new__(cls)
+        parameter.name = name
+        parameter.value = value
+        parameter.type = param_type
+        parameter.validation = validation or {}
+        parameter.enum_values = enum_values or []
+        return parameter
+
     def __str__(self) -> str:
         """Return a string representation of the parameter."""
         if isinstance(self.value, str):
@@ -261,6 +322,334 @@ class DecoratorParameter:
         return f"{self.name}={self.value}"
 
 
+def _strictest(pick: Callable[..., Any], param_def: Dict[str, Any], *keys: str) -> Any:
+    """Combine a bound declared under several spellings into the strictest one.
+
+    Bounds are read from both the parameter definition and its ``validation``
+    block, so ``min_length``/``minLength`` and ``min_value``/``minimum`` style
+    keys are all honoured.
+
+    Args:
+        pick: ``max`` for lower bounds, ``min`` for upper bounds
+        param_def: Parameter definition
+        *keys: Key spellings of the bound
+
+    Returns:
+        The strictest declared bound, or None if none is declared
+    """
+    validation = param_def.get("validation") or {}
+    values = [
+        source[key]
+        for source in (param_def, validation)
+        for key in keys
+        if source.get(key) is not None
+    ]
+    return pick(values) if values else None
+
+
+def value_bounds(param_def: Mapping[str, Any]) -> Tuple[Any, Any]:
+    """Get the bounds a number parameter's value must lie within.
+
+    Args:
+        param_def: Parameter definition
+
+    Returns:
+        Tuple of (minimum, maximum); either is None if not declared
+    """
+    definition = dict(param_def)
+    return (
+        _strictest(max, definition, "min_value", "minimum"),
+        _strictest(min, definition, "max_value", "maximum"),
+    )
+
+
+def _compile_parameter_checker(
+    name: str, param_def: Dict[str, Any]
+) -> Callable[[Any], None]:
+    """Compile the validation rules of one parameter into a checker closure.
+
+    Args:
+        name: Parameter name
+        param_def: Parameter definition
+
+    Returns:
+        A function raising ValueError if a value is invalid
+    """
+    param_type = param_def.get("type", "string")
+    required = bool(param_def.get("required", False))
+
+    def type_error(value: Any, expected: str) -> ValueError:
+        """Build the type mismatch error for a value.
+
+        Args:
+            value: The offending value
+            expected: The expected type name
+
+        Returns:
+            The error to raise
+        """
+        if value is None and not required:
+            return ValueError(f"Parameter '{name}' must be {expected}")
+        return ValueError(
+            f"Parameter '{name}' must be {expected}, got {type(value).__name__}"
+        )
+
+    if param_type == "string":
+        min_length = _strictest(max, param_def, "min_length", "minLength")
+        max_length = _strictest(min, param_def, "max_length", "maxLength")
+        validation = param_def.get("validation") or {}
+        raw_pattern = validation.get("pattern", param_def.get("pattern"))
+        pattern = re.compile(raw_pattern) if raw_pattern else None
+
+        def check_string(value: Any) -> None:
+            """Check a string parameter value.
+
+            Args:
+                value: The value to check
+
+            Returns:
+                None
+
+            Raises:
+                ValueError: If the value is invalid
+            """
+            if not isinstance(value, str):
+                raise type_error(value, "a string")
+            if min_length is not None and len(value) < min_length:
+                raise ValueError(
+                    f"Parameter '{name}' must be at least {min_length} characters long"
+                )
+            if max_length is not None and len(value) > max_length:
+                raise ValueError(
+                    f"Parameter '{name}' must be at most {max_length} characters long"
+                )
+            if pattern is not None and not pattern.match(value):
+                raise ValueError(f"Parameter '{name}' doesn't match required pattern")
+
+        return check_string
+
+    if param_type == "number":
+        minimum, maximum = value_bounds(param_def)
+
+        def check_number(value: Any) -> None:
+            """Check a number parameter value.
+
+            Args:
+                value: The value to check
+
+            Returns:
+                None
+
+            Raises:
+                ValueError: If the value is invalid
+            """
+            if not isinstance(value, (int, float)):
+                raise type_error(value, "a number")
+            if minimum is not None and value < minimum:
+                raise ValueError(f"Parameter '{name}' must be at least {minimum}")
+            if maximum is not None and value > maximum:
+                raise ValueError(f"Parameter '{name}' must be at most {maximum}")
+
+        return check_number
+
+    if param_type == "boolean":
+
+        def check_boolean(value: Any) -> None:
+            """Check a boolean parameter value.
+
+            Args:
+                value: The value to check
+
+            Returns:
+                None
+
+            Raises:
+                ValueError: If the value is invalid
+            """
+            if not isinstance(value, bool):
+                raise type_error(value, "a boolean")
+
+        return check_boolean
+
+    if param_type == "array":
+
+        def check_array(value: Any) -> None:
+            """Check an array parameter value.
+
+            Args:
+                value: The value to check
+
+            Returns:
+                None
+
+            Raises:
+                ValueError: If the value is invalid
+            """
+            if not isinstance(value, list):
+                raise ValueError(f"Parameter '{name}' must be an array")
+
+        return check_array
+
+    if param_type == "enum":
+        enum_values = list(param_def.get("enum_values") or param_def.get("enum") or [])
+        allowed = frozenset(enum_values)
+        if not enum_values:
+            logger.warning(f"No enum values defined for parameter '{name}'")
+
+        def check_enum(value: Any) -> None:
+            """Check an enum parameter value.
+
+            Args:
+                value: The value to check
+
+            Returns:
+                None
+
+            Raises:
+                ValueError: If the value is invalid
+            """
+            if value is None and not required:
+                choices = ", ".join(f"'{v}'" for v in enum_values)
+                raise ValueError(f"Parameter '{name}' must be one of: {choices}")
+            if not isinstance(value, str):
+                raise type_error(value, "a string")
+            if value not in allowed:
+                if not enum_values:
+                    raise ValueError(f"Parameter '{name}' must be one of: ")
+                raise ValueError(
+                    f"Parameter '{name}' must be one of {enum_values}, got '{value}'"
+                )
+
+        return check_enum
+
+    # Unknown type, skip validation
+    return lambda value: None
+
+
+class _ParameterSlot:
+    """Compiled validation state for one parameter."""
+
+    __slots__ = ("name", "type", "validation", "enum_values", "check")
+
+    def __init__(self, name: str, param_def: Dict[str, Any]) -> None:
+        """Compile a parameter definition.
+
+        Args:
+            name: Parameter name
+            param_def: Parameter definition
+
+        Returns:
+            None
+        """
+        self.name = name
+        self.type: str = param_def.get("type", "string")
+        self.validation: Dict[str, Any] = param_def.get("validation") or {}
+        self.enum_values: List[str] = param_def.get("enum_values") or []
+        self.check = _compile_parameter_checker(name, param_def)
+
+
+class ValidationPlan:
+    """Parameter validation for one decorator definition, compiled once.
+
+    The plan holds the parameter slots in definition order, the required
+    parameter names, one checker closure per parameter (with bounds merged
+    across key spellings and patterns precompiled) and the default values,
+    already validated. Each bound decorator gets its own parameter objects.
+    """
+
+    __slots__ = ("slots", "required", "defaults", "default_errors")
+
+    def __init__(self, param_defs: List[Dict[str, Any]]) -> None:
+        """Compile the parameter definitions of a decorator.
+
+        Args:
+            param_defs: The ``parameters`` list of a decorator definition
+
+        Returns:
+            None
+        """
+        self.slots: Dict[str, _ParameterSlot] = {}
+        required: List[str] = []
+        defaults: List[Tuple[str, _ParameterSlot, Any]] = []
+        self.default_errors: Dict[str, ValueError] = {}
+
+        for param_def in param_defs:
+            name = param_def["name"]
+            slot = _ParameterSlot(name, param_def)
+            self.slots[name] = slot
+            if param_def.get("required", False):
+                required.append(name)
+            if "default" in param_def:
+                default = param_def["default"]
+                try:
+                    slot.check(default)
+                except ValueError as e:
+                    # Only an error if the default is actually used
+                    self.default_errors[name] = e
+                    continue
+                defaults.append((name, slot, default))
+
+        self.required: Tuple[str, ...] = tuple(required)
+        self.defaults: Tuple[Tuple[str, _ParameterSlot, Any], ...] = tuple(defaults)
+
+    def bind(self, params: Dict[str, Any]) -> Dict[str, DecoratorParameter]:
+        """Validate parameter values and merge in the defaults.
+
+        Args:
+            params: Parameter values provided by the caller
+
+        Returns:
+            Validated parameters, provided ones first, then defaults
+
+        Raises:
+            ValueError: If a required parameter is missing or a value is invalid
+        """
+        for name in self.required:
+            if name not in params:
+                raise ValueError(f"Required parameter '{name}' is missing")
+
+        slots = self.slots
+        bound: Dict[str, DecoratorParameter] = {}
+        for name, value in params.items():
+            slot = slots.get(name)
+            if slot is None:
+                raise ValueError(f"Unknown parameter '{name}'")
+            slot.check(value)
+            bound[name] = DecoratorParameter.from_validated(
+                name, value, slot.type, slot.validation, slot.enum_values
+            )
+
+        if self.default_errors:
+            for name, error in self.default_errors.items():
+                if name not in params:
+                    raise error
+        for name, slot, value in self.defaults:
+            if name not in bound:
+                bound[name] = DecoratorParameter.from_validated(
+                    name, value, slot.type, slot.validation, slot.enum_values
+                )
+        return bound
+
+
+class _CurrentDefinitions:
+    """Class attribute reading the definitions of the current registry snapshot."""
+
+    def __get__(
+        self, instance: Any, owner: Optional[type] = None
+    ) -> Mapping[str, Mapping[str, Any]]:
+        """Get the read-only definitions of the published snapshot.
+
+        Args:
+            self: The descriptor instance
+            instance: The decorator instance, or None for class access
+            owner: The class the attribute is read from
+
+        Returns:
+            The current definitions by decorator name
+        """
+        return DynamicDecorator._snapshot.definitions
+
+
 class DynamicDecorator:
     """Dynamic decorator class for prompt transformations.
 
@@ -270,34 +659,75 @@ class DynamicDecorator:
     from the JSON files in the registry.
     """
 
-    # Class-level registry of decorator definitions
-    _registry: Dict[str, Dict[str, Any]] = {}
+    # Current registry generation. Writers never modify a published snapshot;
+    # they build the next generation and swap it in with one assignment.
+    _snapshot = RegistrySnapshot({})
+    # Read-only view of the current snapshot's definitions
+    _registry = _CurrentDefinitions()
+    _write_lock = threading.RLock()
     _loaded = False
+    # Compiled compatibility index keyed by (registry generation, size)
+    _compatibility_index: Optional[Tuple[Tuple[int, int], "CompatibilityIndex"]] = None
+    # Version index keyed by (registry generation, size)
+    _version_index: Optional[Tuple[Tuple[int, int], VersionIndex]] = None
+    # Validation plans per decorator: (definition, plan)
+    _validation_plans: Dict[str, Tuple[Mapping[str, Any], ValidationPlan]] = {}
+    # Render plans per decorator: (definition, base plan, model-specific plans)
+    _render_plans: Dict[
+        str, Tuple[Mapping[str, Any], Optional[RenderPlan], Dict[str, RenderPlan]]
+    ] = {}
 
-    def __init__(self, name: str, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        name: str,
+        target_model: Union[str, ModelTarget, None] = None,
+        **kwargs: Any,
+    ) -> None:
         """Initialize a dynamic decorator.
 
+        A version request can follow the name, as in ``StepByStep:v1.0.0``,
+        ``StepByStep:1.2`` or ``StepByStep:^1.0``; without one the decorator's
+        default (highest) version is used.
+
         Args:
-            name: Name of the decorator to load
+            name: Name of the decorator to load, optionally with a version request
+            target_model: Optional model id, family or resolved target to tailor for
             **kwargs: Parameters for the decorator
 
         Raises:
-            ValueError: If the decorator is not found in the registry
+            ValueError: If the decorator or requested version is not in the registry
 
         Returns:
             None
         """
         # Load the registry if not already loaded
-        if not DynamicDecorator._loaded:
-            DynamicDecorator.load_registry()
+        DynamicDecorator._ensure_loaded()
 
         # Get the decorator definition from the registry
-        if name not in DynamicDecorator._registry:
+        name, _, spec = name.partition(":")
+        definition = DynamicDecorator._registry.get(name)
+        if definition is None:
             raise ValueError(f"Decorator '{name}' not found in registry")
+        self._plan_key = name
+        # The version request as given, kept so serialized decorators stay pinned
+        self._version_spec: Optional[str] = spec or None
+        if spec:
+            resolved = DynamicDecorator.resolve_definition(name, spec)
+            if resolved is None:
+                raise ValueError(f"Decorator '{name}' has no version matching '{spec}'")
+            if resolved is not definition:
+                # Plans for other versions are cached next to the default's
+                definition = resolved
+                self._plan_key = f"{name}:v{definition.get('version')}"
 
         self.name = name
-        self.definition = DynamicDecorator._registry[name]
+        self.definition = definition
         self.parameters: Dict[str, DecoratorParameter] = {}
+        self.target_model: Optional[ModelTarget] = (
+            resolve_model_target(target_model)
+            if isinstance(target_model, str)
+            else target_model
+        )
 
         # Set up parameters
         self._validate_parameters(kwargs)
@@ -314,49 +744,8 @@ class DynamicDecorator:
         Returns:
             None
         """
-        # Get parameter definitions from the registry
-        param_defs = self.definition.get("parameters", [])
-
-        # Create a dictionary of parameter definitions by name
-        param_dict = {p["name"]: p for p in param_defs}
-
-        # Check for required parameters
-        for param_name, param_def in param_dict.items():
-            if param_def.get("required", False) and param_name not in params:
-                raise ValueError(f"Required parameter '{param_name}' is missing")
-
-        # Process provided parameters
-        for param_name, param_value in params.items():
-            if param_name not in param_dict:
-                raise ValueError(f"Unknown parameter '{param_name}'")
-
-            param_def = param_dict[param_name]
-            param_type = param_def.get("type", "string")
-
-            # Validate parameter value
-            self._validate_parameter_value(param_name, param_value, param_def)
-
-            # Store the parameter
-            self.parameters[param_name] = DecoratorParameter(
-                name=param_name,
-                value=param_value,
-                param_type=param_type,
-                validation=param_def.get("validation", {}),
-                enum_values=param_def.get("enum_values", []),
-            )
-
-        # Set default values for missing parameters
-        for param_name, param_def in param_dict.items():
-            if param_name not in params and "default" in param_def:
-                default_value = param_def["default"]
-                param_type = param_def.get("type", "string")
-                self.parameters[param_name] = DecoratorParameter(
-                    name=param_name,
-                    value=default_value,
-                    param_type=param_type,
-                    validation=param_def.get("validation", {}),
-                    enum_values=param_def.get("enum_values", []),
-                )
+        plan = DynamicDecorator._get_validation_plan(self._plan_key, self.definition)
+        self.parameters = plan.bind(params)
 
     def _validate_parameter_value(
         self, name: str, value: Any, param_def: Dict[str, Any]
@@ -374,62 +763,26 @@ class DynamicDecorator:
         Returns:
             None
         """
-        param_type = param_def.get("type", "string")
+        _compile_parameter_checker(name, param_def)(value)
 
-        # Skip validation for None values if the parameter is not required
-        if value is None and not param_def.get("required", False):
-            return
+    @classmethod
+    def _get_validation_plan(
+        cls, name: str, definition: Mapping[str, Any]
+    ) -> ValidationPlan:
+        """Get the compiled validation plan for a decorator definition.
 
-        # Validate based on type
-        if param_type == "string":
-            if not isinstance(value, str):
-                raise ValueError(
-                    f"Parameter '{name}' must be a string, got {type(value).__name__}"
-                )
-            min_length = param_def.get("min_length")
-            max_length = param_def.get("max_length")
-            if min_length is not None and len(value) < min_length:
-                raise ValueError(
-                    f"Parameter '{name}' must be at least {min_length} characters long"
-                )
-            if max_length is not None and len(value) > max_length:
-                raise ValueError(
-                    f"Parameter '{name}' must be at most {max_length} characters long"
-                )
-        elif param_type == "number":
-            if not isinstance(value, (int, float)):
-                raise ValueError(
-                    f"Parameter '{name}' must be a number, got {type(value).__name__}"
-                )
-            min_value = param_def.get("min_value")
-            max_value = param_def.get("max_value")
-            if min_value is not None and value < min_value:
-                raise ValueError(f"Parameter '{name}' must be at least {min_value}")
-            if max_value is not None and value > max_value:
-                raise ValueError(f"Parameter '{name}' must be at most {max_value}")
-        elif param_type == "boolean":
-            if not isinstance(value, bool):
-                raise ValueError(
-                    f"Parameter '{name}' must be a boolean, got {type(value).__name__}"
-                )
-        elif param_type == "enum":
-            if not isinstance(value, str):
-                raise ValueError(
-                    f"Parameter '{name}' must be a string, got {type(value).__name__}"
-                )
-            # Check for enum values in either 'enum_values' or 'enum' field
-            enum_values = param_def.get("enum_values", param_def.get("enum", []))
-            if not enum_values:
-                # Instead of raising an error, log a warning and continue
-                logger.warning(f"No enum values defined for parameter '{name}'")
-                return
-            if value not in enum_values:
-                raise ValueError(
-                    f"Parameter '{name}' must be one of {enum_values}, got '{value}'"
-                )
-        else:
-            # Unknown type, skip validation
-            pass
+        Args:
+            name: Name of the decorator
+            definition: The decorator definition the plan must belong to
+
+        Returns:
+            The validation plan
+        """
+        entry = cls._validation_plans.get(name)
+        if entry is None or entry[0] is not definition:
+            entry = (definition, ValidationPlan(definition.get("parameters", [])))
+            cls._validation_plans[name] = entry
+        return entry[1]
 
     def __call__(self, text_or_func: Union[str, Callable]) -> Union[str, Callable]:
         """Apply the decorator to a text or function.
@@ -475,6 +828,15 @@ class DynamicDecorator:
         Returns:
             Transformed text
         """
+        plan = self.get_render_plan()
+        if plan is not None:
+            try:
+                params = {k: v.value for k, v in self.parameters.items()}
+                return plan.apply(text, params)
+            except Exception as e:
+                logger.error(f"Error applying decorator '{self.name}': {e}")
+                return text
+
         # Get the transform function from the definition
         transform_function = self.definition.get("transform_function", "")
         if not transform_function:
@@ -532,76 +894,251 @@ class DynamicDecorator:
             logger.error(f"Error applying decorator '{self.name}': {e}")
             return text
 
-    def __str__(self) -> str:
-        """Return a string representation of the decorator."""
-        params_str = ", ".join(str(p) for p in self.parameters.values())
-        return f"{self.name}({params_str})"
-
-    @classmethod
-    def load_registry(cls) -> None:
-        """Load decorator definitions from the registry directory.
+    def apply_to_prompt(self, prompt: str) -> str:
+        """Apply the decorator to a prompt.
 
-        This method implements a comprehensive three-tier loading strategy:
-        1. Package resources loading (preferred)
-        2. Auto-repair if package registry is empty
-        3. Enhanced filesystem fallback
+        This is the :class:`~prompt_decorators.core.base.DecoratorBase`
+        interface for :meth:`apply`.
 
         Args:
-            cls: The class object
+            prompt: The prompt to decorate
 
         Returns:
-            None
+            The decorated prompt
         """
-        # Clear the registry
-        cls._registry.clear()
-
-        # First try to load from package resources
-        loaded_from_package = cls._load_from_package_resources()
-
-        # If nothing was loaded from package resources, try auto-repair
-        if not loaded_from_package:
-            logger.debug("Package registry empty, attempting auto-repair...")
-            try:
-                # Import registry validator for auto-repair
-                from prompt_decorators.utils.registry_validator import RegistryValidator
+        return self.apply(prompt)
 
-                # Attempt auto-repair
-                success, message = RegistryValidator.auto_repair_registry()
-                if success:
-                    logger.info(f"Registry auto-repair successful: {message}")
-                    # Retry loading from package resources after repair
-                    loaded_from_package = cls._load_from_package_resources()
-                else:
-                    logger.warning(f"Registry auto-repair failed: {message}")
-            except ImportError:
-                logger.debug("Registry validator not available for auto-repair")
-            except Exception as e:
-                logger.warning(f"Auto-repair attempt failed: {e}")
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the decorator to a dictionary representation.
 
-        # If still nothing loaded, fall back to filesystem
-        if not loaded_from_package:
-            logger.debug("Falling back to filesystem loading...")
-            cls._load_from_filesystem()
+        Args:
+            self: The decorator instance
 
-        cls._loaded = True
-        decorator_count = len(cls._registry)
-        logger.info(f"Loaded {decorator_count} decorators from registry")
+        Returns:
+            Dictionary with the decorator name and parameter values, and the
+            version request when one was given
+        """
+        result: Dict[str, Any] = {
+            "name": self.name,
+            "parameters": {k: v.value for k, v in self.parameters.items()},
+        }
+        if self._version_spec:
+            result["version"] = self._version_spec
+        return result
 
-        # Log loading strategy used for debugging
-        if decorator_count > 0:
-            if loaded_from_package:
-                logger.debug("Successfully loaded decorators from package resources")
-            else:
-                logger.debug("Successfully loaded decorators from filesystem fallback")
-        else:
-            logger.warning("No decorators loaded - registry may be missing or empty")
+    def transform_response(self, response: str) -> str:
+        """Apply the decorator's response transform to a complete response.
 
-    @classmethod
-    def _load_from_package_resources(cls) -> bool:
-        """Load decorator definitions from package resources.
+        Response transforms are registered with
+        :func:`prompt_decorators.core.streaming.register_response_transform`;
+        decorators without one leave responses unchanged.
 
         Args:
-            cls: The class object
+            response: The LLM response to transform
+
+        Returns:
+            The transformed response
+        """
+        from prompt_decorators.core.streaming import get_response_transform
+
+        transform = get_response_transform(self)
+        if transform is None:
+            return response
+        return transform.feed(response) + transform.flush()
+
+    def get_render_plan(self) -> Optional[RenderPlan]:
+        """Get the render plan for this decorator and its target model.
+
+        Args:
+            self: The decorator instance
+
+        Returns:
+            The model-specific plan if the target model has a variant, otherwise
+            the base plan, or None if the decorator uses a custom transform
+            function
+        """
+        _, plan, variants = DynamicDecorator._get_render_plans(
+            self._plan_key, self.definition
+        )
+        if self.target_model is not None and variants:
+            for key in self.target_model.keys:
+                if key in variants:
+                    return variants[key]
+        return plan
+
+    def estimate_tokens(self) -> int:
+        """Estimate the tokens this decorator's instruction adds to a prompt.
+
+        Args:
+            self: The decorator instance
+
+        Returns:
+            The estimate precomputed for its render plan, or 0 if the decorator
+            uses a custom transform function, whose output depends on the text
+        """
+        plan = self.get_render_plan()
+        if plan is None:
+            return 0
+        return plan.estimate_tokens({k: v.value for k, v in self.parameters.items()})
+
+    @classmethod
+    def _get_render_plans(
+        cls, name: str, definition: Mapping[str, Any]
+    ) -> Tuple[Mapping[str, Any], Optional[RenderPlan], Dict[str, RenderPlan]]:
+        """Get the compiled render plans for a decorator definition.
+
+        Plans are compiled when the registry loads; definitions registered or
+        replaced since then are compiled on first use.
+
+        Args:
+            name: Name of the decorator
+            definition: The decorator definition the plans must belong to
+
+        Returns:
+            Tuple of (definition, base plan, model-specific plans)
+        """
+        entry = cls._render_plans.get(name)
+        if entry is None or entry[0] is not definition:
+            entry = (definition,) + cls._compile_render_plans(name, definition)
+            cls._render_plans[name] = entry
+        return entry
+
+    @classmethod
+    def _compile_render_plans(
+        cls, name: str, definition: Mapping[str, Any]
+    ) -> Tuple[Optional[RenderPlan], Dict[str, RenderPlan]]:
+        """Compile the base and model-specific render plans for a definition.
+
+        Definitions with a hand-written transform function have no plan and are
+        applied by executing that function instead.
+
+        Args:
+            name: Name of the decorator
+            definition: The decorator definition
+
+        Returns:
+            Tuple of (base plan or None, model-specific plans by model key)
+        """
+        template = definition.get("transformationTemplate")
+        if not isinstance(template, dict):
+            return None, {}
+        if isinstance(definition, DecoratorRecord):
+            transform_function = definition.custom_transform
+        else:
+            transform_function = definition.get("transform_function", "")
+        if transform_function and (
+            transform_function != create_transform_function_from_template(template)
+        ):
+            return None, {}
+        try:
+            plan = compile_render_plan(template)
+            variants = compile_model_variants(
+                template, definition.get("modelSpecificImplementations") or {}
+            )
+        except Exception as e:
+            logger.debug(f"Cannot compile render plan for {name}: {e}")
+            return None, {}
+        return plan, variants
+
+    def __str__(self) -> str:
+        """Return a string representation of the decorator."""
+        params_str = ", ".join(str(p) for p in self.parameters.values())
+        return f"{self.name}({params_str})"
+
+    @classmethod
+    def load_registry(cls) -> None:
+        """Load decorator definitions from the registry directory.
+
+        This method implements a comprehensive three-tier loading strategy:
+        1. Package resources loading (preferred)
+        2. Auto-repair if package registry is empty
+        3. Enhanced filesystem fallback
+
+        The definitions are loaded into a new registry generation that replaces
+        the current one when loading is complete; concurrent readers keep
+        seeing the previous generation until then.
+
+        Args:
+            cls: The class object
+
+        Returns:
+            None
+        """
+        with cls._write_lock:
+            cls._load_registry()
+
+    @classmethod
+    def _load_registry(cls) -> None:
+        """Load the registry and publish it; the write lock must be held.
+
+        Args:
+            cls: The class object
+
+        Returns:
+            None
+        """
+        definitions = VersionedDefinitions()
+
+        # First try to load from package resources
+        loaded_from_package = cls._load_from_package_resources(definitions)
+
+        # If nothing was loaded from package resources, try auto-repair
+        if not loaded_from_package:
+            logger.debug("Package registry empty, attempting auto-repair...")
+            try:
+                # Import registry validator for auto-repair
+                from prompt_decorators.utils.registry_validator import RegistryValidator
+
+                # Attempt auto-repair
+                success, message = RegistryValidator.auto_repair_registry()
+                if success:
+                    logger.info(f"Registry auto-repair successful: {message}")
+                    # Retry loading from package resources after repair
+                    loaded_from_package = cls._load_from_package_resources(definitions)
+                else:
+                    logger.warning(f"Registry auto-repair failed: {message}")
+            except ImportError:
+                logger.debug("Registry validator not available for auto-repair")
+            except Exception as e:
+                logger.warning(f"Auto-repair attempt failed: {e}")
+
+        # If still nothing loaded, fall back to filesystem
+        if not loaded_from_package:
+            logger.debug("Falling back to filesystem loading...")
+            cls._load_from_filesystem(definitions)
+
+        cls._validation_plans = {}
+        cls._render_plans = {
+            name: (definition,) + cls._compile_render_plans(name, definition)
+            for name, definition in definitions.items()
+        }
+        cls._publish(
+            RegistrySnapshot(
+                dict(definitions), cls._snapshot.generation + 1, definitions.versions
+            )
+        )
+        cls._loaded = True
+        decorator_count = len(definitions)
+        logger.info(f"Loaded {decorator_count} decorators from registry")
+
+        # Log loading strategy used for debugging
+        if decorator_count > 0:
+            if loaded_from_package:
+                logger.debug("Successfully loaded decorators from package resources")
+            else:
+                logger.debug("Successfully loaded decorators from filesystem fallback")
+        else:
+            logger.warning("No decorators loaded - registry may be missing or empty")
+
+    @classmethod
+    def _load_from_package_resources(
+        cls, definitions: Dict[str, Mapping[str, Any]]
+    ) -> bool:
+        """Load decorator definitions from package resources.
+
+        Args:
+            cls: The class object
+            definitions: Registry generation being built, updated in place
 
         Returns:
             bool: True if any decorators were loaded, False otherwise
@@ -624,7 +1161,7 @@ class DynamicDecorator:
                 return False
 
             # Process registry subdirectories
-            subdirs = ["core", "extensions", "simplified_decorators"]
+            subdirs = REGISTRY_SUBDIRS
             decorators_loaded = 0
 
             for subdir in subdirs:
@@ -642,10 +1179,16 @@ class DynamicDecorator:
                         # Use Path.glob for Python 3.9+ and manual iteration for older versions
                         try:
                             # Type ignore for mypy since it doesn't know the exact type
-                            for json_file in subdir_path.glob("**/*.json"):  # type: ignore
+                            json_files = list(subdir_path.glob("**/*.json"))  # type: ignore
+                            if all(isinstance(p, Path) for p in json_files):
+                                decorators_loaded += cls._load_json_files(
+                                    json_files, definitions
+                                )
+                                continue
+                            for json_file in json_files:
                                 with json_file.open("r") as f:  # type: ignore
                                     data = json.load(f)
-                                    if cls._process_decorator_data(data):
+                                    if cls._process_decorator_data(data, definitions):
                                         decorators_loaded += 1
                         except AttributeError:
                             # Fallback for older Python versions or different Path implementations
@@ -667,7 +1210,7 @@ class DynamicDecorator:
                             for json_file in json_files:
                                 with json_file.open("r") as f:
                                     data = json.load(f)
-                                    if cls._process_decorator_data(data):
+                                    if cls._process_decorator_data(data, definitions):
                                         decorators_loaded += 1
                     except (ImportError, AttributeError):
                         # Fallback for Python 3.7-3.8
@@ -686,7 +1229,7 @@ class DynamicDecorator:
                                     f"prompt_decorators.registry.{subdir}", resource
                                 )
                                 data = json.loads(json_data)
-                                if cls._process_decorator_data(data):
+                                if cls._process_decorator_data(data, definitions):
                                     decorators_loaded += 1
                 except Exception as e:
                     logger.error(
@@ -699,11 +1242,42 @@ class DynamicDecorator:
             return False
 
     @classmethod
-    def _process_decorator_data(cls, data: Dict[str, Any]) -> bool:
+    def _load_json_files(
+        cls, paths: Iterable[Path], definitions: Dict[str, Mapping[str, Any]]
+    ) -> int:
+        """Load decorator definitions from JSON files, read in bulk.
+
+        Args:
+            cls: The class object
+            paths: Paths of the JSON files, in load order
+            definitions: Registry generation being built, updated in place
+
+        Returns:
+            The number of decorators loaded
+        """
+        loaded = 0
+        for path, data, error in load_json_files(paths):
+            if error is not None:
+                logger.error(f"Error loading decorator from {path}: {error}")
+            elif isinstance(data, dict) and cls._process_decorator_data(
+                data, definitions, path
+            ):
+                loaded += 1
+        return loaded
+
+    @classmethod
+    def _process_decorator_data(
+        cls,
+        data: Dict[str, Any],
+        definitions: Dict[str, Mapping[str, Any]],
+        source: Optional[str] = None,
+    ) -> bool:
         """Process decorator data from JSON.
 
         Args:
             data: The decorator data loaded from JSON
+            definitions: Registry generation being built, updated in place
+            source: Path of the JSON file, used to load documentation on demand
 
         Returns:
             bool: True if the decorator was processed successfully, False otherwise
@@ -713,57 +1287,85 @@ class DynamicDecorator:
             if "decoratorName" not in data:
                 return False
 
-            name = data["decoratorName"]
-
-            # Get transform_function or create one from transformation template
-            transform_function = data.get("transform_function") or data.get(
-                "transformFunction", ""
-            )
-
-            # If no transform_function but there is a transformationTemplate, create one
-            if not transform_function and "transformationTemplate" in data:
-                try:
-                    transform_function = create_transform_function_from_template(
-                        data["transformationTemplate"]
-                    )
-                    logger.debug(f"Created transform function from template for {name}")
-                except Exception as e:
-                    logger.error(
-                        f"Error creating transform function from template for {name}: {e}"
-                    )
-
-            # Process parameters - ensure enum values are properly set
-            parameters = data.get("parameters", [])
-            for param in parameters:
-                # If param has 'enum' but not 'enum_values', copy enum to enum_values
-                if (
-                    param.get("type") == "enum"
-                    and "enum" in param
-                    and "enum_values" not in param
-                ):
-                    param["enum_values"] = param["enum"]
-                    logger.debug(
-                        f"Copied enum values to enum_values for {name}.{param.get('name')}"
-                    )
-
-            cls._registry[name] = {
-                "name": name,
-                "description": data.get("description", ""),
-                "category": data.get("category", "General"),
-                "parameters": parameters,
-                "transform_function": transform_function,
-                "transformationTemplate": data.get("transformationTemplate", {}),
-                "version": data.get("version", "1.0.0"),
-            }
-            logger.debug(f"Loaded decorator: {name}")
+            definition = cls._build_definition(data, source)
+            definitions[definition.name] = definition
+            logger.debug(f"Loaded decorator: {definition['name']}")
             return True
         except Exception as e:
             logger.error(f"Error processing decorator data: {e}")
             return False
 
     @classmethod
-    def _load_from_filesystem(cls) -> None:
-        """Load decorator definitions from the filesystem for backward compatibility."""
+    def _build_definition(
+        cls, data: Dict[str, Any], source: Optional[str] = None
+    ) -> DecoratorRecord:
+        """Normalise raw registry JSON into the engine's definition format.
+
+        Args:
+            data: The decorator data loaded from JSON
+            source: Path of the JSON file the data was loaded from, if any
+
+        Returns:
+            The normalised decorator definition
+        """
+        name = data["decoratorName"]
+
+        # A hand-written transform function; template-based decorators have none
+        transform_function = data.get("transform_function") or data.get(
+            "transformFunction", ""
+        )
+
+        # Process parameters - ensure enum values are properly set
+        parameters = data.get("parameters", [])
+        for param in parameters:
+            # If param has 'enum' but not 'enum_values', copy enum to enum_values
+            if (
+                param.get("type") == "enum"
+                and "enum" in param
+                and "enum_values" not in param
+            ):
+                param["enum_values"] = param["enum"]
+                logger.debug(
+                    f"Copied enum values to enum_values for {name}.{param.get('name')}"
+                )
+
+        return DecoratorRecord(data, transform_function, source)
+
+    @classmethod
+    def _load_from_filesystem(cls, definitions: Dict[str, Mapping[str, Any]]) -> None:
+        """Load decorator definitions from the filesystem for backward compatibility.
+
+        Args:
+            cls: The class object
+            definitions: Registry generation being built, updated in place
+
+        Returns:
+            None
+        """
+        registry_dir_str = cls._resolve_registry_dir()
+        logger.debug(f"Loading registry from filesystem: {registry_dir_str}")
+
+        # Check if the registry directory exists
+        if not os.path.exists(registry_dir_str):
+            logger.warning(f"Registry directory not found: {registry_dir_str}")
+            return
+
+        # Scan the registry directory for JSON files
+        registry_path = Path(registry_dir_str)
+        for subdir in REGISTRY_SUBDIRS:
+            subdir_path = registry_path / subdir
+            if not subdir_path.exists():
+                continue
+
+            cls._load_json_files(subdir_path.glob("**/*.json"), definitions)
+
+    @staticmethod
+    def _resolve_registry_dir() -> str:
+        """Resolve the filesystem registry directory.
+
+        Returns:
+            The registry directory from the environment or the default location
+        """
         # Get the registry directory from environment variable or use default
         registry_dir_str = os.environ.get(REGISTRY_ENV_VAR, DEFAULT_REGISTRY_DIR)
 
@@ -785,27 +1387,36 @@ class DynamicDecorator:
                     if os.path.exists(registry_path_str):
                         registry_dir_str = registry_path_str
 
-        logger.debug(f"Loading registry from filesystem: {registry_dir_str}")
+        return registry_dir_str
 
-        # Check if the registry directory exists
-        if not os.path.exists(registry_dir_str):
-            logger.warning(f"Registry directory not found: {registry_dir_str}")
-            return
+    @classmethod
+    def get_registry_dirs(cls) -> List[str]:
+        """Get the directories registry definitions are loaded from.
 
-        # Scan the registry directory for JSON files
-        registry_path = Path(registry_dir_str)
-        for subdir in ["core", "extensions", "simplified_decorators"]:
-            subdir_path = registry_path / subdir
-            if not subdir_path.exists():
-                continue
+        Args:
+            cls: The class object
 
-            for json_file in subdir_path.glob("**/*.json"):
-                try:
-                    with open(json_file, "r") as f:
-                        data = json.load(f)
-                    cls._process_decorator_data(data)
-                except Exception as e:
-                    logger.error(f"Error loading decorator from {json_file}: {e}")
+        Returns:
+            Existing registry subdirectories, from the installed package if it
+            has a registry on disk, otherwise from the filesystem registry
+        """
+        roots: List[Path] = []
+        try:
+            from importlib.resources import files
+
+            package_root = files("prompt_decorators").joinpath("registry")
+            if isinstance(package_root, Path) and package_root.is_dir():
+                roots.append(package_root)
+        except (ImportError, AttributeError, TypeError):
+            pass
+        if not roots:
+            roots.append(Path(cls._resolve_registry_dir()))
+        return [
+            str(root / subdir)
+            for root in roots
+            for subdir in REGISTRY_SUBDIRS
+            if (root / subdir).is_dir()
+        ]
 
     @classmethod
     def from_definition(cls, definition: Any) -> type:
@@ -835,7 +1446,8 @@ class DynamicDecorator:
         )
 
         # Register the decorator
-        cls._registry[name] = definition_dict
+        with cls._write_lock:
+            cls._publish(cls.get_snapshot(load=False).updated({name: definition_dict}))
 
         return decorator_class
 
@@ -859,48 +1471,281 @@ class DynamicDecorator:
         if not name:
             raise ValueError("Decorator definition must include 'decoratorName'")
 
-        # Get transform_function or create one from transformation template
-        transform_function = decorator_def.get(
-            "transform_function"
-        ) or decorator_def.get("transformFunction", "")
+        definition = cls._build_definition(decorator_def)
+        with cls._write_lock:
+            cls._publish(cls.get_snapshot(load=False).updated({name: definition}))
+            cls._loaded = True  # Mark registry as loaded after successful registration
+        logger.debug(f"Registered decorator: {name}")
 
-        # If no transform_function but there is a transformationTemplate, create one
-        if not transform_function and "transformationTemplate" in decorator_def:
-            try:
-                transform_function = create_transform_function_from_template(
-                    decorator_def["transformationTemplate"]
-                )
-                logger.debug(f"Created transform function from template for {name}")
-            except Exception as e:
-                logger.error(
-                    f"Error creating transform function from template for {name}: {e}"
-                )
+    @classmethod
+    def update_registry(
+        cls,
+        definitions: Mapping[str, Mapping[str, Any]],
+        remove: Iterable[str] = (),
+    ) -> RegistrySnapshot:
+        """Add, replace and remove definitions in one new registry generation.
 
-        # Process parameters - ensure enum values are properly set
-        parameters = decorator_def.get("parameters", [])
-        for param in parameters:
-            # If param has 'enum' but not 'enum_values', copy enum to enum_values
-            if (
-                param.get("type") == "enum"
-                and "enum" in param
-                and "enum_values" not in param
-            ):
-                param["enum_values"] = param["enum"]
-                logger.debug(
-                    f"Copied enum values to enum_values for {name}.{param.get('name')}"
+        Render plans for the new definitions are compiled before the swap, so the
+        first request on the new generation does not pay for them.
+
+        Args:
+            cls: The class object
+            definitions: Definitions to add or replace, by decorator name
+            remove: Names of decorators to remove, with all their versions
+
+        Returns:
+            The published snapshot
+        """
+        for name, definition in definitions.items():
+            cls._get_render_plans(name, definition)
+        with cls._write_lock:
+            snapshot = cls.get_snapshot(load=False).updated(definitions, remove)
+            cls._publish(snapshot)
+            cls._loaded = True
+        return snapshot
+
+    @classmethod
+    def update_registry_versions(
+        cls,
+        added: Iterable[Mapping[str, Any]],
+        removed: Iterable[Tuple[str, VersionKey]] = (),
+    ) -> RegistrySnapshot:
+        """Add and remove individual decorator versions in one new generation.
+
+        Args:
+            cls: The class object
+            added: Definitions to add; each replaces only the loaded definition with its version
+            removed: (decorator name, version key) pairs to remove
+
+        Returns:
+            The published snapshot
+        """
+        added = list(added)
+        for definition in added:
+            cls._get_render_plans(definition["name"], definition)
+        with cls._write_lock:
+            snapshot = cls.get_snapshot(load=False).updated_versions(added, removed)
+            cls._publish(snapshot)
+            cls._loaded = True
+        return snapshot
+
+    @classmethod
+    def restore_snapshot(cls, snapshot: RegistrySnapshot) -> RegistrySnapshot:
+        """Publish the definitions of an earlier snapshot as a new generation.
+
+        The restored generation gets the next generation number, so caches
+        derived from the registry in the meantime are not reused.
+
+        Args:
+            cls: The class object
+            snapshot: The snapshot to restore, e.g. from :meth:`get_snapshot`
+
+        Returns:
+            The published snapshot
+        """
+        with cls._write_lock:
+            restored = RegistrySnapshot(
+                dict(snapshot.definitions),
+                cls._snapshot.generation + 1,
+                dict(snapshot.versions),
+            )
+            cls._publish(restored)
+        return restored
+
+    @classmethod
+    def _publish(cls, snapshot: RegistrySnapshot) -> None:
+        """Make a registry generation current; the write lock must be held.
+
+        Args:
+            cls: The class object
+            snapshot: The new generation
+
+        Returns:
+            None
+        """
+        DynamicDecorator._snapshot = snapshot
+
+    @classmethod
+    def _ensure_loaded(cls) -> None:
+        """Load the registry once, even when called from several threads.
+
+        Args:
+            cls: The class object
+
+        Returns:
+            None
+        """
+        if not cls._loaded:
+            with cls._write_lock:
+                if not cls._loaded:
+                    cls._load_registry()
+
+    @classmethod
+    def get_snapshot(cls, load: bool = True) -> RegistrySnapshot:
+        """Get the current registry generation.
+
+        Reading the snapshot never blocks; the returned snapshot does not change
+        when the registry is reloaded or a decorator is registered.
+
+        Args:
+            cls: The class object
+            load: Whether to load the registry first if it has not been loaded
+
+        Returns:
+            The current registry snapshot
+        """
+        if load:
+            cls._ensure_loaded()
+        return cls._snapshot
+
+    @classmethod
+    def get_registry_generation(cls) -> int:
+        """Get the generation number of the current registry.
+
+        The number increases whenever the registry is reloaded or changed, so
+        caches derived from the registry can use it to invalidate themselves.
+
+        Args:
+            cls: The class object
+
+        Returns:
+            The registry generation
+        """
+        return cls.get_snapshot().generation
+
+    @classmethod
+    def get_compatibility_index(cls) -> "CompatibilityIndex":
+        """Get the compiled compatibility index for the loaded registry.
+
+        The index is compiled once from the registry's ``compatibility`` blocks and
+        ``compatibilityNotes`` and reused until the registry changes.
+
+        Args:
+            cls: The class object
+
+        Returns:
+            The compatibility index for the current registry contents
+        """
+        from prompt_decorators.utils.compatibility import CompatibilityIndex
+
+        snapshot = cls.get_snapshot()
+        key = (snapshot.generation, len(snapshot))
+        entry = cls._compatibility_index
+        if entry is None or entry[0] != key:
+            entry = (key, CompatibilityIndex.from_definitions(snapshot))
+            cls._compatibility_index = entry
+        return entry[1]
+
+    @classmethod
+    def compile_registry(cls) -> RegistrySnapshot:
+        """Compile everything the engine derives from the current registry.
+
+        Validation plans, render plans and the compatibility index are otherwise
+        compiled on first use. Compiling them up front lets a parent process
+        build them once before forking workers. Definitions that fail to compile
+        are skipped; the error is raised when the decorator is used.
+
+        Args:
+            cls: The class object
+
+        Returns:
+            The snapshot the compiled structures belong to
+        """
+        snapshot = cls.get_snapshot()
+        for name, by_version in snapshot.versions.items():
+            default = snapshot.get(name)
+            for definition in by_version.values():
+                key = (
+                    name
+                    if definition is default
+                    else f"{name}:v{definition.get('version')}"
                 )
+                try:
+                    cls._get_validation_plan(key, definition)
+                except ValueError as e:
+                    logger.debug(f"Cannot compile validation plan for {key}: {e}")
+                cls._get_render_plans(key, definition)
+        cls.get_compatibility_index()
+        cls.get_version_index()
+        return snapshot
 
-        cls._registry[name] = {
-            "name": name,
-            "description": decorator_def.get("description", ""),
-            "category": decorator_def.get("category", "General"),
-            "parameters": parameters,
-            "transform_function": transform_function,
-            "transformationTemplate": decorator_def.get("transformationTemplate", {}),
-            "version": decorator_def.get("version", "1.0.0"),
-        }
-        logger.debug(f"Registered decorator: {name}")
-        cls._loaded = True  # Mark registry as loaded after successful registration
+    @classmethod
+    def get_version_index(cls) -> VersionIndex:
+        """Get the version index for the loaded registry.
+
+        Args:
+            cls: The class object
+
+        Returns:
+            The version index for the current registry contents
+        """
+        snapshot = cls.get_snapshot()
+        key = (snapshot.generation, len(snapshot))
+        entry = cls._version_index
+        if entry is None or entry[0] != key:
+            entry = (key, VersionIndex(snapshot.versions))
+            cls._version_index = entry
+        return entry[1]
+
+    @classmethod
+    def resolve_definition(
+        cls, name: str, spec: str = ""
+    ) -> Optional[Mapping[str, Any]]:
+        """Resolve a decorator name and version request to a definition.
+
+        Args:
+            cls: The class object
+            name: Name of the decorator
+            spec: Version request such as ``1.0.0``, ``1.2``, ``^1.0`` or ``>=1,<2``
+
+        Returns:
+            The highest matching definition, or None if there is none
+
+        Raises:
+            ValueError: If the version request cannot be parsed
+        """
+        if not spec:
+            return cls.get_snapshot().get(name)
+        return cls.get_version_index().resolve(name, spec)
+
+    @classmethod
+    def get_decorator_versions(cls, name: str) -> List[str]:
+        """List the loaded versions of a decorator.
+
+        Args:
+            cls: The class object
+            name: Name of the decorator
+
+        Returns:
+            The version strings, newest first; empty if the decorator is unknown
+        """
+        return cls.get_version_index().versions(name)
+
+    @classmethod
+    def get_decorator_details(cls, name: str) -> Optional[Dict[str, Any]]:
+        """Get the full definition of a decorator, including its documentation.
+
+        Documentation fields (``examples``, ``author`` and the full
+        ``implementationGuidance``) are not kept in the registry; they are loaded
+        from the definition's source file or snapshot on each call.
+
+        Args:
+            cls: The class object
+            name: Name of the decorator
+
+        Returns:
+            The definition fields together with the documentation fields, or None
+            if the decorator is not in the registry
+        """
+        cls._ensure_loaded()
+
+        definition = cls._registry.get(name)
+        if definition is None:
+            return None
+        details = dict(definition)
+        if isinstance(definition, DecoratorRecord):
+            details.update(definition.details())
+        return details
 
     @classmethod
     def get_available_decorators(cls) -> List[Any]:
@@ -913,8 +1758,7 @@ class DynamicDecorator:
             List of decorator definitions
         """
         # Load the registry if not already loaded
-        if not cls._loaded:
-            cls.load_registry()
+        cls._ensure_loaded()
 
         # Convert registry entries to DecoratorSchema objects
         result = []
@@ -941,7 +1785,7 @@ class DynamicDecorator:
             decorator_schema = DecoratorSchema(
                 name=name,
                 description=definition.get("description", ""),
-                category=definition.get("category", "General"),
+                category=definition.get("category", DEFAULT_CATEGORY),
                 parameters=parameters,
                 transform_function=definition.get("transform_function", ""),
                 version=definition.get("version", "1.0.0"),
@@ -1048,33 +1892,228 @@ def extract_decorators(text: str) -> Tuple[List[DynamicDecorator], str]:
     return decorators, clean_text
 
 
-def transform_prompt(prompt: str, decorators: List[str]) -> str:
+def compile_chain(
+    decorators: Iterable[DynamicDecorator], compose: bool = False
+) -> ChainPlan:
+    """Compile a decorator chain into a single render pass.
+
+    The result of applying the chain equals applying each decorator in turn,
+    but template instructions are rendered once here and the text is joined
+    with them once per run of template decorators rather than once per
+    decorator.
+
+    With ``compose``, each template's ``compositionBehavior`` is honoured and
+    duplicate or conflicting instructions are dropped (see
+    :mod:`prompt_decorators.core.composition`); the chain's ``report`` then
+    holds the estimated token savings.
+
+    Args:
+        decorators: The decorators, in the order they would be applied
+        compose: Whether to apply composition behaviours to the instructions
+
+    Returns:
+        The compiled chain
+    """
+    chain = ChainPlan()
+    blocks: List[InstructionBlock] = []
+    if compose:
+        chain.report = CompositionReport()
+        conflicts_of = DynamicDecorator.get_compatibility_index().conflicts_of
+
+    def add_blocks() -> None:
+        """Compose the pending run of instructions and add it to the chain.
+
+        Returns:
+            None
+        """
+        assert chain.report is not None
+        for block in compose_instructions(blocks, conflicts_of, chain.report):
+            chain.add(block.placement, block.instruction, block.name)
+        blocks.clear()
+
+    for decorator in decorators:
+        plan = decorator.get_render_plan()
+        if plan is None:
+            if compose:
+                add_blocks()
+            chain.add_transform(decorator.apply)
+            continue
+        try:
+            params = {k: v.value for k, v in decorator.parameters.items()}
+            instruction = plan.render_instruction(params)
+            tokens = plan.estimate_tokens(params)
+        except Exception as e:
+            logger.error(f"Error applying decorator '{decorator.name}': {e}")
+            continue
+        if not compose:
+            chain.add(plan.placement, instruction, decorator.name, tokens)
+            continue
+        template = decorator.definition.get("transformationTemplate") or {}
+        blocks.append(
+            InstructionBlock(
+                decorator.name,
+                decorator.definition.get("category", DEFAULT_CATEGORY),
+                template.get("compositionBehavior", "accumulate"),
+                plan.placement,
+                instruction,
+            )
+        )
+    if compose:
+        add_blocks()
+        logger.debug(f"Composed decorator chain: {chain.report}")
+    return chain
+
+
+@overload
+def transform_prompt(
+    prompt: str,
+    decorators: List[str],
+    model: Optional[str] = None,
+    versions: Optional[Mapping[str, str]] = None,
+    compose: bool = False,
+    output: Literal["text"] = "text",
+    budget: Optional[int] = None,
+) -> str:
+    """Transform a prompt and return the decorated text."""
+
+
+@overload
+def transform_prompt(
+    prompt: str,
+    decorators: List[str],
+    model: Optional[str] = None,
+    versions: Optional[Mapping[str, str]] = None,
+    compose: bool = False,
+    *,
+    output: Literal["parts"],
+    budget: Optional[int] = None,
+) -> PromptParts:
+    """Transform a prompt and return the prompt parts."""
+
+
+@overload
+def transform_prompt(
+    prompt: str,
+    decorators: List[str],
+    model: Optional[str] = None,
+    versions: Optional[Mapping[str, str]] = None,
+    compose: bool = False,
+    *,
+    output: Literal["lazy"],
+    budget: Optional[int] = None,
+) -> DecoratedPrompt:
+    """Transform a prompt and return a lazily rendered prompt."""
+
+
+def transform_prompt(
+    prompt: str,
+    decorators: List[str],
+    model: Optional[str] = None,
+    versions: Optional[Mapping[str, str]] = None,
+    compose: bool = False,
+    output: str = "text",
+    budget: Optional[int] = None,
+) -> Union[str, PromptParts, DecoratedPrompt]:
     """Transform a prompt using a list of decorator strings.
 
+    With a ``budget``, the decorated prompt is fitted to that many estimated
+    tokens before it is rendered, by removing or shortening the instructions of
+    the decorators latest in the list and, as a last resort, cutting the end of
+    the prompt (see :mod:`prompt_decorators.core.budget`).
+
     Args:
         prompt: The prompt to transform
         decorators: List of decorator strings
+        model: Optional target model id or family to render variants for
+        versions: Optional version requests by decorator name, e.g. a tenant's pins
+        compose: Whether to honour composition behaviours and drop duplicate text
+        output: "text", "parts" for PromptParts or "lazy" for a DecoratedPrompt
+        budget: Optional maximum number of tokens of the decorated prompt
 
     Returns:
-        The transformed prompt
+        The transformed prompt, its parts or the lazily rendered prompt
+
+    Raises:
+        ValueError: If the output mode is unknown
+    """
+    if output not in ("text", "parts", "lazy"):
+        raise ValueError(f"Unknown output mode: {output!r}")
+
+    # Apply the whole chain in one render pass
+    compiled = compile_chain(
+        _create_decorators(decorators, model, versions), compose=compose
+    )
+    if budget is not None:
+        compiled, prompt = fit_chain(compiled, prompt, budget)
+    if output == "parts":
+        return compiled.parts(prompt)
+    if output == "lazy":
+        return compiled.decorate(prompt)
+    return compiled.apply(prompt)
+
+
+def estimate_prompt(
+    prompt: str,
+    decorators: List[str],
+    model: Optional[str] = None,
+    versions: Optional[Mapping[str, str]] = None,
+    compose: bool = False,
+    budget: Optional[int] = None,
+) -> BudgetReport:
+    """Estimate the size of a decorated prompt without rendering it.
+
+    This takes the same arguments as :func:`transform_prompt` and is cheap
+    enough to run on every request: instruction sizes are precomputed when the
+    registry loads, so only the prompt itself is measured.
+
+    Args:
+        prompt: The prompt to transform
+        decorators: List of decorator strings
+        model: Optional target model id or family to render variants for
+        versions: Optional version requests by decorator name, e.g. a tenant's pins
+        compose: Whether to honour composition behaviours and drop duplicate text
+        budget: Optional maximum number of tokens to fit the prompt to
+
+    Returns:
+        The estimate, with what fitting to the budget would remove
     """
-    result = prompt
+    compiled = compile_chain(
+        _create_decorators(decorators, model, versions), compose=compose
+    )
+    compiled, _ = fit_chain(compiled, prompt, budget)
+    assert compiled.budget is not None
+    return compiled.budget
+
 
-    # Apply each decorator in order
+def _create_decorators(
+    decorators: List[str],
+    model: Optional[str] = None,
+    versions: Optional[Mapping[str, str]] = None,
+) -> List[DynamicDecorator]:
+    """Create the decorators of a request; invalid ones are skipped.
+
+    Args:
+        decorators: List of decorator strings
+        model: Optional target model id or family to render variants for
+        versions: Optional version requests by decorator name
+
+    Returns:
+        The decorators, in the order given
+    """
+    # Resolve the target model once for the whole request
+    target = resolve_model_target(model) if model else None
+
+    # Create each decorator; invalid ones are skipped
+    chain: List[DynamicDecorator] = []
     for decorator_str in decorators:
         try:
             # Parse the decorator
             name, params = parse_decorator(decorator_str)
+            # A version in the decorator string takes precedence over a pin
+            if versions and ":" not in name and name in versions:
+                name = f"{name}:{versions[name]}"
 
-            # Create and apply the decorator
-            decorator = DynamicDecorator(name, **params)
-            transformed = decorator(result)
-            if isinstance(transformed, str):
-                result = transformed
-            else:
-                # This should not happen in normal usage, but handle it just in case
-                result = str(transformed)
+            chain.append(DynamicDecorator(name, target_model=target, **params))
         except Exception as e:
             logger.error(f"Error applying decorator '{decorator_str}': {e}")
-
-    return result
+    return chain
@@ -3,10 +3,15 @@
 This module provides base classes and utilities for model-specific decorator adaptations.
 """
 import logging
-from typing import Any, Dict, Generic, Optional, Type, TypeVar
+import threading
+import weakref
+from typing import Any, Dict, Generic, Iterable, Optional, Tuple, Type, TypeVar
 
 from prompt_decorators.core.base import BaseDecorator
-from prompt_decorators.utils.model_detection import get_model_detector
+from prompt_decorators.utils.model_detection import (
+    get_model_detector,
+    normalize_model_id,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -169,39 +174,136 @@ class ModelSpecificDecoratorFactory:
     particular language models, taking into account their unique capabilities and limitations.
     """
 
+    # Generated classes keyed by (base class, model family or model id). Values
+    # are weak so classes without live instances can be garbage collected.
+    _class_cache: "weakref.WeakValueDictionary[Tuple[type, str], type]" = (
+        weakref.WeakValueDictionary()
+    )
+    _cache_lock = threading.Lock()
+
     @staticmethod
-    def create_for_model(
-        decorator_class: Type[BaseDecorator], model_id: str, **params
-    ) -> BaseDecorator:
-        """Create a model-specific version of a decorator.
+    def _model_key(model_id: str) -> str:
+        """Get the cache key for a model: its family, or the normalised id.
 
-        This method creates a new class that extends both ModelSpecificDecorator and
-        the original decorator class, allowing for model-specific adaptations.
+        Args:
+            model_id: ID of the model to adapt for
+
+        Returns:
+            The model family if known, otherwise the normalised model id
+        """
+        family = get_model_detector().resolve_model_family(model_id)
+        return family if family is not None else normalize_model_id(model_id)
+
+    @classmethod
+    def get_class_for_model(
+        cls, decorator_class: Type[BaseDecorator], model_id: str
+    ) -> Type[BaseDecorator]:
+        """Get the model-specific class for a decorator class and model.
+
+        Classes are generated once per (decorator class, model family) and reused,
+        so repeated requests return the same class object.
 
         Args:
             decorator_class: Original decorator class
             model_id: ID of the model to adapt for
-            **params: Parameters for the decorator. These are passed to the decorator constructor.
 
         Returns:
-            Instance of the model-specific decorator
-        """  # Create a name for the model-specific class
-        model_specific_name = f"{decorator_class.__name__}_{model_id.replace('-', '_')}"
+            The model-specific decorator class
+        """
+        key = (decorator_class, cls._model_key(model_id))
+        model_specific_class = cls._class_cache.get(key)
+        if model_specific_class is not None:
+            return model_specific_class
+
+        with cls._cache_lock:
+            model_specific_class = cls._class_cache.get(key)
+            if model_specific_class is None:
+                model_specific_class = cls._build_class(decorator_class, key[1])
+                cls._class_cache[key] = model_specific_class
+        return model_specific_class
+
+    @staticmethod
+    def _build_class(
+        decorator_class: Type[BaseDecorator], model_key: str
+    ) -> Type[BaseDecorator]:
+        """Create the class extending ModelSpecificDecorator and a decorator class.
+
+        Args:
+            decorator_class: Original decorator class
+            model_key: Model family or model id the class is adapted for
+
+        Returns:
+            The generated class
+        """
+        # Create a name for the model-specific class
+        suffix = model_key.replace("-", "_").replace(".", "_")
+        model_specific_name = f"{decorator_class.__name__}_{suffix}"
+
+        def __init__(self, model_id: Optional[str] = None, **kwargs):
+            """Initialize the model-specific decorator.
+
+            Args:
+                model_id: ID of the model to adapt for
+                **kwargs: Parameters for the decorator
+            """
+            ModelSpecificDecorator.__init__(self, model_id=model_id, **kwargs)
 
         # Create a new class that inherits from both ModelSpecificDecorator and the original class
-        model_specific_class = type(
+        return type(
             model_specific_name,
             (ModelSpecificDecorator, decorator_class),
             {
-                "__init__": lambda self, **kwargs: ModelSpecificDecorator.__init__(
-                    self, model_id=model_id, **kwargs
-                ),
+                "__init__": __init__,
                 "apply_for_model": lambda self, prompt: decorator_class.apply(
                     self, prompt
                 ),
-                "_model_id": model_id,
+                "_model_key": model_key,
             },
         )
 
-        # Create an instance of the new class
-        return model_specific_class(**params)
+    @classmethod
+    def evict(cls, decorator_classes: Optional[Iterable[type]] = None) -> int:
+        """Drop cached model-specific classes.
+
+        Args:
+            decorator_classes: Base classes to evict, or None to clear the cache
+
+        Returns:
+            Number of cache entries removed
+        """
+        with cls._cache_lock:
+            if decorator_classes is None:
+                removed = len(cls._class_cache)
+                cls._class_cache.clear()
+                return removed
+            targets = set(decorator_classes)
+            keys = [key for key in list(cls._class_cache.keys()) if key[0] in targets]
+            for key in keys:
+                cls._class_cache.pop(key, None)
+            return len(keys)
+
+    @staticmethod
+    def create_for_model(
+        decorator_class: Type[BaseDecorator], model_id: str, **params
+    ) -> BaseDecorator:
+        """Create a model-specific version of a decorator.
+
+        This method uses a class that extends both ModelSpecificDecorator and
+        the original decorator class, allowing for model-specific adaptations.
+        The class is cached per (decorator class, model family), so only the
+        instance is allocated on repeated calls.
+
+        Args:
+            decorator_class: Original decorator class
+            model_id: ID of the model to adapt for
+            **params: Parameters for the decorator. These are passed to the decorator constructor.
+
+        Returns:
+            Instance of the model-specific decorator
+        """
+        model_specific_class = ModelSpecificDecoratorFactory.get_class_for_model(
+            decorator_class, model_id
+        )
+
+        # Create an instance of the class for this model
+        return model_specific_class(model_id=model_id, **params)
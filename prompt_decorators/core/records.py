@@ -0,0 +1,461 @@
+"""Compact in-memory records and snapshots of the decorator registry.
+
+Registry JSON files carry large documentation sections (``examples``, ``author``
+and most of ``implementationGuidance``) that the engine never needs to parse or
+apply a decorator. :class:`DecoratorRecord` keeps only the fields the engine
+reads, in ``__slots__``, with names, types and enum values interned so they are
+shared across decorators. The documentation fields are loaded on demand by
+:meth:`DecoratorRecord.details`, either by re-reading the definition's source
+file or from a compressed snapshot taken when the definition was registered.
+
+A record is a read-only mapping with the same keys as the engine's plain
+definition dictionaries, so code that reads definitions works with both.
+:class:`RegistrySnapshot` is an immutable generation of those records,
+including every loaded version of each decorator.
+"""
+
+import json
+import logging
+import sys
+import zlib
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from prompt_decorators.core.versions import (
+    VersionKey,
+    add_version,
+    default_version,
+    definition_version,
+)
+
+logger = logging.getLogger(__name__)
+
+# Fields only needed by get_decorator_details and the docs tooling
+HEAVY_FIELDS = ("examples", "author", "implementationGuidance")
+
+# Parameter fields whose string values repeat across decorators
+_INTERNED_PARAMETER_FIELDS = frozenset({"name", "type"})
+
+
+def _intern_names(values: Any) -> Any:
+    """Intern the strings of a list of names.
+
+    Args:
+        values: A list of names, or any other value
+
+    Returns:
+        A list of interned strings, or the value unchanged if it is not a list
+    """
+    if not isinstance(values, list):
+        return values
+    return [sys.intern(v) if isinstance(v, str) else v for v in values]
+
+
+def intern_parameters(parameters: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Rebuild parameter definitions with interned keys and names.
+
+    ``enum`` and ``enum_values`` keep sharing one list when they did before.
+
+    Args:
+        parameters: Parameter definitions from the registry
+
+    Returns:
+        Equivalent parameter definitions
+    """
+    result = []
+    for param in parameters:
+        if not isinstance(param, dict):
+            result.append(param)
+            continue
+        compact: Dict[str, Any] = {}
+        shared: Dict[int, Any] = {}
+        for key, value in param.items():
+            if key in _INTERNED_PARAMETER_FIELDS and isinstance(value, str):
+                value = sys.intern(value)
+            elif key in ("enum", "enum_values") and isinstance(value, list):
+                value = shared.setdefault(id(value), _intern_names(value))
+            compact[sys.intern(key)] = value
+        result.append(compact)
+    return result
+
+
+def _intern_compatibility(compatibility: Any) -> Any:
+    """Intern decorator names in a ``compatibility`` block.
+
+    Args:
+        compatibility: The compatibility block
+
+    Returns:
+        An equivalent block
+    """
+    if not isinstance(compatibility, dict):
+        return compatibility
+    return {sys.intern(k): _intern_names(v) for k, v in compatibility.items()}
+
+
+class DecoratorRecord(Mapping[str, Any]):
+    """Read-only, slotted form of a decorator definition.
+
+    The generated ``transform_function`` source is not stored for template-based
+    decorators; it is regenerated from the template when it is read.
+    """
+
+    __slots__ = (
+        "name",
+        "description",
+        "category",
+        "parameters",
+        "transformationTemplate",
+        "version",
+        "compatibility",
+        "compatibilityNotes",
+        "modelSpecificImplementations",
+        "custom_transform",
+        "_source",
+        "_snapshot",
+    )
+
+    KEYS: Tuple[str, ...] = (
+        "name",
+        "description",
+        "category",
+        "parameters",
+        "transform_function",
+        "transformationTemplate",
+        "version",
+        "compatibility",
+        "compatibilityNotes",
+        "modelSpecificImplementations",
+    )
+
+    def __init__(
+        self,
+        data: Mapping[str, Any],
+        custom_transform: str = "",
+        source: Optional[str] = None,
+    ) -> None:
+        """Build a record from raw registry JSON.
+
+        Args:
+            data: The decorator data loaded from JSON
+            custom_transform: Hand-written transform function source, if any
+            source: Path of the JSON file the data was loaded from, if any
+
+        Returns:
+            None
+        """
+        guidance = data.get("implementationGuidance") or {}
+
+        self.name = sys.intern(data["decoratorName"])
+        self.description = data.get("description", "")
+        self.category = sys.intern(data.get("category", "General"))
+        self.parameters = intern_parameters(data.get("parameters", []))
+        self.transformationTemplate = data.get("transformationTemplate", {})
+        self.version = sys.intern(data.get("version", "1.0.0"))
+        self.compatibility = _intern_compatibility(data.get("compatibility", {}))
+        self.compatibilityNotes = guidance.get("compatibilityNotes", [])
+        self.modelSpecificImplementations = guidance.get(
+            "modelSpecificImplementations", {}
+        )
+        self.custom_transform = custom_transform
+        self._source = source
+        self._snapshot: Optional[bytes] = None
+        if source is None:
+            heavy = {key: data[key] for key in HEAVY_FIELDS if key in data}
+            if heavy:
+                self._snapshot = zlib.compress(json.dumps(heavy).encode("utf-8"))
+
+    def __getitem__(self, key: str) -> Any:
+        """Get a definition field.
+
+        Args:
+            key: The field name
+
+        Returns:
+            The field value
+
+        Raises:
+            KeyError: If the field is not part of a definition
+        """
+        if key == "transform_function":
+            return self.transform_function
+        if key in self.KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the definition's field names.
+
+        Args:
+            self: The DecoratorRecord instance
+
+        Returns:
+            Iterator over the field names
+        """
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        """Get the number of definition fields.
+
+        Args:
+            self: The DecoratorRecord instance
+
+        Returns:
+            The number of fields
+        """
+        return len(self.KEYS)
+
+    def __repr__(self) -> str:
+        """Get a short representation of the record.
+
+        Args:
+            self: The DecoratorRecord instance
+
+        Returns:
+            The representation
+        """
+        return f"DecoratorRecord({self.name!r}, version={self.version!r})"
+
+    @property
+    def source(self) -> Optional[str]:
+        """Path of the JSON file the definition was loaded from.
+
+        Args:
+            self: The DecoratorRecord instance
+
+        Returns:
+            The path, or None for definitions registered at runtime
+        """
+        return self._source
+
+    @property
+    def transform_function(self) -> str:
+        """Transform function source for the decorator.
+
+        Args:
+            self: The DecoratorRecord instance
+
+        Returns:
+            The hand-written source, or source generated from the template
+        """
+        if self.custom_transform or not self.transformationTemplate:
+            return self.custom_transform
+        from prompt_decorators.core.dynamic_decorator import (
+            create_transform_function_from_template,
+        )
+
+        try:
+            return create_transform_function_from_template(self.transformationTemplate)
+        except Exception as e:
+            logger.error(
+                f"Error creating transform function from template for {self.name}: {e}"
+            )
+            return ""
+
+    def details(self) -> Dict[str, Any]:
+        """Load the documentation fields left out of the record.
+
+        Args:
+            self: The DecoratorRecord instance
+
+        Returns:
+            The ``examples``, ``author`` and full ``implementationGuidance``
+            fields that are present in the definition
+        """
+        if self._snapshot is not None:
+            heavy: Dict[str, Any] = json.loads(
+                zlib.decompress(self._snapshot).decode("utf-8")
+            )
+            return heavy
+        if self._source is None:
+            return {}
+        try:
+            with open(self._source, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Cannot load details for {self.name}: {e}")
+            return {}
+        if data.get("decoratorName") != self.name:
+            logger.warning(f"{self._source} no longer defines {self.name}")
+            return {}
+        return {key: data[key] for key in HEAVY_FIELDS if key in data}
+
+
+class RegistrySnapshot(Mapping[str, Mapping[str, Any]]):
+    """One immutable generation of the decorator registry.
+
+    A snapshot exposes its definitions and versions through read-only
+    mappings; a registration or reload builds a new snapshot with the next
+    generation number. Readers can therefore hold on to a snapshot without locking, and
+    caches derived from the registry can key on :attr:`generation`.
+
+    As a mapping, a snapshot holds the default (highest) version of each
+    decorator; :attr:`versions` holds every loaded version.
+    """
+
+    __slots__ = ("definitions", "generation", "versions")
+
+    def __init__(
+        self,
+        definitions: Dict[str, Mapping[str, Any]],
+        generation: int = 0,
+        versions: Optional[Dict[str, Dict[VersionKey, Mapping[str, Any]]]] = None,
+    ) -> None:
+        """Initialize a snapshot.
+
+        Args:
+            definitions: Default definitions by decorator name, not modified afterwards
+            generation: Generation number of the snapshot
+            versions: All definitions by name and version; defaults to the defaults
+
+        Returns:
+            None
+        """
+        self.definitions: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+            definitions
+        )
+        self.generation = generation
+        if versions is None:
+            versions = {
+                name: {definition_version(definition): definition}
+                for name, definition in definitions.items()
+            }
+        self.versions: Mapping[
+            str, Dict[VersionKey, Mapping[str, Any]]
+        ] = MappingProxyType(versions)
+
+    def __getitem__(self, name: str) -> Mapping[str, Any]:
+        """Get the definition of a decorator.
+
+        Args:
+            name: Name of the decorator
+
+        Returns:
+            The decorator definition
+
+        Raises:
+            KeyError: If the decorator is not in the snapshot
+        """
+        return self.definitions[name]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the decorator names.
+
+        Args:
+            self: The RegistrySnapshot instance
+
+        Returns:
+            Iterator over the decorator names
+        """
+        return iter(self.definitions)
+
+    def __len__(self) -> int:
+        """Get the number of decorators.
+
+        Args:
+            self: The RegistrySnapshot instance
+
+        Returns:
+            The number of decorators
+        """
+        return len(self.definitions)
+
+    def __repr__(self) -> str:
+        """Get a short representation of the snapshot.
+
+        Args:
+            self: The RegistrySnapshot instance
+
+        Returns:
+            The representation
+        """
+        return (
+            f"RegistrySnapshot(generation={self.generation}, "
+            f"decorators={len(self.definitions)})"
+        )
+
+    def updated(
+        self,
+        definitions: Mapping[str, Mapping[str, Any]],
+        remove: Iterable[str] = (),
+    ) -> "RegistrySnapshot":
+        """Create the next generation with definitions added, replaced or removed.
+
+        A definition replaces the loaded definition with the same version, and
+        any other version loaded from the same file.
+
+        Args:
+            definitions: Definitions to add, by decorator name
+            remove: Names of decorators to remove, with all their versions
+
+        Returns:
+            The new snapshot; this snapshot is unchanged
+        """
+        defaults = dict(self.definitions)
+        versions = dict(self.versions)
+        for name in remove:
+            if name not in definitions:
+                defaults.pop(name, None)
+                versions.pop(name, None)
+        for name, definition in definitions.items():
+            source = (
+                definition.source if isinstance(definition, DecoratorRecord) else None
+            )
+            by_version = {
+                key: other
+                for key, other in versions.get(name, {}).items()
+                if source is None
+                or not isinstance(other, DecoratorRecord)
+                or other.source != source
+            }
+            defaults[name] = add_version(by_version, definition)
+            versions[name] = by_version
+        return RegistrySnapshot(defaults, self.generation + 1, versions)
+
+    def updated_versions(
+        self,
+        added: Iterable[Mapping[str, Any]],
+        removed: Iterable[Tuple[str, VersionKey]] = (),
+    ) -> "RegistrySnapshot":
+        """Create the next generation with individual versions added or removed.
+
+        Unlike :meth:`updated`, an added definition only replaces the loaded
+        definition with the same version. A decorator whose last version is
+        removed is removed from the snapshot.
+
+        Args:
+            added: Definitions to add
+            removed: (decorator name, version key) pairs to remove
+
+        Returns:
+            The new snapshot; this snapshot is unchanged
+        """
+        defaults = dict(self.definitions)
+        versions = dict(self.versions)
+        copied: Dict[str, Dict[VersionKey, Mapping[str, Any]]] = {}
+
+        def by_version(name: str) -> Dict[VersionKey, Mapping[str, Any]]:
+            """Get a decorator's versions, copied before the first change.
+
+            Args:
+                name: Name of the decorator
+
+            Returns:
+                The copy of the decorator's versions
+            """
+            if name not in copied:
+                copied[name] = versions[name] = dict(versions.get(name, {}))
+            return copied[name]
+
+        for name, key in removed:
+            if key in versions.get(name, {}):
+                del by_version(name)[key]
+        for definition in added:
+            add_version(by_version(definition["name"]), definition)
+        for name, table in copied.items():
+            if table:
+                defaults[name] = default_version(table)
+            else:
+                del versions[name]
+                defaults.pop(name, None)
+        return RegistrySnapshot(defaults, self.generation + 1, versions)
@@ -0,0 +1,828 @@
+"""Render plans for dynamic decorators.
+
+A render plan is the pre-compiled form of a decorator's ``transformationTemplate``:
+the instruction text, the ordered parameter mappings and the placement. Applying a
+plan produces exactly the same text as the transform function generated by
+:func:`~prompt_decorators.core.dynamic_decorator.create_transform_function_from_template`,
+without generating and executing source code on every call.
+
+Plans are also compiled for ``implementationGuidance.modelSpecificImplementations``,
+so a decorator can render a model-tailored instruction for a target model.
+
+A :class:`ChainPlan` fuses the plans of a whole decorator chain, so the prompt
+is joined with the chain's instructions once instead of once per decorator. It
+can also render the chain as :class:`PromptParts`, which keep the instructions
+in a canonical block apart from the user content so providers can cache them,
+or as a :class:`DecoratedPrompt`, which is joined only when it is rendered.
+"""
+
+import ast
+import hashlib
+import io
+import logging
+import re
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from prompt_decorators.core.budget import BudgetReport
+    from prompt_decorators.core.composition import CompositionReport
+
+from prompt_decorators.utils.model_detection import (
+    get_model_detector,
+    normalize_model_id,
+)
+from prompt_decorators.utils.tokens import Tokenizer, estimate_tokens, get_tokenizer
+
+logger = logging.getLogger(__name__)
+
+# Placeholders used by model-specific instructions, e.g. "{reference}"
+PLACEHOLDER_PATTERN = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+class ParameterMapping(NamedTuple):
+    """Compiled mapping of one parameter to instruction text."""
+
+    name: str
+    value_map: Optional[Dict[str, str]]
+    format: Optional[str]
+
+
+class ModelTarget(NamedTuple):
+    """A target model resolved to the keys used to look up variants.
+
+    ``keys`` are tried in order: the model id as given, the registered model id
+    it resolves to, and the model family.
+    """
+
+    model: str
+    keys: Tuple[str, ...]
+
+
+class RenderPlan:
+    """Pre-compiled transformation template."""
+
+    __slots__ = (
+        "instruction",
+        "mappings",
+        "placement",
+        "placeholders",
+        "flags",
+        "_tokens",
+    )
+
+    def __init__(
+        self,
+        instruction: str,
+        mappings: Tuple[ParameterMapping, ...],
+        placement: str = "prepend",
+        placeholders: FrozenSet[str] = frozenset(),
+        flags: Optional[Dict[str, Dict[str, str]]] = None,
+    ) -> None:
+        """Initialize a render plan.
+
+        Args:
+            instruction: The instruction text
+            mappings: Parameter mappings in template order
+            placement: Where the instruction goes (prepend, append, replace)
+            placeholders: Parameters substituted into the instruction text
+            flags: Sentences substituted for boolean placeholders, by parameter
+
+        Returns:
+            None
+        """
+        self.instruction = instruction
+        self.mappings = mappings
+        self.placement = placement
+        self.placeholders = placeholders
+        self.flags = flags or {}
+        # (tokenizer, instruction tokens, tokens per (parameter, mapped value))
+        self._tokens: Optional[Tuple[Tokenizer, int, Dict[Tuple[str, str], int]]]
+        self._tokens = None
+        self._count_tokens()
+
+    def _count_tokens(self) -> Tuple[int, Dict[Tuple[str, str], int]]:
+        """Get the token estimates of the instruction and its mapped sentences.
+
+        The estimates are computed when the plan is compiled and again only
+        when the tokenizer changes.
+
+        Args:
+            self: The render plan
+
+        Returns:
+            Tuple of (instruction tokens, tokens by parameter name and value)
+        """
+        tokenizer = get_tokenizer()
+        counts = self._tokens
+        if counts is None or counts[0] is not tokenizer:
+            sentences = {
+                (mapping.name, value): estimate_tokens(sentence)
+                for mapping in self.mappings
+                for value, sentence in (mapping.value_map or {}).items()
+            }
+            counts = (tokenizer, estimate_tokens(self.instruction), sentences)
+            self._tokens = counts
+        return counts[1], counts[2]
+
+    def estimate_tokens(self, params: Mapping[str, Any]) -> int:
+        """Estimate the tokens of the rendered instruction without rendering it.
+
+        The estimate is the sum of the precomputed estimates of the instruction
+        and of each parameter sentence, so it can differ slightly from
+        estimating the rendered text as a whole.
+
+        Args:
+            params: Parameter values of the decorator
+
+        Returns:
+            The estimated token count of the instruction block
+        """
+        if self.placeholders:
+            return estimate_tokens(self.render_instruction(params))
+        total, sentences = self._count_tokens()
+        for mapping in self.mappings:
+            if mapping.name not in params:
+                continue
+            value = params[mapping.name]
+            if mapping.value_map is not None:
+                total += sentences.get((mapping.name, str(value)), 0)
+            elif mapping.format is not None:
+                total += estimate_tokens(mapping.format.format(value=value))
+        return total
+
+    def render_instruction(self, params: Mapping[str, Any]) -> str:
+        """Render the instruction block for the given parameter values.
+
+        Args:
+            params: Parameter values of the decorator
+
+        Returns:
+            The instruction text with parameter sentences appended
+        """
+        if self.placeholders:
+            result = _substitute(self.instruction, params, self.flags)
+        else:
+            result = self.instruction
+        for mapping in self.mappings:
+            if mapping.name not in params:
+                continue
+            value = params[mapping.name]
+            if mapping.value_map is not None:
+                mapped = mapping.value_map.get(str(value))
+                if mapped is not None:
+                    result += " " + mapped
+            elif mapping.format is not None:
+                result += " " + mapping.format.format(value=value)
+        return result
+
+    def apply(self, text: str, params: Mapping[str, Any]) -> str:
+        """Apply the plan to a text.
+
+        Args:
+            text: Text to transform
+            params: Parameter values of the decorator
+
+        Returns:
+            The transformed text
+        """
+        result = self.render_instruction(params)
+        if self.placement == "prepend":
+            return result + "\n\n" + text
+        if self.placement == "replace":
+            return result
+        return text + "\n\n" + result
+
+
+class ChainStep(NamedTuple):
+    """A rendered template instruction in a chain."""
+
+    placement: str
+    instruction: str
+    key: str
+    tokens: int
+
+
+# A fused run of template decorators: (replacement text or None, blocks placed
+# before the text, blocks placed after it)
+FusedStage = Tuple[Optional[str], Tuple[str, ...], Tuple[str, ...]]
+
+
+class ChainPlan:
+    """A decorator chain fused into as few string joins as possible.
+
+    Applying template decorators one after another copies the whole text for
+    every decorator. Their instructions do not depend on the text, so a run of
+    them collapses into one join: prepended instructions in reverse order, the
+    text, then appended instructions, where a ``replace`` discards everything
+    collected so far. Decorators with a custom transform function need the
+    text itself and end the run.
+    """
+
+    __slots__ = (
+        "stages",
+        "steps",
+        "report",
+        "budget",
+        "_replacement",
+        "_prepends",
+        "_appends",
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty chain.
+
+        Args:
+            self: The chain instance
+
+        Returns:
+            None
+        """
+        self.stages: List[Union[FusedStage, Callable[[str], str]]] = []
+        # The chain as added: (placement, instruction, sort key, tokens) or
+        # transforms
+        self.steps: List[Union[ChainStep, Callable[[str], str]]] = []
+        # What composition removed, when the chain was compiled with it
+        self.report: Optional["CompositionReport"] = None
+        # What fitting the chain to a token budget removed, when it was fitted
+        self.budget: Optional["BudgetReport"] = None
+        self._replacement: Optional[str] = None
+        self._prepends: List[str] = []
+        self._appends: List[str] = []
+
+    def add(
+        self,
+        placement: str,
+        instruction: str,
+        key: str = "",
+        tokens: Optional[int] = None,
+    ) -> None:
+        """Add a rendered template instruction to the chain.
+
+        Args:
+            placement: Where the instruction goes (prepend, append, replace)
+            instruction: The rendered instruction text
+            key: Sort key of the instruction in the canonical static block
+            tokens: Precomputed token estimate of the instruction, if known
+
+        Returns:
+            None
+        """
+        if tokens is None:
+            tokens = estimate_tokens(instruction)
+        self.steps.append(ChainStep(placement, instruction, key, tokens))
+        if placement == "prepend":
+            self._prepends.append(instruction)
+        elif placement == "replace":
+            self._replacement = instruction
+            self._prepends = []
+            self._appends = []
+        else:
+            self._appends.append(instruction)
+
+    def add_transform(self, transform: Callable[[str], str]) -> None:
+        """Add a step that transforms the text as a whole.
+
+        Args:
+            transform: Function from the text so far to the transformed text
+
+        Returns:
+            None
+        """
+        self._flush()
+        self.stages.append(transform)
+        self.steps.append(transform)
+
+    def _pending(self) -> Optional[FusedStage]:
+        """Get the current run of template instructions as a stage.
+
+        Args:
+            self: The chain instance
+
+        Returns:
+            The fused stage, or None if the run is empty
+        """
+        if self._replacement is None and not self._prepends and not self._appends:
+            return None
+        return (
+            self._replacement,
+            tuple(reversed(self._prepends)),
+            tuple(self._appends),
+        )
+
+    def _flush(self) -> None:
+        """Close the current run of template instructions.
+
+        Args:
+            self: The chain instance
+
+        Returns:
+            None
+        """
+        stage = self._pending()
+        if stage is not None:
+            self.stages.append(stage)
+        self._replacement = None
+        self._prepends = []
+        self._appends = []
+
+    def apply(self, text: str) -> str:
+        """Apply the chain to a text.
+
+        Args:
+            text: Text to transform
+
+        Returns:
+            The text as if each decorator had been applied in turn
+        """
+        pending = self._pending()
+        stages = self.stages if pending is None else self.stages + [pending]
+        return self._run(stages, text)
+
+    @staticmethod
+    def _run(stages: List[Union[FusedStage, Callable[[str], str]]], text: str) -> str:
+        """Apply stages of a chain to a text.
+
+        Args:
+            stages: The stages to apply
+            text: Text to transform
+
+        Returns:
+            The transformed text
+        """
+        for stage in stages:
+            if callable(stage):
+                text = stage(text)
+                continue
+            replacement, prepends, appends = stage
+            if replacement is not None:
+                text = replacement
+            if prepends or appends:
+                text = "\n\n".join((*prepends, text, *appends))
+        return text
+
+    def estimate_tokens(self, text: str, text_tokens: Optional[int] = None) -> int:
+        """Estimate the tokens of the decorated prompt without rendering it.
+
+        The estimate adds the precomputed estimates of the instructions to the
+        text's, counting a token per separator, as
+        :meth:`DecoratedPrompt.estimate_tokens` does. Custom transform functions
+        need the text, so chains with one are decorated to estimate them.
+
+        Args:
+            text: Text to transform
+            text_tokens: Token estimate of the text, if already known
+
+        Returns:
+            The estimated token count of the decorated prompt
+        """
+        if any(callable(step) for step in self.steps):
+            return self.decorate(text).estimate_tokens()
+        tokens = estimate_tokens(text) if text_tokens is None else text_tokens
+        fragments = 1
+        for step in self.steps:
+            assert not callable(step)
+            if step.placement == "replace":
+                tokens = step.tokens
+                fragments = 1
+            else:
+                tokens += step.tokens
+                fragments += 1
+        return tokens + fragments - 1
+
+    def decorate(self, text: str) -> "DecoratedPrompt":
+        """Apply the chain without joining the final text.
+
+        Only stages followed by a custom transform function are joined, since
+        the function needs the text; the rest of the result keeps references
+        to the instructions and the text.
+
+        Args:
+            text: Text to transform
+
+        Returns:
+            The decorated prompt, rendered on demand
+        """
+        pending = self._pending()
+        stages = self.stages if pending is None else self.stages + [pending]
+        if not stages or callable(stages[-1]):
+            return DecoratedPrompt((), self._run(stages, text), ())
+        replacement, prepends, appends = stages[-1]
+        text = self._run(stages[:-1], text)
+        return DecoratedPrompt(
+            prepends, text if replacement is None else replacement, appends
+        )
+
+    def parts(self, text: str) -> "PromptParts":
+        """Render the chain as a static instruction block and the dynamic text.
+
+        The static block holds every instruction in canonical order (by sort
+        key, then text), whatever order or placement the chain used, so the
+        same set of decorators always produces the same bytes. A ``replace``
+        instruction becomes the dynamic text and discards earlier instructions;
+        custom transform functions are applied to the dynamic text.
+
+        Args:
+            text: The user's prompt text
+
+        Returns:
+            The rendered parts
+        """
+        static: List[Tuple[str, str]] = []
+        for step in self.steps:
+            if callable(step):
+                text = step(text)
+                continue
+            placement, instruction, key, _ = step
+            if placement == "replace":
+                static = []
+                text = instruction
+            else:
+                static.append((key, instruction))
+        block = "\n\n".join(instruction for _, instruction in sorted(static))
+        return PromptParts(block, text, hashlib.sha256(block.encode()).hexdigest())
+
+
+class PromptParts(NamedTuple):
+    """A decorated prompt split for provider prompt caching.
+
+    ``static`` is the canonical instruction block, identical for identical
+    decorator chains and suited to a system message; ``dynamic`` is the user
+    content. ``static_hash`` is the SHA-256 hex digest of ``static``.
+    """
+
+    static: str
+    dynamic: str
+    static_hash: str
+
+    def to_messages(self) -> List[Dict[str, str]]:
+        """Convert the parts to chat messages.
+
+        Args:
+            self: The prompt parts
+
+        Returns:
+            A system message with the static block, if any, and a user message
+        """
+        messages = [{"role": "user", "content": self.dynamic}]
+        if self.static:
+            messages.insert(0, {"role": "system", "content": self.static})
+        return messages
+
+    def __str__(self) -> str:
+        """Join the parts into a single prompt.
+
+        Args:
+            self: The prompt parts
+
+        Returns:
+            The static block followed by the dynamic content
+        """
+        if not self.static:
+            return self.dynamic
+        return self.static + "\n\n" + self.dynamic
+
+
+class DecoratedPrompt:
+    """A decorated prompt that is joined only when it is rendered.
+
+    The prompt is the instructions placed before the text, the text and the
+    instructions placed after it, separated by blank lines. It holds references
+    to these fragments, so measuring it, splitting it into messages or writing
+    it out never copies a large text into a new string.
+    """
+
+    __slots__ = ("prefix", "text", "suffix")
+
+    SEPARATOR = "\n\n"
+
+    def __init__(self, prefix: Sequence[str], text: str, suffix: Sequence[str]) -> None:
+        """Initialize a decorated prompt.
+
+        Args:
+            prefix: Instructions placed before the text, in output order
+            text: The prompt text
+            suffix: Instructions placed after the text, in output order
+
+        Returns:
+            None
+        """
+        self.prefix = tuple(prefix)
+        self.text = text
+        self.suffix = tuple(suffix)
+
+    def fragments(self) -> Tuple[str, ...]:
+        """Get the fragments of the prompt without separators.
+
+        Args:
+            self: The decorated prompt
+
+        Returns:
+            The instructions before the text, the text and the instructions after it
+        """
+        return (*self.prefix, self.text, *self.suffix)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the chunks of the rendered prompt, separators included.
+
+        Args:
+            self: The decorated prompt
+
+        Returns:
+            An iterator over the chunks; joined they equal str(self)
+        """
+        for i, fragment in enumerate(self.fragments()):
+            if i:
+                yield self.SEPARATOR
+            yield fragment
+
+    def __str__(self) -> str:
+        """Render the prompt.
+
+        Args:
+            self: The decorated prompt
+
+        Returns:
+            The decorated prompt text
+        """
+        if not self.prefix and not self.suffix:
+            return self.text
+        return self.SEPARATOR.join(self.fragments())
+
+    def __len__(self) -> int:
+        """Get the length of the rendered prompt without rendering it.
+
+        Args:
+            self: The decorated prompt
+
+        Returns:
+            The number of characters in str(self)
+        """
+        fragments = self.fragments()
+        separators = len(self.SEPARATOR) * (len(fragments) - 1)
+        return sum(len(fragment) for fragment in fragments) + separators
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another decorated prompt or a string.
+
+        Args:
+            self: The decorated prompt
+            other: The object to compare with
+
+        Returns:
+            True if both render to the same text
+        """
+        if isinstance(other, DecoratedPrompt):
+            return len(self) == len(other) and str(self) == str(other)
+        if isinstance(other, str):
+            return len(self) == len(other) and str(self) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return a string representation of the decorated prompt.
+
+        Args:
+            self: The decorated prompt
+
+        Returns:
+            The representation, with the size instead of the text
+        """
+        return (
+            f"DecoratedPrompt({len(self.prefix)} before, {len(self.text)} chars, "
+            f"{len(self.suffix)} after)"
+        )
+
+    def estimate_tokens(self) -> int:
+        """Estimate the number of tokens in the rendered prompt.
+
+        Args:
+            self: The decorated prompt
+
+        Returns:
+            The estimated token count, one per separator plus each fragment's
+        """
+        fragments = self.fragments()
+        return sum(estimate_tokens(f) for f in fragments) + len(fragments) - 1
+
+    def to_messages(self) -> List[Dict[str, str]]:
+        """Convert the prompt to chat messages.
+
+        Args:
+            self: The decorated prompt
+
+        Returns:
+            A system message with the instructions, if any, and a user message
+            with the text
+        """
+        messages = [{"role": "user", "content": self.text}]
+        instructions = self.prefix + self.suffix
+        if instructions:
+            content = self.SEPARATOR.join(instructions)
+            messages.insert(0, {"role": "system", "content": content})
+        return messages
+
+    def write_to(self, target: Any, encoding: str = "utf-8") -> int:
+        """Write the rendered prompt chunk by chunk.
+
+        Args:
+            target: A text file, binary file or socket
+            encoding: Encoding for binary files and sockets
+
+        Returns:
+            The number of characters written
+        """
+        if hasattr(target, "sendall"):
+            for chunk in self:
+                target.sendall(chunk.encode(encoding))
+        elif isinstance(target, (io.RawIOBase, io.BufferedIOBase)) or "b" in str(
+            getattr(target, "mode", "")
+        ):
+            for chunk in self:
+                target.write(chunk.encode(encoding))
+        else:
+            for chunk in self:
+                target.write(chunk)
+        return len(self)
+
+
+def _format_placeholder(
+    name: str, value: Any, flags: Mapping[str, Mapping[str, str]]
+) -> str:
+    """Format a parameter value for substitution into an instruction.
+
+    Booleans are replaced by the template's sentence for the flag when there is
+    one, since a bare ``true``/``false`` carries no meaning in prose.
+
+    Args:
+        name: The parameter name
+        value: The parameter value
+        flags: Sentences for boolean parameters, keyed by ``"true"``/``"false"``
+
+    Returns:
+        The value as instruction text
+    """
+    if isinstance(value, bool):
+        key = "true" if value else "false"
+        return flags.get(name, {}).get(key, key)
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(item) for item in value)
+    if value is None:
+        return ""
+    return str(value)
+
+
+def _substitute(
+    instruction: str,
+    params: Mapping[str, Any],
+    flags: Mapping[str, Mapping[str, str]],
+) -> str:
+    """Substitute ``{param}`` placeholders in a model-specific instruction.
+
+    Placeholders for parameters without a value are removed.
+
+    Args:
+        instruction: The instruction with placeholders
+        params: Parameter values of the decorator
+        flags: Sentences for boolean parameters, keyed by ``"true"``/``"false"``
+
+    Returns:
+        The instruction with placeholders replaced
+    """
+    result = PLACEHOLDER_PATTERN.sub(
+        lambda match: _format_placeholder(
+            match.group(1), params.get(match.group(1)), flags
+        ),
+        instruction,
+    )
+    return re.sub(r" {2,}", " ", result).strip()
+
+
+def _literal(source: str) -> str:
+    """Evaluate text the way the generated transform function embeds it.
+
+    The generated function places template strings inside triple-quoted
+    literals, so escape sequences are interpreted. Evaluating the same literal
+    keeps plan output identical to the generated function.
+
+    Args:
+        source: The raw template text
+
+    Returns:
+        The string value of the literal
+
+    Raises:
+        ValueError: If the text cannot be embedded in a literal
+    """
+    try:
+        value = ast.literal_eval("'''" + source + "'''")
+    except (SyntaxError, ValueError) as e:
+        raise ValueError(f"Template text cannot be compiled: {e}") from e
+    if not isinstance(value, str):
+        raise ValueError("Template text did not evaluate to a string")
+    return value
+
+
+def compile_render_plan(
+    template: Mapping[str, Any], instruction: Optional[str] = None
+) -> RenderPlan:
+    """Compile a transformation template into a render plan.
+
+    Args:
+        template: The ``transformationTemplate`` definition
+        instruction: Optional model-specific instruction replacing the template's
+
+    Returns:
+        The compiled render plan
+
+    Raises:
+        ValueError: If the template cannot be compiled
+    """
+    placeholders: FrozenSet[str] = frozenset()
+    if instruction is None:
+        text = _literal(template.get("instruction", ""))
+    else:
+        text = instruction
+        placeholders = frozenset(PLACEHOLDER_PATTERN.findall(instruction))
+
+    mappings: List[ParameterMapping] = []
+    flags: Dict[str, Dict[str, str]] = {}
+    for name, mapping in (template.get("parameterMapping") or {}).items():
+        if name in placeholders:
+            # The model-specific instruction already uses this parameter
+            value_map = mapping.get("valueMap") or {}
+            if {"true", "false"} <= set(value_map):
+                flags[name] = {k: value_map[k] for k in ("true", "false")}
+            continue
+        if "valueMap" in mapping:
+            value_map = {str(k): v for k, v in mapping["valueMap"].items()}
+            mappings.append(ParameterMapping(name, value_map, None))
+        elif "format" in mapping:
+            mappings.append(ParameterMapping(name, None, _literal(mapping["format"])))
+
+    return RenderPlan(
+        instruction=text,
+        mappings=tuple(mappings),
+        placement=template.get("placement", "prepend"),
+        placeholders=placeholders,
+        flags=flags,
+    )
+
+
+def compile_model_variants(
+    template: Mapping[str, Any], variants: Mapping[str, Any]
+) -> Dict[str, RenderPlan]:
+    """Compile model-specific instruction variants into render plans.
+
+    Args:
+        template: The decorator's ``transformationTemplate``
+        variants: The ``modelSpecificImplementations`` mapping of model to variant
+
+    Returns:
+        Mapping of normalised model id or family to render plan
+    """
+    plans: Dict[str, RenderPlan] = {}
+    for model, variant in variants.items():
+        instruction = variant.get("instruction") if isinstance(variant, dict) else None
+        if not isinstance(instruction, str) or not instruction:
+            continue
+        plans[normalize_model_id(model)] = compile_render_plan(template, instruction)
+    return plans
+
+
+def resolve_model_target(model: str) -> ModelTarget:
+    """Resolve a target model through the model detector.
+
+    This should be called once per request; the result can be shared by every
+    decorator applied in that request.
+
+    Args:
+        model: A model id (e.g. ``gpt-4o-2024-08-06``) or family name
+
+    Returns:
+        The model together with its variant lookup keys
+    """
+    detector = get_model_detector()
+    keys = [normalize_model_id(model)]
+    family = detector.resolve_model_family(model)
+    if family is None or normalize_model_id(family) != keys[0]:
+        resolved = detector.resolve_model_id(model)
+        if resolved is not None:
+            keys.append(normalize_model_id(resolved))
+    if family is not None:
+        keys.append(normalize_model_id(family))
+    return ModelTarget(model, tuple(dict.fromkeys(keys)))
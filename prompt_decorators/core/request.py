@@ -1,21 +1,134 @@
 """Request handling for prompt decorators.
 
 This module provides the DecoratedRequest class for managing decorated prompts.
+
+Decorators are serialized as ``{"name": ..., "parameters": {...}}``, with the
+``version`` request when the decorator was pinned to one, and resolved
+by name when a request is loaded: first among the decorator classes registered
+with :class:`~prompt_decorators.utils.discovery.DecoratorRegistry`, then in the
+dynamic decorator registry. Requests are serialized with the fast JSON backend
+when it is installed, and :meth:`DecoratedRequest.from_jsonl` and
+:meth:`DecoratedRequest.apply_many` process request logs one record at a time.
 """
 
 import json
-from typing import Any, Dict, List, Optional, Type, Union
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from prompt_decorators.core.base import BaseDecorator, ValidationError
+from prompt_decorators.core.dynamic_decorator import DynamicDecorator, compile_chain
+from prompt_decorators.core.render import ChainPlan
+from prompt_decorators.utils.discovery import DecoratorRegistry
+from prompt_decorators.utils.json_backend import dumps, loads
+
+# A decorator attached to a request
+Decorator = Union[BaseDecorator, DynamicDecorator]
+
+# Distinct decorators shared by the requests of one JSONL read before the
+# cache is cleared
+SHARED_DECORATORS_LIMIT = 4096
+
+
+def resolve_decorator(
+    data: Mapping[str, Any], cache: Optional[Dict[Any, Decorator]] = None
+) -> Decorator:
+    """Create a decorator from its dictionary representation.
+
+    Args:
+        data: Dictionary with ``name`` (or ``type``), ``parameters`` and ``version``
+        cache: Decorators already created, shared by equal representations
+
+    Returns:
+        A registered decorator class instance, or a dynamic decorator
+
+    Raises:
+        ValueError: If the data is invalid or the decorator is not registered
+    """
+    key = None
+    if cache is not None:
+        parameters = data.get("parameters")
+        try:
+            key = (
+                data.get("name") or data.get("type"),
+                data.get("version"),
+                # Value types are part of the key: 1, 1.0 and True are equal
+                # but do not all validate as the same parameter type
+                tuple(sorted((k, type(v), v) for k, v in parameters.items()))
+                if parameters
+                else (),
+            )
+            hash(key)
+        except (AttributeError, TypeError):
+            # List-style or unhashable parameter values are not shared
+            key = None
+        else:
+            decorator = cache.get(key)
+            if decorator is not None:
+                return decorator
+
+    decorator = _create_decorator(data)
+    if key is not None and cache is not None:
+        if len(cache) >= SHARED_DECORATORS_LIMIT:
+            cache.clear()
+        cache[key] = decorator
+    return decorator
+
+
+def _create_decorator(data: Mapping[str, Any]) -> Decorator:
+    """Create a new decorator from its dictionary representation.
 
-from prompt_decorators.core.base import BaseDecorator
+    Args:
+        data: Dictionary with ``name`` (or ``type``), ``parameters`` and ``version``
+
+    Returns:
+        A registered decorator class instance, or a dynamic decorator
+
+    Raises:
+        ValueError: If the data is invalid or the decorator is not registered
+    """
+    name = data.get("name") or data.get("type")
+    if not isinstance(name, str):
+        raise ValueError("Decorator missing 'name' field")
+
+    parameters = data.get("parameters") or {}
+    if isinstance(parameters, list):
+        try:
+            parameters = {p["name"]: p["value"] for p in parameters}
+        except (KeyError, TypeError):
+            raise ValueError("Parameter must have name and value fields")
+    elif not isinstance(parameters, dict):
+        raise ValueError("Parameters must be a dictionary or a list")
+
+    decorator_class = DecoratorRegistry().get_decorator(name)
+    if decorator_class is not None:
+        try:
+            return decorator_class(**parameters)
+        except ValidationError as e:
+            raise ValueError(str(e)) from e
+    version = data.get("version")
+    return DynamicDecorator(f"{name}:{version}" if version else name, **parameters)
 
 
 class DecoratedRequest:
     """Class representing a request decorated with prompt decorators."""
 
+    __slots__ = ("prompt", "model", "api_params", "_decorators")
+
     def __init__(
         self,
         prompt: str,
-        decorators: Optional[List[BaseDecorator]] = None,
+        decorators: Optional[List[Decorator]] = None,
         model: Optional[str] = None,
         api_params: Optional[Dict[str, Any]] = None,
     ):
@@ -26,35 +139,52 @@ class DecoratedRequest:
             decorators: Optional list of decorators to apply
             model: Optional model identifier
             api_params: Optional additional API parameters
+
+        Raises:
+            ValueError: If two decorators have the same name
         """
         self.prompt = prompt
+        # Decorators by name, in the order they are applied
+        self._decorators: Dict[str, Decorator] = {}
         self.decorators = decorators or []
         self.model = model
         self.api_params = api_params or {}
 
-        # Validate decorator compatibility
-        self._validate_decorators()
+    @property
+    def decorators(self) -> Tuple[Decorator, ...]:
+        """Get the decorators in the order they are applied.
 
-    def _validate_decorators(self) -> None:
-        """Validate that the decorators are compatible with each other.
+        Use :meth:`add_decorator` and :meth:`remove_decorator`, or assign a new
+        sequence, to change them.
 
         Args:
             self: The request instance
 
+        Returns:
+            The request's decorators
+        """
+        return tuple(self._decorators.values())
+
+    @decorators.setter
+    def decorators(self, decorators: Iterable[Decorator]) -> None:
+        """Replace the request's decorators.
+
+        Args:
+            self: The request instance
+            decorators: The decorators, in the order they are applied
+
         Returns:
             None
 
         Raises:
-            ValueError: If incompatible decorators are found
+            ValueError: If two decorators have the same name
         """
-        # This is a placeholder for more complex compatibility checking
-        # In a real implementation, this would check for conflicting decorators
-        decorator_names = set()
-
-        for decorator in self.decorators:
-            if decorator.name in decorator_names:
+        index: Dict[str, Decorator] = {}
+        for decorator in decorators:
+            if decorator.name in index:
                 raise ValueError(f"Duplicate decorator: {decorator.name}")
-            decorator_names.add(decorator.name)
+            index[decorator.name] = decorator
+        self._decorators = index
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the request to a dictionary representation.
@@ -67,7 +197,7 @@ class DecoratedRequest:
         """
         result = {
             "prompt": self.prompt,
-            "decorators": [decorator.to_dict() for decorator in self.decorators],
+            "decorators": [d.to_dict() for d in self._decorators.values()],
         }
 
         if self.model:
@@ -85,16 +215,23 @@ class DecoratedRequest:
             indent: Optional indentation for pretty-printing
 
         Returns:
-            JSON string representation of the request
+            JSON string representation of the request; compact without indent
         """
-        return json.dumps(self.to_dict(), indent=indent)
+        if indent is not None:
+            return json.dumps(self.to_dict(), indent=indent)
+        return dumps(self.to_dict())
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "DecoratedRequest":
+    def from_dict(
+        cls,
+        data: Mapping[str, Any],
+        cache: Optional[Dict[Any, Decorator]] = None,
+    ) -> "DecoratedRequest":
         """Create a request from a dictionary.
 
         Args:
             data: Dictionary representation of a request
+            cache: Decorators to share with other requests, see :func:`resolve_decorator`
 
         Returns:
             New request instance
@@ -105,44 +242,28 @@ class DecoratedRequest:
         if "prompt" not in data:
             raise ValueError("Missing required field 'prompt'")
 
-        # Deserialize decorators from the dictionary
-        # In a production implementation, we would import all available decorator classes
-        # or use a decorator registry to dynamically load the correct classes
-        from ..decorators import OutputFormat, Reasoning
-
-        decorator_classes = {
-            "Reasoning": Reasoning,
-            "OutputFormat": OutputFormat,
-            # Add more decorator classes as they become available
-        }
-
-        decorators = []
-        if "decorators" in data:
-            for decorator_data in data["decorators"]:
-                if "type" not in decorator_data:
-                    raise ValueError("Decorator missing 'type' field")
-
-                decorator_type = decorator_data["type"]
-                if decorator_type not in decorator_classes:
-                    raise ValueError(f"Unknown decorator type: {decorator_type}")
-
-                decorator_class = decorator_classes[decorator_type]
-                decorator = decorator_class.from_dict(decorator_data)
-                decorators.append(decorator)
+        decorators = data.get("decorators") or []
+        if not isinstance(decorators, list):
+            raise ValueError("'decorators' must be a list")
 
         return cls(
             prompt=data["prompt"],
-            decorators=decorators,
+            decorators=[resolve_decorator(d, cache) for d in decorators],
             model=data.get("model"),
             api_params=data.get("api_params", {}),
         )
 
     @classmethod
-    def from_json(cls, json_str: str) -> "DecoratedRequest":
+    def from_json(
+        cls,
+        json_str: Union[str, bytes],
+        cache: Optional[Dict[Any, Decorator]] = None,
+    ) -> "DecoratedRequest":
         """Create a request from a JSON string.
 
         Args:
             json_str: JSON string representation of a request
+            cache: Decorators to share with other requests, see :func:`resolve_decorator`
 
         Returns:
             New request instance
@@ -151,12 +272,78 @@ class DecoratedRequest:
             ValueError: If the JSON is invalid
         """
         try:
-            data = json.loads(json_str)
-            return cls.from_dict(data)
+            data = loads(json_str)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON: {e}")
+        if not isinstance(data, dict):
+            raise ValueError("Request must be a JSON object")
+        return cls.from_dict(data, cache)
+
+    @classmethod
+    def from_jsonl(
+        cls, source: Union[str, Path, IO[str], IO[bytes], Iterable[str]]
+    ) -> Iterator["DecoratedRequest"]:
+        """Read requests from JSON Lines, one at a time.
 
-    def add_decorator(self, decorator: BaseDecorator) -> "DecoratedRequest":
+        Blank lines are skipped. Requests are created as the iterator advances,
+        so a log of any size is read in constant memory. Requests whose
+        decorators have the same name, version and parameters share one
+        decorator instance, which is only validated once.
+
+        Args:
+            source: Path of a JSONL file, or an open file or iterable of lines
+
+        Returns:
+            Iterator of requests in file order
+
+        Raises:
+            ValueError: If a line is not a valid request, with its line number
+        """
+        if isinstance(source, (str, Path)):
+            with open(source, "rb") as f:
+                yield from cls.from_jsonl(f)
+            return
+        cache: Dict[Any, Decorator] = {}
+        for number, line in enumerate(source, 1):
+            if not line.strip():
+                continue
+            try:
+                yield cls.from_json(line, cache)
+            except ValueError as e:
+                raise ValueError(f"Line {number}: {e}") from e
+
+    @classmethod
+    def apply_many(cls, requests: Iterable["DecoratedRequest"]) -> Iterator[str]:
+        """Apply the decorators of many requests.
+
+        Requests with the same dynamic decorator instances, as
+        :meth:`from_jsonl` creates for equal decorators, share one compiled
+        chain.
+
+        Args:
+            requests: The requests, e.g. from :meth:`from_jsonl`
+
+        Returns:
+            Iterator of the decorated prompts, in request order
+        """
+        # Compiled chains by decorator identities; the entry keeps the
+        # decorators alive so their ids are not reused
+        chains: Dict[Tuple[int, ...], Tuple[Tuple[Decorator, ...], ChainPlan]] = {}
+        for request in requests:
+            decorators = tuple(request._decorators.values())
+            if not all(isinstance(d, DynamicDecorator) for d in decorators):
+                yield request.apply_decorators()
+                continue
+            key = tuple(map(id, decorators))
+            entry = chains.get(key)
+            if entry is None:
+                if len(chains) >= SHARED_DECORATORS_LIMIT:
+                    chains.clear()
+                chain = compile_chain(decorators)  # type: ignore[arg-type]
+                entry = chains[key] = (decorators, chain)
+            yield entry[1].apply(request.prompt)
+
+    def add_decorator(self, decorator: Decorator) -> "DecoratedRequest":
         """Add a decorator to the request.
 
         Args:
@@ -168,17 +355,12 @@ class DecoratedRequest:
         Raises:
             ValueError: If a decorator with the same name already exists
         """
-        # Check if a decorator with the same name already exists
-        for existing in self.decorators:
-            if existing.name == decorator.name:
-                raise ValueError(
-                    f"Decorator with name '{decorator.name}' already exists"
-                )
-
-        self.decorators.append(decorator)
+        if decorator.name in self._decorators:
+            raise ValueError(f"Decorator with name '{decorator.name}' already exists")
+        self._decorators[decorator.name] = decorator
         return self
 
-    def get_decorator(self, decorator_name: str) -> Optional[BaseDecorator]:
+    def get_decorator(self, decorator_name: str) -> Optional[Decorator]:
         """Get a decorator by name.
 
         Args:
@@ -187,10 +369,7 @@ class DecoratedRequest:
         Returns:
             The decorator if found, None otherwise
         """
-        for decorator in self.decorators:
-            if decorator.name == decorator_name:
-                return decorator
-        return None
+        return self._decorators.get(decorator_name)
 
     def remove_decorator(self, decorator_name: str) -> bool:
         """Remove a decorator by name.
@@ -201,11 +380,7 @@ class DecoratedRequest:
         Returns:
             True if the decorator was removed, False if not found
         """
-        for i, decorator in enumerate(self.decorators):
-            if decorator.name == decorator_name:
-                self.decorators.pop(i)
-                return True
-        return False
+        return self._decorators.pop(decorator_name, None) is not None
 
     def apply_decorators(self) -> str:
         """Apply all decorators to the prompt.
@@ -219,10 +394,15 @@ class DecoratedRequest:
         Note:
             Decorators are applied in the order they were added.
             This allows for composing decorators in a specific sequence.
+            Dynamic decorators are applied as one fused chain.
         """
+        decorators = self._decorators.values()
+        if all(isinstance(d, DynamicDecorator) for d in decorators):
+            return compile_chain(decorators).apply(self.prompt)  # type: ignore[arg-type]
+
         decorated_prompt = self.prompt
 
-        for decorator in self.decorators:
+        for decorator in decorators:
             decorated_prompt = decorator.apply_to_prompt(decorated_prompt)
 
         return decorated_prompt
@@ -233,5 +413,5 @@ class DecoratedRequest:
         Returns:
             String representation showing the prompt and decorators
         """
-        decorator_str = ", ".join(d.name for d in self.decorators)
+        decorator_str = ", ".join(self._decorators)
         return f"DecoratedRequest(prompt='{self.prompt[:50]}...', decorators=[{decorator_str}])"
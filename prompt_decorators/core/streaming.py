@@ -0,0 +1,726 @@
+"""Streaming decoration of prompts and post-processing of responses.
+
+Prompts
+-------
+:func:`apply_dynamic_decorators_stream` decorates a prompt read from an
+iterable of text chunks or a text file object. Decorator sigils (``+++Name``)
+are read from the head of the prompt, even when they span chunk boundaries;
+then the prepended instructions are emitted, the body is passed through chunk
+by chunk, and the appended instructions follow at the end. Memory use does not
+depend on the size of the body.
+
+The output equals :func:`~prompt_decorators.dynamic_decorators_module.apply_dynamic_decorators`
+for prompts whose sigils all come before the body. Sigils later in the body are
+passed through as text, since finding them would mean reading the whole input
+first. A decorator with a custom transform function needs the whole text, so a
+chain containing one buffers the body.
+
+Responses
+---------
+:class:`ResponsePipeline` applies the response-side transforms of a decorator
+chain to a sync or async stream of model output chunks. Each
+:class:`ResponseTransform` declares its ``lookahead``: 0 if it transforms each
+chunk as it arrives, a number of characters it may hold back to see what
+follows, or None if it needs the whole response (such as a
+:meth:`DecoratorBase.transform_response` override). Output is emitted as soon
+as every transform in the chain has released it.
+
+Typical usage:
+    >>> from prompt_decorators.core.streaming import apply_dynamic_decorators_stream
+    >>> with open("transcript.txt") as src, open("decorated.txt", "w") as dst:
+    ...     dst.writelines(apply_dynamic_decorators_stream(src))
+    >>> for chunk in transform_response_stream(llm_chunks, decorators):
+    ...     ui.write(chunk)
+"""
+
+import logging
+import re
+from typing import (
+    IO,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from prompt_decorators.core.base import DecoratorBase
+from prompt_decorators.core.dynamic_decorator import (
+    DECORATOR_PATTERN,
+    DynamicDecorator,
+    compile_chain,
+    parse_decorator,
+)
+
+logger = logging.getLogger(__name__)
+
+# Characters read at a time from file objects
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Longest head (sigils and the whitespace between them) kept while looking for
+# the end of a sigil; anything longer is treated as the start of the body
+MAX_HEAD_SIZE = 64 * 1024
+
+_SIGIL_PATTERN = re.compile(DECORATOR_PATTERN)
+_SIGIL_PREFIX = "+++"
+
+TextSource = Union[Iterable[str], IO[str]]
+
+
+def iter_chunks(
+    source: TextSource, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """Iterate over the text chunks of a source.
+
+    Args:
+        source: An iterable of text chunks or a text file object
+        chunk_size: Characters to read at a time from a file object
+
+    Returns:
+        An iterator over the non-empty chunks
+    """
+    if hasattr(source, "read"):
+        read = source.read  # type: ignore[union-attr]
+        return (chunk for chunk in iter(lambda: read(chunk_size), "") if chunk)
+    return (chunk for chunk in source if chunk)
+
+
+def read_head(chunks: Iterator[str]) -> Tuple[List[str], str]:
+    """Read the decorator sigils at the head of a prompt.
+
+    Args:
+        chunks: The prompt's text chunks; consumed up to the start of the body
+
+    Returns:
+        Tuple of (sigil texts, start of the body already read from chunks)
+    """
+    sigils: List[str] = []
+    buffer = ""
+    pos = 0
+    exhausted = False
+    while True:
+        # Skip whitespace between sigils
+        while pos < len(buffer) and buffer[pos].isspace():
+            pos += 1
+        rest = buffer[pos:]
+        if rest and not rest.startswith(_SIGIL_PREFIX[: len(rest)]):
+            return sigils, rest
+        match = (
+            _SIGIL_PATTERN.match(buffer, pos)
+            if len(rest) >= len(_SIGIL_PREFIX)
+            else None
+        )
+        if match is not None:
+            end = match.end()
+            # A match reaching the end of the buffer, or followed by an
+            # unclosed parameter list, may continue in the next chunk
+            complete = end < len(buffer) and buffer[end] != "("
+            if complete or exhausted:
+                sigils.append(match.group(0))
+                pos = end
+                continue
+        elif len(rest) > len(_SIGIL_PREFIX) or (exhausted and rest):
+            return sigils, rest
+        if exhausted:
+            return sigils, ""
+        if len(buffer) - pos > MAX_HEAD_SIZE:
+            logger.warning("Decorator sigil too long; treating it as prompt text")
+            return sigils, rest
+        try:
+            buffer = buffer[pos:] + next(chunks)
+            pos = 0
+        except StopIteration:
+            exhausted = True
+
+
+def _strip_trailing(chunks: Iterable[str]) -> Iterator[str]:
+    """Pass chunks through, dropping whitespace at the very end.
+
+    Args:
+        chunks: The text chunks
+
+    Returns:
+        An iterator over the chunks; only runs of whitespace are held back
+    """
+    pending = ""
+    for chunk in chunks:
+        stripped = chunk.rstrip()
+        if stripped:
+            yield pending + stripped
+            pending = chunk[len(stripped) :]
+        else:
+            pending += chunk
+
+
+def decorate_stream(
+    chunks: Iterable[str],
+    decorators: Sequence[DynamicDecorator],
+    compose: bool = False,
+) -> Iterator[str]:
+    """Apply decorators to a prompt given as text chunks.
+
+    Args:
+        chunks: The prompt's text chunks
+        decorators: The decorators, in the order they would be applied
+        compose: Whether to honour composition behaviours and drop duplicate text
+
+    Returns:
+        An iterator over the chunks of the decorated prompt
+    """
+    chain = compile_chain(decorators, compose=compose)
+    if any(callable(step) for step in chain.steps):
+        # A custom transform function needs the whole text
+        logger.debug("Decorator chain has a custom transform; buffering the body")
+        yield from chain.decorate("".join(chunks))
+        return
+
+    stage = chain.decorate("")
+    for fragment in stage.prefix:
+        yield fragment
+        yield stage.SEPARATOR
+    if any(step[0] == "replace" for step in chain.steps):  # type: ignore[index]
+        # A replace instruction discards the body
+        for _ in chunks:
+            pass
+        yield stage.text
+    else:
+        yield from chunks
+    for fragment in stage.suffix:
+        yield stage.SEPARATOR
+        yield fragment
+
+
+def apply_dynamic_decorators_stream(
+    source: TextSource,
+    compose: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Apply the decorators at the head of a prompt, streaming the result.
+
+    Args:
+        source: The prompt as an iterable of text chunks or a text file object
+        compose: Whether to honour composition behaviours and drop duplicate text
+        chunk_size: Characters to read at a time from a file object
+
+    Returns:
+        An iterator over the chunks of the decorated prompt
+    """
+    chunks = iter_chunks(source, chunk_size)
+    sigils, start = read_head(chunks)
+
+    decorators = []
+    for sigil in sigils:
+        try:
+            name, params = parse_decorator(sigil)
+            decorators.append(DynamicDecorator(name, **params))
+        except Exception as e:
+            logger.error(f"Error creating decorator from '{sigil}': {e}")
+
+    def body() -> Iterator[str]:
+        """Yield the body without surrounding whitespace.
+
+        Returns:
+            An iterator over the body chunks
+        """
+        if start:
+            yield start
+        yield from chunks
+
+    return decorate_stream(_strip_trailing(body()), decorators, compose=compose)
+
+
+class ResponseTransform:
+    """A response transform that can be applied to a stream of chunks.
+
+    The base transform is incremental: :meth:`transform` is applied to each
+    chunk as it arrives. Transforms that need to see following text override
+    :meth:`feed` and :meth:`flush` and set :attr:`lookahead`.
+    """
+
+    # Characters of following text the transform may hold back before
+    # releasing output; None if it needs the whole response
+    lookahead: Optional[int] = 0
+
+    def transform(self, text: str) -> str:
+        """Transform a piece of the response.
+
+        Args:
+            text: The text to transform
+
+        Returns:
+            The transformed text
+        """
+        return text
+
+    def feed(self, chunk: str) -> str:
+        """Accept the next chunk of the response.
+
+        Args:
+            chunk: The chunk
+
+        Returns:
+            The output that is safe to emit now
+        """
+        return self.transform(chunk)
+
+    def flush(self) -> str:
+        """Finish the response.
+
+        Args:
+            self: The transform instance
+
+        Returns:
+            Any output still held back
+        """
+        return ""
+
+
+class RegexResponseTransform(ResponseTransform):
+    """Replace a pattern whose matches are at most ``max_length`` long.
+
+    Text that a match starting later could still include is held back, and
+    up to ``max_length`` characters of released text are kept as context for
+    word boundaries and lookbehinds, so the output equals applying the
+    substitution to the whole response.
+    """
+
+    def __init__(
+        self, pattern: Union[str, Pattern[str]], replacement: str, max_length: int
+    ) -> None:
+        """Initialize the transform.
+
+        Args:
+            pattern: The regular expression
+            replacement: The replacement, as for re.sub
+            max_length: The longest text a match can span
+
+        Returns:
+            None
+        """
+        self.pattern = re.compile(pattern)
+        self.replacement = replacement
+        self.lookahead = max_length
+        # Released context followed by held-back text starting at _start
+        self._pending = ""
+        self._start = 0
+
+    def transform(self, text: str) -> str:
+        """Apply the substitution to a complete text.
+
+        Args:
+            text: The text to transform
+
+        Returns:
+            The text with matches replaced
+        """
+        return self.pattern.sub(self.replacement, text)
+
+    def _release(self, pending: str, cut: int) -> str:
+        """Substitute and release the held-back text up to a cut.
+
+        Args:
+            pending: Context followed by the held-back text
+            cut: Position up to which text is safe to release
+
+        Returns:
+            The released text with matches replaced
+        """
+        output = []
+        last = self._start
+        for match in self.pattern.finditer(pending, self._start):
+            if match.start() >= cut or (match.end() == match.start() == cut):
+                break
+            output.append(pending[last : match.start()])
+            output.append(match.expand(self.replacement))
+            last = match.end()
+            # A match starting before the cut lies entirely within the text
+            cut = max(cut, last)
+        output.append(pending[last:cut])
+        keep = max(0, cut - (self.lookahead or 0))
+        self._pending = pending[keep:]
+        self._start = cut - keep
+        return "".join(output)
+
+    def feed(self, chunk: str) -> str:
+        """Accept the next chunk, releasing text no later match can reach.
+
+        Args:
+            chunk: The chunk
+
+        Returns:
+            The transformed text that is safe to emit now
+        """
+        pending = self._pending + chunk
+        cut = len(pending) - (self.lookahead or 0)
+        if cut <= self._start:
+            self._pending = pending
+            return ""
+        return self._release(pending, cut)
+
+    def flush(self) -> str:
+        """Finish the response.
+
+        Args:
+            self: The transform instance
+
+        Returns:
+            The rest of the transformed text
+        """
+        output = self._release(self._pending, len(self._pending) + 1)
+        self._pending = ""
+        self._start = 0
+        return output
+
+
+class WholeResponseTransform(ResponseTransform):
+    """Apply a function that needs the complete response."""
+
+    lookahead = None
+
+    def __init__(self, function: Callable[[str], str]) -> None:
+        """Initialize the transform.
+
+        Args:
+            function: Function from the complete response to the transformed one
+
+        Returns:
+            None
+        """
+        self.function = function
+        self._chunks: List[str] = []
+
+    def transform(self, text: str) -> str:
+        """Apply the function to a complete response.
+
+        Args:
+            text: The complete response
+
+        Returns:
+            The transformed response
+        """
+        return self.function(text)
+
+    def feed(self, chunk: str) -> str:
+        """Collect the next chunk.
+
+        Args:
+            chunk: The chunk
+
+        Returns:
+            An empty string; nothing is released before the end
+        """
+        self._chunks.append(chunk)
+        return ""
+
+    def flush(self) -> str:
+        """Apply the function to the collected response.
+
+        Args:
+            self: The transform instance
+
+        Returns:
+            The transformed response
+        """
+        text = "".join(self._chunks)
+        self._chunks = []
+        return self.transform(text)
+
+
+class CodeFenceTransform(ResponseTransform):
+    """Remove a Markdown code fence wrapped around the whole response.
+
+    Models asked for JSON, YAML or XML often wrap it in a fence. The opening
+    fence line is held back until it is complete; afterwards only a trailing
+    run of whitespace and backticks, which may be the closing fence, is held.
+    """
+
+    lookahead = 64
+
+    _OPENING = re.compile(r"\s*```[\w+.-]*[ \t]*\n")
+    _CLOSING = re.compile(r"\s*```\s*\Z")
+    _TAIL = re.compile(r"\s*(?:`{1,3}\s*)?\Z")
+
+    def __init__(self) -> None:
+        """Initialize the transform.
+
+        Args:
+            self: The transform instance
+
+        Returns:
+            None
+        """
+        self._pending = ""
+        self._fenced: Optional[bool] = None
+
+    def transform(self, text: str) -> str:
+        """Remove the fence from a complete response.
+
+        Args:
+            text: The complete response
+
+        Returns:
+            The response without the surrounding fence
+        """
+        match = self._OPENING.match(text)
+        if match is None:
+            return text
+        body = text[match.end() :]
+        closing = self._CLOSING.search(body)
+        return body[: closing.start()] if closing else body
+
+    def feed(self, chunk: str) -> str:
+        """Accept the next chunk.
+
+        Args:
+            chunk: The chunk
+
+        Returns:
+            The output that is safe to emit now
+        """
+        pending = self._pending + chunk
+        if self._fenced is None:
+            match = self._OPENING.match(pending)
+            if match is not None:
+                self._fenced = True
+                pending = pending[match.end() :]
+            elif (
+                "\n" in pending.lstrip()
+                or len(pending) > self.lookahead
+                or (pending.strip() and not "```".startswith(pending.strip()[:3]))
+            ):
+                self._fenced = False
+            else:
+                self._pending = pending
+                return ""
+        if not self._fenced:
+            self._pending = ""
+            return pending
+        tail = self._TAIL.search(pending)
+        cut = tail.start() if tail else len(pending)
+        self._pending = pending[cut:]
+        return pending[:cut]
+
+    def flush(self) -> str:
+        """Finish the response, dropping a closing fence.
+
+        Args:
+            self: The transform instance
+
+        Returns:
+            Any text held back that is not the closing fence
+        """
+        pending, self._pending = self._pending, ""
+        if self._fenced and self._CLOSING.match(pending):
+            return ""
+        return pending
+
+
+# Factories of response transforms for dynamic decorators, by decorator name
+_RESPONSE_TRANSFORMS: Dict[
+    str, Callable[[DynamicDecorator], Optional[ResponseTransform]]
+] = {}
+
+
+def register_response_transform(
+    name: str, factory: Callable[[DynamicDecorator], Optional[ResponseTransform]]
+) -> None:
+    """Register the response transform of a dynamic decorator.
+
+    Args:
+        name: Name of the decorator
+        factory: Function creating a transform for a decorator instance, or None
+
+    Returns:
+        None
+    """
+    _RESPONSE_TRANSFORMS[name] = factory
+
+
+def _output_format_transform(
+    decorator: DynamicDecorator,
+) -> Optional[ResponseTransform]:
+    """Strip code fences from responses that must be structured data.
+
+    Args:
+        decorator: The OutputFormat decorator
+
+    Returns:
+        A code fence transform for JSON, YAML and XML, otherwise None
+    """
+    parameter = decorator.parameters.get("format")
+    if parameter is not None and parameter.value in ("json", "yaml", "xml"):
+        return CodeFenceTransform()
+    return None
+
+
+register_response_transform("OutputFormat", _output_format_transform)
+
+
+def get_response_transform(decorator: Any) -> Optional[ResponseTransform]:
+    """Get a fresh response transform for a decorator.
+
+    Args:
+        decorator: A DynamicDecorator or DecoratorBase instance
+
+    Returns:
+        The transform, or None if the decorator leaves responses unchanged
+    """
+    if isinstance(decorator, DynamicDecorator):
+        factory = _RESPONSE_TRANSFORMS.get(decorator.name)
+        return factory(decorator) if factory is not None else None
+    if isinstance(decorator, DecoratorBase) and (
+        type(decorator).transform_response is not DecoratorBase.transform_response
+    ):
+        return WholeResponseTransform(decorator.transform_response)
+    return None
+
+
+class ResponsePipeline:
+    """The response transforms of a decorator chain, applied to a stream.
+
+    Transforms run in chain order; each one's released output is fed to the
+    next. A pipeline holds per-response state, so use one per response.
+    """
+
+    def __init__(self, transforms: Iterable[ResponseTransform]) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            transforms: The transforms, in the order they apply
+
+        Returns:
+            None
+        """
+        self.transforms = list(transforms)
+
+    @classmethod
+    def for_decorators(cls, decorators: Iterable[Any]) -> "ResponsePipeline":
+        """Create the pipeline for a decorator chain.
+
+        Args:
+            cls: The class object
+            decorators: DynamicDecorator or DecoratorBase instances
+
+        Returns:
+            The pipeline of the decorators' response transforms
+        """
+        transforms = (get_response_transform(d) for d in decorators)
+        return cls(t for t in transforms if t is not None)
+
+    @property
+    def lookahead(self) -> Optional[int]:
+        """Get the most text the pipeline may hold back.
+
+        Args:
+            self: The pipeline instance
+
+        Returns:
+            The sum of the transforms' lookahead, or None if one needs everything
+        """
+        total = 0
+        for transform in self.transforms:
+            if transform.lookahead is None:
+                return None
+            total += transform.lookahead
+        return total
+
+    def feed(self, chunk: str) -> str:
+        """Pass the next chunk through the transforms.
+
+        Args:
+            chunk: The chunk
+
+        Returns:
+            The output that every transform has released
+        """
+        for transform in self.transforms:
+            if not chunk:
+                break
+            chunk = transform.feed(chunk)
+        return chunk
+
+    def flush(self) -> str:
+        """Finish the response.
+
+        Args:
+            self: The pipeline instance
+
+        Returns:
+            The output held back by the transforms
+        """
+        output = ""
+        for transform in self.transforms:
+            output = (transform.feed(output) if output else "") + transform.flush()
+        return output
+
+    def process(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Transform a stream of response chunks.
+
+        Args:
+            chunks: The model output chunks
+
+        Returns:
+            An iterator over the transformed chunks, without empty ones
+        """
+        for chunk in chunks:
+            output = self.feed(chunk)
+            if output:
+                yield output
+        output = self.flush()
+        if output:
+            yield output
+
+    async def aprocess(self, chunks: AsyncIterable[str]) -> AsyncIterator[str]:
+        """Transform an async stream of response chunks.
+
+        Args:
+            chunks: The model output chunks
+
+        Returns:
+            An async iterator over the transformed chunks, without empty ones
+        """
+        async for chunk in chunks:
+            output = self.feed(chunk)
+            if output:
+                yield output
+        output = self.flush()
+        if output:
+            yield output
+
+
+def transform_response_stream(
+    chunks: Iterable[str], decorators: Iterable[Any]
+) -> Iterator[str]:
+    """Apply a decorator chain's response transforms to a stream of chunks.
+
+    Args:
+        chunks: The model output chunks
+        decorators: DynamicDecorator or DecoratorBase instances
+
+    Returns:
+        An iterator over the transformed chunks
+    """
+    return ResponsePipeline.for_decorators(decorators).process(chunks)
+
+
+def atransform_response_stream(
+    chunks: AsyncIterable[str], decorators: Iterable[Any]
+) -> AsyncIterator[str]:
+    """Apply a decorator chain's response transforms to an async stream.
+
+    Args:
+        chunks: The model output chunks
+        decorators: DynamicDecorator or DecoratorBase instances
+
+    Returns:
+        An async iterator over the transformed chunks
+    """
+    return ResponsePipeline.for_decorators(decorators).aprocess(chunks)
@@ -4,12 +4,56 @@ This module provides utilities for validating decorator parameters.
 """
 import re
 from enum import Enum
-from typing import Any, Dict, List, Optional, Pattern, Type, TypeVar, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from .base import ValidationError
 
 T = TypeVar("T")
 
+# Compiled check: (decorator_name, param_name, value) -> validated value
+Check = Callable[[str, str, Any], Any]
+
+
+def _error(decorator_name: str, param_name: str, message: str) -> ValidationError:
+    """Build the validation error for a parameter.
+
+    Args:
+        decorator_name: Name of the decorator
+        param_name: Name of the parameter
+        message: Description of the problem
+
+    Returns:
+        The error, with message ``"[decorator] param: message"``
+    """
+    return ValidationError(f"{param_name}: {message}", decorator_name)
+
+
+def _inner_message(error: ValidationError) -> str:
+    """Extract the message of a nested item error.
+
+    Args:
+        error: Error raised while validating a list item or dictionary entry
+
+    Returns:
+        The error text after the parameter name
+    """
+    return error.args[0].split(":", 1)[1].strip()
+
 
 class Validator:
     """Base class for parameter validators."""
@@ -61,9 +105,7 @@ class TypeValidator(Validator):
         if value is None:
             if self.allow_none:
                 return None
-            raise ValidationError(
-                decorator_name, param_name, "Parameter cannot be None"
-            )
+            raise _error(decorator_name, param_name, "Parameter cannot be None")
 
         # Check if the value is an instance of the expected type
         if not isinstance(value, self.expected_type):
@@ -76,7 +118,7 @@ class TypeValidator(Validator):
                             return cast(T, member)
                     # No matching enum value
                     valid_values = [member.value for member in self.expected_type]
-                    raise ValidationError(
+                    raise _error(
                         decorator_name,
                         param_name,
                         f"Invalid value '{value}'. Must be one of: {', '.join(repr(v) for v in valid_values)}",
@@ -84,13 +126,13 @@ class TypeValidator(Validator):
                 except Exception as e:
                     if isinstance(e, ValidationError):
                         raise
-                    raise ValidationError(
+                    raise _error(
                         decorator_name,
                         param_name,
                         f"Cannot convert '{value}' to {self.expected_type.__name__}",
                     )
 
-            raise ValidationError(
+            raise _error(
                 decorator_name,
                 param_name,
                 f"Expected {self.expected_type.__name__}, got {type(value).__name__}",
@@ -139,13 +181,11 @@ class RangeValidator(Validator):
         if value is None:
             if self.allow_none:
                 return None
-            raise ValidationError(
-                decorator_name, param_name, "Parameter cannot be None"
-            )
+            raise _error(decorator_name, param_name, "Parameter cannot be None")
 
         # Check type first
         if not isinstance(value, (int, float)):
-            raise ValidationError(
+            raise _error(
                 decorator_name,
                 param_name,
                 f"Expected number, got {type(value).__name__}",
@@ -153,13 +193,13 @@ class RangeValidator(Validator):
 
         # Check range
         if self.minimum is not None and value < self.minimum:
-            raise ValidationError(
+            raise _error(
                 decorator_name,
                 param_name,
                 f"Value {value} is below minimum {self.minimum}",
             )
         if self.maximum is not None and value > self.maximum:
-            raise ValidationError(
+            raise _error(
                 decorator_name,
                 param_name,
                 f"Value {value} is above maximum {self.maximum}",
@@ -200,13 +240,11 @@ class PatternValidator(Validator):
         if value is None:
             if self.allow_none:
                 return None
-            raise ValidationError(
-                decorator_name, param_name, "Parameter cannot be None"
-            )
+            raise _error(decorator_name, param_name, "Parameter cannot be None")
 
         # Check type first
         if not isinstance(value, str):
-            raise ValidationError(
+            raise _error(
                 decorator_name,
                 param_name,
                 f"Expected string, got {type(value).__name__}",
@@ -214,7 +252,7 @@ class PatternValidator(Validator):
 
         # Check pattern
         if not self.pattern.match(value):
-            raise ValidationError(
+            raise _error(
                 decorator_name,
                 param_name,
                 f"Value '{value}' does not match pattern '{self.pattern.pattern}'",
@@ -255,14 +293,12 @@ class EnumValidator(Validator):
         if value is None:
             if self.allow_none:
                 return None
-            raise ValidationError(
-                decorator_name, param_name, "Parameter cannot be None"
-            )
+            raise _error(decorator_name, param_name, "Parameter cannot be None")
 
         # If already an enum instance, verify it's the right type
         if isinstance(value, Enum):
             if not isinstance(value, self.enum_class):
-                raise ValidationError(
+                raise _error(
                     decorator_name,
                     param_name,
                     f"Expected {self.enum_class.__name__}, got {type(value).__name__}",
@@ -277,13 +313,13 @@ class EnumValidator(Validator):
 
             # No matching enum value
             valid_values = [member.value for member in self.enum_class]
-            raise ValidationError(
+            raise _error(
                 decorator_name,
                 param_name,
                 f"Invalid value '{value}'. Must be one of: {', '.join(repr(v) for v in valid_values)}",
             )
 
-        raise ValidationError(
+        raise _error(
             decorator_name,
             param_name,
             f"Expected {self.enum_class.__name__} or string, got {type(value).__name__}",
@@ -332,25 +368,23 @@ class ListValidator(Validator):
         if value is None:
             if self.allow_none:
                 return None
-            raise ValidationError(
-                decorator_name, param_name, "Parameter cannot be None"
-            )
+            raise _error(decorator_name, param_name, "Parameter cannot be None")
 
         # Check type first
         if not isinstance(value, list):
-            raise ValidationError(
+            raise _error(
                 decorator_name, param_name, f"Expected list, got {type(value).__name__}"
             )
 
         # Check length constraints
         if self.min_length is not None and len(value) < self.min_length:
-            raise ValidationError(
+            raise _error(
                 decorator_name,
                 param_name,
                 f"List length {len(value)} is below minimum {self.min_length}",
             )
         if self.max_length is not None and len(value) > self.max_length:
-            raise ValidationError(
+            raise _error(
                 decorator_name,
                 param_name,
                 f"List length {len(value)} is above maximum {self.max_length}",
@@ -367,10 +401,10 @@ class ListValidator(Validator):
                     validated_list.append(validated_item)
                 except ValidationError as e:
                     # Re-raise with original parameter name
-                    raise ValidationError(
+                    raise _error(
                         decorator_name,
                         param_name,
-                        f"Item at index {i} is invalid: {e.args[0].split(':', 1)[1].strip()}",
+                        f"Item at index {i} is invalid: {_inner_message(e)}",
                     )
             return validated_list
 
@@ -422,13 +456,11 @@ class DictValidator(Validator):
         if value is None:
             if self.allow_none:
                 return None
-            raise ValidationError(
-                decorator_name, param_name, "Parameter cannot be None"
-            )
+            raise _error(decorator_name, param_name, "Parameter cannot be None")
 
         # Check type first
         if not isinstance(value, dict):
-            raise ValidationError(
+            raise _error(
                 decorator_name,
                 param_name,
                 f"Expected dictionary, got {type(value).__name__}",
@@ -437,7 +469,7 @@ class DictValidator(Validator):
         # Check required keys
         for key in self.required_keys:
             if key not in value:
-                raise ValidationError(
+                raise _error(
                     decorator_name, param_name, f"Missing required key '{key}'"
                 )
 
@@ -445,7 +477,7 @@ class DictValidator(Validator):
         if not self.allow_extra_keys and self.required_keys:
             for key in value:
                 if key not in self.required_keys:
-                    raise ValidationError(
+                    raise _error(
                         decorator_name, param_name, f"Extra key '{key}' is not allowed"
                     )
 
@@ -460,10 +492,10 @@ class DictValidator(Validator):
                         decorator_name, f"{param_name} key", key
                     )
                 except ValidationError as e:
-                    raise ValidationError(
+                    raise _error(
                         decorator_name,
                         param_name,
-                        f"Key '{key}' is invalid: {e.args[0].split(':', 1)[1].strip()}",
+                        f"Key '{key}' is invalid: {_inner_message(e)}",
                     )
 
             # Validate value
@@ -474,10 +506,10 @@ class DictValidator(Validator):
                         decorator_name, f"{param_name}['{key}']", val
                     )
                 except ValidationError as e:
-                    raise ValidationError(
+                    raise _error(
                         decorator_name,
                         param_name,
-                        f"Value for key '{key}' is invalid: {e.args[0].split(':', 1)[1].strip()}",
+                        f"Value for key '{key}' is invalid: {_inner_message(e)}",
                     )
 
             validated_dict[validated_key] = validated_value
@@ -485,6 +517,61 @@ class DictValidator(Validator):
         return validated_dict
 
 
+class ChoiceValidator(Validator):
+    """Validator for string values restricted to a set of choices.
+
+    This is the registry's ``enum`` parameter type: unlike :class:`EnumValidator`
+    the allowed values are plain strings rather than members of an Enum class.
+    """
+
+    def __init__(self, choices: Iterable[str], allow_none: bool = False):
+        """Initialize a choice validator.
+
+        Args:
+            choices: Allowed values, in the order they are reported
+            allow_none: Whether None is allowed
+        """
+        self.choices = list(choices)
+        self.allow_none = allow_none
+
+    def validate(
+        self, decorator_name: str, param_name: str, value: Any
+    ) -> Optional[str]:
+        """Validate a parameter value against the allowed choices.
+
+        Args:
+            decorator_name: Name of the decorator
+            param_name: Name of the parameter
+            value: Parameter value to validate
+
+        Returns:
+            Validated parameter value
+
+        Raises:
+            ValidationError: If validation fails
+        """
+        if value is None:
+            if self.allow_none:
+                return None
+            raise _error(decorator_name, param_name, "Parameter cannot be None")
+
+        if not isinstance(value, str):
+            raise _error(
+                decorator_name,
+                param_name,
+                f"Expected string, got {type(value).__name__}",
+            )
+
+        if value not in self.choices:
+            raise _error(
+                decorator_name,
+                param_name,
+                f"Invalid value '{value}'. Must be one of: {', '.join(repr(v) for v in self.choices)}",
+            )
+
+        return value
+
+
 class ValidationPipeline:
     """Pipeline for validating multiple parameters."""
 
@@ -496,6 +583,17 @@ class ValidationPipeline:
         """
         self.validators = validators
 
+    def compile(self) -> "CompiledPipeline":
+        """Compile the pipeline into a fused validator.
+
+        Args:
+            self: The ValidationPipeline instance
+
+        Returns:
+            The compiled pipeline
+        """
+        return compile_pipeline(self)
+
     def validate(
         self, decorator_name: str, parameters: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -520,3 +618,552 @@ class ValidationPipeline:
                 )
 
         return validated_params
+
+
+class CompiledPipeline:
+    """A :class:`ValidationPipeline` compiled into one fused validator.
+
+    Each validator is turned into a closure with its configuration bound as
+    locals: patterns are compiled once, choices and enum values are looked up in
+    precomputed sets and dictionaries, and list items and dictionary entries are
+    checked by the compiled item validators in a single loop. Results and error
+    messages are the same as the pipeline's.
+    """
+
+    __slots__ = ("checks",)
+
+    def __init__(self, checks: Tuple[Tuple[str, Check], ...]):
+        """Initialize a compiled pipeline.
+
+        Args:
+            checks: Compiled checks as (parameter name, check) pairs
+        """
+        self.checks = checks
+
+    def validate(
+        self, decorator_name: str, parameters: Mapping[str, Any]
+    ) -> Dict[str, Any]:
+        """Validate multiple parameters.
+
+        Args:
+            decorator_name: Name of the decorator
+            parameters: Dictionary of parameter values
+
+        Returns:
+            Dictionary of validated parameter values
+
+        Raises:
+            ValidationError: If any parameter fails validation
+        """
+        validated_params = {}
+        for param_name, check in self.checks:
+            if param_name in parameters:
+                validated_params[param_name] = check(
+                    decorator_name, param_name, parameters[param_name]
+                )
+        return validated_params
+
+    def validate_many(
+        self, decorator_name: str, parameter_sets: Iterable[Mapping[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Validate a batch of parameter dictionaries for one decorator.
+
+        Args:
+            decorator_name: Name of the decorator
+            parameter_sets: Parameter dictionaries to validate
+
+        Returns:
+            The validated parameter dictionaries, in order
+
+        Raises:
+            ValidationError: On the first parameter that fails validation
+        """
+        validate = self.validate
+        return [validate(decorator_name, params) for params in parameter_sets]
+
+
+def compile_pipeline(pipeline: ValidationPipeline) -> CompiledPipeline:
+    """Compile a validation pipeline into a fused validator.
+
+    Validators of unknown (custom) types are called as they are.
+
+    Args:
+        pipeline: The pipeline to compile
+
+    Returns:
+        The compiled pipeline
+    """
+    return CompiledPipeline(
+        tuple(
+            (param_name, compile_validator(validator))
+            for param_name, validator in pipeline.validators.items()
+        )
+    )
+
+
+def _value_lookup(enum_class: Type[Enum]) -> Optional[Dict[Any, Enum]]:
+    """Map enum values to their first member.
+
+    Args:
+        enum_class: The Enum class
+
+    Returns:
+        The lookup, or None if a value is unhashable
+    """
+    lookup: Dict[Any, Enum] = {}
+    try:
+        for member in enum_class:
+            lookup.setdefault(member.value, member)
+    except TypeError:
+        return None
+    return lookup
+
+
+def compile_validator(validator: Validator) -> Check:
+    """Compile a single validator into a check function.
+
+    Args:
+        validator: The validator to compile
+
+    Returns:
+        A function ``check(decorator_name, param_name, value)`` returning the
+        validated value
+    """
+    kind = type(validator)
+
+    if kind is TypeValidator:
+        return _compile_type(cast(TypeValidator, validator))
+    if kind is RangeValidator:
+        return _compile_range(cast(RangeValidator, validator))
+    if kind is PatternValidator:
+        return _compile_pattern(cast(PatternValidator, validator))
+    if kind is EnumValidator:
+        return _compile_enum(cast(EnumValidator, validator))
+    if kind is ChoiceValidator:
+        return _compile_choice(cast(ChoiceValidator, validator))
+    if kind is ListValidator:
+        return _compile_list(cast(ListValidator, validator))
+    if kind is DictValidator:
+        return _compile_dict(cast(DictValidator, validator))
+    return validator.validate
+
+
+def _compile_type(validator: TypeValidator) -> Check:
+    """Compile a type validator.
+
+    Args:
+        validator: The validator to compile
+
+    Returns:
+        The compiled check
+    """
+    expected_type = validator.expected_type
+    type_name = expected_type.__name__
+    allow_none = validator.allow_none
+    if not (isinstance(expected_type, type) and issubclass(expected_type, Enum)):
+
+        def check_type(decorator_name: str, param_name: str, value: Any) -> Any:
+            """Check the value's type.
+
+            Args:
+                decorator_name: Name of the decorator
+                param_name: Name of the parameter
+                value: Parameter value to validate
+
+            Returns:
+                Validated parameter value
+            """
+            if value is None:
+                if allow_none:
+                    return None
+                raise _error(decorator_name, param_name, "Parameter cannot be None")
+            if not isinstance(value, expected_type):
+                raise _error(
+                    decorator_name,
+                    param_name,
+                    f"Expected {type_name}, got {type(value).__name__}",
+                )
+            return value
+
+        return check_type
+
+    members = _value_lookup(expected_type)
+    fallback = validator.validate
+
+    def check_enum_type(decorator_name: str, param_name: str, value: Any) -> Any:
+        """Check the value's type, converting enum values to members.
+
+        Args:
+            decorator_name: Name of the decorator
+            param_name: Name of the parameter
+            value: Parameter value to validate
+
+        Returns:
+            Validated parameter value
+        """
+        if value is None:
+            if allow_none:
+                return None
+            raise _error(decorator_name, param_name, "Parameter cannot be None")
+        if isinstance(value, expected_type):
+            return value
+        if members is not None and isinstance(value, str):
+            member = members.get(value)
+            if member is not None:
+                return member
+        return fallback(decorator_name, param_name, value)
+
+    return check_enum_type
+
+
+def _compile_range(validator: RangeValidator) -> Check:
+    """Compile a range validator.
+
+    Args:
+        validator: The validator to compile
+
+    Returns:
+        The compiled check
+    """
+    minimum = validator.minimum
+    maximum = validator.maximum
+
+    allow_none = validator.allow_none
+
+    def check_range(decorator_name: str, param_name: str, value: Any) -> Any:
+        """Check the value is a number within range.
+
+        Args:
+            decorator_name: Name of the decorator
+            param_name: Name of the parameter
+            value: Parameter value to validate
+
+        Returns:
+            Validated parameter value
+        """
+        if value is None:
+            if allow_none:
+                return None
+            raise _error(decorator_name, param_name, "Parameter cannot be None")
+        if not isinstance(value, (int, float)):
+            raise _error(
+                decorator_name,
+                param_name,
+                f"Expected number, got {type(value).__name__}",
+            )
+        if minimum is not None and value < minimum:
+            raise _error(
+                decorator_name, param_name, f"Value {value} is below minimum {minimum}"
+            )
+        if maximum is not None and value > maximum:
+            raise _error(
+                decorator_name, param_name, f"Value {value} is above maximum {maximum}"
+            )
+        return value
+
+    return check_range
+
+
+def _compile_pattern(validator: PatternValidator) -> Check:
+    """Compile a pattern validator.
+
+    Args:
+        validator: The validator to compile
+
+    Returns:
+        The compiled check
+    """
+    match = validator.pattern.match
+    source = validator.pattern.pattern
+
+    allow_none = validator.allow_none
+
+    def check_pattern(decorator_name: str, param_name: str, value: Any) -> Any:
+        """Check the value is a string matching the pattern.
+
+        Args:
+            decorator_name: Name of the decorator
+            param_name: Name of the parameter
+            value: Parameter value to validate
+
+        Returns:
+            Validated parameter value
+        """
+        if value is None:
+            if allow_none:
+                return None
+            raise _error(decorator_name, param_name, "Parameter cannot be None")
+        if not isinstance(value, str):
+            raise _error(
+                decorator_name,
+                param_name,
+                f"Expected string, got {type(value).__name__}",
+            )
+        if not match(value):
+            raise _error(
+                decorator_name,
+                param_name,
+                f"Value '{value}' does not match pattern '{source}'",
+            )
+        return value
+
+    return check_pattern
+
+
+def _compile_enum(validator: EnumValidator) -> Check:
+    """Compile an enum validator.
+
+    Args:
+        validator: The validator to compile
+
+    Returns:
+        The compiled check
+    """
+    enum_class = validator.enum_class
+    members = _value_lookup(enum_class)
+    fallback = validator.validate
+
+    allow_none = validator.allow_none
+
+    def check_enum(decorator_name: str, param_name: str, value: Any) -> Any:
+        """Check the value is a member or the value of a member.
+
+        Args:
+            decorator_name: Name of the decorator
+            param_name: Name of the parameter
+            value: Parameter value to validate
+
+        Returns:
+            Validated parameter value (as Enum member)
+        """
+        if value is None:
+            if allow_none:
+                return None
+            raise _error(decorator_name, param_name, "Parameter cannot be None")
+        if isinstance(value, enum_class):
+            return value
+        if members is not None and isinstance(value, str):
+            member = members.get(value)
+            if member is not None:
+                return member
+        return fallback(decorator_name, param_name, value)
+
+    return check_enum
+
+
+def _compile_choice(validator: ChoiceValidator) -> Check:
+    """Compile a choice validator.
+
+    Args:
+        validator: The validator to compile
+
+    Returns:
+        The compiled check
+    """
+    allowed: FrozenSet[str] = frozenset(validator.choices)
+    choices = ", ".join(repr(v) for v in validator.choices)
+
+    allow_none = validator.allow_none
+
+    def check_choice(decorator_name: str, param_name: str, value: Any) -> Any:
+        """Check the value is one of the choices.
+
+        Args:
+            decorator_name: Name of the decorator
+            param_name: Name of the parameter
+            value: Parameter value to validate
+
+        Returns:
+            Validated parameter value
+        """
+        if value is None:
+            if allow_none:
+                return None
+            raise _error(decorator_name, param_name, "Parameter cannot be None")
+        if not isinstance(value, str):
+            raise _error(
+                decorator_name,
+                param_name,
+                f"Expected string, got {type(value).__name__}",
+            )
+        if value not in allowed:
+            raise _error(
+                decorator_name,
+                param_name,
+                f"Invalid value '{value}'. Must be one of: {choices}",
+            )
+        return value
+
+    return check_choice
+
+
+def _compile_list(validator: ListValidator) -> Check:
+    """Compile a list validator and its item validator.
+
+    Args:
+        validator: The validator to compile
+
+    Returns:
+        The compiled check
+    """
+    min_length = validator.min_length
+    max_length = validator.max_length
+    check_item = (
+        compile_validator(validator.item_validator)
+        if validator.item_validator
+        else None
+    )
+
+    allow_none = validator.allow_none
+
+    def check_list(decorator_name: str, param_name: str, value: Any) -> Any:
+        """Check the value is a list of valid items.
+
+        Args:
+            decorator_name: Name of the decorator
+            param_name: Name of the parameter
+            value: Parameter value to validate
+
+        Returns:
+            Validated parameter value
+        """
+        if value is None:
+            if allow_none:
+                return None
+            raise _error(decorator_name, param_name, "Parameter cannot be None")
+        if not isinstance(value, list):
+            raise _error(
+                decorator_name, param_name, f"Expected list, got {type(value).__name__}"
+            )
+        if min_length is not None and len(value) < min_length:
+            raise _error(
+                decorator_name,
+                param_name,
+                f"List length {len(value)} is below minimum {min_length}",
+            )
+        if max_length is not None and len(value) > max_length:
+            raise _error(
+                decorator_name,
+                param_name,
+                f"List length {len(value)} is above maximum {max_length}",
+            )
+        if check_item is None:
+            return value
+
+        validated_list = []
+        for item in value:
+            try:
+                validated_list.append(check_item(decorator_name, param_name, item))
+            except ValidationError:
+                # Checks are deterministic: repeat with the item's name for the
+                # exact message instead of formatting it for every item
+                index = len(validated_list)
+                try:
+                    check_item(decorator_name, f"{param_name}[{index}]", item)
+                except ValidationError as e:
+                    raise _error(
+                        decorator_name,
+                        param_name,
+                        f"Item at index {index} is invalid: {_inner_message(e)}",
+                    )
+                raise
+        return validated_list
+
+    return check_list
+
+
+def _compile_dict(validator: DictValidator) -> Check:
+    """Compile a dictionary validator and its key and value validators.
+
+    Args:
+        validator: The validator to compile
+
+    Returns:
+        The compiled check
+    """
+    required_keys = tuple(validator.required_keys)
+    allowed_keys: Optional[FrozenSet[Any]] = (
+        frozenset(required_keys)
+        if not validator.allow_extra_keys and required_keys
+        else None
+    )
+    check_key = (
+        compile_validator(validator.key_validator) if validator.key_validator else None
+    )
+    check_value = (
+        compile_validator(validator.value_validator)
+        if validator.value_validator
+        else None
+    )
+
+    allow_none = validator.allow_none
+
+    def check_dict(decorator_name: str, param_name: str, value: Any) -> Any:
+        """Check the value is a dictionary with valid keys and values.
+
+        Args:
+            decorator_name: Name of the decorator
+            param_name: Name of the parameter
+            value: Parameter value to validate
+
+        Returns:
+            Validated parameter value
+        """
+        if value is None:
+            if allow_none:
+                return None
+            raise _error(decorator_name, param_name, "Parameter cannot be None")
+        if not isinstance(value, dict):
+            raise _error(
+                decorator_name,
+                param_name,
+                f"Expected dictionary, got {type(value).__name__}",
+            )
+        for key in required_keys:
+            if key not in value:
+                raise _error(
+                    decorator_name, param_name, f"Missing required key '{key}'"
+                )
+        if allowed_keys is not None:
+            for key in value:
+                if key not in allowed_keys:
+                    raise _error(
+                        decorator_name, param_name, f"Extra key '{key}' is not allowed"
+                    )
+        if check_key is None and check_value is None:
+            return dict(value)
+
+        validated_dict = {}
+        for key, val in value.items():
+            validated_key = key
+            if check_key is not None:
+                try:
+                    validated_key = check_key(decorator_name, param_name, key)
+                except ValidationError:
+                    try:
+                        check_key(decorator_name, f"{param_name} key", key)
+                    except ValidationError as e:
+                        raise _error(
+                            decorator_name,
+                            param_name,
+                            f"Key '{key}' is invalid: {_inner_message(e)}",
+                        )
+                    raise
+            validated_value = val
+            if check_value is not None:
+                try:
+                    validated_value = check_value(decorator_name, param_name, val)
+                except ValidationError:
+                    try:
+                        check_value(decorator_name, f"{param_name}['{key}']", val)
+                    except ValidationError as e:
+                        raise _error(
+                            decorator_name,
+                            param_name,
+                            f"Value for key '{key}' is invalid: {_inner_message(e)}",
+                        )
+                    raise
+            validated_dict[validated_key] = validated_value
+        return validated_dict
+
+    return check_dict
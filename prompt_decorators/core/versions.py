@@ -0,0 +1,383 @@
+"""Decorator versions and semantic version range resolution.
+
+Several versions of a decorator can be loaded side by side. The registry maps
+each name to its highest version; :class:`VersionIndex` keeps every version of
+every decorator, sorted, and resolves version requests such as ``1.2.3``,
+``1.2`` (latest ``1.2.x``), ``^1.2``, ``~1.2.0`` or ``>=1.0,<2.0`` to a
+definition. Resolutions are cached per (name, request) pattern, so a tenant that
+pins its decorator versions pays for range matching once per pattern.
+
+Typical usage:
+    >>> from prompt_decorators.core.dynamic_decorator import DynamicDecorator
+    >>> DynamicDecorator("StepByStep:v1")  # latest 1.x.x
+    >>> DynamicDecorator.resolve_definition("StepByStep", "^1.0")
+"""
+
+import logging
+import operator
+import re
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+logger = logging.getLogger(__name__)
+
+# (major, minor, patch, 1 for releases or 0 for pre-releases, pre-release tag)
+VersionKey = Tuple[int, int, int, int, str]
+
+# Predicates a version must satisfy: (comparison, bound)
+Requirement = Tuple[Callable[[Any, Any], bool], Tuple[int, int, int]]
+
+_VERSION_PATTERN = re.compile(
+    r"^\s*v?(\d+)(?:\.(\d+))?(?:\.(\d+))?(?:-([0-9A-Za-z.-]+))?(?:\+[0-9A-Za-z.-]+)?\s*$"
+)
+_COMPARATOR_PATTERN = re.compile(r"^(>=|<=|>|<|==|=)?\s*(.+)$")
+_OPERATORS = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+    "==": operator.eq,
+    "=": operator.eq,
+}
+
+# Fields of a definition that are usually identical across its versions
+SHARED_FIELDS = (
+    "description",
+    "category",
+    "parameters",
+    "transformationTemplate",
+    "compatibility",
+    "compatibilityNotes",
+    "modelSpecificImplementations",
+)
+
+
+def _parse_parts(version: str) -> Tuple[Tuple[Optional[int], ...], str]:
+    """Split a version string into its numeric parts and pre-release tag.
+
+    Args:
+        version: The version string, with or without a leading ``v``
+
+    Returns:
+        Tuple of (major, minor, patch) with None for missing parts, and the tag
+
+    Raises:
+        ValueError: If the string is not a version
+    """
+    match = _VERSION_PATTERN.match(version)
+    if not match:
+        raise ValueError(f"Invalid version: {version!r}")
+    major, minor, patch, pre = match.groups()
+    parts = tuple(None if p is None else int(p) for p in (major, minor, patch))
+    return parts, pre or ""
+
+
+def parse_version(version: str) -> VersionKey:
+    """Parse a version string into a sortable key.
+
+    Missing minor and patch numbers count as 0; a pre-release sorts before the
+    release it precedes.
+
+    Args:
+        version: The version string, e.g. ``1.2.3`` or ``v2.0.0-beta``
+
+    Returns:
+        The version key
+
+    Raises:
+        ValueError: If the string is not a version
+    """
+    (major, minor, patch), pre = _parse_parts(version)
+    return (major or 0, minor or 0, patch or 0, 0 if pre else 1, pre)
+
+
+def definition_version(definition: Mapping[str, Any]) -> VersionKey:
+    """Get the version key of a decorator definition.
+
+    Args:
+        definition: The decorator definition
+
+    Returns:
+        The version key; definitions with an invalid version count as 0.0.0
+    """
+    try:
+        return parse_version(str(definition.get("version", "1.0.0")))
+    except ValueError:
+        logger.warning(
+            f"Invalid version {definition.get('version')!r} for "
+            f"{definition.get('name')}; treating it as 0.0.0"
+        )
+        return (0, 0, 0, 1, "")
+
+
+def parse_requirement(spec: str) -> Tuple[List[Requirement], Optional[VersionKey]]:
+    """Parse a version request into the predicates a version must satisfy.
+
+    Supported forms: ``*`` or ``latest``; an exact version ``1.2.3``; a partial
+    version ``1`` or ``1.2`` (latest matching release); caret ``^1.2.3`` and tilde
+    ``~1.2.3`` ranges; and comparators ``>=1.0 <2.0`` (comma or space separated).
+    Ranges and partial versions only match releases; exact requests, and
+    ``*``/``latest`` when a decorator only has pre-releases, can resolve to a
+    pre-release.
+
+    Args:
+        spec: The version request, with or without a leading ``v``
+
+    Returns:
+        Tuple of (predicates on (major, minor, patch), exact version key or None)
+
+    Raises:
+        ValueError: If the request cannot be parsed
+    """
+    spec = spec.strip()
+    if spec in ("", "*", "latest"):
+        return [], None
+
+    if spec[0] in "^~":
+        (major, minor, patch), _ = _parse_parts(spec[1:])
+        assert major is not None
+        lower = (major, minor or 0, patch or 0)
+        if spec[0] == "~" and minor is not None:
+            upper = (major, minor + 1, 0)
+        elif spec[0] == "^" and major == 0 and minor is not None:
+            # ^0.0.3 allows only 0.0.3, but ^0.0 allows any 0.0.x
+            if minor or patch is None:
+                upper = (0, minor + 1, 0)
+            else:
+                upper = (0, 0, patch + 1)
+        else:
+            upper = (major + 1, 0, 0)
+        return [(operator.ge, lower), (operator.lt, upper)], None
+
+    if not any(c in spec for c in "<>=, "):
+        parts, pre = _parse_parts(spec)
+        if parts[2] is not None:
+            return [], parse_version(spec)
+        # Partial version: the latest release with that prefix
+        major, minor, _ = parts
+        assert major is not None
+        if minor is None:
+            return [
+                (operator.ge, (major, 0, 0)),
+                (operator.lt, (major + 1, 0, 0)),
+            ], None
+        return [
+            (operator.ge, (major, minor, 0)),
+            (operator.lt, (major, minor + 1, 0)),
+        ], None
+
+    requirements: List[Requirement] = []
+    for term in re.split(r"[,\s]+", re.sub(r"([<>=])\s+", r"\1", spec)):
+        match = _COMPARATOR_PATTERN.match(term)
+        if not match:
+            raise ValueError(f"Invalid version requirement: {spec!r}")
+        op, version = match.groups()
+        key = parse_version(version)
+        requirements.append((_OPERATORS[op or "=="], key[:3]))
+    return requirements, None
+
+
+def share_fields(
+    definition: Mapping[str, Any], others: Iterable[Mapping[str, Any]]
+) -> None:
+    """Make a definition reuse field values it has in common with other versions.
+
+    Only :class:`~prompt_decorators.core.records.DecoratorRecord` definitions are
+    changed; equal values are replaced by the other version's object so the
+    versions share one copy.
+
+    Args:
+        definition: The newly loaded definition
+        others: Other versions of the same decorator
+
+    Returns:
+        None
+    """
+    from prompt_decorators.core.records import DecoratorRecord
+
+    if not isinstance(definition, DecoratorRecord):
+        return
+    for other in others:
+        if not isinstance(other, DecoratorRecord) or other is definition:
+            continue
+        for field in SHARED_FIELDS:
+            value = getattr(other, field)
+            current = getattr(definition, field)
+            if current is not value and current == value:
+                setattr(definition, field, value)
+
+
+def default_version(
+    by_version: Mapping[VersionKey, Mapping[str, Any]]
+) -> Mapping[str, Any]:
+    """Pick the version of a decorator the registry uses by default.
+
+    Args:
+        by_version: Definitions of the decorator by version key
+
+    Returns:
+        The highest release, or the highest pre-release if there are no releases
+    """
+    return by_version[max(by_version, key=lambda key: (key[3], key))]
+
+
+def add_version(
+    by_version: Dict[VersionKey, Mapping[str, Any]], definition: Mapping[str, Any]
+) -> Mapping[str, Any]:
+    """Add a definition to the versions of its decorator.
+
+    A definition with the same version as a loaded one replaces it. Fields equal
+    to those of other versions are shared with them.
+
+    Args:
+        by_version: Definitions of the decorator by version key, updated in place
+        definition: The definition to add
+
+    Returns:
+        The decorator's default definition after the addition
+    """
+    share_fields(definition, by_version.values())
+    by_version[definition_version(definition)] = definition
+    return default_version(by_version)
+
+
+class VersionedDefinitions(Dict[str, Mapping[str, Any]]):
+    """Definitions by name that keep every version assigned to them.
+
+    Assigning a definition adds it to :attr:`versions`; the dictionary itself
+    holds the default version of each decorator. Registry loaders can fill one
+    like a plain dictionary of definitions.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty table.
+
+        Args:
+            self: The table instance
+
+        Returns:
+            None
+        """
+        super().__init__()
+        self.versions: Dict[str, Dict[VersionKey, Mapping[str, Any]]] = {}
+
+    def __setitem__(self, name: str, definition: Mapping[str, Any]) -> None:
+        """Add a version of a decorator.
+
+        Args:
+            name: Name of the decorator
+            definition: The definition to add
+
+        Returns:
+            None
+        """
+        by_version = self.versions.setdefault(name, {})
+        super().__setitem__(name, add_version(by_version, definition))
+
+
+class VersionIndex:
+    """Sorted versions of every decorator with cached range resolution.
+
+    The index is immutable apart from its resolution cache and belongs to one
+    registry generation.
+    """
+
+    # Maximum number of cached (name, request) resolutions
+    CACHE_SIZE = 4096
+
+    def __init__(self, versions: Mapping[str, Mapping[VersionKey, Mapping[str, Any]]]):
+        """Build the index.
+
+        Args:
+            versions: Definitions of each decorator by version key
+
+        Returns:
+            None
+        """
+        self._versions: Dict[
+            str, Tuple[Sequence[VersionKey], Mapping[VersionKey, Mapping[str, Any]]]
+        ] = {
+            name: (sorted(by_version, reverse=True), by_version)
+            for name, by_version in versions.items()
+        }
+        self._cache: Dict[Tuple[str, str], Optional[Mapping[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def versions(self, name: str) -> List[str]:
+        """List the versions of a decorator, newest first.
+
+        Args:
+            name: Name of the decorator
+
+        Returns:
+            The version strings; empty if the decorator is unknown
+        """
+        entry = self._versions.get(name)
+        if entry is None:
+            return []
+        keys, by_version = entry
+        return [str(by_version[key].get("version", "")) for key in keys]
+
+    def resolve(self, name: str, spec: str = "") -> Optional[Mapping[str, Any]]:
+        """Resolve a version request to a definition.
+
+        Args:
+            name: Name of the decorator
+            spec: Version request (see parse_requirement); empty for the latest
+
+        Returns:
+            The highest matching definition, or None if no version matches
+
+        Raises:
+            ValueError: If the request cannot be parsed
+        """
+        cache_key = (name, spec)
+        try:
+            return self._cache[cache_key]
+        except KeyError:
+            pass
+
+        result = self._resolve(name, spec)
+        with self._lock:
+            if len(self._cache) >= self.CACHE_SIZE:
+                self._cache.clear()
+            self._cache[cache_key] = result
+        return result
+
+    def _resolve(self, name: str, spec: str) -> Optional[Mapping[str, Any]]:
+        """Resolve a version request without the cache.
+
+        Args:
+            name: Name of the decorator
+            spec: Version request
+
+        Returns:
+            The highest matching definition, or None if no version matches
+        """
+        requirements, exact = parse_requirement(spec)
+        entry = self._versions.get(name)
+        if entry is None:
+            return None
+        keys, by_version = entry
+        if exact is not None:
+            return by_version.get(exact)
+        if not requirements:
+            # The latest version is the registry's default version
+            return default_version(by_version)
+        for key in keys:
+            # Pre-releases are only matched by an exact request
+            if key[3] and all(
+                compare(key[:3], bound) for compare, bound in requirements
+            ):
+                return by_version[key]
+        return None
@@ -12,14 +12,32 @@ Features:
 - Support for decorator composition
 """
 
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+    overload,
+)
 
 from prompt_decorators.core.base import DecoratorBase, DecoratorParameter
 from prompt_decorators.core.dynamic_decorator import (
     DynamicDecorator,
+    compile_chain,
+    estimate_prompt,
     extract_decorators,
     parse_decorator,
 )
+from prompt_decorators.core.render import DecoratedPrompt, PromptParts
+from prompt_decorators.core.streaming import (
+    apply_dynamic_decorators_stream,
+    transform_response_stream,
+)
 
 __all__ = [
     "DynamicDecorator",
@@ -29,6 +47,11 @@ __all__ = [
     "create_decorator_instance",
     "create_decorator_class",
     "apply_dynamic_decorators",
+    "apply_dynamic_decorators_stream",
+    "transform_response_stream",
+    "PromptParts",
+    "DecoratedPrompt",
+    "compile_chain",
     "apply_decorator",
     "register_decorator",
     "extract_decorator_name",
@@ -36,6 +59,9 @@ __all__ = [
     "create_decorator",
     "list_available_decorators",
     "transform_prompt",
+    "estimate_prompt",
+    "suggest_decorators",
+    "complete_decorator_chain",
 ]
 
 
@@ -122,25 +148,52 @@ def create_decorator_class(definition: DecoratorDefinition) -> type:
     return DynamicDecorator.from_definition(definition)
 
 
-def apply_dynamic_decorators(prompt: str) -> str:
+@overload
+def apply_dynamic_decorators(
+    prompt: str, compose: bool = False, output: Literal["text"] = "text"
+) -> str:
+    """Apply decorators and return the decorated text."""
+
+
+@overload
+def apply_dynamic_decorators(
+    prompt: str, compose: bool = False, *, output: Literal["parts"]
+) -> PromptParts:
+    """Apply decorators and return the prompt parts."""
+
+
+@overload
+def apply_dynamic_decorators(
+    prompt: str, compose: bool = False, *, output: Literal["lazy"]
+) -> DecoratedPrompt:
+    """Apply decorators and return a lazily rendered prompt."""
+
+
+def apply_dynamic_decorators(
+    prompt: str, compose: bool = False, output: str = "text"
+) -> Union[str, PromptParts, DecoratedPrompt]:
     """Apply decorators to a prompt using the +++ syntax.
 
     Args:
         prompt: The prompt text with decorator syntax
+        compose: Whether to honour composition behaviours and drop duplicate text
+        output: "text", "parts" for PromptParts or "lazy" for a DecoratedPrompt
 
     Returns:
-        The transformed prompt
+        The transformed prompt, its parts or the lazily rendered prompt
+
+    Raises:
+        ValueError: If the output mode is unknown
     """
+    if output not in ("text", "parts", "lazy"):
+        raise ValueError(f"Unknown output mode: {output!r}")
     decorators, clean_prompt = extract_decorators(prompt)
-    result = clean_prompt
-    for decorator in decorators:
-        transformed = decorator(result)
-        if isinstance(transformed, str):
-            result = transformed
-        else:
-            # This should not happen in normal usage, but handle it just in case
-            result = str(transformed)
-    return result
+    chain = compile_chain(decorators, compose=compose)
+    if output == "parts":
+        return chain.parts(clean_prompt)
+    if output == "lazy":
+        return chain.decorate(clean_prompt)
+    return chain.apply(clean_prompt)
 
 
 def apply_decorator(decorator_name: str, prompt: str, **kwargs: Any) -> str:
@@ -247,7 +300,56 @@ def list_available_decorators() -> List[str]:
     return [decorator.name for decorator in decorators]
 
 
-def transform_prompt(prompt: str, decorators: List[str]) -> str:
+@overload
+def transform_prompt(
+    prompt: str,
+    decorators: List[str],
+    model: Optional[str] = None,
+    versions: Optional[Dict[str, str]] = None,
+    compose: bool = False,
+    output: Literal["text"] = "text",
+    budget: Optional[int] = None,
+) -> str:
+    """Transform a prompt and return the decorated text."""
+
+
+@overload
+def transform_prompt(
+    prompt: str,
+    decorators: List[str],
+    model: Optional[str] = None,
+    versions: Optional[Dict[str, str]] = None,
+    compose: bool = False,
+    *,
+    output: Literal["parts"],
+    budget: Optional[int] = None,
+) -> PromptParts:
+    """Transform a prompt and return the prompt parts."""
+
+
+@overload
+def transform_prompt(
+    prompt: str,
+    decorators: List[str],
+    model: Optional[str] = None,
+    versions: Optional[Dict[str, str]] = None,
+    compose: bool = False,
+    *,
+    output: Literal["lazy"],
+    budget: Optional[int] = None,
+) -> DecoratedPrompt:
+    """Transform a prompt and return a lazily rendered prompt."""
+
+
+def transform_prompt(
+    prompt: str,
+    decorators: List[str],
+    model: Optional[str] = None,
+    versions: Optional[Dict[str, str]] = None,
+    compose: bool = False,
+    output: str = "text",
+    budget: Optional[int] = None,
+) -> Union[str, PromptParts, DecoratedPrompt]:
     """Transform a prompt using a list of decorator strings.
 
     This function is a wrapper around the core transform_prompt function
@@ -256,12 +358,64 @@ def transform_prompt(prompt: str, decorators: List[str]) -> str:
     Args:
         prompt: The prompt to transform
         decorators: List of decorator strings
+        model: Optional target model id or family for model-specific variants
+        versions: Optional version requests by decorator name, e.g. a tenant's pins
+        compose: Whether to honour composition behaviours and drop duplicate text
+        output: "text", "parts" for PromptParts or "lazy" for a DecoratedPrompt
+        budget: Optional maximum number of tokens of the decorated prompt
 
     Returns:
-        The transformed prompt
+        The transformed prompt, its parts or the lazily rendered prompt
     """
     from prompt_decorators.core.dynamic_decorator import (
         transform_prompt as core_transform_prompt,
     )
 
-    return core_transform_prompt(prompt, decorators)
+    options: Dict[str, Any] = {}
+    if model is not None:
+        options["model"] = model
+    if versions is not None:
+        options["versions"] = versions
+    if compose:
+        options["compose"] = compose
+    if output != "text":
+        options["output"] = output
+    if budget is not None:
+        options["budget"] = budget
+    return cast(
+        Union[str, PromptParts, DecoratedPrompt],
+        core_transform_prompt(prompt, decorators, **options),
+    )
+
+
+def suggest_decorators(decorators: List[str], limit: int = 5) -> List[Tuple[str, int]]:
+    """Suggest decorators that pair well with the given ones.
+
+    Suggestions come from the registry's "enhances" compatibility notes and never
+    include decorators that conflict with the given chain.
+
+    Args:
+        decorators: Names of the decorators already chosen
+        limit: Maximum number of suggestions
+
+    Returns:
+        List of ``(name, score)`` tuples, best first
+    """
+    return DynamicDecorator.get_compatibility_index().suggest(decorators, limit)
+
+
+def complete_decorator_chain(
+    decorators: List[str], max_additions: int = 3
+) -> List[str]:
+    """Extend a decorator chain with well-paired decorators without conflicts.
+
+    Args:
+        decorators: Names of the decorators already in the chain
+        max_additions: Maximum number of decorators to add
+
+    Returns:
+        Names of the decorators to add, in order
+    """
+    return DynamicDecorator.get_compatibility_index().complete_chain(
+        decorators, max_additions
+    )
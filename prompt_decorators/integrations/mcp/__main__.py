@@ -3,6 +3,7 @@
 
 Usage:
     python -m prompt_decorators.integrations.mcp [`--host HOST`] [`--port PORT`] [`--verbose`]
+        [`--watch-registry`] [`--extensions-dir DIR`]
 """
 
 import argparse
@@ -16,6 +17,17 @@ def main() -> None:
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
     parser.add_argument("--host", type=str, default="0.0.0.0", help="Host to bind to")
     parser.add_argument("--port", type=int, default=5000, help="Port to listen on")
+    parser.add_argument(
+        "--watch-registry",
+        action="store_true",
+        help="Reload changed registry files without restarting",
+    )
+    parser.add_argument(
+        "--extensions-dir",
+        action="append",
+        default=[],
+        help="Additional decorator directory to watch (repeatable)",
+    )
     args = parser.parse_args()
 
     # Configure logging level based on verbose flag
@@ -37,6 +49,11 @@ def main() -> None:
             logger.error("MCP SDK not installed. Please install with: pip install mcp")
             sys.exit(1)
 
+        if args.watch_registry:
+            from prompt_decorators.utils.registry_watcher import RegistryWatcher
+
+            RegistryWatcher(extra_dirs=args.extensions_dir).start()
+
         run_server(host=args.host, port=args.port)
     except ImportError as e:
         logger.error(f"Failed to import server: {e}")
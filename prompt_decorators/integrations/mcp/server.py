@@ -107,14 +107,19 @@ mcp = FastMCP("Prompt Decorators")
 
 # Only import decorator modules if MCP is available
 if MCP_AVAILABLE:
+    from prompt_decorators.core.dynamic_decorator import DynamicDecorator
     from prompt_decorators.core.dynamic_decorator import (
         transform_prompt as core_transform_prompt,
     )
     from prompt_decorators.dynamic_decorators_module import (
         apply_dynamic_decorators,
+        complete_decorator_chain,
         get_available_decorators,
         load_decorator_definitions,
     )
+    from prompt_decorators.dynamic_decorators_module import (
+        suggest_decorators as core_suggest_decorators,
+    )
 
     # Make sure decorators are loaded
     load_decorator_definitions()
@@ -431,11 +436,13 @@ if MCP_AVAILABLE:
                     if isinstance(template, dict):
                         response["transformationTemplate"] = template
 
+                # Documentation fields are not kept in memory; load them on demand
+                details = DynamicDecorator.get_decorator_details(name) or {}
+
                 # Add author information if available
-                if hasattr(decorator, "author"):
-                    author = decorator.author
-                    if isinstance(author, dict):
-                        response["author"] = author
+                author = details.get("author")
+                if isinstance(author, dict):
+                    response["author"] = author
 
                 # Add detailed compatibility information
                 if hasattr(decorator, "compatibility"):
@@ -449,16 +456,14 @@ if MCP_AVAILABLE:
                     }
 
                 # Add examples if available
-                if hasattr(decorator, "examples") and decorator.examples:
-                    examples = decorator.examples
-                    if isinstance(examples, list):
-                        response["examples"] = examples
+                examples = details.get("examples")
+                if isinstance(examples, list) and examples:
+                    response["examples"] = examples
 
                 # Add implementation guidance if available
-                if hasattr(decorator, "implementationGuidance"):
-                    guidance = decorator.implementationGuidance
-                    if isinstance(guidance, dict):
-                        response["implementationGuidance"] = guidance
+                guidance = details.get("implementationGuidance")
+                if isinstance(guidance, dict):
+                    response["implementationGuidance"] = guidance
 
                 return {
                     "content": [
@@ -701,7 +706,9 @@ if MCP_AVAILABLE:
             }
 
     @mcp.tool()
-    def transform_prompt(prompt: str, decorator_strings: List[str]) -> Dict[str, Any]:
+    def transform_prompt(
+        prompt: str, decorator_strings: List[str], model: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Transform a prompt using a list of decorator strings.
 
         This tool directly transforms a prompt using the raw decorator syntax strings
@@ -711,6 +718,7 @@ if MCP_AVAILABLE:
         Args:
             prompt: The prompt text to transform.
             decorator_strings: List of decorator syntax strings to apply.
+            model: Optional target model id or family for model-specific variants.
 
         Returns:
             The transformed prompt, following MCP tool response format.
@@ -741,7 +749,9 @@ if MCP_AVAILABLE:
 
             # Create the decorated prompt
             if valid_decorators:
-                transformed_prompt = core_transform_prompt(prompt, valid_decorators)
+                transformed_prompt = core_transform_prompt(
+                    prompt, valid_decorators, model=model
+                )
             else:
                 transformed_prompt = prompt
 
@@ -777,6 +787,45 @@ if MCP_AVAILABLE:
                 ],
             }
 
+    @mcp.tool()
+    def suggest_decorators(
+        decorators: List[str], limit: int = 5, max_additions: int = 3
+    ) -> Dict[str, Any]:
+        """Suggest decorators that pair well with a chain.
+
+        Suggestions are driven by the registry's "enhances" compatibility notes and
+        never conflict with the given decorators. The response also contains a
+        greedy completion of the chain.
+
+        Args:
+            decorators: Names of the decorators already chosen.
+            limit: Maximum number of suggestions to return.
+            max_additions: Maximum number of decorators to add when completing.
+
+        Returns:
+            Suggestions and a conflict-free chain completion.
+        """
+        try:
+            logger.info(f"Suggesting decorators for {decorators}")
+            suggestions = core_suggest_decorators(decorators, limit)
+            completion = complete_decorator_chain(decorators, max_additions)
+            names = ", ".join(name for name, _ in suggestions) or "none"
+            return {
+                "content": [{"type": "text", "text": f"Pairs well with: {names}"}],
+                "suggestions": [
+                    {"name": name, "score": score} for name, score in suggestions
+                ],
+                "completion": completion,
+            }
+        except Exception as e:
+            logger.error(f"Error suggesting decorators: {str(e)}")
+            return {
+                "isError": True,
+                "content": [
+                    {"type": "text", "text": f"Error suggesting decorators: {str(e)}"}
+                ],
+            }
+
     def run_server(host: str = "0.0.0.0", port: int = 5000) -> None:
         """Run the MCP server.
 
@@ -840,12 +889,15 @@ else:
         logger.error("MCP is not available. Cannot apply decorators.")
         return {"error": "MCP is not available"}
 
-    def transform_prompt(prompt: str, decorator_strings: List[str]) -> Dict[str, Any]:
+    def transform_prompt(
+        prompt: str, decorator_strings: List[str], model: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Stub implementation for when MCP is not available.
 
         Args:
             prompt: The prompt text to transform (ignored).
             decorator_strings: List of decorator strings to apply (ignored).
+            model: Optional target model (ignored).
 
         Returns:
             A dictionary with an error message.
@@ -869,6 +921,22 @@ else:
         logger.error("MCP is not available. Cannot create decorated prompt.")
         return {"error": "MCP is not available"}
 
+    def suggest_decorators(
+        decorators: List[str], limit: int = 5, max_additions: int = 3
+    ) -> Dict[str, Any]:
+        """Stub implementation for when MCP is not available.
+
+        Args:
+            decorators: Names of the decorators already chosen (ignored).
+            limit: Maximum number of suggestions to return (ignored).
+            max_additions: Maximum number of decorators to add (ignored).
+
+        Returns:
+            A dictionary with an error message.
+        """
+        logger.error("MCP is not available. Cannot suggest decorators.")
+        return {"error": "MCP is not available"}
+
     def run_server(host: str = "0.0.0.0", port: int = 5000) -> None:
         """Stub implementation for when MCP is not available.
 
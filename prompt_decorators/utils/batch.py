@@ -0,0 +1,325 @@
+"""Bulk transformation of JSONL prompt records.
+
+Each input line is a JSON object with the prompt and the decorators to apply:
+
+    {"id": "q1", "prompt": "Explain DNS.", "decorators": ["+++StepByStep"]}
+
+``decorators`` may be omitted when the prompt carries its decorators inline.
+``model``, ``versions``, ``compose`` and ``budget`` are passed on to
+:func:`~prompt_decorators.core.dynamic_decorator.transform_prompt`, overriding
+the defaults of the run. Each output line holds the input line number, the
+record's ``id`` if it has one, and either the transformed ``prompt`` or an
+``error``:
+
+    {"line": 1, "id": "q1", "prompt": "Please break down ..."}
+
+:func:`transform_lines` parses and transforms records in batches across a
+process pool and yields the results in input order. Only a few batches per
+worker are in flight at a time, so memory stays bounded however large the
+input is. The registry is loaded and compiled in the parent before the pool
+starts, so forked workers inherit it instead of loading it again.
+
+Typical usage:
+    >>> from prompt_decorators.utils.batch import transform_lines
+    >>> with open("prompts.jsonl") as src, open("out.jsonl", "w") as dst:
+    ...     for line in transform_lines(src, jobs=4):
+    ...         dst.write(line + "\\n")
+"""
+
+import json
+import logging
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from prompt_decorators.core.dynamic_decorator import (
+    DECORATOR_PATTERN,
+    DynamicDecorator,
+    transform_prompt,
+)
+from prompt_decorators.utils.json_backend import loads
+
+logger = logging.getLogger(__name__)
+
+# Records sent to a worker at a time
+DEFAULT_BATCH_SIZE = 256
+
+# Batches in flight per worker; bounds memory while keeping workers busy
+BATCHES_PER_WORKER = 2
+
+# Record fields passed on to transform_prompt
+TRANSFORM_OPTIONS = ("model", "versions", "compose", "budget")
+
+# (line number, raw line)
+NumberedLine = Tuple[int, str]
+
+
+class BatchStats:
+    """Counters and throughput of a bulk transformation."""
+
+    __slots__ = ("records", "errors", "bytes_in", "bytes_out", "start")
+
+    def __init__(self) -> None:
+        """Initialize the counters and start the clock.
+
+        Args:
+            self: The stats instance
+
+        Returns:
+            None
+        """
+        self.records = 0
+        self.errors = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.start = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        """Get the seconds since the run started.
+
+        Args:
+            self: The stats instance
+
+        Returns:
+            The elapsed wall-clock time
+        """
+        return time.perf_counter() - self.start
+
+    def summary(self) -> str:
+        """Describe the progress and throughput so far.
+
+        Args:
+            self: The stats instance
+
+        Returns:
+            A one-line summary
+        """
+        elapsed = max(self.elapsed, 1e-9)
+        return (
+            f"{self.records} records ({self.errors} errors) in {elapsed:.2f}s: "
+            f"{self.records / elapsed:.0f} records/s, "
+            f"{self.bytes_in / elapsed / 1e6:.2f} MB/s in, "
+            f"{self.bytes_out / elapsed / 1e6:.2f} MB/s out"
+        )
+
+
+def transform_record(
+    record: Mapping[str, Any], defaults: Optional[Mapping[str, Any]] = None
+) -> str:
+    """Transform the prompt of one record.
+
+    Args:
+        record: The record, with ``prompt`` and optionally ``decorators``
+        defaults: Options for records that do not set them
+
+    Returns:
+        The transformed prompt
+
+    Raises:
+        ValueError: If the record has no prompt or its decorators are not a list
+    """
+    prompt = record.get("prompt")
+    if not isinstance(prompt, str):
+        raise ValueError("record has no 'prompt' string")
+    options = dict(defaults or {})
+    options.update((k, record[k]) for k in TRANSFORM_OPTIONS if k in record)
+    decorators = record.get("decorators")
+    if decorators is None:
+        # The prompt carries its decorators inline
+        decorators = [
+            m.group(0) for m in re.finditer(DECORATOR_PATTERN, prompt, re.MULTILINE)
+        ]
+        for decorator in decorators:
+            prompt = prompt.replace(decorator, "", 1)
+        prompt = prompt.strip()
+    elif isinstance(decorators, str):
+        decorators = [decorators]
+    if not isinstance(decorators, list):
+        raise ValueError("'decorators' must be a list of decorator strings")
+    return str(transform_prompt(prompt, decorators, **options))
+
+
+def transform_batch(
+    lines: List[NumberedLine], defaults: Optional[Mapping[str, Any]] = None
+) -> List[Tuple[str, bool]]:
+    """Transform a batch of JSONL lines.
+
+    Args:
+        lines: The numbered input lines
+        defaults: Options for records that do not set them
+
+    Returns:
+        List of (JSON result line, whether it is an error) in input order
+    """
+    results = []
+    for number, line in lines:
+        result: Dict[str, Any] = {"line": number}
+        try:
+            record = loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("record is not a JSON object")
+            if "id" in record:
+                result["id"] = record["id"]
+            result["prompt"] = transform_record(record, defaults)
+        except Exception as e:
+            result["error"] = str(e)
+        results.append((json.dumps(result, ensure_ascii=False), "error" in result))
+    return results
+
+
+def _numbered(lines: Iterable[str], offset: int) -> Iterator[NumberedLine]:
+    """Number the records of a JSONL input, skipping blank lines.
+
+    Args:
+        lines: The input lines
+        offset: Number of records to skip
+
+    Returns:
+        Iterator of (record number from 1, line) after the skipped records
+    """
+    number = 0
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        number += 1
+        if number > offset:
+            yield number, line
+
+
+def transform_lines(
+    lines: Iterable[str],
+    jobs: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    offset: int = 0,
+    defaults: Optional[Mapping[str, Any]] = None,
+    stats: Optional[BatchStats] = None,
+) -> Iterator[str]:
+    """Transform JSONL records, in order, across a process pool.
+
+    Args:
+        lines: The input lines; blank lines are ignored
+        jobs: Worker processes; defaults to the CPU count, 1 disables the pool
+        batch_size: Records sent to a worker at a time
+        offset: Number of records to skip, e.g. those done by an earlier run
+        defaults: Options for records that do not set them
+        stats: Counters to update as results are produced
+
+    Returns:
+        Iterator of JSON result lines without line endings
+    """
+    stats = stats if stats is not None else BatchStats()
+    records = _numbered(lines, offset)
+    batches = iter(lambda: list(islice(records, batch_size)), [])
+
+    def emit(
+        results: List[Tuple[str, bool]], batch: List[NumberedLine]
+    ) -> Iterator[str]:
+        """Count a finished batch and yield its result lines.
+
+        Args:
+            results: The batch's results
+            batch: The batch's input lines
+
+        Returns:
+            Iterator of the result lines
+        """
+        stats.records += len(results)
+        stats.bytes_in += sum(len(line) + 1 for _, line in batch)
+        for line, failed in results:
+            stats.errors += failed
+            stats.bytes_out += len(line) + 1
+            yield line
+
+    workers = jobs or os.cpu_count() or 1
+    if workers <= 1:
+        for batch in batches:
+            yield from emit(transform_batch(batch, defaults), batch)
+        return
+
+    # Workers forked from here inherit the loaded registry
+    DynamicDecorator.compile_registry()
+    pending: Deque[Tuple[Future, List[NumberedLine]]] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for batch in batches:
+            pending.append((pool.submit(transform_batch, batch, defaults), batch))
+            if len(pending) >= workers * BATCHES_PER_WORKER:
+                future, done = pending.popleft()
+                yield from emit(future.result(), done)
+        while pending:
+            future, done = pending.popleft()
+            yield from emit(future.result(), done)
+
+
+def count_records(path: str) -> int:
+    """Count the complete result lines of an earlier run's output.
+
+    A partial last line, left by an interrupted run, is removed from the file
+    so the run can append after it.
+
+    Args:
+        path: Path of the JSONL output file
+
+    Returns:
+        The number of complete lines, or 0 if the file does not exist
+    """
+    if not os.path.exists(path):
+        return 0
+    count = 0
+    complete = 0
+    with open(path, "rb+") as f:
+        for line in f:
+            if line.endswith(b"\n"):
+                complete += len(line)
+                count += 1 if line.strip() else 0
+        if f.tell() != complete:
+            logger.warning(f"Removing a partial line at the end of {path}")
+            f.truncate(complete)
+    return count
+
+
+def write_lines(
+    results: Iterable[str],
+    output: IO[str],
+    progress: Optional[Callable[[], None]] = None,
+    interval: float = 0,
+) -> None:
+    """Write result lines, reporting progress at an interval.
+
+    Args:
+        results: The JSON result lines
+        output: The text stream to write to
+        progress: Function called every ``interval`` seconds and at the end
+        interval: Seconds between progress calls; 0 only calls it at the end
+
+    Returns:
+        None
+    """
+    next_report = time.perf_counter() + interval
+    for line in results:
+        output.write(line)
+        output.write("\n")
+        if interval and progress and time.perf_counter() >= next_report:
+            output.flush()
+            progress()
+            next_report = time.perf_counter() + interval
+    output.flush()
+    if progress:
+        progress()
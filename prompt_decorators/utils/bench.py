@@ -0,0 +1,426 @@
+"""Standard performance workloads for the decorator engine.
+
+:func:`run_benchmarks` runs a fixed set of workloads against the installed
+registry, so results from different hosts and Python versions can be compared:
+
+``cold_import``
+    Importing the package in a fresh interpreter.
+``registry_load``
+    Loading and publishing the registry.
+``single_apply``
+    Creating each decorator in the registry and applying it to a prompt, one at
+    a time. Parameters are taken from the definition: the default, the first
+    enum value, or a sample value for the parameter's type.
+``long_chain``
+    Transforming a prompt with a chain of 32 decorators.
+``large_prompt``
+    Transforming a 4 MB prompt with a chain of 5 decorators.
+``parser_stress``
+    Extracting 200 inline decorator annotations with parameters from a prompt.
+
+Every operation of a workload is timed on its own, after one warm-up pass, and
+the result reports throughput and latency percentiles. The workloads use fixed
+inputs, so two runs differ only by the host and interpreter.
+
+Typical usage:
+    >>> from prompt_decorators.utils.bench import run_benchmarks
+    >>> for result in run_benchmarks(["long_chain"], iterations=100):
+    ...     print(result.name, result.percentile(50))
+"""
+
+import cProfile
+import os
+import platform
+import subprocess
+import sys
+import time
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+from prompt_decorators.core.dynamic_decorator import (
+    DynamicDecorator,
+    extract_decorators,
+    transform_prompt,
+    value_bounds,
+)
+from prompt_decorators.utils.json_backend import JSON_BACKEND
+
+# A zero-argument operation whose run time is measured
+Operation = Callable[[], Any]
+
+PROMPT = "Explain how DNS resolution works, from the browser to the root servers."
+
+# Decorators used by the chain workloads, in order
+CHAIN = (
+    "+++StepByStep(numbered=true)",
+    "+++Reasoning(depth=comprehensive)",
+    "+++Concise",
+    "+++Detailed",
+    "+++Audience(level=beginner)",
+)
+
+# Values for parameters that have no default or enum values, by type
+SAMPLE_VALUES: Dict[str, Any] = {
+    "string": "sample",
+    "boolean": True,
+    "array": ["sample"],
+    "object": {},
+}
+
+# Parameters that cannot be passed as keywords to DynamicDecorator
+RESERVED_NAMES = frozenset({"name", "target_model"})
+
+LONG_CHAIN_LENGTH = 32
+LARGE_PROMPT_SIZE = 4 * 1024 * 1024
+PARSER_ANNOTATIONS = 200
+
+
+def _cold_import() -> List[Operation]:
+    """Build the cold import workload.
+
+    Returns:
+        An operation importing the package in a new interpreter
+    """
+    command = [sys.executable, "-c", "import prompt_decorators"]
+    return [lambda: subprocess.run(command, check=True)]
+
+
+def _registry_load() -> List[Operation]:
+    """Build the registry load workload.
+
+    Returns:
+        An operation loading the registry
+    """
+    return [DynamicDecorator.load_registry]
+
+
+def _sample_value(param_def: Mapping[str, Any]) -> Any:
+    """Pick a valid value for a decorator parameter.
+
+    Args:
+        param_def: The parameter definition
+
+    Returns:
+        The default if it is valid, else the first enum value or a sample value
+    """
+    choices = param_def.get("enum_values") or param_def.get("enum")
+    default = param_def.get("default")
+    if choices:
+        return default if default in choices else choices[0]
+    if default is not None:
+        return default
+    param_type = param_def.get("type", "string")
+    if param_type == "number":
+        minimum = value_bounds(param_def)[0]
+        return 1 if minimum is None else minimum
+    return SAMPLE_VALUES.get(param_type, "sample")
+
+
+def sample_parameters(name: str) -> Dict[str, Any]:
+    """Build parameters that a decorator accepts.
+
+    Args:
+        name: Name of the decorator
+
+    Returns:
+        A value for each parameter that is required or has no valid default,
+        except those named like arguments of the DynamicDecorator constructor
+    """
+    definition = DynamicDecorator.get_snapshot()[name]
+    parameters = {}
+    for param_def in definition.get("parameters") or []:
+        choices = param_def.get("enum_values") or param_def.get("enum")
+        default = param_def.get("default")
+        valid_default = default is not None and (not choices or default in choices)
+        if param_def["name"] in RESERVED_NAMES:
+            continue
+        if param_def.get("required") or not valid_default:
+            parameters[param_def["name"]] = _sample_value(param_def)
+    return parameters
+
+
+def _apply(name: str, parameters: Mapping[str, Any]) -> str:
+    """Create a decorator and apply it to the sample prompt.
+
+    Args:
+        name: Name of the decorator
+        parameters: Parameters of the decorator
+
+    Returns:
+        The decorated prompt
+    """
+    return DynamicDecorator(name, **parameters).apply(PROMPT)
+
+
+def _single_apply() -> List[Operation]:
+    """Build the single decorator workload.
+
+    Returns:
+        An operation per decorator in the registry
+    """
+    return [
+        partial(_apply, name, sample_parameters(name))
+        for name in sorted(DynamicDecorator.get_snapshot())
+    ]
+
+
+def _long_chain() -> List[Operation]:
+    """Build the long chain workload.
+
+    Returns:
+        An operation applying a long decorator chain
+    """
+    chain = [CHAIN[i % len(CHAIN)] for i in range(LONG_CHAIN_LENGTH)]
+    return [lambda: transform_prompt(PROMPT, chain)]
+
+
+def _large_prompt() -> List[Operation]:
+    """Build the large prompt workload.
+
+    Returns:
+        An operation decorating a large prompt
+    """
+    prompt = (PROMPT + "\n") * (LARGE_PROMPT_SIZE // (len(PROMPT) + 1))
+    chain = list(CHAIN)
+    return [lambda: transform_prompt(prompt, chain)]
+
+
+def _parser_stress() -> List[Operation]:
+    """Build the parser stress workload.
+
+    Returns:
+        An operation extracting many inline decorators
+    """
+    lines = [CHAIN[i % len(CHAIN)] for i in range(PARSER_ANNOTATIONS)]
+    text = "\n".join(lines) + "\n" + PROMPT
+    return [lambda: extract_decorators(text)]
+
+
+# Workload builders and default iterations, in the order they run
+WORKLOADS: Dict[str, Callable[[], List[Operation]]] = {
+    "cold_import": _cold_import,
+    "registry_load": _registry_load,
+    "single_apply": _single_apply,
+    "long_chain": _long_chain,
+    "large_prompt": _large_prompt,
+    "parser_stress": _parser_stress,
+}
+DEFAULT_ITERATIONS: Dict[str, int] = {
+    "cold_import": 5,
+    "registry_load": 20,
+    "single_apply": 50,
+    "long_chain": 1000,
+    "large_prompt": 50,
+    "parser_stress": 200,
+}
+
+
+class BenchResult:
+    """Timings of one workload."""
+
+    __slots__ = ("name", "latencies", "seconds")
+
+    def __init__(self, name: str, latencies: List[float], seconds: float) -> None:
+        """Initialize a result.
+
+        Args:
+            name: Name of the workload
+            latencies: Seconds taken by each operation
+            seconds: Total wall-clock time of the measured runs
+
+        Returns:
+            None
+        """
+        self.name = name
+        self.latencies = sorted(latencies)
+        self.seconds = seconds
+
+    @property
+    def ops(self) -> int:
+        """Get the number of operations measured.
+
+        Args:
+            self: The result instance
+
+        Returns:
+            The operation count
+        """
+        return len(self.latencies)
+
+    def percentile(self, percent: float) -> float:
+        """Get a latency percentile, by the nearest-rank method.
+
+        Args:
+            self: The result instance
+            percent: The percentile, from 0 to 100
+
+        Returns:
+            The latency in seconds, or 0 if nothing was measured
+        """
+        if not self.latencies:
+            return 0.0
+        rank = max(1, -(-len(self.latencies) * percent // 100))
+        return self.latencies[min(int(rank), len(self.latencies)) - 1]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the result to a JSON-serializable dictionary.
+
+        Args:
+            self: The result instance
+
+        Returns:
+            The operation count, throughput and latencies in milliseconds
+        """
+        return {
+            "name": self.name,
+            "ops": self.ops,
+            "seconds": self.seconds,
+            "ops_per_second": self.ops / self.seconds if self.seconds else 0.0,
+            "mean_ms": sum(self.latencies) / self.ops * 1000 if self.ops else 0.0,
+            "p50_ms": self.percentile(50) * 1000,
+            "p90_ms": self.percentile(90) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": self.percentile(100) * 1000,
+        }
+
+
+def run_workload(
+    name: str,
+    operations: List[Operation],
+    iterations: int,
+    profiler: Optional[cProfile.Profile] = None,
+) -> BenchResult:
+    """Time the operations of a workload.
+
+    Args:
+        name: Name of the workload
+        operations: The operations, each run once per iteration
+        iterations: Number of measured passes over the operations
+        profiler: Profiler enabled during the measured passes, if any
+
+    Returns:
+        The workload's timings
+    """
+    for operation in operations:
+        operation()
+    latencies = []
+    clock = time.perf_counter
+    start = clock()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        for _ in range(iterations):
+            for operation in operations:
+                began = clock()
+                operation()
+                latencies.append(clock() - began)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+    return BenchResult(name, latencies, clock() - start)
+
+
+def select_workloads(names: Optional[Iterable[str]] = None) -> List[str]:
+    """Check workload names and put them in the order they run.
+
+    Args:
+        names: Workloads to run; all by default
+
+    Returns:
+        The workload names, in :data:`WORKLOADS` order
+
+    Raises:
+        ValueError: If a workload name is unknown
+    """
+    if names is None:
+        return list(WORKLOADS)
+    requested = set(names)
+    unknown = sorted(requested - set(WORKLOADS))
+    if unknown:
+        raise ValueError(f"Unknown workload(s): {', '.join(unknown)}")
+    return [name for name in WORKLOADS if name in requested]
+
+
+def run_benchmarks(
+    names: Optional[Iterable[str]] = None,
+    iterations: Optional[int] = None,
+    profile_dir: Optional[str] = None,
+    progress: Optional[Callable[[BenchResult], None]] = None,
+) -> List[BenchResult]:
+    """Run the standard workloads.
+
+    Args:
+        names: Workloads to run, in :data:`WORKLOADS` order; all by default
+        iterations: Passes per workload, instead of :data:`DEFAULT_ITERATIONS`
+        profile_dir: Directory to write a ``<workload>.pstats`` file per workload
+        progress: Function called with each result as it completes
+
+    Returns:
+        The results, in the order the workloads ran
+
+    Raises:
+        ValueError: If a workload name is unknown
+    """
+    selected = select_workloads(names)
+    if profile_dir:
+        os.makedirs(profile_dir, exist_ok=True)
+
+    results = []
+    for name in selected:
+        profiler = cProfile.Profile() if profile_dir else None
+        result = run_workload(
+            name,
+            WORKLOADS[name](),
+            iterations or DEFAULT_ITERATIONS[name],
+            profiler,
+        )
+        if profiler is not None and profile_dir:
+            profiler.dump_stats(os.path.join(profile_dir, f"{name}.pstats"))
+        results.append(result)
+        if progress:
+            progress(result)
+    return results
+
+
+def environment() -> Dict[str, Any]:
+    """Describe the host, interpreter and registry the benchmarks ran on.
+
+    Returns:
+        Dictionary of environment details
+    """
+    import prompt_decorators
+
+    snapshot = DynamicDecorator.get_snapshot()
+    return {
+        "package_version": getattr(prompt_decorators, "__version__", "unknown"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "json_backend": JSON_BACKEND,
+        "decorators": len(snapshot),
+    }
+
+
+def format_result(result: BenchResult) -> str:
+    """Format a result as a table row.
+
+    Args:
+        result: The workload's timings
+
+    Returns:
+        The row, aligned with :data:`TABLE_HEADER`
+    """
+    row = result.to_dict()
+    return (
+        f"{row['name']:<15}{row['ops']:>8}{row['ops_per_second']:>12.1f}"
+        f"{row['p50_ms']:>10.3f}{row['p90_ms']:>10.3f}{row['p99_ms']:>10.3f}"
+        f"{row['max_ms']:>10.3f}"
+    )
+
+
+TABLE_HEADER = (
+    f"{'workload':<15}{'ops':>8}{'ops/s':>12}"
+    f"{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+)
@@ -1,9 +1,28 @@
 """Decorator Compatibility Module.
 
 This module provides utilities for checking compatibility between decorators.
+Registry metadata (``compatibility.requires``/``conflicts`` and
+``implementationGuidance.compatibilityNotes``) is compiled into a
+:class:`CompatibilityIndex` that maps decorator names to integer ids and stores
+relationships as bitsets, so a chain of *k* decorators validates in O(k). The
+same index keeps the "enhances" graph for recommendation queries.
 """
+import ast
 import logging
-from typing import Any, Dict, List, Optional, Set, Union
+import operator
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from ..core.base import BaseDecorator
 
@@ -14,6 +33,212 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _decorator_name(decorator: Any) -> str:
+    """Get the name of a decorator given as a string or decorator instance.
+
+    Args:
+        decorator: Decorator name or decorator instance
+
+    Returns:
+        The decorator name
+    """
+    if isinstance(decorator, str):
+        return decorator
+    return getattr(decorator, "name", str(decorator))
+
+
+def _decorator_parameters(decorator: Any) -> Dict[str, Any]:
+    """Get the parameter values of a decorator for condition evaluation.
+
+    Supports both dynamic decorators (parameters holding ``value`` attributes)
+    and class-based decorators (values stored as ``_<name>`` attributes).
+
+    Args:
+        decorator: Decorator name or decorator instance
+
+    Returns:
+        Dictionary mapping parameter names to their values
+    """
+    if isinstance(decorator, str):
+        return {}
+    values: Dict[str, Any] = {}
+    for param_name, param in (getattr(decorator, "parameters", None) or {}).items():
+        if hasattr(param, "value"):
+            values[param_name] = param.value
+        else:
+            values[param_name] = getattr(decorator, f"_{param_name}", None)
+    return values
+
+
+# Context handed to compiled conditions: decorator name -> parameter values
+ConditionContext = Mapping[str, Mapping[str, Any]]
+Condition = Callable[[ConditionContext], Any]
+
+_COMPARISONS: Dict[type, Callable[[Any, Any], Any]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.In: lambda left, right: left in right,
+    ast.NotIn: lambda left, right: left not in right,
+}
+
+
+def compile_condition(expression: str) -> Callable[[ConditionContext], bool]:
+    """Compile a rule condition into a predicate over decorator parameters.
+
+    Conditions use a small, safe subset of Python expression syntax:
+
+    * ``Decorator`` - true when the decorator is present
+    * ``Decorator.param`` - the parameter's value (``None`` when absent)
+    * ``Decorator is present`` / ``Decorator is absent`` (or ``is not present``)
+    * comparisons (``==``, ``!=``, ``<``, ``<=``, ``>``, ``>=``, ``in``, ``not in``)
+      against literals, lists and tuples
+    * ``and``, ``or`` and ``not``
+
+    Args:
+        expression: The condition expression
+
+    Returns:
+        A predicate taking a mapping of decorator name to parameter values
+
+    Raises:
+        ValueError: If the expression is malformed or uses unsupported syntax
+    """
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid condition '{expression}': {e.msg}") from e
+
+    evaluate = _compile_node(tree.body, expression)
+
+    def predicate(context: ConditionContext) -> bool:
+        """Evaluate the condition, treating incomparable values as false.
+
+        Args:
+            context: Mapping of decorator name to parameter values
+
+        Returns:
+            Whether the condition holds
+        """
+        try:
+            return bool(evaluate(context))
+        except TypeError:
+            # e.g. ordering comparison against a missing (None) parameter
+            return False
+
+    return predicate
+
+
+def _compile_node(node: ast.AST, expression: str) -> Condition:
+    """Compile a single condition AST node into a closure.
+
+    Args:
+        node: The AST node to compile
+        expression: The full expression, used for error messages
+
+    Returns:
+        A closure evaluating the node against a condition context
+
+    Raises:
+        ValueError: If the node uses unsupported syntax
+    """
+    if isinstance(node, ast.BoolOp):
+        operands = [_compile_node(value, expression) for value in node.values]
+        if isinstance(node.op, ast.And):
+            return lambda ctx: all(operand(ctx) for operand in operands)
+        return lambda ctx: any(operand(ctx) for operand in operands)
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        operand = _compile_node(node.operand, expression)
+        return lambda ctx: not operand(ctx)
+
+    if isinstance(node, ast.Compare):
+        if len(node.ops) == 1 and isinstance(node.ops[0], (ast.Is, ast.IsNot)):
+            return _compile_presence(node, expression)
+        left = _compile_node(node.left, expression)
+        steps = []
+        for op, comparator in zip(node.ops, node.comparators):
+            compare = _COMPARISONS.get(type(op))
+            if compare is None:
+                raise ValueError(f"Unsupported operator in condition '{expression}'")
+            steps.append((compare, _compile_node(comparator, expression)))
+
+        def compare_chain(ctx: ConditionContext) -> bool:
+            """Evaluate a (possibly chained) comparison.
+
+            Args:
+                ctx: Mapping of decorator name to parameter values
+
+            Returns:
+                Whether every comparison in the chain holds
+            """
+            current = left(ctx)
+            for compare, right in steps:
+                other = right(ctx)
+                if not compare(current, other):
+                    return False
+                current = other
+            return True
+
+        return compare_chain
+
+    if isinstance(node, ast.Name):
+        name = node.id
+        return lambda ctx: name in ctx
+
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+        decorator, param = node.value.id, node.attr
+        return lambda ctx: (ctx.get(decorator) or {}).get(param)
+
+    if isinstance(node, ast.Constant):
+        value = node.value
+        return lambda ctx: value
+
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        if all(isinstance(element, ast.Constant) for element in node.elts):
+            values = tuple(
+                element.value
+                for element in node.elts
+                if isinstance(element, ast.Constant)
+            )
+            return lambda ctx: values
+        elements = [_compile_node(element, expression) for element in node.elts]
+        return lambda ctx: tuple(element(ctx) for element in elements)
+
+    raise ValueError(
+        f"Unsupported syntax '{type(node).__name__}' in condition '{expression}'"
+    )
+
+
+def _compile_presence(node: ast.Compare, expression: str) -> Condition:
+    """Compile an ``X is present`` / ``X is absent`` style comparison.
+
+    Args:
+        node: The comparison node
+        expression: The full expression, used for error messages
+
+    Returns:
+        A closure evaluating the presence check
+
+    Raises:
+        ValueError: If the comparison is not a presence check
+    """
+    comparator = node.comparators[0]
+    if not isinstance(node.left, ast.Name) or not isinstance(comparator, ast.Name):
+        raise ValueError(f"Unsupported 'is' comparison in condition '{expression}'")
+    if comparator.id not in ("present", "absent"):
+        raise ValueError(
+            f"Expected 'present' or 'absent' in condition '{expression}', "
+            f"got '{comparator.id}'"
+        )
+    name = node.left.id
+    expect_present = (comparator.id == "present") != isinstance(node.ops[0], ast.IsNot)
+    return lambda ctx: (name in ctx) == expect_present
+
+
 class CompatibilityIssue:
     """Class representing a compatibility issue between decorators."""
 
@@ -37,12 +262,8 @@ class CompatibilityIssue:
             severity: Issue severity (info, warning, error)
         """
         self.message = message
-        self.decorator1 = (
-            decorator1.name if isinstance(decorator1, BaseDecorator) else decorator1
-        )
-        self.decorator2 = (
-            decorator2.name if isinstance(decorator2, BaseDecorator) else decorator2
-        )
+        self.decorator1 = _decorator_name(decorator1)
+        self.decorator2 = _decorator_name(decorator2)
         self.severity = severity
 
     def __str__(self) -> str:
@@ -54,20 +275,439 @@ class CompatibilityIssue:
         return f"{self.severity.upper()}: {self.message} (between {self.decorator1} and {self.decorator2})"
 
 
+def _iter_bits(mask: int) -> Iterable[int]:
+    """Iterate over the positions of the set bits in a mask, lowest first.
+
+    Args:
+        mask: Integer bitset
+
+    Returns:
+        Iterator over the positions of set bits
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class CompatibilityIndex:
+    """Compiled view of registry compatibility metadata.
+
+    Every decorator name gets a stable integer id (its position in sorted order)
+    and each relationship is stored as an integer bitset indexed by id. Checking
+    a chain only needs one mask update per decorator, so validation cost grows
+    linearly with chain length rather than with the number of pairs.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        """Initialize an empty index for a fixed set of decorator names.
+
+        Args:
+            names: Names of all decorators known to the index
+        """
+        self._names: List[str] = sorted(set(names))
+        self._ids: Dict[str, int] = {name: i for i, name in enumerate(self._names)}
+        size = len(self._names)
+        self._conflicts: List[int] = [0] * size
+        self._requires: List[int] = [0] * size
+        # Requirements that name decorators outside the index
+        self._unresolved_requires: Dict[int, List[str]] = {}
+        # Explanations for conflicts, keyed by sorted id pair
+        self._conflict_notes: Dict[Tuple[int, int], str] = {}
+        # "enhances" adjacency in both directions
+        self._enhances: List[int] = [0] * size
+        self._enhanced_by: List[int] = [0] * size
+
+    @classmethod
+    def from_definitions(
+        cls, definitions: Mapping[str, Mapping[str, Any]]
+    ) -> "CompatibilityIndex":
+        """Compile an index from decorator definitions.
+
+        Reads ``compatibility.requires``/``compatibility.conflicts`` and the
+        ``compatibilityNotes`` from each definition. Notes that reference names
+        that are not decorators (e.g. ``"All"``) are ignored.
+
+        Args:
+            definitions: Mapping of decorator name to definition
+
+        Returns:
+            The compiled index
+        """
+        index = cls(definitions.keys())
+        for name, definition in definitions.items():
+            compatibility = definition.get("compatibility") or {}
+            for other in compatibility.get("conflicts") or []:
+                index.add_conflict(name, other)
+            for other in compatibility.get("requires") or []:
+                index.add_requirement(name, other)
+
+            for note in definition.get("compatibilityNotes") or []:
+                other = note.get("decorator")
+                relationship = note.get("relationship")
+                if not other or other not in index._ids:
+                    continue
+                if relationship == "conflicts":
+                    index.add_conflict(name, other, note.get("notes"))
+                elif relationship == "requires":
+                    index.add_requirement(name, other)
+                elif relationship == "enhances":
+                    index.add_enhancement(name, other)
+        return index
+
+    @property
+    def names(self) -> List[str]:
+        """Decorator names in id order.
+
+        Args:
+            self: The index instance
+
+        Returns:
+            List of decorator names
+        """
+        return list(self._names)
+
+    def id_of(self, name: str) -> Optional[int]:
+        """Get the integer id of a decorator.
+
+        Args:
+            name: Decorator name
+
+        Returns:
+            The id, or None if the decorator is not in the index
+        """
+        return self._ids.get(name)
+
+    def mask_of(self, names: Iterable[str]) -> int:
+        """Build a bitset containing the given decorators.
+
+        Args:
+            names: Decorator names; unknown names are ignored
+
+        Returns:
+            Integer bitset with one bit per known decorator
+        """
+        mask = 0
+        ids = self._ids
+        for name in names:
+            i = ids.get(name)
+            if i is not None:
+                mask |= 1 << i
+        return mask
+
+    def add_conflict(self, name1: str, name2: str, note: Optional[str] = None) -> None:
+        """Record that two decorators conflict (symmetric).
+
+        Args:
+            name1: First decorator name
+            name2: Second decorator name
+            note: Optional explanation of the conflict
+
+        Returns:
+            None
+        """
+        id1, id2 = self._ids.get(name1), self._ids.get(name2)
+        if id1 is None or id2 is None or id1 == id2:
+            return
+        self._conflicts[id1] |= 1 << id2
+        self._conflicts[id2] |= 1 << id1
+        if note:
+            self._conflict_notes.setdefault((min(id1, id2), max(id1, id2)), note)
+
+    def add_requirement(self, name: str, required: str) -> None:
+        """Record that a decorator requires another one in the same chain.
+
+        Args:
+            name: Decorator with the requirement
+            required: Decorator that must also be present
+
+        Returns:
+            None
+        """
+        i = self._ids.get(name)
+        if i is None or required == name:
+            return
+        j = self._ids.get(required)
+        if j is None:
+            self._unresolved_requires.setdefault(i, []).append(required)
+        else:
+            self._requires[i] |= 1 << j
+
+    def add_enhancement(self, name: str, enhanced: str) -> None:
+        """Record that a decorator enhances another one.
+
+        Args:
+            name: Decorator that enhances
+            enhanced: Decorator that is enhanced
+
+        Returns:
+            None
+        """
+        i, j = self._ids.get(name), self._ids.get(enhanced)
+        if i is None or j is None or i == j:
+            return
+        self._enhances[i] |= 1 << j
+        self._enhanced_by[j] |= 1 << i
+
+    def conflicts_of(self, name: str) -> List[str]:
+        """Get the decorators that conflict with a decorator.
+
+        Args:
+            name: Decorator name
+
+        Returns:
+            Sorted list of conflicting decorator names
+        """
+        i = self._ids.get(name)
+        if i is None:
+            return []
+        return [self._names[j] for j in _iter_bits(self._conflicts[i])]
+
+    def requirements_of(self, name: str) -> List[str]:
+        """Get the decorators a decorator requires.
+
+        Args:
+            name: Decorator name
+
+        Returns:
+            List of required decorator names
+        """
+        i = self._ids.get(name)
+        if i is None:
+            return []
+        required = [self._names[j] for j in _iter_bits(self._requires[i])]
+        return required + self._unresolved_requires.get(i, [])
+
+    def _ranked_candidates(self, present: int) -> List[Tuple[int, int]]:
+        """Rank decorators linked to a chain by the "enhances" graph.
+
+        Args:
+            present: Bitset of the decorators already in the chain
+
+        Returns:
+            ``(negated score, id)`` pairs, best first, excluding chain members and
+            decorators that conflict with the chain
+        """
+        forbidden = present
+        linked = 0
+        for i in _iter_bits(present):
+            forbidden |= self._conflicts[i]
+            linked |= self._enhances[i] | self._enhanced_by[i]
+
+        ranked = []
+        for c in _iter_bits(linked & ~forbidden):
+            score = (self._enhances[c] & present).bit_count() + (
+                self._enhanced_by[c] & present
+            ).bit_count()
+            ranked.append((-score, c))
+        ranked.sort()
+        return ranked
+
+    def suggest(self, names: Iterable[str], limit: int = 5) -> List[Tuple[str, int]]:
+        """Suggest decorators that pair well with a chain.
+
+        A candidate scores one point for every chain member it enhances or is
+        enhanced by. Candidates that conflict with the chain are excluded; ties
+        are broken by name so results are deterministic.
+
+        Args:
+            names: Decorator names already in the chain
+            limit: Maximum number of suggestions
+
+        Returns:
+            List of ``(name, score)`` tuples, best first
+        """
+        ranked = self._ranked_candidates(self.mask_of(names))
+        return [(self._names[c], -score) for score, c in ranked[:limit]]
+
+    def complete_chain(self, names: Iterable[str], max_additions: int = 3) -> List[str]:
+        """Greedily extend a chain with well-paired, non-conflicting decorators.
+
+        Each step adds the best-scoring candidate whose requirements are already
+        satisfied by the chain, so the completed chain introduces no conflicts.
+
+        Args:
+            names: Decorator names already in the chain
+            max_additions: Maximum number of decorators to add
+
+        Returns:
+            The decorators to add, in the order they were chosen
+        """
+        present = self.mask_of(names)
+        additions: List[str] = []
+        while len(additions) < max_additions:
+            for _, c in self._ranked_candidates(present):
+                if c in self._unresolved_requires:
+                    continue
+                if self._requires[c] & ~present:
+                    continue
+                present |= 1 << c
+                additions.append(self._names[c])
+                break
+            else:
+                break
+        return additions
+
+    def is_valid_chain(self, names: Iterable[str]) -> bool:
+        """Check whether a chain has no conflicts and no missing requirements.
+
+        Args:
+            names: Decorator names in chain order
+
+        Returns:
+            True if the chain is valid
+        """
+        present = 0
+        forbidden = 0
+        required = 0
+        ids = self._ids
+        for name in names:
+            i = ids.get(name)
+            if i is None:
+                continue
+            bit = 1 << i
+            if forbidden & bit or self._conflicts[i] & present:
+                return False
+            if i in self._unresolved_requires:
+                return False
+            present |= bit
+            forbidden |= self._conflicts[i]
+            required |= self._requires[i]
+        return required & ~present == 0
+
+    def validate_chain(self, names: Sequence[str]) -> List[CompatibilityIssue]:
+        """Validate a chain and describe every conflict and missing requirement.
+
+        Args:
+            names: Decorator names in chain order
+
+        Returns:
+            List of compatibility issues (empty if the chain is valid)
+        """
+        issues: List[CompatibilityIssue] = []
+        present = 0
+        seen: List[int] = []
+        ids = self._ids
+        for name in names:
+            i = ids.get(name)
+            if i is None:
+                continue
+            bit = 1 << i
+            clash = self._conflicts[i] & present
+            for j in _iter_bits(clash):
+                other = self._names[j]
+                note = self._conflict_notes.get((min(i, j), max(i, j)))
+                message = f"{other} conflicts with {name}"
+                if note:
+                    message = f"{message}: {note}"
+                issues.append(
+                    CompatibilityIssue(
+                        message=message,
+                        decorator1=other,
+                        decorator2=name,
+                        severity=CompatibilityIssue.SEVERITY_ERROR,
+                    )
+                )
+            if not present & bit:
+                seen.append(i)
+            present |= bit
+
+        for i in seen:
+            missing = [self._names[j] for j in _iter_bits(self._requires[i] & ~present)]
+            missing.extend(self._unresolved_requires.get(i, []))
+            for required in missing:
+                issues.append(
+                    CompatibilityIssue(
+                        message=f"{self._names[i]} requires {required}",
+                        decorator1=self._names[i],
+                        decorator2=required,
+                        severity=CompatibilityIssue.SEVERITY_ERROR,
+                    )
+                )
+        return issues
+
+
 class CompatibilityChecker:
     """Checker for decorator compatibility."""
 
-    def __init__(self):
-        """Initialize a compatibility checker."""
+    def __init__(
+        self,
+        index: Optional[CompatibilityIndex] = None,
+        use_registry_index: bool = False,
+    ):
+        """Initialize a compatibility checker.
+
+        Args:
+            index: Optional compiled registry index to check chains against
+            use_registry_index: Whether to fall back to the loaded registry's index
+        """
         # Dictionary mapping decorator pairs to compatibility rules
         self._compatibility_rules: Dict[tuple, List[Dict[str, Any]]] = {}
 
         # Sets of explicitly incompatible decorator pairs
         self._incompatible_pairs: Set[tuple] = set()
 
+        # Per-decorator view of the pairs with rules, so group checks only visit
+        # pairs that actually have rules
+        self._partners: Dict[str, Set[str]] = {}
+
+        # Compiled rule conditions, keyed by the condition expression
+        self._conditions: Dict[str, Optional[Callable[[ConditionContext], bool]]] = {}
+
+        self._index = index
+        self._use_registry_index = use_registry_index
+
+    def set_index(self, index: Optional[CompatibilityIndex]) -> None:
+        """Set the compiled registry index used for chain checks.
+
+        Args:
+            index: The index to use, or None to disable registry checks
+
+        Returns:
+            None
+        """
+        self._index = index
+
+    def _get_index(self) -> Optional[CompatibilityIndex]:
+        """Get the index to check chains against.
+
+        Args:
+            self: The checker instance
+
+        Returns:
+            The explicit index, the loaded registry's index, or None
+        """
+        if self._index is not None or not self._use_registry_index:
+            return self._index
+        from ..core.dynamic_decorator import DynamicDecorator
+
+        if not DynamicDecorator._loaded:
+            return None
+        return DynamicDecorator.get_compatibility_index()
+
+    def _compile(self, expression: str) -> Optional[Callable[[ConditionContext], bool]]:
+        """Compile a rule condition once, logging invalid expressions.
+
+        Args:
+            expression: The condition expression
+
+        Returns:
+            The compiled predicate, or None if the expression is invalid
+        """
+        if expression not in self._conditions:
+            try:
+                self._conditions[expression] = compile_condition(expression)
+            except ValueError as e:
+                logger.warning(str(e))
+                self._conditions[expression] = None
+        return self._conditions[expression]
+
     def add_rule(self, decorator1: str, decorator2: str, rule: Dict[str, Any]) -> None:
         """Add a compatibility rule.
 
+        Rules may carry a ``condition`` expression (see :func:`compile_condition`);
+        such rules only produce an issue when the condition holds.
+
         Args:
             decorator1: Name of the first decorator
             decorator2: Name of the second decorator
@@ -83,6 +723,11 @@ class CompatibilityChecker:
             self._compatibility_rules[pair] = []
 
         self._compatibility_rules[pair].append(rule)
+        self._partners.setdefault(decorator1, set()).add(decorator2)
+        self._partners.setdefault(decorator2, set()).add(decorator1)
+
+        if "condition" in rule:
+            self._compile(rule["condition"])
 
         # If this is an incompatibility rule, add to incompatible pairs
         if rule.get("compatible", True) is False:
@@ -115,23 +760,24 @@ class CompatibilityChecker:
             },
         )
 
-    def check_compatibility(
+    def _check_rules(
         self,
         decorator1: Union[str, BaseDecorator],
         decorator2: Union[str, BaseDecorator],
+        context: ConditionContext,
     ) -> List[CompatibilityIssue]:
-        """Check compatibility between two decorators.
+        """Check the explicit rules for one pair of decorators.
 
         Args:
             decorator1: First decorator
             decorator2: Second decorator
+            context: Parameter values of the decorators in the chain
 
         Returns:
-            List of compatibility issues (empty if fully compatible)
+            List of compatibility issues for the pair
         """
-        # Extract names
-        name1 = decorator1.name if isinstance(decorator1, BaseDecorator) else decorator1
-        name2 = decorator2.name if isinstance(decorator2, BaseDecorator) else decorator2
+        name1 = _decorator_name(decorator1)
+        name2 = _decorator_name(decorator2)
 
         # Ensure consistent ordering
         pair = tuple(sorted([name1, name2]))
@@ -165,35 +811,105 @@ class CompatibilityChecker:
                     )
                 )
             elif "condition" in rule:
-                # TODO: Implement condition evaluation
-                # This would evaluate a condition involving the decorators' parameters
-                pass
+                condition = self._compile(rule["condition"])
+                if condition is not None and condition(context):
+                    issues.append(
+                        CompatibilityIssue(
+                            message=rule.get(
+                                "message",
+                                f"{name1} and {name2} may not work well together",
+                            ),
+                            decorator1=decorator1,
+                            decorator2=decorator2,
+                            severity=rule.get(
+                                "severity", CompatibilityIssue.SEVERITY_WARNING
+                            ),
+                        )
+                    )
 
         return issues
 
+    def check_compatibility(
+        self,
+        decorator1: Union[str, BaseDecorator],
+        decorator2: Union[str, BaseDecorator],
+    ) -> List[CompatibilityIssue]:
+        """Check compatibility between two decorators.
+
+        Args:
+            decorator1: First decorator
+            decorator2: Second decorator
+
+        Returns:
+            List of compatibility issues (empty if fully compatible)
+        """
+        return self.check_compatibility_group([decorator1, decorator2])
+
     def check_compatibility_group(
-        self, decorators: List[Union[str, BaseDecorator]]
+        self, decorators: Sequence[Union[str, BaseDecorator]]
     ) -> List[CompatibilityIssue]:
         """Check compatibility among a group of decorators.
 
+        Only pairs that have explicit rules are visited, and registry metadata is
+        checked through the compiled index, so the cost is linear in the number of
+        decorators plus the number of matching rules.
+
         Args:
             decorators: List of decorators to check
 
         Returns:
             List of compatibility issues (empty if fully compatible)
         """
-        issues = []
-
-        # Check all pairs
-        for i in range(len(decorators)):
-            for j in range(i + 1, len(decorators)):
-                issues.extend(self.check_compatibility(decorators[i], decorators[j]))
+        names = [_decorator_name(decorator) for decorator in decorators]
+        context: Dict[str, Dict[str, Any]] = {}
+        for name, decorator in zip(names, decorators):
+            context.setdefault(name, _decorator_parameters(decorator))
+
+        # Collect rule issues per (earlier, later) position so the output keeps
+        # the same pair order as an exhaustive pairwise scan
+        pair_issues: List[Tuple[int, int, List[CompatibilityIssue]]] = []
+        positions: Dict[str, List[int]] = {}
+        for j, name in enumerate(names):
+            for partner in self._partners.get(name, ()):
+                for i in positions.get(partner, ()):
+                    found = self._check_rules(decorators[i], decorators[j], context)
+                    if found:
+                        pair_issues.append((i, j, found))
+            positions.setdefault(name, []).append(j)
+        pair_issues.sort(key=lambda item: (item[0], item[1]))
+
+        issues = [issue for _, _, found in pair_issues for issue in found]
+
+        index = self._get_index()
+        if index is not None:
+            reported = {
+                frozenset((issue.decorator1, issue.decorator2))
+                for issue in issues
+                if issue.severity == CompatibilityIssue.SEVERITY_ERROR
+            }
+            for issue in index.validate_chain(names):
+                if frozenset((issue.decorator1, issue.decorator2)) not in reported:
+                    issues.append(issue)
 
         return issues
 
 
+def validate_decorator_chain(
+    decorators: Sequence[Union[str, BaseDecorator]],
+) -> List[CompatibilityIssue]:
+    """Validate a decorator chain with the global compatibility checker.
+
+    Args:
+        decorators: Decorators (or decorator names) in chain order
+
+    Returns:
+        List of compatibility issues (empty if the chain is valid)
+    """
+    return get_compatibility_checker().check_compatibility_group(decorators)
+
+
 # Create a global compatibility checker
-compatibility_checker = CompatibilityChecker()
+compatibility_checker = CompatibilityChecker(use_registry_index=True)
 
 
 # Convenience function to get the global compatibility checker
@@ -238,7 +954,7 @@ def setup_core_compatibility_rules() -> None:
         },
     )
 
-    # Add parameter-specific rules (condition logic will be implemented in future updates)
+    # Add parameter-specific rules
     checker.add_rule(
         "OutputFormat",
         "CodeGeneration",
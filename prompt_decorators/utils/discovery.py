@@ -12,6 +12,7 @@ import sys
 from typing import Dict, List, Optional, Set, Type, Union
 
 from prompt_decorators.core.base import BaseDecorator
+from prompt_decorators.utils.json_backend import iter_json_paths, load_json_files, loads
 from prompt_decorators.utils.json_loader import load_json_file
 
 
@@ -225,10 +226,27 @@ class DecoratorRegistry:
             ValueError: If the JSON is invalid or missing required fields
         """
         try:
-            data = json.loads(json_string)
+            data = loads(json_string)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON: {e}")
 
+        return self._register_from_data(data)
+
+    def _register_from_data(self, data: Dict) -> Optional[Type[BaseDecorator]]:
+        """Register a decorator from a parsed JSON definition.
+
+        Args:
+            data: The parsed decorator definition
+
+        Returns:
+            The registered decorator class if successful, None otherwise
+
+        Raises:
+            ValueError: If required fields are missing
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Decorator definition must be a JSON object")
+
         # Validate required fields
         if "name" not in data:
             raise ValueError("Missing required field 'name'")
@@ -255,9 +273,7 @@ class DecoratorRegistry:
             ValueError: If the file cannot be read or contains invalid JSON
         """
         try:
-            data = load_json_file(file_path)
-            json_string = json.dumps(data)
-            return self.register_from_json_string(json_string)
+            return self._register_from_data(load_json_file(file_path))
         except Exception as e:
             raise ValueError(f"Error loading decorator from {file_path}: {e}")
 
@@ -275,16 +291,17 @@ class DecoratorRegistry:
             in the specified directory.
         """
         count = 0
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if file.endswith(".json"):
-                    file_path = os.path.join(root, file)
-                    try:
-                        if self.register_from_json_file(file_path):
-                            count += 1
-                    except ValueError as e:
-                        # Log the error but continue processing other files
-                        print(f"Error registering decorator from {file_path}: {e}")
+        for file_path, data, error in load_json_files(iter_json_paths(directory)):
+            try:
+                if error is not None:
+                    raise ValueError(
+                        f"Error loading decorator from {file_path}: {error}"
+                    )
+                if self._register_from_data(data):
+                    count += 1
+            except Exception as e:
+                # Log the error but continue processing other files
+                print(f"Error registering decorator from {file_path}: {e}")
 
         return count
 
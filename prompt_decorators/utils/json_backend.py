@@ -0,0 +1,158 @@
+"""Bulk JSON file loading with an optional fast parser.
+
+Registry and decorator directories are loaded through :func:`load_json_files`,
+which reads and parses many files at once. Files are parsed with ``orjson`` when
+it is installed and with the standard library otherwise; set the
+``PROMPT_DECORATORS_JSON_BACKEND`` environment variable to ``json`` to force the
+standard library. Large batches are read across a thread pool, which overlaps
+file I/O (and parsing, with ``orjson``). :func:`loads` and :func:`dumps` use
+the same backend for single documents.
+
+Typical usage:
+    >>> from prompt_decorators.utils.json_backend import iter_json_paths, load_json_files
+    >>> for path, data, error in load_json_files(iter_json_paths("registry")):
+    ...     print(path, error or data["decoratorName"])
+"""
+
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+JSON_BACKEND_ENV_VAR = "PROMPT_DECORATORS_JSON_BACKEND"
+
+# Below this many files a thread pool costs more than it saves
+PARALLEL_MIN_FILES = 32
+
+# Default number of threads for large batches; single-CPU hosts load serially
+DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
+
+# (path, parsed data or None, error or None)
+LoadResult = Tuple[str, Any, Optional[Exception]]
+
+_loads: Callable[[Union[str, bytes]], Any] = json.loads
+_dumps: Optional[Callable[[Any], bytes]] = None
+JSON_BACKEND = "json"
+if os.environ.get(JSON_BACKEND_ENV_VAR, "orjson") != "json":
+    try:
+        import orjson
+
+        _loads = orjson.loads
+        _dumps = orjson.dumps
+        JSON_BACKEND = "orjson"
+    except ImportError:
+        pass
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document with the configured backend.
+
+    Args:
+        data: The JSON text or UTF-8 bytes
+
+    Returns:
+        The parsed value
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    return _loads(data)
+
+
+def dumps(value: Any) -> str:
+    """Serialize a value to compact JSON with the configured backend.
+
+    Values the fast backend cannot serialize, such as integers wider than
+    64 bits, fall back to the standard library.
+
+    Args:
+        value: The value to serialize
+
+    Returns:
+        The JSON text
+
+    Raises:
+        TypeError: If the value is not JSON serializable
+    """
+    if _dumps is not None:
+        try:
+            return _dumps(value).decode()
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def read_json_file(path: Union[str, Path]) -> Any:
+    """Read and parse one JSON file.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        The parsed value
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
+def _load_one(path: str) -> LoadResult:
+    """Read and parse one file, capturing any error.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        The load result for the file
+    """
+    try:
+        return path, read_json_file(path), None
+    except (OSError, ValueError) as e:
+        return path, None, e
+
+
+def iter_json_paths(root: Union[str, Path]) -> List[str]:
+    """List the JSON files under a directory, recursively.
+
+    Args:
+        root: The directory to search
+
+    Returns:
+        Paths of the JSON files, in directory walk order
+    """
+    return [
+        os.path.join(dirpath, name)
+        for dirpath, _, filenames in os.walk(root)
+        for name in filenames
+        if name.endswith(".json")
+    ]
+
+
+def load_json_files(
+    paths: Iterable[Union[str, Path]], workers: Optional[int] = None
+) -> List[LoadResult]:
+    """Read and parse many JSON files.
+
+    Errors are returned with the file instead of raised, so one bad file does
+    not stop the rest from loading.
+
+    Args:
+        paths: Paths of the files
+        workers: Threads to use; defaults to DEFAULT_WORKERS for large batches
+
+    Returns:
+        One (path, data, error) result per file, in the order given
+    """
+    path_list = [str(path) for path in paths]
+    workers = DEFAULT_WORKERS if workers is None else workers
+    if workers <= 1 or len(path_list) < PARALLEL_MIN_FILES:
+        return [_load_one(path) for path in path_list]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_load_one, path_list))
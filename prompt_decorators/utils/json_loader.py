@@ -1,19 +1,44 @@
 """JSON loading utilities for decorator definitions.
 
 This module provides utilities for loading and validating decorator definitions from JSON.
+
+The schema is checked and compiled into a validator once per schema file and
+reused for every definition. If the optional ``fastjsonschema`` package is
+installed, ``JSONLoader(backend="fastjsonschema")`` validates with code
+generated from the schema; failures are re-checked with ``jsonschema`` so the
+raised errors are the same with either backend.
 """
 
 import json
 import logging
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import jsonschema
+from jsonschema.exceptions import best_match
+
+from prompt_decorators.utils.json_backend import load_json_files, loads, read_json_file
+
+try:
+    import fastjsonschema
+
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Compiled validators by (schema path, modification time, backend)
+_VALIDATOR_CACHE: Dict[Tuple[str, int, str], Tuple[Any, Optional[Callable]]] = {}
+_VALIDATOR_CACHE_LOCK = threading.Lock()
+
+# Loader used by load_from_directory worker processes
+_worker_loader: Optional["JSONLoader"] = None
+
 
 class JSONLoader:
     """Loader for decorator definitions from JSON.
@@ -27,14 +52,35 @@ class JSONLoader:
         Path(__file__).parent.parent / "schemas" / "decorator_schema.json"
     )
 
-    def __init__(self, schema_path: Optional[str] = None):
+    def __init__(
+        self,
+        schema_path: Optional[str] = None,
+        backend: str = "jsonschema",
+        fail_fast: bool = False,
+    ):
         """Initialize the JSON loader.
 
         Args:
             schema_path: Path to the schema file for validation (optional)
+            backend: "jsonschema", or "fastjsonschema" for generated validation code
+            fail_fast: Report the first schema error found instead of the best match
+
+        Raises:
+            ValueError: If the backend is unknown or not installed
         """
+        if backend not in ("jsonschema", "fastjsonschema"):
+            raise ValueError(f"Unknown schema validation backend: {backend}")
+        if backend == "fastjsonschema" and not FASTJSONSCHEMA_AVAILABLE:
+            raise ValueError(
+                "fastjsonschema is not installed. "
+                "Please install with: pip install fastjsonschema"
+            )
         self.schema_path = schema_path or str(self.DEFAULT_SCHEMA_PATH)
+        self.backend = backend
+        self.fail_fast = fail_fast
         self.schema = self._load_schema()
+        self._validator: Optional[Any] = None
+        self._fast_validate: Optional[Callable] = None
 
     def _load_schema(self) -> Dict[str, Any]:
         """Load the JSON schema for validation.
@@ -82,7 +128,7 @@ class JSONLoader:
         """
         try:
             # Parse the JSON
-            decorator_data = json.loads(json_string)
+            decorator_data = loads(json_string)
 
             # Validate if requested
             if validate:
@@ -129,16 +175,17 @@ class JSONLoader:
             raise
 
     def load_from_directory(
-        self, directory_path: str, validate: bool = True
+        self, directory_path: str, validate: bool = True, workers: int = 1
     ) -> List[Dict[str, Any]]:
         """Load all decorator definitions from JSON files in a directory.
 
         Args:
             directory_path: Path to the directory containing JSON files
             validate: Whether to validate against the schema (default: True)
+            workers: Number of processes to load files with (default: 1, serial)
 
         Returns:
-            List of decorator definitions as dictionaries
+            List of decorator definitions as dictionaries, in file order
         """
         decorators = []
 
@@ -149,9 +196,35 @@ class JSONLoader:
                 logger.warning(f"Directory not found: {directory_path}")
                 return []
 
-            for file_path in directory.glob("**/*.json"):
+            file_paths = [str(file_path) for file_path in directory.glob("**/*.json")]
+            if workers > 1 and len(file_paths) > workers:
+                chunksize = max(1, len(file_paths) // (workers * 4))
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker,
+                    initargs=(self.schema_path, self.backend, self.fail_fast),
+                ) as pool:
+                    results = list(
+                        pool.map(
+                            _load_in_worker,
+                            file_paths,
+                            [validate] * len(file_paths),
+                            chunksize=chunksize,
+                        )
+                    )
+                for file_path, decorator, error in results:
+                    if error is not None:
+                        logger.warning(f"Error loading {file_path}: {error}")
+                    else:
+                        decorators.append(decorator)
+                return decorators
+
+            for file_path, decorator, load_error in load_json_files(file_paths):
                 try:
-                    decorator = self.load_from_file(str(file_path), validate)
+                    if load_error is not None:
+                        raise load_error
+                    if validate:
+                        self._validate_against_schema(decorator)
                     decorators.append(decorator)
                 except Exception as e:
                     logger.warning(f"Error loading {file_path}: {e}")
@@ -161,6 +234,41 @@ class JSONLoader:
 
         return decorators
 
+    def _compile_validator(self) -> Tuple[Any, Optional[Callable]]:
+        """Check the schema and compile validators for it, once per schema file.
+
+        Args:
+            self: The loader instance
+
+        Returns:
+            Tuple of (jsonschema validator, generated validation function or None)
+
+        Raises:
+            jsonschema.exceptions.SchemaError: If the schema itself is invalid
+        """
+        try:
+            mtime = os.stat(self.schema_path).st_mtime_ns
+        except OSError:
+            mtime = 0
+        key = (os.path.abspath(self.schema_path), mtime, self.backend)
+        with _VALIDATOR_CACHE_LOCK:
+            entry = _VALIDATOR_CACHE.get(key)
+            if entry is None or entry[0].schema != self.schema:
+                validator_class = jsonschema.validators.validator_for(self.schema)
+                validator_class.check_schema(self.schema)
+                fast_validate = None
+                if self.backend == "fastjsonschema":
+                    # Like jsonschema: no defaults filled in, formats not checked
+                    fast_validate = fastjsonschema.compile(
+                        self.schema,
+                        use_default=False,
+                        use_formats=False,
+                        detailed_exceptions=False,
+                    )
+                entry = (validator_class(self.schema), fast_validate)
+                _VALIDATOR_CACHE[key] = entry
+        return entry
+
     def _validate_against_schema(self, data: Dict[str, Any]) -> None:
         """Validate a decorator definition against the schema.
 
@@ -177,7 +285,55 @@ class JSONLoader:
             logger.warning("Schema not available. Skipping validation.")
             return
 
-        jsonschema.validate(instance=data, schema=self.schema)
+        if self._validator is None:
+            self._validator, self._fast_validate = self._compile_validator()
+
+        if self._fast_validate is not None:
+            try:
+                self._fast_validate(data)
+                return
+            except fastjsonschema.JsonSchemaException:
+                # Fall through to report the error the way jsonschema does
+                pass
+
+        errors = self._validator.iter_errors(data)
+        error = next(errors, None) if self.fail_fast else best_match(errors)
+        if error is not None:
+            raise error
+
+
+def _init_worker(schema_path: str, backend: str, fail_fast: bool) -> None:
+    """Create the loader used by a load_from_directory worker process.
+
+    Args:
+        schema_path: Path to the schema file
+        backend: Schema validation backend
+        fail_fast: Whether to report the first schema error found
+
+    Returns:
+        None
+    """
+    global _worker_loader
+    _worker_loader = JSONLoader(schema_path, backend, fail_fast)
+
+
+def _load_in_worker(
+    file_path: str, validate: bool
+) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+    """Load one file in a load_from_directory worker process.
+
+    Args:
+        file_path: Path to the JSON file
+        validate: Whether to validate against the schema
+
+    Returns:
+        Tuple of (file path, decorator definition or None, error message or None)
+    """
+    assert _worker_loader is not None
+    try:
+        return file_path, _worker_loader.load_from_file(file_path, validate), None
+    except Exception as e:
+        return file_path, None, str(e)
 
 
 # Helper function to load a JSON file
@@ -194,5 +350,5 @@ def load_json_file(file_path: str) -> Dict[str, Any]:
         FileNotFoundError: If the file is not found
         json.JSONDecodeError: If the JSON is invalid
     """
-    with open(file_path, "r") as f:
-        return json.load(f)
+    data: Dict[str, Any] = read_json_file(file_path)
+    return data
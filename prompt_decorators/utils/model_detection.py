@@ -5,12 +5,173 @@ This module provides utilities for detecting model capabilities and features.
 
 import json
 import logging
+import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Characters that separate the components of a model id
+_MODEL_ID_SEPARATORS = "-.:@"
+
+# Suffixes that only pin a release channel; ids are also indexed without them
+_CHANNEL_SUFFIXES = ("-latest",)
+
+
+def normalize_model_id(model_id: str) -> str:
+    """Normalise a model identifier for lookup.
+
+    Lower-cases the id, drops provider prefixes such as ``openai/`` or
+    ``models/`` and unifies separators, so ``OpenAI/GPT_4o`` and ``gpt-4o``
+    resolve to the same model.
+
+    Args:
+        model_id: The model identifier
+
+    Returns:
+        The normalised identifier
+    """
+    normalized = model_id.strip().lower()
+    if "/" in normalized:
+        normalized = normalized.rsplit("/", 1)[1]
+    return re.sub(r"[\s_]+", "-", normalized)
+
+
+class _TrieNode:
+    """Node of the model id prefix trie."""
+
+    __slots__ = ("children", "model_id", "best")
+
+    def __init__(self) -> None:
+        """Initialize an empty trie node.
+
+        Args:
+            self: The node instance
+
+        Returns:
+            None
+        """
+        self.children: Dict[str, "_TrieNode"] = {}
+        # Registered model id if a key ends at this node
+        self.model_id: Optional[str] = None
+        # (key length, key, model id) of the shortest key in this subtree
+        self.best: Optional[Tuple[int, str, str]] = None
+
+
+class _ModelIdTrie:
+    """Prefix trie over normalised model ids and their aliases."""
+
+    def __init__(self) -> None:
+        """Initialize an empty trie.
+
+        Args:
+            self: The trie instance
+
+        Returns:
+            None
+        """
+        self._root = _TrieNode()
+        self._keys: Dict[str, str] = {}
+
+    def insert(self, key: str, model_id: str) -> None:
+        """Index a lookup key for a registered model.
+
+        Args:
+            key: Normalised id or alias
+            model_id: The registered model id the key resolves to
+
+        Returns:
+            None
+        """
+        if key in self._keys:
+            return
+        self._keys[key] = model_id
+        candidate = (len(key), key, model_id)
+        node = self._root
+        for char in key:
+            if node.best is None or candidate < node.best:
+                node.best = candidate
+            node = node.children.setdefault(char, _TrieNode())
+        if node.best is None or candidate < node.best:
+            node.best = candidate
+        node.model_id = model_id
+
+    def exact(self, key: str) -> Optional[str]:
+        """Look up a key exactly.
+
+        Args:
+            key: Normalised id
+
+        Returns:
+            The registered model id, or None
+        """
+        return self._keys.get(key)
+
+    def longest_prefix(self, key: str) -> Optional[str]:
+        """Find the longest indexed key that prefixes ``key`` at a separator.
+
+        Args:
+            key: Normalised id, e.g. ``gpt-4o-2024-08-06``
+
+        Returns:
+            The registered model id of the longest match (``gpt-4o``), or None
+        """
+        node = self._root
+        match = None
+        for position, char in enumerate(key):
+            child = node.children.get(char)
+            if child is None:
+                break
+            node = child
+            end = position + 1
+            if node.model_id is not None and (
+                end == len(key) or key[end] in _MODEL_ID_SEPARATORS
+            ):
+                match = node.model_id
+        return match
+
+    def shortest_extension(self, key: str) -> Optional[str]:
+        """Find the shortest indexed key that starts with ``key``.
+
+        Ties are broken lexicographically, so the result is deterministic.
+
+        Args:
+            key: Normalised partial id, e.g. ``gpt-4o-vis``
+
+        Returns:
+            The registered model id of the shortest extension, or None
+        """
+        node = self._root
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                return None
+            node = child
+        return node.best[2] if node.best is not None else None
+
+    def substring_match(self, key: str) -> Optional[str]:
+        """Find a model by substring containment in either direction.
+
+        Prefers the longest indexed key contained in ``key``, then the shortest
+        indexed key containing it; ties are broken lexicographically.
+
+        Args:
+            key: Normalised id
+
+        Returns:
+            The registered model id, or None
+        """
+        contained = [k for k in self._keys if k in key]
+        if contained:
+            return self._keys[min(contained, key=lambda k: (-len(k), k))]
+        containing = [k for k in self._keys if key in k]
+        if containing:
+            return self._keys[min(containing, key=lambda k: (len(k), k))]
+        return None
+
 
 class ModelCapabilities:
     """Class to represent the capabilities of a model.
@@ -125,6 +286,9 @@ class ModelDetector:
         Path(__file__).parent.parent.parent / "config" / "model_capabilities.json"
     )
 
+    # Maximum number of resolved model ids remembered (including misses)
+    MEMO_SIZE = 1024
+
     _instance = None
 
     def __new__(cls):
@@ -151,6 +315,9 @@ class ModelDetector:
         """
         self._models = {}
         self._families = {}
+        self._trie: Optional[_ModelIdTrie] = None
+        self._memo: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        self._memo_lock = threading.Lock()
         self._load_default_capabilities()
         self._load_builtin_capabilities()
 
@@ -290,7 +457,99 @@ class ModelDetector:
         if model.model_family not in self._families:
             self._families[model.model_family] = []
 
-        self._families[model.model_family].append(model.model_id)
+        if model.model_id not in self._families[model.model_family]:
+            self._families[model.model_family].append(model.model_id)
+
+        # Lookup structures are rebuilt lazily on the next resolution
+        with self._memo_lock:
+            self._trie = None
+            self._memo.clear()
+
+    def _build_trie(self) -> _ModelIdTrie:
+        """Build the lookup trie over registered model ids and aliases.
+
+        Keys are inserted in sorted order so alias collisions resolve the same
+        way regardless of registration order.
+
+        Args:
+            self: The ModelDetector instance
+
+        Returns:
+            The lookup trie
+        """
+        trie = _ModelIdTrie()
+        for model_id in sorted(self._models):
+            key = normalize_model_id(model_id)
+            trie.insert(key, model_id)
+        for model_id in sorted(self._models):
+            key = normalize_model_id(model_id)
+            for suffix in _CHANNEL_SUFFIXES:
+                if key.endswith(suffix):
+                    trie.insert(key[: -len(suffix)], model_id)
+        return trie
+
+    def build_index(self) -> None:
+        """Build the lookup trie now instead of on the first resolution.
+
+        Args:
+            self: The ModelDetector instance
+
+        Returns:
+            None
+        """
+        with self._memo_lock:
+            if self._trie is None:
+                self._trie = self._build_trie()
+
+    def resolve_model_id(self, model_id: str) -> Optional[str]:
+        """Resolve a model identifier to a registered model id.
+
+        Resolution is deterministic and tries, in order: an exact match, the
+        normalised id or an alias (ids without ``-latest``), the longest
+        registered id that prefixes the query (``gpt-4o-2024-08-06`` resolves to
+        ``gpt-4o``), the shortest registered id extending the query, and finally
+        substring containment. Results, including misses, are memoised in a
+        bounded LRU.
+
+        Args:
+            model_id: The model identifier
+
+        Returns:
+            The registered model id, or None if no model matches
+        """
+        if model_id in self._models:
+            return model_id
+
+        memo = self._memo
+        with self._memo_lock:
+            if model_id in memo:
+                memo.move_to_end(model_id)
+                return memo[model_id]
+            trie = self._trie
+            if trie is None:
+                trie = self._trie = self._build_trie()
+
+        key = normalize_model_id(model_id)
+        resolved = (
+            trie.exact(key)
+            or trie.longest_prefix(key)
+            or trie.shortest_extension(key)
+            or trie.substring_match(key)
+        )
+
+        if resolved is None:
+            logger.warning(f"No capabilities found for model: {model_id}")
+        elif resolved != model_id:
+            logger.debug(f"Using capabilities for {resolved} as a match for {model_id}")
+
+        with self._memo_lock:
+            # A model registered meanwhile replaced the trie and cleared the memo;
+            # this result may be stale, so it is not remembered
+            if self._trie is trie:
+                memo[model_id] = resolved
+                if len(memo) > self.MEMO_SIZE:
+                    memo.popitem(last=False)
+        return resolved
 
     def get_model_capabilities(self, model_id: str) -> Optional[ModelCapabilities]:
         """Get capabilities for a specific model.
@@ -303,22 +562,29 @@ class ModelDetector:
 
         Note:
             This method attempts to find an exact match first, then falls back
-            to a partial match if no exact match is found.
+            to normalised, prefix and partial matches (see resolve_model_id).
         """
-        # Try exact match
-        if model_id in self._models:
-            return self._models[model_id]
+        resolved = self.resolve_model_id(model_id)
+        if resolved is None:
+            return None
+        return self._models.get(resolved)
 
-        # Try partial match
-        for registered_id in self._models:
-            if model_id in registered_id or registered_id in model_id:
-                logger.debug(
-                    f"Using capabilities for {registered_id} as a match for {model_id}"
-                )
-                return self._models[registered_id]
+    def resolve_model_family(self, model: str) -> Optional[str]:
+        """Resolve a model id or family name to a model family.
 
-        logger.warning(f"No capabilities found for model: {model_id}")
-        return None
+        Args:
+            model: A model identifier or a family name
+
+        Returns:
+            The model family, or None if it cannot be determined
+        """
+        if model in self._families:
+            return model
+        normalized = normalize_model_id(model)
+        if normalized in self._families:
+            return normalized
+        capabilities = self.get_model_capabilities(model)
+        return capabilities.model_family if capabilities is not None else None
 
     def get_models_by_family(self, family: str) -> List[ModelCapabilities]:
         """Get all models in a specific family.
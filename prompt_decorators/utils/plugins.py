@@ -15,6 +15,7 @@ from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Set, Type
 
 from prompt_decorators.core.base import BaseDecorator
+from prompt_decorators.core.model_specific import ModelSpecificDecoratorFactory
 from prompt_decorators.utils.discovery import get_registry
 from prompt_decorators.utils.factory import DecoratorFactory
 
@@ -248,6 +249,9 @@ class PluginManager:
         # Call unload hook if defined
         self._call_hook("plugin_unloaded", plugin)
 
+        # Drop model-specific classes generated from the plugin's decorators
+        ModelSpecificDecoratorFactory.evict(plugin.decorators)
+
         # Remove from loaded plugins
         del self._plugins[plugin_name]
         logger.info(f"Unloaded plugin: {plugin_name}")
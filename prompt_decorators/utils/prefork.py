@@ -0,0 +1,59 @@
+"""Pre-fork loading of the decorator registry for worker pools.
+
+A pool of forked workers (gunicorn, uWSGI, ``multiprocessing`` with the fork
+start method) that loads the registry in each worker pays for it once per
+worker. :func:`preload_registry` instead loads and compiles everything the
+engine derives from the registry (definitions, validation plans, render plans,
+the compatibility index and the model id lookup trie) once in the parent, so
+workers inherit it through copy-on-write pages and never parse the registry.
+
+Inherited pages stay shared only while nothing writes to them. The cyclic
+garbage collector writes to every object it tracks when it runs in a worker,
+which copies the pages holding them; :func:`gc.freeze` moves the preloaded
+objects to a permanent generation the collector ignores. Reference count
+updates still copy the pages of objects a worker touches, so sharing is best
+for the bulk of the registry that a given worker never reads.
+
+Typical usage in a gunicorn config file:
+    >>> from prompt_decorators.utils.prefork import preload_registry
+    >>> def on_starting(server):
+    ...     preload_registry()
+
+With ``preload_app = True`` the call can also go at import time of the
+application module.
+"""
+
+import gc
+import logging
+import time
+
+from prompt_decorators.core.dynamic_decorator import DynamicDecorator
+from prompt_decorators.core.records import RegistrySnapshot
+from prompt_decorators.utils.model_detection import get_model_detector
+
+logger = logging.getLogger(__name__)
+
+
+def preload_registry(freeze: bool = True) -> RegistrySnapshot:
+    """Load and compile the registry in a parent process before forking.
+
+    Args:
+        freeze: Whether to move the loaded objects out of reach of the collector
+
+    Returns:
+        The preloaded registry snapshot
+    """
+    start = time.perf_counter()
+    DynamicDecorator.load_registry()
+    snapshot = DynamicDecorator.compile_registry()
+    get_model_detector().build_index()
+
+    gc.collect()
+    if freeze:
+        gc.freeze()
+    logger.info(
+        f"Preloaded {len(snapshot)} decorators (generation {snapshot.generation}) "
+        f"in {(time.perf_counter() - start) * 1000:.1f} ms"
+        + (f", {gc.get_freeze_count()} objects frozen" if freeze else "")
+    )
+    return snapshot
@@ -3,19 +3,74 @@
 This module provides comprehensive validation and automatic repair capabilities
 for the prompt decorators registry, helping to diagnose and fix common installation
 issues where registry files are missing or incomplete.
+
+Decorator files can be validated incrementally and in parallel: a content-hash
+manifest records the result for each file, so unchanged files are skipped on the
+next run, and the remaining files are spread over a process pool.
 """
 
+import hashlib
 import json
 import logging
+import os
 import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
 from importlib import resources
 from pathlib import Path
 
 # Ensure Literal is imported
-from typing import Any, Dict, List, Literal, Optional, Tuple, TypedDict, Union, cast
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    TypedDict,
+    Union,
+    cast,
+)
 
 logger = logging.getLogger(__name__)
 
+# Bump when validate_decorator_file changes, so cached results are discarded
+MANIFEST_VERSION = 1
+
+# Below this many files a process pool costs more than it saves
+PARALLEL_MIN_FILES = 64
+
+
+def _validate_path(path: str) -> Tuple[bool, List[str]]:
+    """Validate one decorator file in a worker process.
+
+    Args:
+        path: Path of the JSON file
+
+    Returns:
+        Tuple of (is_valid, error_messages)
+    """
+    return RegistryValidator.validate_decorator_file(Path(path))
+
+
+def _file_digest(path: str) -> Optional[str]:
+    """Compute the SHA-256 digest of a file's content.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        The hex digest, or None if the file cannot be read
+    """
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
 
 class _InfoSubdirectoriesEntry(TypedDict):
     """Structure for package and source file counts within a subdirectory."""
@@ -154,13 +209,21 @@ class RegistryValidator:
         return info
 
     @staticmethod
-    def validate_registry() -> (
-        Dict[str, Any]
-    ):  # Keep Any for result for now, or define another TypedDict
+    def validate_registry(
+        check_files: bool = False,
+        manifest_path: Optional[Union[str, Path]] = None,
+        jobs: Optional[int] = None,
+    ) -> Dict[str, Any]:  # Keep Any for result for now, or define another TypedDict
         """Validate the current registry state.
 
+        Args:
+            check_files: Also validate every decorator file (see validate_files)
+            manifest_path: Manifest used to skip unchanged files when checking files
+            jobs: Worker processes used when checking files
+
         Returns:
-            Dictionary containing validation results
+            Dictionary containing validation results; with ``check_files`` the
+            file report is included under ``files``
         """
         result: Dict[str, Any] = {
             "status": "unknown",
@@ -201,6 +264,16 @@ class RegistryValidator:
                 )
                 result["status"] = "needs_repair"
 
+        if check_files and info["package_registry_path"] is not None:
+            report = RegistryValidator.validate_files(
+                [info["package_registry_path"]], manifest_path, jobs
+            )
+            result["files"] = report
+            if report["invalid"]:
+                result["issues"].append(
+                    f"{report['invalid']} invalid decorator files in package registry"
+                )
+
         # Check if source registry is available for repair
         if info["source_registry_exists"] and info["source_file_count"] > 0:
             result["recommendations"].append(
@@ -424,6 +497,160 @@ class RegistryValidator:
 
         return len(errors) == 0, errors
 
+    @staticmethod
+    def collect_decorator_files(paths: Iterable[Union[str, Path]]) -> List[str]:
+        """Collect decorator JSON files from files and directories.
+
+        Args:
+            paths: Files, or directories to search recursively
+
+        Returns:
+            Sorted absolute paths of the JSON files
+        """
+        files: Set[str] = set()
+        for path in paths:
+            root = os.path.realpath(os.path.expanduser(str(path)))
+            if os.path.isdir(root):
+                for dirpath, _, filenames in os.walk(root):
+                    files.update(
+                        os.path.join(dirpath, name)
+                        for name in filenames
+                        if name.endswith(".json")
+                    )
+            elif os.path.isfile(root):
+                files.add(root)
+        return sorted(files)
+
+    @staticmethod
+    def load_manifest(manifest_path: Union[str, Path]) -> Dict[str, Dict[str, Any]]:
+        """Load cached validation results from a manifest file.
+
+        Args:
+            manifest_path: Path of the manifest
+
+        Returns:
+            Cached results by file path; empty if the manifest is missing,
+            unreadable or was written by a different validator version
+        """
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if (
+            not isinstance(manifest, dict)
+            or manifest.get("version") != MANIFEST_VERSION
+        ):
+            return {}
+        files = manifest.get("files")
+        return files if isinstance(files, dict) else {}
+
+    @staticmethod
+    def save_manifest(
+        manifest_path: Union[str, Path], files: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """Write validation results to a manifest file atomically.
+
+        Args:
+            manifest_path: Path of the manifest
+            files: Results by file path, with ``sha256``, ``valid`` and ``errors``
+
+        Returns:
+            None
+        """
+        manifest_path = Path(manifest_path)
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=str(manifest_path.parent), prefix=".manifest-", suffix=".json"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"version": MANIFEST_VERSION, "files": files}))
+            os.replace(tmp_path, manifest_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @staticmethod
+    def validate_files(
+        paths: Iterable[Union[str, Path]],
+        manifest_path: Optional[Union[str, Path]] = None,
+        jobs: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Validate decorator files, skipping unchanged ones and in parallel.
+
+        Files whose content hash matches the manifest reuse the recorded result.
+        The others are validated with :meth:`validate_decorator_file`, across a
+        process pool when there are enough of them, and the manifest is rewritten
+        if anything changed.
+
+        Args:
+            paths: Decorator files, or directories to search recursively
+            manifest_path: Manifest of cached results to read and update, if any
+            jobs: Worker processes; defaults to the CPU count, 1 disables the pool
+
+        Returns:
+            Report with ``status`` ("valid" or "invalid"), file counts,
+            ``duration`` in seconds and a ``files`` list of per-file results
+        """
+        start = time.perf_counter()
+        files = RegistryValidator.collect_decorator_files(paths)
+        cached = RegistryValidator.load_manifest(manifest_path) if manifest_path else {}
+
+        results: Dict[str, Dict[str, Any]] = {}
+        pending: List[str] = []
+        for path in files:
+            digest = _file_digest(path)
+            entry = cached.get(path)
+            if digest is not None and entry and entry.get("sha256") == digest:
+                results[path] = dict(entry, cached=True)
+            else:
+                results[path] = {"sha256": digest, "cached": False}
+                pending.append(path)
+
+        workers = jobs or os.cpu_count() or 1
+        if workers > 1 and len(pending) >= PARALLEL_MIN_FILES:
+            chunksize = max(1, len(pending) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(_validate_path, pending, chunksize=chunksize))
+        else:
+            outcomes = [_validate_path(path) for path in pending]
+        for path, (valid, errors) in zip(pending, outcomes):
+            results[path].update(valid=valid, errors=errors)
+
+        if manifest_path and (pending or len(cached) != len(results)):
+            RegistryValidator.save_manifest(
+                manifest_path,
+                {
+                    path: {
+                        "sha256": result["sha256"],
+                        "valid": result["valid"],
+                        "errors": result["errors"],
+                    }
+                    for path, result in results.items()
+                    if result["sha256"] is not None
+                },
+            )
+
+        invalid = sum(1 for result in results.values() if not result["valid"])
+        return {
+            "status": "invalid" if invalid else "valid",
+            "total": len(files),
+            "checked": len(pending),
+            "skipped": len(files) - len(pending),
+            "invalid": invalid,
+            "duration": time.perf_counter() - start,
+            "files": [
+                {
+                    "path": path,
+                    "valid": result["valid"],
+                    "errors": result["errors"],
+                    "cached": result["cached"],
+                }
+                for path, result in results.items()
+            ],
+        }
+
     @staticmethod
     def get_diagnostic_info() -> Dict[str, Any]:
         """Get comprehensive diagnostic information for troubleshooting.
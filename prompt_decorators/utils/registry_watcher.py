@@ -0,0 +1,431 @@
+"""Hot reloading of the decorator registry.
+
+:class:`RegistryWatcher` polls the registry directories (and any extra
+directories, such as user extension directories) for added, changed and
+removed JSON files. Only the files that changed are parsed again; each one is
+validated by compiling it the way the engine would, and the result is
+published as a new registry generation in a single swap. Decorators created
+before the swap keep using the definitions of the generation they were
+created from, so in-flight requests finish on the old generation.
+
+Typical usage:
+    >>> from prompt_decorators.utils.registry_watcher import RegistryWatcher
+    >>> watcher = RegistryWatcher(extra_dirs=["~/.config/prompt-decorators/extensions"])
+    >>> watcher.start()
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+from prompt_decorators.core.dynamic_decorator import DynamicDecorator, ValidationPlan
+from prompt_decorators.core.records import DecoratorRecord, RegistrySnapshot
+from prompt_decorators.core.render import compile_model_variants, compile_render_plan
+from prompt_decorators.core.versions import VersionKey, definition_version
+from prompt_decorators.utils.telemetry import get_telemetry_manager
+
+logger = logging.getLogger(__name__)
+
+# (modification time in ns, size) of a watched file
+FileState = Tuple[int, int]
+
+# (decorator name, version key) of a definition
+DefinitionKey = Tuple[str, VersionKey]
+
+
+class WatchedFile(NamedTuple):
+    """Definition loaded from a watched file.
+
+    When several files define the same decorator version, the one with the
+    highest ``order`` (the most recently loaded) is published.
+    """
+
+    name: str
+    version: VersionKey
+    order: int
+
+    @property
+    def key(self) -> DefinitionKey:
+        """Name and version of the definition.
+
+        Args:
+            self: The WatchedFile instance
+
+        Returns:
+            The (decorator name, version key) pair
+        """
+        return self.name, self.version
+
+
+class ReloadResult(NamedTuple):
+    """Outcome of one registry reload."""
+
+    generation: int
+    changed: List[str]
+    removed: List[str]
+    failures: List[Dict[str, str]]
+    duration: float
+
+
+def load_definition_file(path: str) -> Optional[DecoratorRecord]:
+    """Parse and validate one registry JSON file.
+
+    The definition is compiled the way the engine uses it (parameter validation
+    plan and render plans), so a file that would fail at request time is
+    rejected before it is published.
+
+    Args:
+        path: Path of the JSON file
+
+    Returns:
+        The decorator record, or None if the file is not a decorator definition
+        (like the registry loader, other JSON files are ignored)
+
+    Raises:
+        ValueError: If the file is not a valid decorator definition
+    """
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Cannot read {path}: {e}") from e
+
+    if not isinstance(data, dict) or "decoratorName" not in data:
+        return None
+    if not isinstance(data["decoratorName"], str) or not data["decoratorName"]:
+        raise ValueError(f"{path}: 'decoratorName' must be a non-empty string")
+    if not isinstance(data.get("parameters", []), list):
+        raise ValueError(f"{path}: 'parameters' must be a list")
+
+    record = DynamicDecorator._build_definition(data, path)
+    ValidationPlan(record.parameters)
+    template = record.transformationTemplate
+    if template and not record.custom_transform:
+        if not isinstance(template, dict):
+            raise ValueError(f"{path}: 'transformationTemplate' must be an object")
+        compile_render_plan(template)
+        compile_model_variants(template, record.modelSpecificImplementations or {})
+    return record
+
+
+class RegistryWatcher:
+    """Watch registry directories and publish changed definitions.
+
+    The watcher polls file modification times and sizes, which works on every
+    platform and filesystem without extra dependencies. Use :meth:`check` to
+    poll once, or :meth:`start` to poll from a background thread.
+    """
+
+    def __init__(
+        self,
+        paths: Optional[Iterable[str]] = None,
+        extra_dirs: Iterable[str] = (),
+        interval: float = 2.0,
+    ) -> None:
+        """Initialize a registry watcher.
+
+        Files in the registry directories, and extension files that back the
+        current registry, are taken as the baseline; other extension files are
+        loaded by the first check.
+
+        Args:
+            paths: Directories to watch; defaults to the registry directories
+            extra_dirs: Additional directories to watch, e.g. user extensions
+            interval: Seconds between polls when running in the background
+
+        Returns:
+            None
+        """
+        if paths is None:
+            paths = DynamicDecorator.get_registry_dirs()
+        registry_dirs = [os.path.abspath(os.path.expanduser(p)) for p in paths]
+        self.paths = registry_dirs + [
+            os.path.abspath(os.path.expanduser(p)) for p in extra_dirs
+        ]
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Definition loaded from each file, and the state it was loaded at
+        self._files: Dict[str, WatchedFile] = {}
+        self._states: Dict[str, FileState] = {}
+        self._order = 0
+        current = self._scan()
+        snapshot = DynamicDecorator.get_snapshot()
+        backing = {
+            definition.source: definition
+            for by_version in snapshot.versions.values()
+            for definition in by_version.values()
+            if isinstance(definition, DecoratorRecord) and definition.source in current
+        }
+        for path, state in current.items():
+            if not any(path.startswith(root + os.sep) for root in registry_dirs):
+                continue
+            self._states[path] = state
+            if path in backing:
+                continue
+            # Registry files shadowed by another definition of the same version
+            # are published again if that definition is removed
+            try:
+                record = load_definition_file(path)
+            except Exception as e:
+                logger.debug(f"Registry watcher skipped {path}: {e}")
+                continue
+            if record is not None:
+                self._track(path, record)
+        for source, definition in backing.items():
+            self._states[source] = current[source]
+            self._track(source, definition)
+
+    def _track(self, path: str, definition: DecoratorRecord) -> WatchedFile:
+        """Record the definition loaded from a file as its most recent one.
+
+        Args:
+            self: The RegistryWatcher instance
+            path: Path of the file
+            definition: The definition loaded from it
+
+        Returns:
+            The tracked entry
+        """
+        self._order += 1
+        entry = WatchedFile(
+            definition.name, definition_version(definition), self._order
+        )
+        self._files[path] = entry
+        return entry
+
+    def _scan(self) -> Dict[str, FileState]:
+        """Collect the state of every JSON file in the watched directories.
+
+        Args:
+            self: The RegistryWatcher instance
+
+        Returns:
+            Mapping of file path to its (mtime, size) state
+        """
+        states: Dict[str, FileState] = {}
+        for root in self.paths:
+            for dirpath, _, filenames in os.walk(root):
+                for filename in filenames:
+                    if not filename.endswith(".json"):
+                        continue
+                    path = os.path.join(dirpath, filename)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    states[path] = (stat.st_mtime_ns, stat.st_size)
+        return states
+
+    def check(self) -> Optional[ReloadResult]:
+        """Poll once and publish a new registry generation if files changed.
+
+        Files that fail to load or validate keep their previous definition (if
+        any) and are retried when they change again.
+
+        Args:
+            self: The RegistryWatcher instance
+
+        Returns:
+            The reload result, or None if nothing changed
+        """
+        with self._lock:
+            start = time.perf_counter()
+            current = self._scan()
+            modified = [
+                path
+                for path, state in current.items()
+                if self._states.get(path) != state
+            ]
+            deleted = [path for path in self._states if path not in current]
+            if not modified and not deleted:
+                return None
+
+            added: Dict[DefinitionKey, DecoratorRecord] = {}
+            vacated: Dict[DefinitionKey, str] = {}
+            failures: List[Dict[str, str]] = []
+            for path in modified:
+                self._states[path] = current[path]
+                try:
+                    record = load_definition_file(path)
+                except Exception as e:
+                    logger.warning(f"Registry reload skipped {path}: {e}")
+                    failures.append({"path": path, "error": str(e)})
+                    continue
+                previous = self._files.pop(path, None)
+                if previous is not None:
+                    vacated[previous.key] = path
+                if record is not None:
+                    added[self._track(path, record).key] = record
+            for path in deleted:
+                del self._states[path]
+                previous = self._files.pop(path, None)
+                if previous is not None:
+                    vacated[previous.key] = path
+
+            snapshot = DynamicDecorator.get_snapshot()
+            removals: List[DefinitionKey] = []
+            for key, path in vacated.items():
+                if key in added or not self._published_from(snapshot, key, path):
+                    continue
+                record = self._fallback(key, failures)
+                if record is None:
+                    removals.append(key)
+                else:
+                    added[key] = record
+
+            generation = snapshot.generation
+            changed = sorted({name for name, _ in added})
+            removed = sorted({name for name, _ in removals} - set(changed))
+            if added or removals:
+                generation = DynamicDecorator.update_registry_versions(
+                    added.values(), removals
+                ).generation
+
+            result = ReloadResult(
+                generation, changed, removed, failures, time.perf_counter() - start
+            )
+
+        self._report(result)
+        return result
+
+    @staticmethod
+    def _published_from(
+        snapshot: RegistrySnapshot, key: DefinitionKey, path: str
+    ) -> bool:
+        """Check whether a file backs a published decorator version.
+
+        Args:
+            snapshot: The current registry generation
+            key: Name and version of the definition
+            path: Path of the file
+
+        Returns:
+            True if the published definition of that version was loaded from the file
+        """
+        name, version = key
+        definition = snapshot.versions.get(name, {}).get(version)
+        return isinstance(definition, DecoratorRecord) and definition.source == path
+
+    def _fallback(
+        self, key: DefinitionKey, failures: List[Dict[str, str]]
+    ) -> Optional[DecoratorRecord]:
+        """Reload the next remaining definition of a decorator version.
+
+        Files that still define the version are tried from the most recently
+        loaded one, e.g. the builtin definition that a deleted extension file
+        overrode.
+
+        Args:
+            self: The RegistryWatcher instance
+            key: Name and version of the definition
+            failures: Reload failures, appended to
+
+        Returns:
+            The definition to publish, or None if no file defines the version
+        """
+        candidates = sorted(
+            (entry.order, path)
+            for path, entry in self._files.items()
+            if entry.key == key
+        )
+        for _, path in reversed(candidates):
+            try:
+                record = load_definition_file(path)
+            except Exception as e:
+                logger.warning(f"Registry reload skipped {path}: {e}")
+                failures.append({"path": path, "error": str(e)})
+                record = None
+            if record is not None and (record.name, definition_version(record)) == key:
+                return record
+            # The file changed since it was tracked; the next poll picks it up
+            del self._files[path]
+            self._states.pop(path, None)
+        return None
+
+    def _report(self, result: ReloadResult) -> None:
+        """Log a reload and report it to telemetry.
+
+        Args:
+            self: The RegistryWatcher instance
+            result: The reload result
+
+        Returns:
+            None
+        """
+        logger.info(
+            f"Registry reload: generation {result.generation}, "
+            f"{len(result.changed)} changed, {len(result.removed)} removed, "
+            f"{len(result.failures)} failed in {result.duration * 1000:.1f} ms"
+        )
+        get_telemetry_manager().track_registry_reload(
+            result.generation,
+            result.duration,
+            result.changed,
+            result.removed,
+            result.failures,
+        )
+
+    def start(self) -> None:
+        """Start polling in a daemon thread.
+
+        Args:
+            self: The RegistryWatcher instance
+
+        Returns:
+            None
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="registry-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop polling and wait for the thread to finish.
+
+        Args:
+            self: The RegistryWatcher instance
+            timeout: Seconds to wait for the thread
+
+        Returns:
+            None
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        """Poll until stopped.
+
+        Args:
+            self: The RegistryWatcher instance
+
+        Returns:
+            None
+        """
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                logger.error(f"Registry watcher error: {e}")
+
+    @property
+    def watched_files(self) -> Mapping[str, str]:
+        """Decorator names by the file that defines them.
+
+        Args:
+            self: The RegistryWatcher instance
+
+        Returns:
+            Mapping of file path to decorator name
+        """
+        return {path: entry.name for path, entry in self._files.items()}
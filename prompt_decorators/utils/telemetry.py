@@ -251,6 +251,45 @@ class TelemetryManager:
         self._queue_event(event)
         self._call_callbacks("performance", event)
 
+    def track_registry_reload(
+        self,
+        generation: int,
+        duration: float,
+        changed: List[str],
+        removed: List[str],
+        failures: Optional[List[Dict[str, str]]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Track a hot reload of the decorator registry.
+
+        Args:
+            generation: Registry generation published by the reload
+            duration: Time taken to reload in seconds
+            changed: Names of decorators added or updated
+            removed: Names of decorators removed
+            failures: Files that failed to load, as path and error (optional)
+            metadata: Additional metadata (optional)
+
+        Returns:
+            None
+        """
+        if not self._enabled:
+            return
+
+        event = {
+            "type": "registry_reload",
+            "timestamp": datetime.utcnow().isoformat(),
+            "generation": generation,
+            "duration": duration,
+            "changed": changed,
+            "removed": removed,
+            "failures": failures or [],
+            "metadata": metadata or {},
+        }
+
+        self._queue_event(event)
+        self._call_callbacks("registry_reload", event)
+
     def _queue_event(self, event: Dict[str, Any]) -> None:
         """Queue an event for processing.
 
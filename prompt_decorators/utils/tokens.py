@@ -0,0 +1,79 @@
+"""Token estimates for prompt text.
+
+The engine does not depend on a model tokenizer. By default
+:func:`estimate_tokens` uses the common heuristic of about four characters per
+token for English text and code, which is close enough to compare prompt sizes
+and report savings, and costs nothing for large prompts.
+
+A model tokenizer can be plugged in with :func:`set_tokenizer` when estimates
+must match a model's context window more closely:
+
+    >>> import tiktoken
+    >>> from prompt_decorators.utils.tokens import set_tokenizer
+    >>> encoding = tiktoken.get_encoding("o200k_base")
+    >>> set_tokenizer(lambda text: len(encoding.encode(text)))
+
+Estimates cached by the engine, such as the instruction sizes of compiled
+render plans, are recomputed when the tokenizer changes.
+"""
+
+from typing import Callable, Optional
+
+# Average number of characters per token for English text and code
+CHARS_PER_TOKEN = 4
+
+# A function returning the number of tokens in a text
+Tokenizer = Callable[[str], int]
+
+
+def heuristic_tokens(text: str) -> int:
+    """Estimate the number of tokens in a text from its length.
+
+    Args:
+        text: The text to measure
+
+    Returns:
+        The estimated token count; 0 for an empty text
+    """
+    if not text:
+        return 0
+    return max(1, (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN)
+
+
+_tokenizer: Tokenizer = heuristic_tokens
+
+
+def set_tokenizer(tokenizer: Optional[Tokenizer]) -> None:
+    """Set the tokenizer used for token estimates.
+
+    Args:
+        tokenizer: Function counting the tokens of a text, or None for the heuristic
+
+    Returns:
+        None
+    """
+    global _tokenizer
+    _tokenizer = tokenizer or heuristic_tokens
+
+
+def get_tokenizer() -> Tokenizer:
+    """Get the tokenizer used for token estimates.
+
+    Returns:
+        The configured tokenizer, or :func:`heuristic_tokens`
+    """
+    return _tokenizer
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in a text.
+
+    Args:
+        text: The text to measure
+
+    Returns:
+        The estimated token count; 0 for an empty text
+    """
+    if not text:
+        return 0
+    return _tokenizer(text)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Benchmark memory use of ModelSpecificDecoratorFactory under sustained load.
+
+Creates a long stream of model-specific decorators across several models and
+reports traced memory and the number of live generated classes at regular
+checkpoints. With the class cache in place both stay flat once every
+(decorator, model family) pair has been seen.
+
+Usage:
+    python scripts/bench_model_specific_cache.py [--requests N] [--checkpoints K]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from prompt_decorators.core.base import BaseDecorator  # noqa: E402
+from prompt_decorators.core.model_specific import (  # noqa: E402
+    ModelSpecificDecorator,
+    ModelSpecificDecoratorFactory,
+)
+
+MODELS = [
+    "gpt-4o",
+    "gpt-4o-2024-08-06",
+    "gpt-4-turbo",
+    "claude-3-7-sonnet-latest",
+    "claude-3-7-sonnet-20250219",
+    "llama-3.2-70b-chat",
+    "mistral-7b-instruct",
+]
+
+
+class BenchDecorator(BaseDecorator):
+    """Minimal decorator used as the base class for the benchmark."""
+
+    name = "BenchDecorator"
+
+    def apply(self, prompt: str) -> str:
+        """Prefix the prompt.
+
+        Args:
+            prompt: The prompt to decorate
+
+        Returns:
+            The decorated prompt
+        """
+        return f"Bench: {prompt}"
+
+
+def count_generated_classes():
+    """Count live model-specific classes.
+
+    Returns:
+        Number of generated ModelSpecificDecorator subclasses still alive
+    """
+    gc.collect()
+    return sum(
+        1
+        for obj in gc.get_objects()
+        if isinstance(obj, type)
+        and issubclass(obj, ModelSpecificDecorator)
+        and obj is not ModelSpecificDecorator
+    )
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50000)
+    parser.add_argument("--checkpoints", type=int, default=5)
+    args = parser.parse_args()
+
+    step = max(1, args.requests // args.checkpoints)
+
+    # Warm up lookups so one-off allocations are not attributed to the stream
+    for model_id in MODELS:
+        ModelSpecificDecoratorFactory.create_for_model(BenchDecorator, model_id)
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+
+    print(f"{'requests':>10} {'traced KiB':>12} {'classes':>8}")
+    for i in range(1, args.requests + 1):
+        decorator = ModelSpecificDecoratorFactory.create_for_model(
+            BenchDecorator, MODELS[i % len(MODELS)]
+        )
+        decorator.apply("prompt")
+        if i % step == 0:
+            gc.collect()
+            current = tracemalloc.get_traced_memory()[0] - baseline
+            print(f"{i:>10} {current / 1024:>12.1f} {count_generated_classes():>8}")
+
+    elapsed = time.perf_counter() - start
+    tracemalloc.stop()
+    print(f"\n{args.requests / elapsed:,.0f} requests/s")
+
+
+if __name__ == "__main__":
+    main()
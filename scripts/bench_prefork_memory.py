@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Benchmark registry memory across a pool of forked workers.
+
+Forks N workers that each apply a sample of decorators, then reads every
+worker's proportional (PSS) and private memory from /proc while all of them are
+alive. In "independent" mode each worker loads the registry itself, as a pool
+without preloading does; in "prefork" mode the parent calls
+``preload_registry()`` first and the workers inherit the compiled registry.
+Linux only.
+
+Usage:
+    python scripts/bench_prefork_memory.py [--workers N] [--requests R]
+        [--mode independent|prefork|both] [--no-freeze]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from prompt_decorators.core.dynamic_decorator import DynamicDecorator  # noqa: E402
+from prompt_decorators.utils.prefork import preload_registry  # noqa: E402
+
+
+def read_memory():
+    """Read this process's memory counters.
+
+    Returns:
+        Tuple of (PSS, private) memory in KiB
+    """
+    values = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[1].isdigit():
+                values[parts[0].rstrip(":")] = int(parts[1])
+    private = values.get("Private_Clean", 0) + values.get("Private_Dirty", 0)
+    return values.get("Pss", 0), private
+
+
+def work(requests):
+    """Apply decorators the way a worker serving requests would.
+
+    Args:
+        requests: Number of decorators to apply
+
+    Returns:
+        None
+    """
+    names = sorted(DynamicDecorator.get_snapshot())
+    for i in range(requests):
+        try:
+            decorator = DynamicDecorator(names[i % len(names)])
+        except ValueError:
+            # A few registry entries need parameters or have invalid defaults
+            continue
+        decorator.apply("Explain the water cycle.")
+
+
+def run_pool(workers, requests):
+    """Fork workers, collect their memory while all are alive, then reap them.
+
+    Args:
+        workers: Number of workers to fork
+        requests: Decorators applied by each worker before measuring
+
+    Returns:
+        List of (PSS, private) tuples in KiB, one per worker
+    """
+    release_r, release_w = os.pipe()
+    children = []
+    for _ in range(workers):
+        report_r, report_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                os.close(release_w)
+                os.close(report_r)
+                work(requests)
+                os.write(report_w, b"ready")
+                # Wait until every sibling is alive, so PSS splits shared pages
+                os.read(release_r, 1)
+                pss, private = read_memory()
+                os.write(report_w, f"{pss} {private}".encode())
+                status = 0
+            finally:
+                os._exit(status)
+        os.close(report_w)
+        children.append((pid, report_r))
+
+    for _, report_r in children:
+        os.read(report_r, 5)
+    os.close(release_w)
+
+    results = []
+    for pid, report_r in children:
+        pss, private = os.read(report_r, 64).split()
+        results.append((int(pss), int(private)))
+        os.close(report_r)
+        os.waitpid(pid, 0)
+    os.close(release_r)
+    return results
+
+
+def run_mode(mode, workers, requests, freeze):
+    """Run one pool in a fresh process so modes do not affect each other.
+
+    Args:
+        mode: "independent" or "prefork"
+        workers: Number of workers
+        requests: Decorators applied by each worker
+        freeze: Whether the prefork parent freezes the garbage collector
+
+    Returns:
+        None
+    """
+    pid = os.fork()
+    if pid:
+        os.waitpid(pid, 0)
+        return
+
+    start = time.perf_counter()
+    if mode == "prefork":
+        preload_registry(freeze=freeze)
+    parent_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    results = run_pool(workers, requests)
+    pool_ms = (time.perf_counter() - start) * 1000
+
+    total_pss = sum(pss for pss, _ in results)
+    total_private = sum(private for _, private in results)
+    print(
+        f"{mode:>12} {workers:>8} {total_pss / 1024:>10.1f} "
+        f"{total_private / 1024:>12.1f} {total_private / 1024 / workers:>12.1f} "
+        f"{parent_ms:>10.0f} {pool_ms:>8.0f}",
+        flush=True,
+    )
+    os._exit(0)
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument(
+        "--mode", choices=["independent", "prefork", "both"], default="both"
+    )
+    parser.add_argument("--no-freeze", action="store_true")
+    args = parser.parse_args()
+
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        parser.error("this benchmark needs /proc/self/smaps_rollup (Linux)")
+
+    modes = ["independent", "prefork"] if args.mode == "both" else [args.mode]
+    print(
+        f"{'mode':>12} {'workers':>8} {'PSS MiB':>10} {'private MiB':>12} "
+        f"{'per worker':>12} {'parent ms':>10} {'pool ms':>8}"
+    )
+    for mode in modes:
+        run_mode(mode, args.workers, args.requests, not args.no_freeze)
+
+
+if __name__ == "__main__":
+    main()
@@ -185,6 +185,10 @@ setup(
         "mcp": [
             "mcp[cli]>=0.1.0",
         ],
+        "fast": [
+            "fastjsonschema>=2.16.0",
+            "orjson>=3.8.0",
+        ],
         "all": [
             "langchain>=0.0.200",
             "openai>=1.0.0",
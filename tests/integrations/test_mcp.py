@@ -34,6 +34,7 @@ from prompt_decorators.integrations.mcp.server import (
     create_decorated_prompt,
     get_decorator_details,
     list_decorators,
+    suggest_decorators,
     transform_prompt,
 )
 
@@ -168,7 +169,7 @@ return result + "\\n" + text
         os.environ["DECORATOR_REGISTRY_DIR"] = str(registry_path)
 
         # Clear the registry cache and reload
-        DynamicDecorator._registry = {}
+        DynamicDecorator.update_registry({}, remove=DynamicDecorator._registry)
         DynamicDecorator._loaded = False
         DynamicDecorator.load_registry()
 
@@ -182,7 +183,7 @@ return result + "\\n" + text
                 del os.environ["DECORATOR_REGISTRY_DIR"]
 
         # Clear the registry cache again
-        DynamicDecorator._registry = {}
+        DynamicDecorator.update_registry({}, remove=DynamicDecorator._registry)
         DynamicDecorator._loaded = False
 
 
@@ -648,6 +649,19 @@ class TestMCPTools:
         assert result["content"][0]["text"] is not None
         assert len(result["content"][0]["text"]) > 0
 
+    @pytest.mark.usefixtures("mcp_test_registry")
+    def test_suggest_decorators(self):
+        """Test the suggest_decorators tool."""
+        result = suggest_decorators(decorators=["StepByStep"], limit=3)
+        assert isinstance(result, dict)
+        assert "content" in result
+        assert isinstance(result["suggestions"], list)
+        assert len(result["suggestions"]) <= 3
+        for suggestion in result["suggestions"]:
+            assert suggestion["name"] != "StepByStep"
+            assert suggestion["score"] > 0
+        assert "StepByStep" not in result["completion"]
+
 
 class TestMCPIntegration:
     """Tests for the MCP integration as a whole."""
@@ -28,12 +28,12 @@ pytestmark = pytest.mark.skipif(
 def setup_enum_decorators():
     """Set up test decorators with enum parameters."""
     # Save original registry state
-    original_registry = DynamicDecorator._registry.copy()
+    original_registry = DynamicDecorator.get_snapshot(load=False)
     original_loaded = DynamicDecorator._loaded
 
     try:
         # Clear and setup test registry
-        DynamicDecorator._registry.clear()
+        DynamicDecorator.update_registry({}, remove=DynamicDecorator._registry)
         DynamicDecorator._loaded = True  # Prevent automatic reloading
 
         # Define test decorators
@@ -87,7 +87,7 @@ return f"EnumValues decorator with option: {option}\\n{text}"
 
     finally:
         # Restore original registry state
-        DynamicDecorator._registry = original_registry
+        DynamicDecorator.restore_snapshot(original_registry)
         DynamicDecorator._loaded = original_loaded
 
 
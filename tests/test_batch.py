@@ -0,0 +1,76 @@
+"""Tests for bulk transformation of JSONL prompt records."""
+
+import json
+import sys
+
+from prompt_decorators.__main__ import main
+from prompt_decorators.core.dynamic_decorator import transform_prompt
+from prompt_decorators.utils.batch import BatchStats, count_records, transform_lines
+
+
+def _records(count):
+    """Build JSONL input lines.
+
+    Args:
+        count: Number of records
+
+    Returns:
+        The input lines
+    """
+    return [
+        json.dumps({"id": i, "prompt": f"Q{i}?", "decorators": ["+++StepByStep"]})
+        for i in range(count)
+    ]
+
+
+def test_results_are_in_input_order():
+    """Test that pooled results come back in input order and match serial ones."""
+    lines = _records(50)
+    serial = list(transform_lines(lines, jobs=1, batch_size=7))
+    pooled = list(transform_lines(lines, jobs=2, batch_size=7))
+
+    assert pooled == serial
+    results = [json.loads(line) for line in serial]
+    assert [r["id"] for r in results] == list(range(50))
+    assert results[3]["prompt"] == transform_prompt("Q3?", ["+++StepByStep"])
+
+
+def test_errors_and_inline_decorators():
+    """Test that bad records report errors and inline decorators are applied."""
+    lines = ["not json", "", json.dumps({"prompt": "+++Concise\nWhy?"}), "[1]"]
+    stats = BatchStats()
+    results = [json.loads(line) for line in transform_lines(lines, jobs=1, stats=stats)]
+
+    assert [r["line"] for r in results] == [1, 2, 3]
+    assert "error" in results[0] and "error" in results[2]
+    assert results[1]["prompt"] == transform_prompt("Why?", ["+++Concise"])
+    assert (stats.records, stats.errors) == (3, 2)
+
+
+def test_offset_skips_records():
+    """Test that an offset skips records but keeps their line numbers."""
+    results = list(transform_lines(_records(5), jobs=1, offset=3))
+    assert [json.loads(line)["line"] for line in results] == [4, 5]
+
+
+def test_count_records_removes_partial_line(tmp_path):
+    """Test that a partial line left by an interrupted run is removed."""
+    output = tmp_path / "out.jsonl"
+    output.write_text('{"line": 1}\n{"line": 2}\n{"li')
+    assert count_records(str(output)) == 2
+    assert output.read_text() == '{"line": 1}\n{"line": 2}\n'
+    assert count_records(str(tmp_path / "missing.jsonl")) == 0
+
+
+def test_cli_resumes_output(tmp_path, monkeypatch):
+    """Test that the transform command resumes an interrupted output file."""
+    source = tmp_path / "in.jsonl"
+    source.write_text("\n".join(_records(6)) + "\n")
+    output = tmp_path / "out.jsonl"
+    expected = [line + "\n" for line in transform_lines(_records(6), jobs=1)]
+    output.write_text("".join(expected[:4]) + expected[4][:10])
+
+    argv = ["prompt-decorators", "transform", str(source), "--output", str(output)]
+    monkeypatch.setattr(sys, "argv", argv + ["--resume", "--jobs", "1", "--quiet"])
+    assert main() == 0
+    assert output.read_text() == "".join(expected)
@@ -0,0 +1,63 @@
+"""Tests for the standard performance workloads."""
+
+import json
+import sys
+
+import pytest
+
+from prompt_decorators.__main__ import main
+from prompt_decorators.core.dynamic_decorator import DynamicDecorator
+from prompt_decorators.utils.bench import BenchResult, run_benchmarks, sample_parameters
+
+
+def test_percentiles_use_nearest_rank():
+    """Test latency percentiles."""
+    result = BenchResult("probe", [0.004, 0.001, 0.003, 0.002], 0.01)
+    assert result.percentile(50) == 0.002
+    assert result.percentile(99) == result.percentile(100) == 0.004
+    assert result.to_dict()["ops_per_second"] == pytest.approx(400)
+
+
+def test_run_benchmarks_writes_profiles(tmp_path):
+    """Test running selected workloads with profiling."""
+    results = run_benchmarks(
+        ["parser_stress", "long_chain"], iterations=2, profile_dir=str(tmp_path)
+    )
+    assert [r.name for r in results] == ["long_chain", "parser_stress"]
+    assert all(r.ops == 2 for r in results)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "long_chain.pstats",
+        "parser_stress.pstats",
+    ]
+    with pytest.raises(ValueError, match="Unknown workload"):
+        run_benchmarks(["nope"])
+
+
+def test_cli_prints_json_report(capsys, monkeypatch):
+    """Test the machine-readable output of the bench command."""
+    argv = ["prompt-decorators", "bench", "--workload", "single_apply"]
+    monkeypatch.setattr(sys, "argv", argv + ["--iterations", "1", "--json"])
+    assert main() == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["environment"]["decorators"] > 0
+    (result,) = report["results"]
+    assert result["name"] == "single_apply"
+    assert result["ops"] == report["environment"]["decorators"]
+
+
+def test_cli_rejects_unknown_workload_first(capsys, monkeypatch):
+    """Test that unknown workloads are reported before any output."""
+    argv = ["prompt-decorators", "bench", "--workload", "nope"]
+    monkeypatch.setattr(sys, "argv", argv)
+    assert main() == 1
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "Unknown workload(s): nope" in captured.err
+
+
+def test_sample_parameters_fill_required_and_invalid_defaults():
+    """Test that every decorator gets parameters it accepts."""
+    assert sample_parameters("StepByStep") == {}
+    assert sample_parameters("TechStack") == {"for": "web", "constraints": "budget"}
+    for name in DynamicDecorator.get_snapshot():
+        DynamicDecorator(name, **sample_parameters(name))
@@ -0,0 +1,104 @@
+"""Tests for token estimates and prompt budgets."""
+
+import pytest
+
+from prompt_decorators.core.budget import fit_chain, truncate_text
+from prompt_decorators.core.dynamic_decorator import (
+    DynamicDecorator,
+    compile_chain,
+    estimate_prompt,
+    transform_prompt,
+)
+from prompt_decorators.utils.tokens import estimate_tokens, set_tokenizer
+
+CHAIN = ["+++StepByStep", "+++Concise", "+++Detailed", "+++Reasoning"]
+PROMPT = "Explain DNS.\n\n" + "Some context. " * 200
+
+
+@pytest.fixture
+def word_tokenizer():
+    """Count tokens as whitespace-separated words while the test runs."""
+    set_tokenizer(lambda text: len(text.split()))
+    yield
+    set_tokenizer(None)
+
+
+def test_estimate_matches_rendered_prompt():
+    """Test that the estimate is close to the rendered prompt's size."""
+    report = estimate_prompt(PROMPT, CHAIN)
+    rendered = estimate_tokens(transform_prompt(PROMPT, CHAIN))
+    assert report.fits
+    assert rendered <= report.estimated_tokens <= rendered + len(CHAIN)
+
+
+def test_decorator_estimates_are_precomputed():
+    """Test that decorators report their instruction size without rendering."""
+    decorator = DynamicDecorator("StepByStep", numbered=True)
+    instruction = decorator.apply("")
+    assert abs(decorator.estimate_tokens() - estimate_tokens(instruction)) <= 2
+
+
+def test_tokenizer_is_pluggable(word_tokenizer):
+    """Test that a custom tokenizer replaces the heuristic and cached estimates."""
+    decorator = DynamicDecorator("StepByStep")
+    assert decorator.estimate_tokens() == len(decorator.apply("").split())
+    assert estimate_prompt("one two three", []).estimated_tokens == 3
+
+
+def test_budget_drops_latest_decorators_first():
+    """Test that instructions are removed from the end of the chain."""
+    full = estimate_prompt(PROMPT, CHAIN).estimated_tokens
+    last = DynamicDecorator("Reasoning").estimate_tokens()
+    report = estimate_prompt(PROMPT, CHAIN, budget=full - last - 1)
+    assert report.dropped == ["Reasoning"]
+    assert report.fits
+
+    prompt = transform_prompt(PROMPT, CHAIN, budget=full - last - 1)
+    assert DynamicDecorator("Reasoning").apply("").strip() not in prompt
+    assert DynamicDecorator("StepByStep").apply("").strip() in prompt
+
+
+def test_budget_shortens_instruction_when_dropping_is_too_much():
+    """Test that an instruction is cut to leading sentences when that fits."""
+    full = estimate_prompt(PROMPT, CHAIN).estimated_tokens
+    report = estimate_prompt(PROMPT, CHAIN, budget=full - 5)
+    assert report.truncated == ["Reasoning"]
+    assert report.dropped == []
+    assert report.estimated_tokens <= full - 5
+
+
+def test_shortened_instruction_keeps_line_breaks(word_tokenizer):
+    """Test that cutting an instruction to leading sentences keeps its layout."""
+    instruction = "Follow these rules:\n- Be brief.\n- Cite sources.\n- Use lists."
+    definition = {
+        "name": "ListProbe",
+        "transformationTemplate": {"instruction": instruction},
+    }
+    DynamicDecorator.get_snapshot()
+    DynamicDecorator.update_registry({"ListProbe": definition})
+    try:
+        chain = compile_chain([DynamicDecorator("ListProbe")])
+        fitted, text = fit_chain(chain, "Go.", chain.estimate_tokens("Go.") - 1)
+        assert fitted.budget.truncated == ["ListProbe"]
+        shortened = "Follow these rules:\n- Be brief.\n- Cite sources."
+        assert fitted.apply(text) == shortened + "\n\nGo."
+    finally:
+        DynamicDecorator.update_registry({}, remove=["ListProbe"])
+
+
+def test_budget_truncates_prompt_on_section_boundary():
+    """Test that the prompt is cut at the end once every instruction is gone."""
+    prompt = "Question?\n\n" + "First section. " * 20 + "\n\n" + "x" * 400
+    chain, text = fit_chain(compile_chain([DynamicDecorator("Concise")]), prompt, 85)
+    assert chain.budget is not None
+    assert chain.budget.dropped == ["Concise"]
+    assert chain.budget.prompt_truncated > 0
+    assert text == prompt[: prompt.rindex("\n\n")]
+    assert estimate_tokens(chain.apply(text)) <= 85
+
+
+def test_truncate_text_fits_custom_tokenizer(word_tokenizer):
+    """Test that truncation honours the configured tokenizer."""
+    text = " ".join(f"w{i}" for i in range(100))
+    assert estimate_tokens(truncate_text(text, 10)) <= 10
+    assert truncate_text(text, 100) == text
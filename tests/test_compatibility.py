@@ -0,0 +1,165 @@
+"""Tests for the compiled compatibility index and rule conditions."""
+
+import pytest
+
+from prompt_decorators.core.dynamic_decorator import DynamicDecorator
+from prompt_decorators.utils.compatibility import (
+    CompatibilityChecker,
+    CompatibilityIndex,
+    CompatibilityIssue,
+    compile_condition,
+)
+
+DEFINITIONS = {
+    "Alpha": {
+        "compatibility": {"conflicts": ["Beta"], "requires": []},
+        "compatibilityNotes": [
+            {"decorator": "Gamma", "relationship": "enhances", "notes": "Works well"}
+        ],
+    },
+    "Beta": {"compatibility": {}, "compatibilityNotes": []},
+    "Gamma": {
+        "compatibility": {"requires": ["Delta"]},
+        "compatibilityNotes": [
+            {"decorator": "All", "relationship": "requires", "notes": "Ignored"},
+            {
+                "decorator": "Beta",
+                "relationship": "conflicts",
+                "notes": "Opposite styles",
+            },
+        ],
+    },
+    "Delta": {},
+}
+
+
+@pytest.fixture
+def index():
+    """Compile an index from a small set of definitions."""
+    return CompatibilityIndex.from_definitions(DEFINITIONS)
+
+
+def test_conflicts_are_symmetric(index):
+    """Test that conflicts declared on one side apply to both."""
+    assert index.conflicts_of("Alpha") == ["Beta"]
+    assert index.conflicts_of("Beta") == ["Alpha", "Gamma"]
+
+
+def test_validate_chain_reports_conflicts_and_requirements(index):
+    """Test that chain validation reports conflicts and missing requirements."""
+    assert index.is_valid_chain(["Alpha", "Gamma", "Delta"])
+    assert not index.is_valid_chain(["Gamma", "Alpha"])
+
+    issues = index.validate_chain(["Gamma", "Beta"])
+    messages = [issue.message for issue in issues]
+    assert messages == [
+        "Gamma conflicts with Beta: Opposite styles",
+        "Gamma requires Delta",
+    ]
+    assert all(issue.severity == CompatibilityIssue.SEVERITY_ERROR for issue in issues)
+
+
+def test_unknown_names_are_ignored(index):
+    """Test that names outside the registry do not affect validation."""
+    assert index.is_valid_chain(["Unknown", "Alpha"])
+    assert index.validate_chain(["Unknown"]) == []
+
+
+@pytest.mark.parametrize(
+    "context,expected",
+    [
+        ({"OutputFormat": {"format_type": "json"}, "CodeGeneration": {}}, True),
+        ({"OutputFormat": {"format_type": "markdown"}, "CodeGeneration": {}}, False),
+        ({"OutputFormat": {"format_type": "json"}}, False),
+    ],
+)
+def test_compile_condition(context, expected):
+    """Test evaluation of rule conditions against decorator parameters."""
+    condition = compile_condition(
+        "OutputFormat.format_type not in ['markdown', 'text'] "
+        "and CodeGeneration is present"
+    )
+    assert condition(context) is expected
+
+
+def test_compile_condition_rejects_unsupported_syntax():
+    """Test that conditions cannot call functions."""
+    with pytest.raises(ValueError):
+        compile_condition("__import__('os').getcwd()")
+
+
+def test_checker_evaluates_rule_conditions():
+    """Test that conditional rules only fire when their condition holds."""
+    checker = CompatibilityChecker()
+    checker.add_rule(
+        "Depth",
+        "Brief",
+        {
+            "compatible": True,
+            "message": "Deep analysis is cut short by Brief",
+            "condition": "Depth.level >= 3",
+        },
+    )
+
+    class _Param:
+        def __init__(self, value):
+            self.value = value
+
+    class _Decorator:
+        def __init__(self, name, **params):
+            self.name = name
+            self.parameters = {k: _Param(v) for k, v in params.items()}
+
+    assert (
+        checker.check_compatibility_group([_Decorator("Depth", level=1), "Brief"]) == []
+    )
+    issues = checker.check_compatibility_group([_Decorator("Depth", level=4), "Brief"])
+    assert [issue.message for issue in issues] == [
+        "Deep analysis is cut short by Brief"
+    ]
+    assert issues[0].decorator1 == "Depth"
+
+
+def test_registry_index_tracks_registered_decorators():
+    """Test that the registry index picks up compatibility from registrations."""
+    DynamicDecorator.load_registry()
+    DynamicDecorator.register_decorator(
+        {
+            "decoratorName": "CompatProbe",
+            "description": "Probe decorator",
+            "parameters": [],
+            "compatibility": {"conflicts": ["Reasoning"]},
+        }
+    )
+    try:
+        index = DynamicDecorator.get_compatibility_index()
+        assert "CompatProbe" in index.conflicts_of("Reasoning")
+        assert not index.is_valid_chain(["Reasoning", "CompatProbe"])
+    finally:
+        DynamicDecorator.load_registry()
+
+
+def test_suggest_ranks_enhancing_decorators():
+    """Test that suggestions follow the enhances graph and skip conflicts."""
+    index = CompatibilityIndex.from_definitions(
+        {
+            "Base": {
+                "compatibilityNotes": [
+                    {"decorator": "Helper", "relationship": "enhances"},
+                    {"decorator": "Rival", "relationship": "enhances"},
+                    {"decorator": "Extra", "relationship": "enhances"},
+                ]
+            },
+            "Helper": {
+                "compatibilityNotes": [
+                    {"decorator": "Base", "relationship": "enhances"},
+                    {"decorator": "Extra", "relationship": "enhances"},
+                ]
+            },
+            "Rival": {"compatibility": {"conflicts": ["Base"]}},
+            "Extra": {"compatibility": {"requires": ["Missing"]}},
+        }
+    )
+    assert index.suggest(["Base"]) == [("Helper", 2), ("Extra", 1)]
+    # Extra has an unsatisfiable requirement, so completion stops after Helper
+    assert index.complete_chain(["Base"], max_additions=3) == ["Helper"]
@@ -0,0 +1,153 @@
+"""Tests for composing decorator instructions within a chain."""
+
+from prompt_decorators.core.composition import (
+    CompositionReport,
+    InstructionBlock,
+    compose_instructions,
+)
+from prompt_decorators.core.dynamic_decorator import (
+    DynamicDecorator,
+    compile_chain,
+    transform_prompt,
+)
+
+
+def _block(name, text, behavior="accumulate", category="General", placement="prepend"):
+    """Build an instruction block.
+
+    Args:
+        name: Decorator name
+        text: Instruction text
+        behavior: Composition behaviour
+        category: Decorator category
+        placement: Instruction placement
+
+    Returns:
+        The instruction block
+    """
+    return InstructionBlock(name, category, behavior, placement, text)
+
+
+def _compose(blocks, conflicts=None):
+    """Compose blocks and return the kept instructions with the report.
+
+    Args:
+        blocks: The instruction blocks
+        conflicts: Conflicting decorator names by decorator name
+
+    Returns:
+        Tuple of (kept instruction texts, report)
+    """
+    report = CompositionReport()
+    kept = compose_instructions(
+        blocks, lambda name: (conflicts or {}).get(name, ()), report
+    )
+    return [block.instruction for block in kept], report
+
+
+def test_accumulate_keeps_every_instruction():
+    """Test that accumulating decorators keep their instructions."""
+    texts, report = _compose([_block("A", "Do a."), _block("B", "Do b.")])
+    assert texts == ["Do a.", "Do b."]
+    assert report.saved_tokens == 0
+
+
+def test_override_replaces_same_category_and_decorator():
+    """Test override within an explicit category and for repeated decorators."""
+    texts, report = _compose(
+        [
+            _block("A", "Do a.", category="Format"),
+            _block("C", "Do c."),
+            _block("B", "Do b.", behavior="override", category="Format"),
+            _block("D", "Do d 1.", behavior="selective-override"),
+            _block("D", "Do d 2.", behavior="selective-override"),
+        ]
+    )
+    assert texts == ["Do c.", "Do b.", "Do d 2."]
+    assert ("A", "overridden by B") in report.dropped
+    assert report.saved_tokens > 0
+
+
+def test_override_does_not_group_default_category():
+    """Test that decorators without a category are not overridden together."""
+    texts, _ = _compose([_block("A", "Do a."), _block("B", "Do b.", "override")])
+    assert texts == ["Do a.", "Do b."]
+
+
+def test_chain_treats_missing_category_as_default():
+    """Test that definitions without a category are not overridden together."""
+    definitions = {
+        name: {
+            "name": name,
+            "transformationTemplate": {
+                "instruction": f"Do {name}.",
+                "compositionBehavior": "override",
+            },
+        }
+        for name in ("PlainA", "PlainB")
+    }
+    DynamicDecorator.get_snapshot()
+    DynamicDecorator.update_registry(definitions)
+    try:
+        chain = compile_chain(
+            [DynamicDecorator("PlainA"), DynamicDecorator("PlainB")], compose=True
+        )
+        assert chain.report.dropped == []
+        assert "Do PlainA." in chain.apply("Go.")
+    finally:
+        DynamicDecorator.update_registry({}, remove=definitions)
+
+
+def test_conflicting_instruction_is_replaced():
+    """Test that a later decorator replaces an earlier one it conflicts with."""
+    texts, report = _compose(
+        [_block("Concise", "Be brief."), _block("Detailed", "Be thorough.")],
+        {"Detailed": ["Concise"]},
+    )
+    assert texts == ["Be thorough."]
+    assert report.dropped == [("Concise", "conflicts with Detailed")]
+
+
+def test_duplicate_sentences_are_dropped():
+    """Test that sentences already given earlier in the chain are removed."""
+    texts, report = _compose(
+        [
+            _block("A", "Be clear. Use steps."),
+            _block("B", "use  steps. Cite sources."),
+            _block("C", "Be clear."),
+        ]
+    )
+    assert texts == ["Be clear. Use steps.", "Cite sources."]
+    assert report.dropped == [("C", "duplicate")]
+
+
+def test_duplicate_removal_keeps_line_breaks():
+    """Test that the sentences left after removing a duplicate keep their layout."""
+    texts, _ = _compose(
+        [
+            _block("A", "Use steps."),
+            _block("B", "Be clear.\nUse steps.\nCite sources."),
+            _block("C", "Cite sources.\n\nUse steps. End."),
+        ]
+    )
+    assert texts == ["Use steps.", "Be clear.\nCite sources.", "End."]
+
+
+def test_compose_is_off_by_default():
+    """Test that chains render unchanged unless composition is requested."""
+    decorators = [DynamicDecorator("StepByStep"), DynamicDecorator("StepByStep")]
+    chain = compile_chain(decorators)
+    assert chain.report is None
+    assert chain.apply("Go.").count("\n\n") == 2
+
+
+def test_transform_prompt_composes_chain():
+    """Test composition through transform_prompt."""
+    chain = ["+++StepByStep", "+++Concise", "+++StepByStep", "+++Detailed"]
+    plain = transform_prompt("Explain DNS.", chain)
+    composed = transform_prompt("Explain DNS.", chain, compose=True)
+
+    assert composed.endswith("Explain DNS.")
+    assert len(composed) < len(plain)
+    step = DynamicDecorator("StepByStep").apply("")
+    assert composed.count(step.strip()) == 1
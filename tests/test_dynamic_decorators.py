@@ -167,7 +167,7 @@ return result + text
 
         # Reset the registry
         DynamicDecorator._loaded = False
-        DynamicDecorator._registry.clear()
+        DynamicDecorator.update_registry({}, remove=DynamicDecorator._registry)
 
 
 def test_dynamic_decorator_loading(temp_registry):
@@ -113,7 +113,7 @@ return f"Selected option: {selected_option}\\n{text}"
 
         # Reset registry and load the new decorators
         DynamicDecorator._loaded = False
-        DynamicDecorator._registry.clear()
+        DynamicDecorator.update_registry({}, remove=DynamicDecorator._registry)
 
         # Directly register the decorators for more reliable testing
         DynamicDecorator.register_decorator(with_enum_values)
@@ -130,7 +130,7 @@ return f"Selected option: {selected_option}\\n{text}"
 
         # Reset the registry
         DynamicDecorator._loaded = False
-        DynamicDecorator._registry.clear()
+        DynamicDecorator.update_registry({}, remove=DynamicDecorator._registry)
 
 
 def test_enum_values_parameter(enum_registry):
@@ -222,12 +222,12 @@ return f"Using enum value: {value}\\n{text}"
     }
 
     # Save the original registry state
-    original_registry = DynamicDecorator._registry.copy()
+    original_registry = DynamicDecorator.get_snapshot(load=False)
     original_loaded = DynamicDecorator._loaded
 
     try:
         # Ensure we're starting fresh
-        DynamicDecorator._registry.clear()
+        DynamicDecorator.update_registry({}, remove=DynamicDecorator._registry)
         DynamicDecorator._loaded = True  # Prevent reloading
 
         # Register the decorator
@@ -256,5 +256,5 @@ return f"Using enum value: {value}\\n{text}"
 
     finally:
         # Restore the original registry
-        DynamicDecorator._registry = original_registry
+        DynamicDecorator.restore_snapshot(original_registry)
         DynamicDecorator._loaded = original_loaded
@@ -0,0 +1,99 @@
+"""Tests for bulk JSON file loading."""
+
+import json
+
+import pytest
+
+from prompt_decorators.utils import json_backend
+from prompt_decorators.utils.discovery import DecoratorRegistry
+from prompt_decorators.utils.json_backend import (
+    iter_json_paths,
+    load_json_files,
+    loads,
+    read_json_file,
+)
+
+
+def make_files(directory, count):
+    """Write numbered JSON files, with an invalid one in the middle.
+
+    Args:
+        directory: Directory to write to
+        count: Number of files
+
+    Returns:
+        Paths of the files, in order
+    """
+    paths = []
+    for i in range(count):
+        path = directory / f"f{i:03d}.json"
+        path.write_text("{broken" if i == count // 2 else json.dumps({"i": i}))
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_load_json_files_keeps_order_and_errors(tmp_path, monkeypatch, workers):
+    """Test that results follow the input order and carry per-file errors."""
+    monkeypatch.setattr(json_backend, "PARALLEL_MIN_FILES", 2)
+    paths = make_files(tmp_path, 9)
+
+    results = load_json_files(paths, workers=workers)
+
+    assert [path for path, _, _ in results] == [str(p) for p in paths]
+    assert isinstance(results[4][2], json.JSONDecodeError)
+    assert [data["i"] for _, data, error in results if error is None] == [
+        0,
+        1,
+        2,
+        3,
+        5,
+        6,
+        7,
+        8,
+    ]
+
+
+def test_missing_file_is_reported(tmp_path):
+    """Test that unreadable files are returned as errors."""
+    [(_, data, error)] = load_json_files([tmp_path / "missing.json"])
+    assert data is None
+    assert isinstance(error, OSError)
+
+
+def test_backend_errors_are_json_decode_errors(tmp_path):
+    """Test that the configured backend raises the standard error type."""
+    with pytest.raises(json.JSONDecodeError):
+        loads("{nope")
+    path = tmp_path / "data.json"
+    path.write_text('{"name": "caf\\u00e9", "n": [1, 2.5, null]}')
+    assert read_json_file(path) == {"name": "café", "n": [1, 2.5, None]}
+
+
+def test_iter_json_paths_recurses(tmp_path):
+    """Test that JSON files in nested directories are found."""
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "x.json").write_text("{}")
+    (tmp_path / "y.json").write_text("{}")
+    (tmp_path / "z.txt").write_text("")
+    found = sorted(p.rsplit("/", 1)[-1] for p in iter_json_paths(tmp_path))
+    assert found == ["x.json", "y.json"]
+
+
+def test_registry_directory_registration_skips_bad_files(tmp_path, capsys, monkeypatch):
+    """Test that a directory of definitions is registered from bulk-loaded files."""
+    (tmp_path / "good.json").write_text(
+        json.dumps({"name": "BulkProbe", "description": "Probe"})
+    )
+    (tmp_path / "bad.json").write_text("{broken")
+    registered = []
+    monkeypatch.setattr(
+        DecoratorRegistry,
+        "_register_from_data",
+        lambda self, data: registered.append(data["name"]) or object,
+    )
+
+    registry = DecoratorRegistry()
+    assert registry.register_all_from_json_directory(str(tmp_path)) == 1
+    assert registered == ["BulkProbe"]
+    assert "bad.json" in capsys.readouterr().out
@@ -0,0 +1,108 @@
+"""Tests for schema validation in JSONLoader."""
+
+import json
+
+import jsonschema
+import pytest
+
+from prompt_decorators.utils import json_loader
+from prompt_decorators.utils.json_loader import JSONLoader
+
+VALID = {
+    "decoratorName": "Probe",
+    "version": "1.0.0",
+    "description": "Probe decorator",
+    "parameters": [],
+}
+
+
+def schema_error(validate, data):
+    """Run a validation function and describe the error it raises.
+
+    Args:
+        validate: The validation function
+        data: The instance to validate
+
+    Returns:
+        Tuple of (message, path) of the error, or None if the data is valid
+    """
+    try:
+        validate(data)
+    except jsonschema.ValidationError as e:
+        return e.message, list(e.absolute_path)
+    return None
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        VALID,
+        {**VALID, "version": 3},
+        {key: value for key, value in VALID.items() if key != "decoratorName"},
+        {**VALID, "parameters": "none"},
+        {**VALID, "parameters": [{"name": "x", "type": "weird"}]},
+    ],
+)
+def test_errors_match_jsonschema_validate(data):
+    """Test that the compiled validator reports what jsonschema.validate does."""
+    loader = JSONLoader()
+    expected = schema_error(
+        lambda d: jsonschema.validate(instance=d, schema=loader.schema), data
+    )
+    assert schema_error(loader._validate_against_schema, data) == expected
+
+
+def test_validator_is_compiled_once_per_schema(monkeypatch):
+    """Test that loaders share the validator compiled for a schema file."""
+    monkeypatch.setattr(json_loader, "_VALIDATOR_CACHE", {})
+    validators = set()
+    for _ in range(3):
+        loader = JSONLoader()
+        for _ in range(3):
+            loader.load_from_string(json.dumps(VALID))
+        validators.add(id(loader._validator))
+    assert len(validators) == 1
+    assert len(json_loader._VALIDATOR_CACHE) == 1
+
+
+def test_fail_fast_reports_an_error():
+    """Test that fail-fast mode still rejects invalid definitions."""
+    loader = JSONLoader(fail_fast=True)
+    with pytest.raises(jsonschema.ValidationError):
+        loader.load_from_string(json.dumps({**VALID, "version": 3}))
+
+
+def test_unknown_backend_is_rejected():
+    """Test that an unknown validation backend is reported."""
+    with pytest.raises(ValueError, match="Unknown schema validation backend"):
+        JSONLoader(backend="nope")
+
+
+@pytest.mark.skipif(
+    not json_loader.FASTJSONSCHEMA_AVAILABLE, reason="fastjsonschema not installed"
+)
+def test_fastjsonschema_backend_matches_jsonschema():
+    """Test that the generated validator accepts and rejects the same data."""
+    loader = JSONLoader(backend="fastjsonschema")
+    data = dict(VALID)
+    loader._validate_against_schema(data)
+    assert data == VALID  # Schema defaults are not filled in
+    with pytest.raises(jsonschema.ValidationError) as excinfo:
+        loader._validate_against_schema({**VALID, "version": 3})
+    assert excinfo.value.absolute_path[0] == "version"
+
+
+def test_parallel_directory_load_matches_serial(tmp_path):
+    """Test that loading across processes returns the same definitions."""
+    for i in range(6):
+        data = {**VALID, "decoratorName": f"Probe{i}"}
+        if i == 3:
+            data["version"] = 3
+        (tmp_path / f"probe{i}.json").write_text(json.dumps(data))
+
+    loader = JSONLoader()
+    serial = loader.load_from_directory(str(tmp_path))
+    parallel = loader.load_from_directory(str(tmp_path), workers=2)
+
+    assert parallel == serial
+    assert len(serial) == 5
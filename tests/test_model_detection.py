@@ -0,0 +1,91 @@
+"""Tests for model id resolution in the model detector."""
+
+import pytest
+
+from prompt_decorators.utils.model_detection import (
+    ModelCapabilities,
+    ModelDetector,
+    normalize_model_id,
+)
+
+
+@pytest.fixture
+def detector():
+    """Create a fresh detector, independent of the global singleton."""
+    detector = object.__new__(ModelDetector)
+    detector._initialize()
+    return detector
+
+
+def test_normalize_model_id():
+    """Test that provider prefixes, case and separators are normalised."""
+    assert normalize_model_id(" OpenAI/GPT_4o ") == "gpt-4o"
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("gpt-4o", "gpt-4o"),
+        ("GPT-4o-Mini", "gpt-4o-mini"),
+        ("gpt-4o-2024-08-06", "gpt-4o"),
+        ("gpt-4o-mini-2024-07-18", "gpt-4o-mini"),
+        ("claude-3-7-sonnet", "claude-3-7-sonnet-latest"),
+        ("claude-3-7-sonnet-20250219", "claude-3-7-sonnet-latest"),
+        ("gpt-4-tur", "gpt-4-turbo"),
+        ("azure-gpt-4-turbo-deployment", "gpt-4-turbo"),
+        ("mistral-large", None),
+    ],
+)
+def test_resolve_model_id(detector, query, expected):
+    """Test deterministic resolution of exact, prefixed and partial ids."""
+    assert detector.resolve_model_id(query) == expected
+
+
+def test_misses_are_memoised(detector, caplog):
+    """Test that a miss is only computed and logged once."""
+    with caplog.at_level("WARNING"):
+        assert detector.get_model_capabilities("mistral-large") is None
+        assert detector.get_model_capabilities("mistral-large") is None
+    assert caplog.text.count("mistral-large") == 1
+
+    detector.register_model(ModelCapabilities("mistral-large", "mistral"))
+    assert detector.resolve_model_id("mistral-large-2407") == "mistral-large"
+
+
+def test_stale_resolution_is_not_memoised(detector, monkeypatch):
+    """Test that a result from a trie replaced during resolution is not kept."""
+    detector.build_index()
+    stale = detector._trie
+    real_exact = stale.exact
+
+    def register_then_match(key):
+        """Register a model while the stale trie is being searched.
+
+        Args:
+            key: The normalised query
+
+        Returns:
+            The stale trie's exact match
+        """
+        detector.register_model(ModelCapabilities("mistral-large", "mistral"))
+        return real_exact(key)
+
+    monkeypatch.setattr(stale, "exact", register_then_match)
+    assert detector.resolve_model_id("mistral-large-2407") is None
+    assert "mistral-large-2407" not in detector._memo
+    assert detector.resolve_model_id("mistral-large-2407") == "mistral-large"
+
+
+def test_memo_is_bounded(detector, monkeypatch):
+    """Test that the memo evicts the oldest entries."""
+    monkeypatch.setattr(ModelDetector, "MEMO_SIZE", 2)
+    for query in ["gpt-4o-a", "gpt-4o-b", "gpt-4o-c"]:
+        detector.resolve_model_id(query)
+    assert list(detector._memo) == ["gpt-4o-b", "gpt-4o-c"]
+
+
+def test_resolve_model_family(detector):
+    """Test resolving families from ids and family names."""
+    assert detector.resolve_model_family("openai") == "openai"
+    assert detector.resolve_model_family("claude-3-7-sonnet") == "anthropic"
+    assert detector.resolve_model_family("unknown-model") is None
@@ -0,0 +1,50 @@
+"""Tests for model-specific decorator class caching."""
+
+from prompt_decorators.core.base import BaseDecorator
+from prompt_decorators.core.model_specific import ModelSpecificDecoratorFactory
+from prompt_decorators.utils.plugins import Plugin, get_plugin_manager
+
+
+class CachedDecorator(BaseDecorator):
+    """Decorator used as a base for model-specific classes."""
+
+    name = "CachedDecorator"
+
+    def apply(self, prompt):
+        """Prefix the prompt."""
+        return f"Cached: {prompt}"
+
+
+def test_classes_are_reused_per_model_family():
+    """Test that one class is generated per decorator and model family."""
+    gpt4o = ModelSpecificDecoratorFactory.create_for_model(CachedDecorator, "gpt-4o")
+    turbo = ModelSpecificDecoratorFactory.create_for_model(
+        CachedDecorator, "gpt-4-turbo"
+    )
+    claude = ModelSpecificDecoratorFactory.create_for_model(
+        CachedDecorator, "claude-3-7-sonnet-latest"
+    )
+
+    assert type(gpt4o) is type(turbo)
+    assert type(gpt4o) is not type(claude)
+    assert isinstance(gpt4o, CachedDecorator)
+    assert (gpt4o.model_id, turbo.model_id) == ("gpt-4o", "gpt-4-turbo")
+    assert gpt4o.apply("Prompt") == "Cached: Prompt"
+
+
+def test_unload_plugin_evicts_generated_classes():
+    """Test that unloading a plugin drops classes generated from its decorators."""
+    manager = get_plugin_manager()
+    plugin = Plugin("cache-test-plugin", "1.0.0", decorators=[CachedDecorator])
+    manager.load_plugin(plugin)
+
+    first = ModelSpecificDecoratorFactory.create_for_model(CachedDecorator, "gpt-4o")
+    assert ModelSpecificDecoratorFactory.get_class_for_model(
+        CachedDecorator, "gpt-4o"
+    ) is type(first)
+
+    assert manager.unload_plugin("cache-test-plugin")
+    assert not any(
+        key[0] is CachedDecorator
+        for key in ModelSpecificDecoratorFactory._class_cache.keys()
+    )
@@ -0,0 +1,59 @@
+"""Tests for pre-fork loading of the registry."""
+
+import gc
+import os
+import sys
+
+import pytest
+
+from prompt_decorators.core.dynamic_decorator import DynamicDecorator
+from prompt_decorators.utils.prefork import preload_registry
+
+
+def test_preload_compiles_registry():
+    """Test that preloading leaves nothing to compile on first use."""
+    snapshot = preload_registry(freeze=False)
+
+    assert snapshot is DynamicDecorator.get_snapshot()
+    assert set(DynamicDecorator._render_plans) == set(snapshot)
+    plans = dict(DynamicDecorator._validation_plans)
+    DynamicDecorator("StepByStep")
+    assert DynamicDecorator._validation_plans["StepByStep"] is plans["StepByStep"]
+    key = DynamicDecorator._compatibility_index[0]
+    assert key == (snapshot.generation, len(snapshot))
+
+
+def test_preload_freezes_collector():
+    """Test that preloading moves loaded objects to the permanent generation."""
+    try:
+        preload_registry()
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_worker_uses_preloaded_registry():
+    """Test that a forked worker applies decorators without reloading."""
+    snapshot = preload_registry(freeze=False)
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        status = 1
+        try:
+            os.close(read_fd)
+            result = DynamicDecorator("StepByStep").apply("Explain recursion.")
+            same = DynamicDecorator.get_snapshot() is snapshot
+            os.write(write_fd, f"{int(same)} {len(result)}".encode())
+            status = 0
+        finally:
+            sys.stdout.flush()
+            os._exit(status)
+    os.close(write_fd)
+    same, length = os.read(read_fd, 64).split()
+    os.close(read_fd)
+    _, status = os.waitpid(pid, 0)
+
+    assert status == 0
+    assert same == b"1"
+    assert int(length) > len("Explain recursion.")
@@ -0,0 +1,66 @@
+"""Tests for compact decorator records."""
+
+import json
+
+from prompt_decorators.core.dynamic_decorator import (
+    DynamicDecorator,
+    create_transform_function_from_template,
+)
+from prompt_decorators.core.records import DecoratorRecord
+
+DATA = {
+    "decoratorName": "RecordProbe",
+    "description": "Decorator used to test records",
+    "version": "1.2.0",
+    "parameters": [
+        {"name": "style", "type": "enum", "enum": ["brief", "full"]},
+    ],
+    "transformationTemplate": {"instruction": "Be careful.", "placement": "append"},
+    "implementationGuidance": {
+        "examples": [{"context": "x"}],
+        "compatibilityNotes": [{"decorator": "Reasoning", "relationship": "enhances"}],
+    },
+    "examples": [{"description": "Example", "usage": "+++RecordProbe"}],
+    "author": {"name": "Tester"},
+}
+
+
+def test_record_reads_like_a_definition():
+    """Test that a record exposes the engine's definition fields."""
+    record = DecoratorRecord(json.loads(json.dumps(DATA)))
+    assert record["name"] == "RecordProbe"
+    assert record.get("category") == "General"
+    assert record["compatibilityNotes"][0]["decorator"] == "Reasoning"
+    assert "examples" not in record
+    assert record["transform_function"] == create_transform_function_from_template(
+        DATA["transformationTemplate"]
+    )
+    # Names and types are interned, so they are shared between decorators
+    other = DecoratorRecord(json.loads(json.dumps(DATA)))
+    assert other["parameters"][0]["type"] is record["parameters"][0]["type"]
+
+
+def test_details_are_loaded_from_source_file(tmp_path):
+    """Test that documentation fields are re-read from the source file."""
+    path = tmp_path / "record-probe.json"
+    path.write_text(json.dumps(DATA))
+    record = DecoratorRecord(DATA, source=str(path))
+    assert record.details() == {
+        key: DATA[key] for key in ("examples", "author", "implementationGuidance")
+    }
+
+    path.write_text(json.dumps(dict(DATA, decoratorName="Renamed")))
+    assert record.details() == {}
+
+
+def test_get_decorator_details_for_registered_decorator():
+    """Test details for decorators registered without a source file."""
+    DynamicDecorator.register_decorator(DATA)
+    try:
+        details = DynamicDecorator.get_decorator_details("RecordProbe")
+        assert details["version"] == "1.2.0"
+        assert details["author"] == {"name": "Tester"}
+        assert details["implementationGuidance"]["examples"] == [{"context": "x"}]
+        assert DynamicDecorator.get_decorator_details("MissingProbe") is None
+    finally:
+        DynamicDecorator.update_registry({}, remove=["RecordProbe"])
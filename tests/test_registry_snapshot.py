@@ -0,0 +1,74 @@
+"""Tests for registry generations and concurrent reloads."""
+
+import threading
+
+import pytest
+
+from prompt_decorators.core.dynamic_decorator import DynamicDecorator
+
+PROBE = {"decoratorName": "SnapshotProbe", "description": "Probe", "parameters": []}
+
+
+def test_registration_publishes_new_generation():
+    """Test that writers swap in a new generation instead of mutating."""
+    DynamicDecorator.load_registry()
+    before = DynamicDecorator.get_snapshot()
+    try:
+        DynamicDecorator.register_decorator(PROBE)
+        after = DynamicDecorator.get_snapshot()
+
+        assert after.generation == before.generation + 1
+        assert "SnapshotProbe" in after
+        assert "SnapshotProbe" not in before
+        assert DynamicDecorator.get_registry_generation() == after.generation
+    finally:
+        DynamicDecorator.load_registry()
+    assert "SnapshotProbe" not in DynamicDecorator.get_snapshot()
+
+
+def test_published_snapshot_is_read_only():
+    """Test that the registry can only change by publishing a new generation."""
+    DynamicDecorator.load_registry()
+    original = DynamicDecorator.get_snapshot()
+    with pytest.raises(TypeError):
+        DynamicDecorator._registry["Probe"] = {}  # type: ignore[index]
+    try:
+        snapshot = DynamicDecorator.update_registry({}, remove=original)
+        assert len(snapshot) == 0 and DynamicDecorator._registry is snapshot.definitions
+        restored = DynamicDecorator.restore_snapshot(original)
+        assert restored.generation == original.generation + 2
+        assert dict(restored) == dict(original) and len(original) > 0
+    finally:
+        DynamicDecorator.restore_snapshot(original)
+
+
+def test_readers_never_see_partial_registry():
+    """Test that decorators resolve while the registry is being reloaded."""
+    DynamicDecorator.load_registry()
+    errors = []
+    stop = threading.Event()
+
+    def reload():
+        """Reload the registry until the readers are done."""
+        while not stop.is_set():
+            DynamicDecorator.load_registry()
+
+    def read():
+        """Create decorators during reloads."""
+        for _ in range(300):
+            try:
+                DynamicDecorator("StepByStep")
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+    writer = threading.Thread(target=reload)
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    writer.start()
+    for reader in readers:
+        reader.start()
+    for reader in readers:
+        reader.join()
+    stop.set()
+    writer.join()
+
+    assert errors == []
@@ -0,0 +1,88 @@
+"""Tests for incremental and parallel registry file validation."""
+
+import json
+
+from prompt_decorators.utils import registry_validator
+from prompt_decorators.utils.registry_validator import RegistryValidator
+
+
+def write_decorator(path, name, **extra):
+    """Write a decorator definition file.
+
+    Args:
+        path: Path of the file
+        name: Decorator name
+        **extra: Additional definition fields
+
+    Returns:
+        None
+    """
+    data = {"decoratorName": name, "description": f"{name} decorator", **extra}
+    path.write_text(json.dumps(data))
+
+
+def test_validate_files_reports_invalid_files(tmp_path):
+    """Test that the report lists each file with its errors."""
+    write_decorator(tmp_path / "good.json", "Good")
+    write_decorator(tmp_path / "bad.json", "Bad", parameters={})
+    (tmp_path / "broken.json").write_text("{not json")
+
+    report = RegistryValidator.validate_files([tmp_path], jobs=1)
+
+    assert report["status"] == "invalid"
+    assert (report["total"], report["checked"], report["invalid"]) == (3, 3, 2)
+    errors = {entry["path"].rsplit("/", 1)[-1]: entry for entry in report["files"]}
+    assert errors["good.json"]["valid"]
+    assert errors["bad.json"]["errors"] == ["parameters must be a list"]
+    assert errors["broken.json"]["errors"][0].startswith("Invalid JSON")
+
+
+def test_manifest_skips_unchanged_files(tmp_path):
+    """Test that only files whose content changed are validated again."""
+    registry = tmp_path / "registry"
+    registry.mkdir()
+    manifest = tmp_path / "manifest.json"
+    for i in range(3):
+        write_decorator(registry / f"d{i}.json", f"D{i}")
+
+    first = RegistryValidator.validate_files([registry], manifest, jobs=1)
+    assert (first["checked"], first["skipped"]) == (3, 0)
+
+    write_decorator(registry / "d1.json", "D1", parameters="oops")
+    second = RegistryValidator.validate_files([registry], manifest, jobs=1)
+    assert (second["checked"], second["skipped"]) == (1, 2)
+    assert second["status"] == "invalid"
+
+    # Cached failures are still reported
+    third = RegistryValidator.validate_files([registry], manifest, jobs=1)
+    assert (third["checked"], third["invalid"]) == (0, 1)
+    cached = [entry for entry in third["files"] if not entry["valid"]]
+    assert cached[0]["cached"] and cached[0]["errors"]
+
+
+def test_manifest_from_other_version_is_ignored(tmp_path):
+    """Test that results cached by another validator version are discarded."""
+    manifest = tmp_path / "manifest.json"
+    write_decorator(tmp_path / "d.json", "D")
+    RegistryValidator.validate_files([tmp_path / "d.json"], manifest, jobs=1)
+
+    data = json.loads(manifest.read_text())
+    data["version"] = registry_validator.MANIFEST_VERSION + 1
+    manifest.write_text(json.dumps(data))
+
+    report = RegistryValidator.validate_files([tmp_path / "d.json"], manifest, jobs=1)
+    assert report["checked"] == 1
+
+
+def test_parallel_validation_matches_serial(tmp_path, monkeypatch):
+    """Test that validating across a process pool gives the same results."""
+    monkeypatch.setattr(registry_validator, "PARALLEL_MIN_FILES", 2)
+    for i in range(6):
+        extra = {"parameters": [{"name": "x"}]} if i % 2 else {}
+        write_decorator(tmp_path / f"d{i}.json", f"D{i}", **extra)
+
+    serial = RegistryValidator.validate_files([tmp_path], jobs=1)
+    parallel = RegistryValidator.validate_files([tmp_path], jobs=2)
+
+    assert parallel["files"] == serial["files"]
+    assert parallel["invalid"] == 3
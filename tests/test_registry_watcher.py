@@ -0,0 +1,127 @@
+"""Tests for hot reloading the registry."""
+
+import json
+import os
+
+import pytest
+
+from prompt_decorators.core.dynamic_decorator import DynamicDecorator
+from prompt_decorators.utils import registry_watcher
+from prompt_decorators.utils.registry_watcher import RegistryWatcher
+
+
+def _definition(instruction):
+    """Build a minimal decorator definition.
+
+    Args:
+        instruction: Instruction of the transformation template
+
+    Returns:
+        The definition
+    """
+    return {
+        "decoratorName": "WatchProbe",
+        "description": "Probe",
+        "parameters": [],
+        "transformationTemplate": {"instruction": instruction},
+    }
+
+
+class _Telemetry:
+    """Records reload events instead of sending them."""
+
+    def __init__(self):
+        """Initialize the recorder."""
+        self.reloads = []
+
+    def track_registry_reload(self, *args, **kwargs):
+        """Record a reload event."""
+        self.reloads.append(args)
+
+
+@pytest.fixture
+def telemetry(monkeypatch):
+    """Capture telemetry reported by the watcher."""
+    recorder = _Telemetry()
+    monkeypatch.setattr(registry_watcher, "get_telemetry_manager", lambda: recorder)
+    yield recorder
+    DynamicDecorator.load_registry()
+
+
+def _write(path, data):
+    """Write JSON and make sure the change is visible to the watcher."""
+    path.write_text(data if isinstance(data, str) else json.dumps(data))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_watcher_publishes_changed_files(tmp_path, telemetry):
+    """Test that changes are validated and swapped in as new generations."""
+    DynamicDecorator.load_registry()
+    path = tmp_path / "watch-probe.json"
+    _write(path, _definition("First."))
+    watcher = RegistryWatcher(paths=[], extra_dirs=[str(tmp_path)])
+
+    result = watcher.check()
+    assert result.changed == ["WatchProbe"]
+    in_flight = DynamicDecorator("WatchProbe")
+    assert watcher.check() is None
+
+    _write(path, _definition("Second."))
+    assert watcher.check().generation == DynamicDecorator.get_registry_generation()
+    assert DynamicDecorator("WatchProbe").apply("Text") == "Second.\n\nText"
+    # Decorators created on the old generation keep its definition
+    assert in_flight.apply("Text") == "First.\n\nText"
+
+    _write(path, "{not json")
+    result = watcher.check()
+    assert result.changed == [] and len(result.failures) == 1
+    assert DynamicDecorator("WatchProbe").apply("Text") == "Second.\n\nText"
+
+    path.unlink()
+    assert watcher.check().removed == ["WatchProbe"]
+    assert "WatchProbe" not in DynamicDecorator.get_snapshot()
+    assert "StepByStep" in DynamicDecorator.get_snapshot()
+    # One event per reload, including the one that only reported a failure
+    assert [len(event[4]) for event in telemetry.reloads] == [0, 0, 1, 0]
+
+
+def test_deleting_an_override_restores_the_builtin(tmp_path, telemetry):
+    """Test that deleting an extension file republishes the definition it replaced."""
+    DynamicDecorator.load_registry()
+    builtin = DynamicDecorator("Concise").apply("Text")
+    data = json.loads(open(DynamicDecorator.get_snapshot()["Concise"].source).read())
+    data["transformationTemplate"] = {"instruction": "Override."}
+    path = tmp_path / "concise.json"
+    _write(path, data)
+    watcher = RegistryWatcher(extra_dirs=[str(tmp_path)])
+
+    assert watcher.check().changed == ["Concise"]
+    assert DynamicDecorator("Concise").apply("Text") == "Override.\n\nText"
+
+    path.unlink()
+    result = watcher.check()
+    assert result.changed == ["Concise"] and result.removed == []
+    assert DynamicDecorator("Concise").apply("Text") == builtin
+
+
+def test_deleting_one_version_keeps_the_others(tmp_path, telemetry):
+    """Test that deleting a file removes only the versions it defined."""
+    DynamicDecorator.load_registry()
+    old, new = tmp_path / "old.json", tmp_path / "new.json"
+    _write(old, dict(_definition("Old."), version="1.0.0"))
+    _write(new, dict(_definition("New."), version="2.0.0"))
+    watcher = RegistryWatcher(paths=[], extra_dirs=[str(tmp_path)])
+    watcher.check()
+    assert DynamicDecorator.get_decorator_versions("WatchProbe") == ["2.0.0", "1.0.0"]
+
+    old.unlink()
+    assert watcher.check().removed == ["WatchProbe"]
+    assert DynamicDecorator.get_decorator_versions("WatchProbe") == ["2.0.0"]
+
+    _write(old, dict(_definition("Old."), version="1.0.0"))
+    watcher.check()
+    new.unlink()
+    watcher.check()
+    assert DynamicDecorator.get_decorator_versions("WatchProbe") == ["1.0.0"]
+    assert DynamicDecorator("WatchProbe").apply("Text") == "Old.\n\nText"
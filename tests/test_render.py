@@ -0,0 +1,213 @@
+"""Tests for compiled render plans and model-specific variants."""
+
+import io
+import random
+
+import pytest
+
+from prompt_decorators.core.dynamic_decorator import (
+    DynamicDecorator,
+    compile_chain,
+    create_transform_function_from_template,
+    transform_prompt,
+)
+from prompt_decorators.core.render import (
+    ChainPlan,
+    DecoratedPrompt,
+    compile_render_plan,
+)
+
+TEMPLATE = {
+    "instruction": "Base instruction.",
+    "parameterMapping": {
+        "depth": {"valueMap": {"shallow": "Stay brief.", "deep": "Go deep."}},
+        "flag": {"valueMap": {"true": "Flag is on.", "false": "Flag is off."}},
+        "topic": {"format": "Focus on {value}."},
+    },
+    "placement": "prepend",
+}
+
+DEFINITION = {
+    "decoratorName": "RenderProbe",
+    "description": "Decorator used to test render plans",
+    "parameters": [
+        {"name": "depth", "type": "enum", "enum": ["shallow", "deep"]},
+        {"name": "flag", "type": "boolean", "default": True},
+        {"name": "topic", "type": "string"},
+    ],
+    "transformationTemplate": TEMPLATE,
+    "implementationGuidance": {
+        "modelSpecificImplementations": {
+            "gpt-4o": {"instruction": "GPT variant about {topic}, {flag}"},
+            "anthropic": {"instruction": "Anthropic variant."},
+        }
+    },
+}
+
+
+@pytest.fixture
+def render_probe():
+    """Register a decorator with model-specific variants."""
+    DynamicDecorator.load_registry()
+    DynamicDecorator.register_decorator(DEFINITION)
+    yield
+    DynamicDecorator.load_registry()
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"depth": "deep"},
+        {"depth": "deep", "flag": False, "topic": "types"},
+        {"depth": "unknown", "flag": "true", "topic": ["a", "b"]},
+    ],
+)
+@pytest.mark.parametrize("placement", ["prepend", "append", "replace", "other"])
+def test_plan_matches_generated_function(params, placement):
+    """Test that plans render exactly what the generated function returns."""
+    template = dict(TEMPLATE, placement=placement)
+    namespace = {}
+    exec(create_transform_function_from_template(template), namespace)
+
+    plan = compile_render_plan(template)
+
+    assert plan.apply("Prompt", params) == namespace["transform"]("Prompt", **params)
+
+
+@pytest.mark.usefixtures("render_probe")
+@pytest.mark.parametrize(
+    "model,expected",
+    [
+        (None, "Base instruction. Go deep. Focus on tests."),
+        ("gpt-4o-2024-08-06", "GPT variant about tests, Flag is on. Go deep."),
+        ("claude-3-7-sonnet-latest", "Anthropic variant. Go deep. Focus on tests."),
+        ("mistral-7b-instruct", "Base instruction. Go deep. Focus on tests."),
+    ],
+)
+def test_transform_prompt_uses_model_variant(model, expected):
+    """Test that the target model selects the matching variant or the base plan."""
+    result = transform_prompt(
+        "Prompt", ["+++RenderProbe(depth=deep, topic=tests)"], model=model
+    )
+    assert result == f"{expected}\n\nPrompt"
+
+
+@pytest.mark.usefixtures("render_probe")
+def test_decorator_target_model():
+    """Test that a decorator instance can be tailored for a model family."""
+    decorator = DynamicDecorator("RenderProbe", target_model="anthropic", depth="deep")
+    assert decorator.apply("Prompt") == "Anthropic variant. Go deep.\n\nPrompt"
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_chain_plan_matches_sequential_application(seed):
+    """Test that a fused chain equals applying each step in turn."""
+    rng = random.Random(seed)
+    chain = ChainPlan()
+    text = expected = "Prompt\n\n```\ncode\n```"
+    for i in range(rng.randint(0, 8)):
+        placement = rng.choice(["prepend", "append", "replace", "other", "custom"])
+        if placement == "custom":
+            chain.add_transform(str.upper)
+            expected = expected.upper()
+            continue
+        chain.add(placement, f"Step {i}.")
+        expected = compile_render_plan(
+            {"instruction": f"Step {i}.", "placement": placement}
+        ).apply(expected, {})
+    assert chain.apply(text) == expected
+    # Applying does not change the chain
+    assert chain.apply(text) == expected
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_compile_chain_matches_decorators_applied_in_turn(seed):
+    """Test fused registry chains against sequential application."""
+    rng = random.Random(seed)
+    names = sorted(DynamicDecorator.get_snapshot())
+    decorators = []
+    while len(decorators) < rng.randint(1, 6):
+        try:
+            decorators.append(DynamicDecorator(rng.choice(names)))
+        except ValueError:
+            continue
+
+    expected = "Review this file:\n" + "x = 1\n" * 100
+    prompt = expected
+    for decorator in decorators:
+        expected = decorator.apply(expected)
+    assert compile_chain(decorators).apply(prompt) == expected
+
+
+def test_parts_static_block_is_canonical():
+    """Test that the static block ignores decorator order and user content."""
+    first = transform_prompt(
+        "First prompt", ["+++StepByStep", "+++Concise"], output="parts"
+    )
+    second = transform_prompt(
+        "Second prompt", ["+++Concise", "+++StepByStep"], output="parts"
+    )
+
+    assert first.static == second.static
+    assert first.static_hash == second.static_hash
+    assert (first.dynamic, second.dynamic) == ("First prompt", "Second prompt")
+    assert first.to_messages()[0] == {"role": "system", "content": first.static}
+
+
+def test_parts_handle_replace_and_custom_transforms():
+    """Test parts for replace instructions and custom transform steps."""
+    chain = ChainPlan()
+    chain.add("prepend", "Early.", "A")
+    chain.add("replace", "Replaced.", "B")
+    chain.add("append", "Late.", "C")
+    chain.add_transform(str.upper)
+
+    parts = chain.parts("Prompt")
+
+    assert parts == ("Late.", "REPLACED.", parts.static_hash)
+    assert str(parts) == "Late.\n\nREPLACED."
+
+
+def test_unknown_output_mode():
+    """Test that an unknown output mode is rejected."""
+    with pytest.raises(ValueError, match="Unknown output mode"):
+        transform_prompt("Prompt", [], output="html")
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_decorated_prompt_renders_like_apply(seed):
+    """Test that the lazy result renders, measures and streams like apply()."""
+    rng = random.Random(seed)
+    chain = ChainPlan()
+    for i in range(rng.randint(0, 6)):
+        placement = rng.choice(["prepend", "append", "replace", "custom"])
+        if placement == "custom":
+            chain.add_transform(str.upper)
+        else:
+            chain.add(placement, f"Step {i}.")
+    expected = chain.apply("Prompt")
+
+    prompt = chain.decorate("Prompt")
+
+    assert str(prompt) == expected
+    assert prompt == expected
+    assert len(prompt) == len(expected)
+    assert "".join(prompt) == expected
+    binary, text = io.BytesIO(), io.StringIO()
+    prompt.write_to(binary)
+    prompt.write_to(text)
+    assert binary.getvalue().decode() == text.getvalue() == expected
+
+
+def test_decorated_prompt_keeps_text_reference():
+    """Test that the lazy result refers to the prompt text instead of copying it."""
+    document = "line\n" * 10000
+    prompt = transform_prompt(document, ["+++StepByStep"], output="lazy")
+
+    assert isinstance(prompt, DecoratedPrompt)
+    assert prompt.text is document
+    messages = prompt.to_messages()
+    assert messages[0]["role"] == "system"
+    assert messages[1] == {"role": "user", "content": document}
+    assert prompt.estimate_tokens() >= len(document) // 4
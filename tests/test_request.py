@@ -0,0 +1,147 @@
+"""Tests for decorated requests."""
+
+import io
+
+import pytest
+
+from prompt_decorators.core.base import DecoratorBase
+from prompt_decorators.core.dynamic_decorator import DynamicDecorator
+from prompt_decorators.core.request import DecoratedRequest
+from prompt_decorators.utils.discovery import DecoratorRegistry
+
+
+class Shout(DecoratorBase):
+    """Class-based decorator that upper-cases the prompt."""
+
+    name = "Shout"
+
+    def apply_to_prompt(self, prompt):
+        """Upper-case the prompt.
+
+        Args:
+            prompt: The prompt to decorate
+
+        Returns:
+            The upper-cased prompt
+        """
+        return prompt.upper()
+
+
+@pytest.fixture
+def shout():
+    """Register the class-based decorator while the test runs."""
+    registry = DecoratorRegistry()
+    registry.register_decorator(Shout)
+    yield
+    registry._decorators.pop("Shout", None)
+
+
+def _request():
+    """Build a request with two dynamic decorators.
+
+    Returns:
+        The request
+    """
+    return DecoratedRequest(
+        "Explain DNS.",
+        [DynamicDecorator("StepByStep", numbered=True), DynamicDecorator("Concise")],
+        model="gpt-4o",
+    )
+
+
+def test_json_round_trip():
+    """Test that requests resolve their decorators from the registry."""
+    request = _request()
+    loaded = DecoratedRequest.from_json(request.to_json())
+
+    assert loaded.to_dict() == request.to_dict()
+    assert loaded.apply_decorators() == request.apply_decorators()
+    assert DecoratedRequest.from_json(request.to_json(indent=2)).model == "gpt-4o"
+
+
+def test_version_and_legacy_fields():
+    """Test that pinned versions and the legacy ``type`` field are resolved."""
+    pin = f"v{DynamicDecorator('StepByStep').definition['version']}"
+    request = DecoratedRequest("Go.", [DynamicDecorator(f"StepByStep:{pin}")])
+    assert request.to_dict()["decorators"][0]["version"] == pin
+    loaded = DecoratedRequest.from_json(request.to_json())
+    assert loaded.get_decorator("StepByStep").to_dict()["version"] == pin
+    assert "version" not in DynamicDecorator("StepByStep").to_dict()
+
+    request = DecoratedRequest.from_dict(
+        {
+            "prompt": "Go.",
+            "decorators": [
+                {"type": "Concise", "parameters": [{"name": "level", "value": "high"}]}
+            ],
+        }
+    )
+    assert request.get_decorator("Concise").parameters["level"].value == "high"
+    with pytest.raises(ValueError, match="not found in registry"):
+        DecoratedRequest.from_dict({"prompt": "Go.", "decorators": [{"name": "Nope"}]})
+
+
+def test_class_decorators_take_precedence(shout):
+    """Test that registered decorator classes resolve before dynamic ones."""
+    request = DecoratedRequest.from_dict(
+        {"prompt": "go.", "decorators": [{"name": "Shout"}, {"name": "Concise"}]}
+    )
+    assert isinstance(request.get_decorator("Shout"), Shout)
+    assert request.apply_decorators() == DynamicDecorator("Concise").apply("GO.")
+
+    line = (
+        '{"prompt": "go.", "decorators": [{"name": "Shout", "parameters": {"x": 1}}]}'
+    )
+    with pytest.raises(ValueError, match="Line 1: .*Unknown parameter: x"):
+        list(DecoratedRequest.from_jsonl([line]))
+
+
+def test_name_index():
+    """Test adding, finding and removing decorators by name."""
+    request = _request()
+    with pytest.raises(ValueError, match="already exists"):
+        request.add_decorator(DynamicDecorator("Concise"))
+    with pytest.raises(ValueError, match="Duplicate decorator"):
+        DecoratedRequest("Go.", [DynamicDecorator("Concise")] * 2)
+
+    assert request.remove_decorator("StepByStep")
+    assert not request.remove_decorator("StepByStep")
+    request.add_decorator(DynamicDecorator("StepByStep"))
+    assert [d.name for d in request.decorators] == ["Concise", "StepByStep"]
+    with pytest.raises(AttributeError):
+        request.decorators.append(DynamicDecorator("Detailed"))
+    request.decorators = [DynamicDecorator("Detailed")]
+    assert request.get_decorator("Detailed") and not request.get_decorator("Concise")
+
+
+def test_bulk_jsonl():
+    """Test reading and applying a request log."""
+    lines = [_request().to_json(), "", DecoratedRequest("Why?").to_json()] * 3
+    requests = list(DecoratedRequest.from_jsonl(io.StringIO("\n".join(lines))))
+
+    assert len(requests) == 6
+    assert requests[0].get_decorator("Concise") is requests[2].get_decorator("Concise")
+    expected = [request.apply_decorators() for request in requests]
+    assert list(DecoratedRequest.apply_many(requests)) == expected
+
+    with pytest.raises(ValueError, match="Line 2"):
+        list(DecoratedRequest.from_jsonl([lines[0], "{broken"]))
+
+
+def test_shared_decorators_distinguish_value_types():
+    """Test that equal values of different types are not shared."""
+    lines = [
+        '{"prompt": "Go.", "decorators": [{"name": "StepByStep", "parameters": '
+        + f'{{"numbered": {value}}}}}]}}'
+        for value in ("true", "1")
+    ]
+    with pytest.raises(ValueError, match="Line 2"):
+        list(DecoratedRequest.from_jsonl(lines))
+
+
+def test_from_jsonl_reads_files(tmp_path):
+    """Test reading requests from a file path."""
+    path = tmp_path / "requests.jsonl"
+    path.write_text(_request().to_json() + "\n")
+    (request,) = DecoratedRequest.from_jsonl(path)
+    assert request.to_dict() == _request().to_dict()
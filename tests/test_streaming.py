@@ -0,0 +1,201 @@
+"""Tests for streaming prompt decoration and response transforms."""
+
+import asyncio
+import io
+import re
+
+import pytest
+
+from prompt_decorators.core.base import DecoratorBase
+from prompt_decorators.core.dynamic_decorator import DynamicDecorator
+from prompt_decorators.core.streaming import (
+    CodeFenceTransform,
+    RegexResponseTransform,
+    ResponsePipeline,
+    apply_dynamic_decorators_stream,
+    atransform_response_stream,
+    read_head,
+    transform_response_stream,
+)
+from prompt_decorators.dynamic_decorators_module import apply_dynamic_decorators
+
+PROMPTS = [
+    "+++StepByStep(numbered=true) +++Concise\n  Summarise the call.  \n\n",
+    "+++OutputFormat(format=json)\n+++Reasoning(depth=comprehensive) body +x ++ y",
+    "+++StepByStep",
+    "  plain prompt ",
+    "+++StepByStep(numbered=true",
+    "++ not a sigil",
+    "",
+]
+
+
+@pytest.mark.parametrize("prompt", PROMPTS)
+def test_stream_matches_apply_at_every_chunk_size(prompt):
+    """Test that sigils split across chunks give the same result."""
+    expected = apply_dynamic_decorators(prompt)
+    for size in range(1, len(prompt) + 2):
+        chunks = [prompt[i : i + size] for i in range(0, len(prompt), size)]
+        assert "".join(apply_dynamic_decorators_stream(chunks)) == expected
+
+
+def test_stream_reads_file_objects():
+    """Test streaming from a text file object."""
+    prompt = PROMPTS[0]
+    source = io.StringIO(prompt)
+    result = "".join(apply_dynamic_decorators_stream(source, chunk_size=4))
+    assert result == apply_dynamic_decorators(prompt)
+
+
+def test_body_is_passed_through_lazily():
+    """Test that the body is not read before the instructions are emitted."""
+    consumed = []
+
+    def source():
+        """Yield a prompt, recording how far it was read.
+
+        Returns:
+            An iterator over the prompt chunks
+        """
+        yield "+++StepByStep Body"
+        for i in range(3):
+            consumed.append(i)
+            yield f" chunk{i}"
+
+    stream = apply_dynamic_decorators_stream(source())
+    instruction = next(stream)
+    assert instruction.startswith("Please")
+    assert consumed == []
+    assert "".join(stream).endswith("chunk2")
+
+
+def test_sigils_in_body_are_text():
+    """Test that only sigils at the head are read."""
+    sigils, start = read_head(iter(["+++Concise Hello ", "+++StepByStep"]))
+    assert sigils == ["+++Concise"]
+    assert start == "Hello "
+
+
+def _chunkings(text):
+    """Split a text into chunks of every size.
+
+    Args:
+        text: The text to split
+
+    Returns:
+        An iterator over lists of chunks
+    """
+    for size in range(1, len(text) + 2):
+        yield [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class Shout(DecoratorBase):
+    """Decorator whose response transform needs the whole response."""
+
+    name = "Shout"
+
+    def transform_response(self, response: str) -> str:
+        """Upper-case the response.
+
+        Args:
+            response: The response
+
+        Returns:
+            The upper-cased response
+        """
+        return response.upper()
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        '```json\n{"a": "``"}\n```\n',
+        '  ```\n{"a": 1}\n\n```  ',
+        '{"a": 1}',
+        '```json\n{"a": 1}\n``` trailing',
+        "plain ` text ``` more",
+        "",
+    ],
+)
+def test_code_fence_stream_matches_whole_response(response):
+    """Test that stripping fences from a stream equals stripping the whole."""
+    expected = CodeFenceTransform().transform(response)
+    for chunks in _chunkings(response):
+        pipeline = ResponsePipeline([CodeFenceTransform()])
+        assert "".join(pipeline.process(chunks)) == expected
+
+
+@pytest.mark.parametrize(
+    "pattern, replacement, max_length, text",
+    [
+        (r"\bcolour\b", "color", 6, "The colour of colours; xcolour colour"),
+        (r"\s+", " ", 20, "a  b \n\n c   d  "),
+        (r"(?<=a)b", "X", 1, "abab bab"),
+    ],
+)
+def test_regex_stream_matches_whole_response(pattern, replacement, max_length, text):
+    """Test bounded-lookahead substitution across chunk boundaries."""
+    expected = re.sub(pattern, replacement, text)
+    for chunks in _chunkings(text):
+        transform = RegexResponseTransform(pattern, replacement, max_length)
+        assert "".join(ResponsePipeline([transform]).process(chunks)) == expected
+
+
+def test_response_output_is_emitted_early():
+    """Test that incremental transforms release chunks before the end."""
+    decorators = [DynamicDecorator("OutputFormat", format="json")]
+    chunks = ["```json\n", '{"a": ', "1, ", '"b": 2}', "\n```"]
+    stream = transform_response_stream(iter(chunks), decorators)
+
+    # Trailing whitespace is held back in case the closing fence follows
+    assert next(stream) == '{"a":'
+    assert "".join(stream) == ' 1, "b": 2}'
+
+
+def test_pipeline_chains_transforms():
+    """Test a chain mixing incremental and whole-response transforms."""
+    decorators = [DynamicDecorator("OutputFormat", format="json"), Shout()]
+    pipeline = ResponsePipeline.for_decorators(decorators)
+
+    assert pipeline.lookahead is None
+    assert "".join(pipeline.process(["```\n", "{'a': 1}", "\n```"])) == "{'A': 1}"
+    assert (
+        ResponsePipeline.for_decorators([DynamicDecorator("StepByStep")]).lookahead == 0
+    )
+
+
+def test_async_response_stream():
+    """Test transforming an async stream of chunks."""
+
+    async def chunks():
+        """Yield response chunks.
+
+        Returns:
+            An async iterator over the chunks
+        """
+        for chunk in ["```yaml\n", "a: 1", "\n```"]:
+            yield chunk
+
+    async def collect():
+        """Collect the transformed stream.
+
+        Returns:
+            The transformed chunks
+        """
+        decorators = [DynamicDecorator("OutputFormat", format="yaml")]
+        return [c async for c in atransform_response_stream(chunks(), decorators)]
+
+    assert "".join(asyncio.run(collect())) == "a: 1"
+
+
+def test_dynamic_decorator_transform_response():
+    """Test the whole-response API of dynamic decorators."""
+    fenced = '```json\n{"a": 1}\n```'
+    assert (
+        DynamicDecorator("OutputFormat", format="json").transform_response(fenced)
+        == '{"a": 1}'
+    )
+    assert (
+        DynamicDecorator("OutputFormat", format="markdown").transform_response(fenced)
+        == fenced
+    )
@@ -113,12 +113,12 @@ def test_decorator_with_dynamic_registration():
     }
 
     # Save the original registry state
-    original_registry = DynamicDecorator._registry.copy()
+    original_registry = DynamicDecorator.get_snapshot(load=False)
     original_loaded = DynamicDecorator._loaded
 
     try:
         # Clear the registry and set loaded to True to prevent reloading
-        DynamicDecorator._registry = {}
+        DynamicDecorator.update_registry({}, remove=DynamicDecorator._registry)
         DynamicDecorator._loaded = True
 
         # Register the decorator
@@ -134,5 +134,5 @@ def test_decorator_with_dynamic_registration():
         assert "Test content" in result
     finally:
         # Restore the original registry state
-        DynamicDecorator._registry = original_registry
+        DynamicDecorator.restore_snapshot(original_registry)
         DynamicDecorator._loaded = original_loaded
@@ -0,0 +1,84 @@
+"""Tests for parameter validators and compiled validation pipelines."""
+
+from enum import Enum
+
+import pytest
+
+from prompt_decorators.core.base import ValidationError
+from prompt_decorators.core.validation import (
+    ChoiceValidator,
+    DictValidator,
+    EnumValidator,
+    ListValidator,
+    PatternValidator,
+    RangeValidator,
+    TypeValidator,
+    ValidationPipeline,
+)
+
+
+class Tone(Enum):
+    """Enum used by the tests."""
+
+    FORMAL = "formal"
+    CASUAL = "casual"
+
+
+PIPELINE = ValidationPipeline(
+    {
+        "tone": EnumValidator(Tone),
+        "level": RangeValidator(1, 5, allow_none=True),
+        "code": PatternValidator(r"^[A-Z]{2}$"),
+        "weights": ListValidator(RangeValidator(0, 1), max_length=3),
+        "labels": DictValidator(TypeValidator(str), ChoiceValidator(["on", "off"])),
+    }
+)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"tone": "formal", "level": None, "code": "AB"},
+        {"weights": [0, 0.5, 1], "labels": {"a": "on"}},
+        {"tone": Tone.CASUAL},
+    ],
+)
+def test_compiled_pipeline_matches_pipeline(params):
+    """Test that compiled and generic pipelines return the same values."""
+    assert PIPELINE.compile().validate("Probe", params) == PIPELINE.validate(
+        "Probe", params
+    )
+
+
+@pytest.mark.parametrize(
+    "params,message",
+    [
+        ({"tone": "loud"}, "[Probe] tone: Invalid value 'loud'. Must be one of: "),
+        ({"level": 9}, "[Probe] level: Value 9 is above maximum 5"),
+        ({"code": None}, "[Probe] code: Parameter cannot be None"),
+        ({"code": "abc"}, "does not match pattern '^[A-Z]{2}$'"),
+        ({"weights": [0, 2]}, "Item at index 1 is invalid: Value 2 is above maximum"),
+        ({"weights": [0] * 4}, "List length 4 is above maximum 3"),
+        ({"labels": {"a": "dim"}}, "Value for key 'a' is invalid: Invalid value"),
+        ({"labels": {1: "on"}}, "Key '1' is invalid: Expected str, got int"),
+    ],
+)
+@pytest.mark.parametrize("compiled", [False, True])
+def test_error_messages(params, message, compiled):
+    """Test that both backends raise the same validation errors."""
+    pipeline = PIPELINE.compile() if compiled else PIPELINE
+    with pytest.raises(ValidationError) as excinfo:
+        pipeline.validate("Probe", params)
+    assert message in str(excinfo.value)
+    assert excinfo.value.decorator_name == "Probe"
+
+
+def test_validate_many():
+    """Test validating a batch of parameter sets with a compiled pipeline."""
+    batch = [{"tone": "casual", "code": "AB"}, {"level": 2, "weights": [1]}]
+    assert PIPELINE.compile().validate_many("Probe", batch) == [
+        {"tone": Tone.CASUAL, "code": "AB"},
+        {"level": 2, "weights": [1]},
+    ]
+    with pytest.raises(ValidationError, match="level: Value 9 is above maximum"):
+        PIPELINE.compile().validate_many("Probe", batch + [{"level": 9}])
@@ -0,0 +1,96 @@
+"""Tests for compiled parameter validation plans."""
+
+import re
+
+import pytest
+
+from prompt_decorators.core.dynamic_decorator import (
+    DynamicDecorator,
+    ValidationPlan,
+    value_bounds,
+)
+
+PARAMETERS = [
+    {"name": "title", "type": "string", "required": True, "min_length": 2},
+    {
+        "name": "code",
+        "type": "string",
+        "validation": {"maxLength": 5, "pattern": "^[A-Z]+$"},
+    },
+    {
+        "name": "count",
+        "type": "number",
+        "default": 3,
+        "min_value": 0,
+        "validation": {"minimum": 1, "maximum": 10},
+    },
+    {"name": "mode", "type": "enum", "enum": ["fast", "slow"], "default": "fast"},
+    {"name": "tags", "type": "array"},
+]
+
+
+@pytest.fixture
+def plan():
+    """Compile a plan for the test parameters."""
+    return ValidationPlan(PARAMETERS)
+
+
+def test_bind_applies_defaults(plan):
+    """Test that defaults are merged after the provided values."""
+    bound = plan.bind({"title": "Hi"})
+    assert list(bound) == ["title", "count", "mode"]
+    assert bound["count"].value == 3
+    # Each binding gets its own default parameters
+    bound["mode"].value = "slow"
+    assert plan.bind({"title": "Hi"})["mode"].value == "fast"
+
+
+@pytest.mark.parametrize(
+    "params,message",
+    [
+        ({}, "Required parameter 'title' is missing"),
+        ({"title": "Hi", "other": 1}, "Unknown parameter 'other'"),
+        ({"title": "H"}, "must be at least 2 characters long"),
+        ({"title": "Hi", "code": "TOOLONG"}, "must be at most 5 characters long"),
+        ({"title": "Hi", "code": "abc"}, "doesn't match required pattern"),
+        ({"title": "Hi", "count": 0}, "must be at least 1"),
+        ({"title": "Hi", "count": 11}, "must be at most 10"),
+        ({"title": "Hi", "count": "3"}, "must be a number, got str"),
+        ({"title": "Hi", "mode": "medium"}, "must be one of ['fast', 'slow']"),
+        ({"title": "Hi", "tags": "a,b"}, "must be an array"),
+        ({"title": "Hi", "code": None}, "Parameter 'code' must be a string"),
+    ],
+)
+def test_bind_rejects_invalid_values(plan, params, message):
+    """Test that both key spellings and all rule types are enforced."""
+    with pytest.raises(ValueError, match=re.escape(message)):
+        plan.bind(params)
+
+
+def test_invalid_default_only_fails_when_used():
+    """Test that an invalid default is reported only if it is applied."""
+    plan = ValidationPlan([{"name": "level", "type": "number", "default": "high"}])
+    assert plan.bind({"level": 2})["level"].value == 2
+    with pytest.raises(ValueError, match="must be a number"):
+        plan.bind({})
+
+
+def test_value_bounds_use_strictest_spelling():
+    """Test that bounds declared under several spellings are combined."""
+    param = {"min_value": 1, "maximum": 10, "validation": {"minimum": 3}}
+    assert value_bounds(param) == (3, 10)
+    assert value_bounds({"name": "count"}) == (None, None)
+
+
+def test_decorators_share_plan_per_definition():
+    """Test that a plan is compiled once per registry definition."""
+    DynamicDecorator.register_decorator(
+        {"decoratorName": "PlanProbe", "parameters": PARAMETERS}
+    )
+    try:
+        DynamicDecorator("PlanProbe", title="One")
+        plan = DynamicDecorator._validation_plans["PlanProbe"][1]
+        DynamicDecorator("PlanProbe", title="Two")
+        assert DynamicDecorator._validation_plans["PlanProbe"][1] is plan
+    finally:
+        DynamicDecorator.update_registry({}, remove=["PlanProbe"])
@@ -0,0 +1,137 @@
+"""Tests for versioned decorator resolution."""
+
+import pytest
+
+from prompt_decorators.core.dynamic_decorator import DynamicDecorator, transform_prompt
+from prompt_decorators.core.versions import VersionIndex, parse_version
+
+
+def _probe(version, text):
+    """Build a probe decorator definition.
+
+    Args:
+        version: Version of the definition
+        text: Instruction the definition prepends
+
+    Returns:
+        The decorator definition
+    """
+    return {
+        "decoratorName": "VersionProbe",
+        "version": version,
+        "description": "Probe",
+        "parameters": [],
+        "transformationTemplate": {"instruction": text, "placement": "prepend"},
+    }
+
+
+@pytest.fixture
+def probe_versions():
+    """Register several versions of a probe decorator."""
+    DynamicDecorator.load_registry()
+    for version in ("1.0.0", "1.2.0", "1.2.5", "2.0.0", "2.1.0-beta"):
+        DynamicDecorator.register_decorator(_probe(version, f"v{version}"))
+    yield
+    DynamicDecorator.load_registry()
+
+
+def test_parse_version_orders_pre_releases_first():
+    """Test that a pre-release sorts before its release."""
+    assert parse_version("v1.2") == (1, 2, 0, 1, "")
+    assert parse_version("2.0.0-rc1") < parse_version("2.0.0")
+    assert parse_version("1.10.0") > parse_version("1.9.9")
+
+
+def test_versions_load_side_by_side(probe_versions):
+    """Test that every version stays loaded and the default is the latest release."""
+    assert DynamicDecorator.get_decorator_versions("VersionProbe") == [
+        "2.1.0-beta",
+        "2.0.0",
+        "1.2.5",
+        "1.2.0",
+        "1.0.0",
+    ]
+    assert DynamicDecorator.get_snapshot()["VersionProbe"]["version"] == "2.0.0"
+    versions = DynamicDecorator.get_snapshot().versions["VersionProbe"].values()
+    parameters = {id(definition["parameters"]) for definition in versions}
+    assert len(parameters) == 1
+
+
+@pytest.mark.parametrize(
+    "spec, expected",
+    [
+        ("", "2.0.0"),
+        ("1.2.0", "1.2.0"),
+        ("1", "1.2.5"),
+        ("1.2", "1.2.5"),
+        ("^1.0", "1.2.5"),
+        ("~1.2.0", "1.2.5"),
+        (">=1.0, <1.2", "1.0.0"),
+        ("2.1.0-beta", "2.1.0-beta"),
+        ("3", None),
+    ],
+)
+def test_resolve_definition(probe_versions, spec, expected):
+    """Test resolving version requests."""
+    definition = DynamicDecorator.resolve_definition("VersionProbe", spec)
+    assert (definition and definition["version"]) == expected
+
+
+@pytest.mark.parametrize(
+    "spec, expected",
+    [
+        ("^0.0", "0.0.9"),
+        ("^0.0.3", "0.0.3"),
+        ("^0.1", "0.1.4"),
+        ("^0", "0.1.4"),
+        ("latest", "0.1.4"),
+    ],
+)
+def test_caret_ranges_below_one(spec, expected):
+    """Test caret ranges on 0.x versions, with and without the patch."""
+    index = VersionIndex(
+        {
+            "Probe": {
+                parse_version(v): {"version": v}
+                for v in ("0.0.3", "0.0.9", "0.1.4", "1.0.0-rc1")
+            }
+        }
+    )
+    assert index.resolve("Probe", spec)["version"] == expected
+
+
+def test_latest_falls_back_to_pre_releases():
+    """Test that the latest request matches the default version."""
+    by_version = {parse_version(v): {"version": v} for v in ("0.9.0-a", "1.0.0-b")}
+    index = VersionIndex({"Probe": by_version})
+    for spec in ("", "*", "latest"):
+        assert index.resolve("Probe", spec)["version"] == "1.0.0-b"
+    assert index.resolve("Probe", "^1.0") is None
+
+
+def test_resolution_is_cached_per_pattern():
+    """Test that a request is only matched against the versions once."""
+    index = VersionIndex({"Probe": {parse_version("1.0.0"): {"version": "1.0.0"}}})
+    first = index.resolve("Probe", "^1.0")
+    index._versions.clear()
+    assert index.resolve("Probe", "^1.0") is first
+    assert index.resolve("Probe", "~1.0") is None
+
+
+def test_decorator_uses_requested_version(probe_versions):
+    """Test that a version suffix selects the definition and its render plan."""
+    assert DynamicDecorator("VersionProbe:v1.2").apply("Go.").startswith("v1.2.5")
+    assert DynamicDecorator("VersionProbe").apply("Go.").startswith("v2.0.0")
+    with pytest.raises(ValueError, match="no version matching"):
+        DynamicDecorator("VersionProbe:v3")
+
+
+def test_transform_prompt_applies_pins(probe_versions):
+    """Test that pinned versions apply unless the decorator string names one."""
+    pins = {"VersionProbe": "1.0.0"}
+    assert transform_prompt("Go.", ["+++VersionProbe"], versions=pins).startswith(
+        "v1.0.0"
+    )
+    assert transform_prompt(
+        "Go.", ["+++VersionProbe:v1.2.0"], versions=pins
+    ).startswith("v1.2.0")